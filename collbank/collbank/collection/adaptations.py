@@ -8,6 +8,7 @@ import re
 import os
 import json
 import csv
+from datetime import datetime, timezone
 
 # ======= imports from my own application ======
 from collbank.basic.utils import ErrHandle
@@ -20,14 +21,14 @@ from collbank.collection.models import FieldChoice, Collection, Resource, \
     LanguageDisorder, Relation, Domain, PID, ResourceCreator, Project, ProjectFunder, \
     Linguality, LingualityType, LingualityNativeness, LingualityAgeGroup, LingualityStatus, \
     LingualityVariant, MultilingualityType, MediaFormat, Organization, Person, \
-    LanguageIso, LanguageName, Language, CountryIso
-from collbank.reader.models import VloItem
+    LanguageIso, LanguageName, Language, CountryIso, Publication, ReferenceIndex
+from collbank.reader.models import VloItem, VloPublication
 
 
 adaptation_list = {
     "collection_list": ["resource_empty", "language_renew", "langname_add", "country_renew",
-                        "modality_strings"],
-    "vloitem_list": ["vloitem_id", "vloitem_publish"],
+                        "modality_strings", "publication_ledger"],
+    "vloitem_list": ["vloitem_id", "vloitem_publish", "vloitem_ledger"],
     "pid_list": []
     }
 
@@ -246,7 +247,7 @@ def adapt_langname_add():
                     elif "official aramaic" in english_name.lower():
                         english_name = "Official Aramaic (700-300 BCE)"
                     # Look for this language in [LanguageName]
-                    langname = LanguageName.objects.filter(name__iexact=english_name).first()
+                    langname = ReferenceIndex.get_langname_byname(english_name)
                     if langname is None:
                         # Problem
                         oErr.Status("adapt_langname_add: cannot find language called [{}] for Language id {}".format(
@@ -337,6 +338,37 @@ def adapt_modality_strings():
 
 # =========== Part of vloitem ======================
 
+def get_published_file(sPublishPath):
+    """Get the modification time, size and hash of a file that has been published earlier"""
+
+    oBack = None
+    if os.path.isfile(sPublishPath):
+        with open(sPublishPath, encoding="utf-8", mode="r") as f:
+            sXmlText = f.read()
+        oBack = dict(published=datetime.fromtimestamp(os.path.getmtime(sPublishPath), tz=timezone.utc),
+                     size=len(sXmlText.encode("utf-8")), xmlhash=Publication.get_hash(sXmlText))
+    return oBack
+
+def adapt_publication_ledger():
+    """Fill the publication ledger from the files that have been published before there was a ledger"""
+
+    oErr = ErrHandle()
+    bResult = True
+    msg = ""
+
+    try:
+        with transaction.atomic():
+            for obj in Collection.objects.filter(publication__isnull=True):
+                oPublished = get_published_file(obj.get_publisfilename())
+                if not oPublished is None:
+                    # Leave the version empty, so that an incremental publication redoes it once
+                    Publication.objects.create(collection=obj, **oPublished)
+    except:
+        bResult = False
+        msg = oErr.get_error_message()
+        oErr.DoError("adapt_publication_ledger")
+    return bResult, msg
+
 def adapt_vloitem_id():
     """Re-calculate the XMLs, adding @id to ResourceProxy items"""
 
@@ -394,3 +426,21 @@ def adapt_vloitem_publish():
         oErr.DoError("adapt_vloitem_publish")
     return bResult, msg
 
+def adapt_vloitem_ledger():
+    """Fill the VloItem publication records from the files that have been published earlier"""
+
+    oErr = ErrHandle()
+    bResult = True
+    msg = ""
+
+    try:
+        with transaction.atomic():
+            for obj in VloItem.objects.filter(publication__isnull=True):
+                oPublished = get_published_file(obj.get_publisfilename())
+                if not oPublished is None:
+                    VloPublication.objects.create(vloitem=obj, **oPublished)
+    except:
+        bResult = False
+        msg = oErr.get_error_message()
+        oErr.DoError("adapt_vloitem_ledger")
+    return bResult, msg
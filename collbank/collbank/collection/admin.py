@@ -37,8 +37,8 @@ def remove_from_fieldsets(fieldsets, fields):
 
 def init_choices(obj, sFieldName, sSet):
     if (obj.fields != None and sFieldName in obj.fields):
-        obj.fields[sFieldName].choices = build_choice_list(sSet)
-        obj.fields[sFieldName].help_text = get_help(sSet)
+        obj.fields[sFieldName].choices = ChoiceRegistry.get_choices(sSet)
+        obj.fields[sFieldName].help_text = ChoiceRegistry.get_help(sSet)
 
 def get_formfield_qs(modelThis, instanceThis, parentName, bNoEmpty = False):
     """Get the queryset for [modelThis]
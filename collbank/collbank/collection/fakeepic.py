@@ -0,0 +1,171 @@
+"""
+Local stand-in for the ePIC handle service
+
+This is used by the tests, and it can be used for benchmarks, without touching the real
+handle server. It understands the calls that PidService makes:
+
+    GET  <prefix>/               list the handles (authentication check)
+    GET  <prefix>/?URL=*/name    search the handles whose URL ends with /name
+    GET  <prefix>/?URL=*&depth=1&limit=n&page=p
+                                 one page of all handles, including their URL
+    POST <prefix>/?prefix=COLL   create a handle
+    GET  <prefix>/<suffix>       get the values of a handle
+    PUT  <prefix>/<suffix>       change the values of a handle
+
+Run it on its own with:  python -m collbank.collection.fakeepic [port] [latency]
+"""
+
+import base64
+import fnmatch
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+
+class FakeEpicHandler(BaseHTTPRequestHandler):
+    """Handle one connection to the fake ePIC service"""
+
+    # Keep-alive, just like the real service
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def setup(self):
+        super(FakeEpicHandler, self).setup()
+        self.server.fake.add_connection()
+
+    def send_json(self, code, oData=None):
+        bData = b"" if oData is None else json.dumps(oData).encode("utf-8")
+        self.send_response(code)
+        if len(bData) > 0:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(bData)))
+        self.end_headers()
+        self.wfile.write(bData)
+
+    def handle_call(self, sMethod):
+        fake = self.server.fake
+        # Read the body, so that the connection can be re-used
+        iLength = int(self.headers.get("Content-Length", 0) or 0)
+        bBody = self.rfile.read(iLength) if iLength > 0 else b""
+        code, oData = fake.answer(sMethod, self.path, self.headers.get("Authorization", ""), bBody)
+        self.send_json(code, oData)
+
+    def do_GET(self):
+        self.handle_call("GET")
+
+    def do_POST(self):
+        self.handle_call("POST")
+
+    def do_PUT(self):
+        self.handle_call("PUT")
+
+
+class FakeEpicServer(object):
+    """A fake ePIC service running in a thread of this process
+
+    [handles] maps the suffix of a handle onto its URL. Status codes that are added
+    to [fail_next] for a method are returned (in that order) instead of the next answers.
+    """
+
+    def __init__(self, prefix="21.11114", user="user", passwd="passwd", port=0, latency=0.0):
+        self.prefix = prefix
+        self.user = user
+        self.passwd = passwd
+        self.latency = latency
+        self.handles = {}
+        self.fail_next = {"GET": [], "POST": [], "PUT": []}
+        self.connections = 0
+        self.requests = 0
+        self.lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), FakeEpicHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.fake = self
+        self.thread = None
+
+    @property
+    def url(self):
+        """The service URL with prefix, as it is stored in PidService.url"""
+        return "http://127.0.0.1:{}/api/handles/{}/".format(self.httpd.server_address[1], self.prefix)
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def add_connection(self):
+        with self.lock:
+            self.connections += 1
+
+    def answer(self, sMethod, sPath, sAuth, bBody):
+        """Get the (status code, JSON data) for one request"""
+
+        with self.lock:
+            self.requests += 1
+            lst_fail = self.fail_next.get(sMethod, [])
+            code = lst_fail.pop(0) if len(lst_fail) > 0 else None
+        if self.latency > 0:
+            time.sleep(self.latency)
+        if not code is None:
+            return code, None
+        sExpected = "Basic " + base64.b64encode("{}:{}".format(self.user, self.passwd).encode("utf-8")).decode("ascii")
+        if sAuth != sExpected:
+            return 401, None
+
+        oUrl = urlsplit(sPath)
+        sBase = "/api/handles/{}/".format(self.prefix)
+        if not oUrl.path.startswith(sBase):
+            return 404, None
+        sSuffix = oUrl.path[len(sBase):].strip("/")
+        oQuery = parse_qs(oUrl.query)
+
+        with self.lock:
+            if sSuffix == "":
+                if sMethod == "GET":
+                    sPattern = oQuery.get("URL", ["*"])[0]
+                    lst_pid = [x for x, url in self.handles.items() if fnmatch.fnmatchcase(url, sPattern)]
+                    if "limit" in oQuery:
+                        # One page of the listing
+                        iLimit = int(oQuery["limit"][0])
+                        iPage = int(oQuery.get("page", ["1"])[0])
+                        lst_pid = lst_pid[(iPage - 1) * iLimit:iPage * iLimit]
+                    if oQuery.get("depth", ["0"])[0] == "1":
+                        return 200, [{"handle": "{}/{}".format(self.prefix, x), "URL": self.handles[x]} for x in lst_pid]
+                    return 200, lst_pid
+                elif sMethod == "POST":
+                    lValues = json.loads(bBody.decode("utf-8"))
+                    sSuffix = "{}-{:04d}-0000-0000-{:04X}".format(
+                        oQuery.get("prefix", ["X"])[0], len(self.handles) + 1, len(self.handles) + 1)
+                    self.handles[sSuffix] = self.get_url(lValues)
+                    return 201, {"epic-pid": "{}/{}".format(self.prefix, sSuffix)}
+            elif sMethod == "GET":
+                if not sSuffix in self.handles:
+                    return 404, None
+                return 200, [{"idx": 1, "type": "URL", "parsed_data": self.handles[sSuffix]}]
+            elif sMethod == "PUT":
+                self.handles[sSuffix] = self.get_url(json.loads(bBody.decode("utf-8")))
+                return 204, None
+        return 405, None
+
+    def get_url(self, lValues):
+        for item in lValues:
+            if item.get("type") == "URL":
+                return item.get("parsed_data", "")
+        return ""
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8099
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.0
+    fake = FakeEpicServer(port=port, latency=latency)
+    print("Fake ePIC service at {} (user/passwd)".format(fake.url))
+    fake.httpd.serve_forever()
@@ -0,0 +1,34 @@
+"""
+Register the PIDs of the collections in the PID queue
+
+Publishing puts collections without a (verified) PID in the queue, so that it does not
+have to wait for the handle service. Run this command regularly (e.g. from cron), or
+keep it running with --loop.
+"""
+
+import time
+from django.core.management.base import BaseCommand
+
+from collbank.collection.views import process_pid_queue
+
+
+class Command(BaseCommand):
+    help = "Register the PIDs of the collections in the PID queue and publish them again"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--loop", type=int, default=0,
+                            help="Keep running, looking at the queue every LOOP seconds")
+        parser.add_argument("--max", type=int, default=0,
+                            help="Do at most MAX collections per run (0 means all that are due)")
+
+    def handle(self, *args, **options):
+        iLoop = options['loop']
+        while True:
+            oBack = process_pid_queue(options['max'])
+            if oBack['status'] in ["error", "degraded"]:
+                self.stderr.write("pidqueue: {}".format(oBack['msg']))
+            elif oBack['done'] > 0 or oBack['errors'] > 0:
+                self.stdout.write("pidqueue: {} registered, {} failed".format(oBack['done'], oBack['errors']))
+            if iLoop <= 0:
+                break
+            time.sleep(iLoop)
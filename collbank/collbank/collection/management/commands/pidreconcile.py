@@ -0,0 +1,39 @@
+"""
+Check all collections and VLO items against the handles under our prefix
+
+This needs only a few calls to the handle service, so it can be run every night.
+"""
+
+from django.core.management.base import BaseCommand
+
+from collbank.collection.models import PidService
+
+
+class Command(BaseCommand):
+    help = "Match all collections and VLO items against the handles of the PID service"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--fix", action="store_true",
+                            help="Store the handle of objects that have exactly one, and fill the PID cache")
+
+    def handle(self, *args, **options):
+        pidservice = PidService.get_service()
+        if pidservice is None:
+            self.stderr.write("pidreconcile: there is no PID service")
+            return
+        oBack = pidservice.reconcile(bFix=options['fix'])
+        if oBack['status'] == "error":
+            self.stderr.write("pidreconcile: {}".format(oBack['msg']))
+            return
+        self.stdout.write("pidreconcile: {} handles, {} objects okay, {} fixed".format(
+            oBack['handles'], oBack['ok'], oBack['fixed']))
+        for sName in oBack['missing']:
+            self.stdout.write("No handle:        {}".format(sName))
+        for sName, lst_pid in oBack['duplicates'].items():
+            self.stdout.write("Several handles:  {} {}".format(sName, ", ".join(lst_pid)))
+        for sName in oBack['mismatches']:
+            self.stdout.write("Other handle:     {}".format(sName))
+        for sName in oBack['urls']:
+            self.stdout.write("Other target URL: {}".format(sName))
+        for sPid in oBack['orphans']:
+            self.stdout.write("No object:        {}".format(sPid))
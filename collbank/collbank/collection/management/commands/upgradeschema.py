@@ -0,0 +1,64 @@
+"""
+Add the tables and columns for publication records, PIDs and upload hashes to an existing database
+
+The migrations of this project are generated on each server, and they are not part of the
+repository. A database that is kept up to date with 'manage.py makemigrations' and
+'manage.py migrate' gets these tables and columns that way, and does not need this command.
+
+For a database that is not maintained through migrations, run this command once after
+updating the code:  python manage.py upgradeschema
+It only adds what is missing, so running it again does nothing.
+"""
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+# The tables (models) that are new: in the order in which they can be created
+NEW_MODELS = [
+    ("collection", "PidCache"),
+    ("collection", "PidQueue"),
+    ("collection", "Publication"),
+    ("reader", "VloPublication"),
+]
+
+# The columns (fields) that are new in existing tables
+NEW_FIELDS = [
+    ("collection", "Collection", "graphversion"),
+    ("reader", "SourceInfo", "filehash"),
+    ("reader", "SourceInfo", "collection"),
+    ("reader", "VloItem", "filehash"),
+]
+
+
+def upgrade_schema():
+    """Create the missing tables and columns and return a list of what has been done"""
+
+    lst_back = []
+    lst_table = connection.introspection.table_names()
+    with connection.schema_editor() as editor:
+        for sApp, sModel in NEW_MODELS:
+            model = apps.get_model(sApp, sModel)
+            if not model._meta.db_table in lst_table:
+                editor.create_model(model)
+                lst_back.append("Created table {}".format(model._meta.db_table))
+        for sApp, sModel, sField in NEW_FIELDS:
+            model = apps.get_model(sApp, sModel)
+            field = model._meta.get_field(sField)
+            with connection.cursor() as cursor:
+                lst_column = [x.name for x in connection.introspection.get_table_description(cursor, model._meta.db_table)]
+            if not field.column in lst_column:
+                editor.add_field(model, field)
+                lst_back.append("Added column {}.{}".format(model._meta.db_table, field.column))
+    return lst_back
+
+
+class Command(BaseCommand):
+    help = "Add the tables and columns for publication records, PIDs and upload hashes, when they are missing"
+
+    def handle(self, *args, **options):
+        lst_done = upgrade_schema()
+        for sDone in lst_done:
+            self.stdout.write("upgradeschema: {}".format(sDone))
+        if len(lst_done) == 0:
+            self.stdout.write("upgradeschema: the database is up to date")
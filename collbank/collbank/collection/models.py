@@ -6,23 +6,34 @@ Each resource in the collection is characterised by its own annotations.
 
 """
 from django.apps import apps
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Case, CharField, F, Prefetch, Value, When
+from django.db.models.signals import post_save, post_delete, pre_delete
+from django.dispatch import receiver
 from django.contrib.auth.models import User
-from datetime import datetime
+from datetime import datetime, timedelta
+from django.utils import timezone
+from django.utils.functional import lazy
 from django.db.models.fields import Field
 import requests
 from requests.auth import HTTPBasicAuth
 
 import copy  # (1) use python copy
+from contextlib import nullcontext
+from itertools import chain
+import hashlib
 import json
 import sys
 import os, time
+import tempfile
+import threading
 import markdown
 
-from collbank.settings import REGISTRY_URL, REGISTRY_DIR, PUBLISH_DIR
+from collbank.settings import REGISTRY_URL, REGISTRY_DIR, PUBLISH_DIR, PID_CACHE_DAYS
 from collbank.basic.utils import ErrHandle
 from collbank.basic.views import get_current_datetime
 from collbank.basic.models import Custom
+from collbank.collection.services import PidClient
 
 
 MAX_IDENTIFIER_LEN = 30
@@ -95,7 +106,7 @@ def build_choice_list(field, position=None, subcat=None):
         else:
             ## Force a real choice to be made
             #choice_list = [('-1','-')]
-            for choice in FieldChoice.objects.filter(field__iexact=field):
+            for choice in FieldChoiceIndex.get_list(field):
                 # Default
                 sEngName = ""
                 # Any special position??
@@ -126,14 +137,58 @@ def build_choice_list(field, position=None, subcat=None):
     # We do not use defaults
     return choice_list;
 
+class LazyChoiceList(object):
+    """The choices of a model field, which are only built from FieldChoice when they are used
+
+    This keeps the database out of the import of the models
+    """
+
+    def __init__(self, field, position=None, subcat=None):
+        self.field = field
+        self.position = position
+        self.subcat = subcat
+
+    def __iter__(self):
+        return iter(ChoiceRegistry.get_choices(self.field, self.position, self.subcat))
+
+    def __len__(self):
+        return len(ChoiceRegistry.get_choices(self.field, self.position, self.subcat))
+
+def get_choices_lazy(field, position=None, subcat=None):
+    """Use this instead of build_choice_list() for the [choices] of a model field"""
+    return LazyChoiceList(field, position, subcat)
+
+class LazyFormChoices(object):
+    """Choices that a form field keeps as a callable, so that they are read when the form is shown"""
+
+    def __init__(self, func):
+        self.func = func
+
+    def __call__(self):
+        return self.func()
+
+    def __iter__(self):
+        return iter(self.func())
+
+class LazyChoiceCharField(models.CharField):
+    """CharField with a LazyChoiceList as choices
+
+    The ModelForm classes are created when the admin is imported. 
+    A plain CharField would then turn its choices into a list right away.
+    """
+
+    def get_choices(self, include_blank=True, **kwargs):
+        get_list = super(LazyChoiceCharField, self).get_choices
+        return LazyFormChoices(lambda: get_list(include_blank=include_blank, **kwargs))
+
 def choice_english(field, num):
     """Get the english name of the field with the indicated machine_number"""
 
     try:
-        result_list = FieldChoice.objects.filter(field__iexact=field).filter(machine_value=num)
-        if (result_list == None):
-            return "(No results for "+field+" with number="+num
-        return result_list[0].english_name
+        choice = FieldChoiceIndex.get_by_value(field, num)
+        if choice is None:
+            return "(empty)"
+        return choice.english_name
     except:
         return "(empty)"
 
@@ -141,14 +196,14 @@ def choice_value(field, term):
     """Get the numerical value of the field with the indicated English name"""
 
     try:
-        result_list = FieldChoice.objects.filter(field__iexact=field).filter(english_name__iexact=term)
-        if result_list == None or result_list.count() == 0:
+        choice = FieldChoiceIndex.get_by_english(field, term)
+        if choice is None:
             # Try looking at abbreviation
-            result_list = FieldChoice.objects.filter(field__iexact=field).filter(abbr__iexact=term)
-        if result_list == None:
+            choice = FieldChoiceIndex.get_by_abbr(field, term)
+        if choice is None:
             return -1
         else:
-            return result_list[0].machine_value
+            return choice.machine_value
     except:
         return -1
 
@@ -156,13 +211,106 @@ def choice_abbreviation(field, num):
     """Get the abbreviation of the field with the indicated machine_number"""
 
     try:
-        result_list = FieldChoice.objects.filter(field__iexact=field).filter(machine_value=num)
-        if (result_list == None):
-            return "{}_{}".format(field, num)
-        return result_list[0].abbr
+        choice = FieldChoiceIndex.get_by_value(field, num)
+        if choice is None:
+            return "-"
+        return getattr(choice, "abbr", "-")
     except:
         return "-"
 
+def get_publication_date(oDate):
+    """Show the publication date [oDate] (which may be None)"""
+
+    if oDate == None:
+        sDate = 'unpublished'
+    else:
+        sDate = timezone.localtime(oDate).strftime("%d/%b/%Y %H:%M:%S")
+    return sDate
+
+def get_publication_status(oPublished, oUpdated):
+    """Combine the last publication date and the last update into a publication status"""
+
+    if oPublished == None:
+        sStatus = 'not-published'
+    elif oUpdated == None or oPublished >= oUpdated:
+        sStatus = 'published'
+    else:
+        sStatus = 'stale'
+    return sStatus
+
+def get_publication_status_expression():
+    """The same as get_publication_status(), as an expression for .annotate() on the [publication] relation"""
+
+    return Case(
+        When(publication__published__isnull=True, then=Value('not-published')),
+        When(updated_at__isnull=True, then=Value('published')),
+        When(publication__published__gte=F('updated_at'), then=Value('published')),
+        default=Value('stale'), output_field=CharField())
+
+def get_file_hash(sFileName):
+    """Get the SHA-256 hash of the contents of [sFileName], or None if there is no such file"""
+
+    sHash = None
+    if os.path.isfile(sFileName):
+        oHash = hashlib.sha256()
+        with open(sFileName, mode="rb") as f:
+            for bChunk in iter(lambda: f.read(65536), b""):
+                oHash.update(bChunk)
+        sHash = oHash.hexdigest()
+    return sHash
+
+def replace_file(sFileName, bData=None, sLinkFrom=None):
+    """Atomically replace [sFileName] by [bData], or by a hardlink to [sLinkFrom]
+
+    The new contents go to a temporary file in the same directory first, 
+    so that readers of [sFileName] either see the old or the new file
+    Returns False if a hardlink was asked for but cannot be made (e.g. across filesystems)
+    """
+
+    sDir = os.path.dirname(sFileName)
+    # Published files must stay readable for the web server and jOAI
+    iMode = os.stat(sFileName).st_mode & 0o777 if os.path.isfile(sFileName) else 0o644
+    fd, sTmpName = tempfile.mkstemp(dir=sDir, prefix=".{}.".format(os.path.basename(sFileName)), suffix=".tmp")
+    try:
+        if sLinkFrom is None:
+            with os.fdopen(fd, mode="wb") as f:
+                f.write(bData)
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(sTmpName, iMode)
+        else:
+            os.close(fd)
+            os.remove(sTmpName)
+            try:
+                os.link(sLinkFrom, sTmpName)
+            except OSError:
+                return False
+        os.replace(sTmpName, sFileName)
+    finally:
+        if os.path.exists(sTmpName):
+            os.remove(sTmpName)
+    return True
+
+def write_published_xml(sXmlText, lst_file):
+    """Write [sXmlText] to each of the files in [lst_file], but only where the contents differ
+
+    The first file is written; the others become hardlinks to it if possible
+    Returns the number of files that have been (re)written
+    """
+
+    bData = sXmlText.encode("utf-8")
+    sHash = hashlib.sha256(bData).hexdigest()
+    iWritten = 0
+    sFirst = None
+    for sFileName in lst_file:
+        if get_file_hash(sFileName) != sHash:
+            if sFirst is None or not replace_file(sFileName, sLinkFrom=sFirst):
+                replace_file(sFileName, bData=bData)
+            iWritten += 1
+        if sFirst is None:
+            sFirst = sFileName
+    return iWritten
+
 def m2m_combi(items):
     try:
         if items == None:
@@ -255,15 +403,17 @@ def get_help(field):
     # find the correct instance in the database
     help_text = ""
     try:
-        entry_list = HelpChoice.objects.filter(field__iexact=field)
-        entry = entry_list[0]
         # Note: only take the first actual instance!!
+        entry = HelpChoiceIndex.get_entry(field)
         help_text = entry.Text()
     except:
         help_text = "Sorry, no help available for " + field
 
     return help_text
 
+# Use this instead of get_help() for the [help_text] of a model field
+get_help_lazy = lazy(get_help, str)
+
 
 # ========================= HELPER MODELS ==============================
 
@@ -279,13 +429,17 @@ class PidService(models.Model):
     # [1] password to this service
     passwd = models.CharField("The password", max_length=MAX_STRING_LEN)
 
+    def get_service():
+        """Get the PID service that is used for collections and VLO items"""
+        return PidService.objects.filter(name=PIDSERVICE_NAME).first()
+
     def authenticate(self):
         """Authenticate with the ePIC API"""
 
         # Default reply
         oBack = {'status': 'error', 'msg': ''}
         # Issue the request
-        r = requests.get(self.url, auth=(self.user,self.passwd))
+        r = PidClient.request(self, "GET", self.url, sCall="authenticate")
         # Check the reply we got
         if r.status_code == 200:
             # Authentication worked
@@ -321,7 +475,7 @@ class PidService(models.Model):
         sUrl = "{}/?URL=*/{}".format(basic_url, sName)
         headers = {'Accept': 'application/json'}
         # Issue the request
-        r = requests.get(sUrl, auth=(self.user, self.passwd), headers=headers, timeout=10)
+        r = PidClient.request(self, "GET", sUrl, sCall="getpid", headers=headers)
         if r.status_code == 200:
             # Got it: process the response
             if r.text == "":
@@ -357,7 +511,7 @@ class PidService(models.Model):
         sUrl = "{}{}".format(self.url,sPid)
         headers = {'Content-type': 'application/json'}
         # sUrl = "{}?prefix=COLL".format(self.url)
-        r = requests.get(sUrl,auth=(self.user, self.passwd), headers={'Content-type': 'application/json'})
+        r = PidClient.request(self, "GET", sUrl, sCall="geturl", headers=headers)
         if r.status_code >= 100 and r.status_code < 300:
             lResponse = json.loads(r.text)
             # Find the element that has type URL
@@ -369,11 +523,14 @@ class PidService(models.Model):
         # we are fine here
         return sBack
 
-    def createpid(self, collection):
-        """Create a PID for this collection's id"""
+    def createpid(self, collection, bSearch=True):
+        """Create a PID for this collection's id
+        
+        Set [bSearch] to False when getpid() has just shown that there is no PID yet
+        """
 
         # First try to find it
-        sAttempt = self.getpid(collection)
+        sAttempt = self.getpid(collection) if bSearch else "-"
         if sAttempt == "":
             # Could be 'not authorized' or multiple responses
             return {'status': 'error', 'msg': 'not authorized?'}
@@ -386,7 +543,7 @@ class PidService(models.Model):
         oData = [{'type': 'URL', 'parsed_data': sSearch}]
         headers = {'Content-type': 'application/json', 'Accept': 'application/json'}
         sUrl = "{}?prefix=COLL".format(self.url)
-        r = requests.post(sUrl,auth=(self.user, self.passwd), json=oData, headers=headers)
+        r = PidClient.request(self, "POST", sUrl, sCall="createpid", json=oData, headers=headers)
         if r.status_code >= 100 and r.status_code < 300:
             # Positive reply -- get the pid
             oResponse = json.loads(r.text)
@@ -413,7 +570,7 @@ class PidService(models.Model):
             sUrl = "{}{}".format(self.url, collection.pidname)
 
             # For updating: use the PUT method
-            r = requests.put(sUrl,auth=(self.user, self.passwd), json=oData, headers=headers)
+            r = PidClient.request(self, "PUT", sUrl, sCall="checkandupdatepid", json=oData, headers=headers)
             if r.status_code < 200 or r.status_code >= 300:
                 # There has been a problem -- return empty
                 oBack['status'] = "error"
@@ -425,6 +582,206 @@ class PidService(models.Model):
         # Return the back object
         return oBack
 
+    def listpids(self, iPageSize=1000):
+        """Get a dictionary from handle (without prefix) onto URL for all handles under our prefix
+
+        The listing is asked for page by page, with the URL of each handle included.
+        Handles for which the service only gives the name are looked up one by one.
+        """
+
+        dict_pid = {}
+        lst_name = []
+        basic_url = self.url
+        if basic_url[-1] == "/":
+            basic_url = basic_url[0:-1]
+        headers = {'Accept': 'application/json'}
+        iPage = 1
+        while True:
+            sUrl = "{}/?URL=*&depth=1&limit={}&page={}".format(basic_url, iPageSize, iPage)
+            r = PidClient.request(self, "GET", sUrl, sCall="listpids", headers=headers)
+            if r.status_code == 404:
+                break
+            elif r.status_code != 200:
+                raise Exception("The listing of page {} returned code {}".format(iPage, r.status_code))
+            lResponse = [] if r.text == "" else json.loads(r.text)
+            for item in lResponse:
+                if isinstance(item, dict):
+                    sPid = item.get("handle", "").split("/")[-1]
+                    dict_pid[sPid] = item.get("URL", "")
+                else:
+                    lst_name.append(item.split("/")[-1])
+            if len(lResponse) < iPageSize:
+                break
+            iPage += 1
+        for sPid in lst_name:
+            r = PidClient.request(self, "GET", "{}{}".format(self.url, sPid), sCall="geturl", headers=headers)
+            dict_pid[sPid] = ""
+            if r.status_code == 200:
+                for item in json.loads(r.text):
+                    if item['type'] == "URL":
+                        dict_pid[sPid] = item['parsed_data']
+                        break
+        return dict_pid
+
+    def reconcile(self, bFix=False):
+        """Match all collections and VLO items against the handles under our prefix
+
+        A handle belongs to the object whose file name (get_xmlfilename()) ends its URL.
+        The report lists the objects that have no handle, more than one handle (which getpid()
+        cannot handle), a different handle than the one stored, or a handle with a different
+        target URL, and it lists the handles without an object.
+        With [bFix], objects with exactly one handle take over that handle and the PID cache
+        is filled, so that registering them does not need the handle service.
+        """
+
+        oErr = ErrHandle()
+        oBack = dict(status="ok", msg="", handles=0, ok=0, fixed=0, missing=[], duplicates={}, 
+                     mismatches=[], urls=[], orphans=[])
+        try:
+            # Get all handles in a few calls, and index them by the last part of their URL
+            dict_pid = self.listpids()
+            oBack['handles'] = len(dict_pid)
+            dict_name = {}
+            for sPid, sUrl in dict_pid.items():
+                dict_name.setdefault(sUrl.rstrip("/").split("/")[-1], []).append(sPid)
+
+            sDomain = self.getdomain()
+            set_seen = set()
+            VloItem = apps.get_model("reader", "VloItem")
+            for obj in chain(Collection.objects.all(), VloItem.objects.all()):
+                sName = obj.get_xmlfilename()
+                lst_pid = dict_name.get(sName, [])
+                set_seen.add(sName)
+                if len(lst_pid) == 0:
+                    oBack['missing'].append(sName)
+                elif len(lst_pid) > 1:
+                    oBack['duplicates'][sName] = sorted(lst_pid)
+                else:
+                    sPid = lst_pid[0]
+                    sTargetUrl = obj.get_targeturl()
+                    if dict_pid[sPid] != sTargetUrl:
+                        oBack['urls'].append(sName)
+                    elif obj.pidname != sPid:
+                        oBack['mismatches'].append(sName)
+                        if bFix:
+                            obj.pidname = sPid
+                            obj.handledomain = sDomain
+                            obj.url = sTargetUrl
+                            obj.save()
+                            PidCache.store(obj, self)
+                            oBack['fixed'] += 1
+                    else:
+                        oBack['ok'] += 1
+                        if bFix and (obj.handledomain != sDomain or obj.url != sTargetUrl):
+                            obj.handledomain = sDomain
+                            obj.url = sTargetUrl
+                            obj.save()
+                        if bFix:
+                            PidCache.store(obj, self)
+            oBack['orphans'] = sorted([sPid for sName, lst_pid in dict_name.items() if not sName in set_seen for sPid in lst_pid])
+        except:
+            msg = oErr.get_error_message()
+            oErr.DoError("PidService/reconcile")
+            oBack['status'] = "error"
+            oBack['msg'] = msg
+        return oBack
+
+
+class PidCache(models.Model):
+    """The last verified PID of a collection or VLO item
+
+    As long as an entry is current, register_pid() and check_pid() do not need the handle service
+    """
+
+    # [1] The name by which the handle service knows the object (see get_xmlfilename())
+    name = models.CharField("Name of the object", max_length=MAX_STRING_LEN, unique=True)
+    # [1] The handle (without the prefix)
+    pidname = models.CharField("Registry identifier", max_length=MAX_STRING_LEN)
+    # [1] The URL the handle points to
+    url = models.CharField("Target URL", max_length=MAX_STRING_LEN)
+    # [1] The service URL with prefix
+    service = models.CharField("The service URL with prefix", max_length=MAX_STRING_LEN)
+    # [1] When the handle was last verified with the handle service
+    verified = models.DateTimeField(default=get_current_datetime)
+
+    def __str__(self):
+        return "{}: {}".format(self.name, self.pidname)
+
+    def is_current(obj, pidservice):
+        """Has the PID of [obj] (a Collection or VloItem) recently been verified, and has nothing changed?"""
+
+        if pidservice is None:
+            return False
+        sPidName = obj.pidname
+        if sPidName is None or sPidName == "" or sPidName.startswith(("empty", "cbmetadata", "vlometadata")):
+            return False
+        sUrl = obj.get_targeturl()
+        if obj.url != sUrl or obj.handledomain != pidservice.getdomain():
+            return False
+        entry = PidCache.objects.filter(name=obj.get_xmlfilename()).first()
+        if entry is None:
+            return False
+        limit = get_current_datetime() - timedelta(days=PID_CACHE_DAYS)
+        return entry.pidname == sPidName and entry.url == sUrl and entry.service == pidservice.url and \
+            entry.verified > limit
+
+    def store(obj, pidservice):
+        """Remember that the PID of [obj] has just been verified with [pidservice]"""
+
+        PidCache.objects.update_or_create(name=obj.get_xmlfilename(), defaults=dict(
+            pidname=obj.pidname, url=obj.url, service=pidservice.url, verified=get_current_datetime()))
+
+
+class PidQueue(models.Model):
+    """A collection whose PID is to be registered by the worker (manage.py pidqueue)
+
+    Until then, the published XML of the collection has a provisional self link
+    """
+
+    # [1] The collection that needs a (verified) PID
+    collection = models.OneToOneField("Collection", on_delete=models.CASCADE, related_name="pidqueue")
+    # [1] Number of failed attempts so far
+    attempts = models.IntegerField("Attempts", default=0)
+    # [0-1] What went wrong with the last attempt
+    msg = models.TextField("Message", null=True, blank=True)
+    # [1] Do not try again before this moment
+    nextattempt = models.DateTimeField("Next attempt", default=get_current_datetime)
+    # [1] Publish the collection again, once its PID is known
+    republish = models.BooleanField("Publish again", default=False)
+    # [0-1] The user name and home URL to be used for publishing again
+    username = models.CharField("User name", max_length=MAX_NAME_LEN, null=True, blank=True)
+    homeurl = models.CharField("Home URL", max_length=MAX_STRING_LEN, null=True, blank=True)
+    # [1] When the collection was added to the queue
+    created = models.DateTimeField(default=get_current_datetime)
+
+    def __str__(self):
+        return "{}: {} attempt(s)".format(self.collection.identifier, self.attempts)
+
+    def add(coll, sUserName="", sHomeUrl="", bRepublish=False):
+        """Make sure [coll] is in the queue, unless its PID has recently been verified
+
+        An entry that is already waiting keeps its attempts
+        """
+
+        if PidCache.is_current(coll, PidService.get_service()):
+            return None
+        obj, created = PidQueue.objects.get_or_create(collection=coll)
+        if bRepublish:
+            obj.republish = True
+            obj.username = sUserName
+            obj.homeurl = sHomeUrl
+            obj.save()
+        return obj
+
+    def set_error(self, msg):
+        """Record a failed attempt and wait longer after each one (up to a day)"""
+
+        self.attempts += 1
+        self.msg = msg
+        iMinutes = min(2 ** (self.attempts - 1), 24 * 60)
+        self.nextattempt = get_current_datetime() + timedelta(minutes=iMinutes)
+        self.save()
+
 
 class FieldChoice(models.Model):
 
@@ -441,6 +798,101 @@ class FieldChoice(models.Model):
         ordering = ['field','machine_value']
 
 
+class FieldChoiceIndex(object):
+    """Process-wide in-memory index of all FieldChoice rows
+
+    The index is loaded with one query on first use, and it is cleared again
+    through the post_save and post_delete signals of FieldChoice
+    """
+
+    loaded = False
+    # Keyed by field in lower case: list of choices in the default ordering
+    by_field = {}
+    # Keyed by (field, machine_value)
+    by_value = {}
+    # Keyed by (field, english_name) in lower case
+    by_english = {}
+    # Keyed by (field, abbr) in lower case
+    by_abbr = {}
+
+    def load():
+        """Read all FieldChoice rows into the dictionaries"""
+
+        oErr = ErrHandle()
+        try:
+            by_field = {}
+            by_value = {}
+            by_english = {}
+            by_abbr = {}
+            # Keep the default ordering, so that the first row wins, just like [.first()] did
+            for choice in FieldChoice.objects.all():
+                sField = choice.field.lower()
+                by_field.setdefault(sField, []).append(choice)
+                by_value.setdefault((sField, choice.machine_value), choice)
+                by_english.setdefault((sField, choice.english_name.lower()), choice)
+                # Not every FieldChoice table has an abbreviation column
+                sAbbr = getattr(choice, "abbr", None)
+                if not sAbbr is None and sAbbr != "":
+                    by_abbr.setdefault((sField, sAbbr.lower()), choice)
+            # Swap in the new dictionaries in one go
+            FieldChoiceIndex.by_field = by_field
+            FieldChoiceIndex.by_value = by_value
+            FieldChoiceIndex.by_english = by_english
+            FieldChoiceIndex.by_abbr = by_abbr
+            FieldChoiceIndex.loaded = True
+        except:
+            msg = oErr.get_error_message()
+            oErr.DoError("FieldChoiceIndex/load")
+
+    def invalidate():
+        """Make sure the index gets re-loaded upon next use"""
+        FieldChoiceIndex.loaded = False
+
+    def get_list(field):
+        """Get all FieldChoice objects for [field]"""
+
+        if not FieldChoiceIndex.loaded:
+            FieldChoiceIndex.load()
+        return FieldChoiceIndex.by_field.get(field.lower(), [])
+
+    def get_by_value(field, num):
+        """Get the FieldChoice for [field] with machine_value [num]"""
+
+        if not FieldChoiceIndex.loaded:
+            FieldChoiceIndex.load()
+        try:
+            iValue = int(num)
+        except (TypeError, ValueError):
+            return None
+        return FieldChoiceIndex.by_value.get((field.lower(), iValue))
+
+    def get_by_english(field, term):
+        """Get the FieldChoice for [field] with (case-insensitive) english name [term]"""
+
+        if not FieldChoiceIndex.loaded:
+            FieldChoiceIndex.load()
+        if term is None:
+            return None
+        return FieldChoiceIndex.by_english.get((field.lower(), str(term).lower()))
+
+    def get_by_abbr(field, term):
+        """Get the FieldChoice for [field] with (case-insensitive) abbreviation [term]"""
+
+        if not FieldChoiceIndex.loaded:
+            FieldChoiceIndex.load()
+        if term is None:
+            return None
+        return FieldChoiceIndex.by_abbr.get((field.lower(), str(term).lower()))
+
+
+@receiver(post_save, sender=FieldChoice)
+@receiver(post_delete, sender=FieldChoice)
+def fieldchoice_changed(sender, **kwargs):
+    """Any change in the FieldChoice table invalidates the index"""
+    FieldChoiceIndex.invalidate()
+    ChoiceRegistry.changed()
+
+
 class HelpChoice(models.Model):
     """Define the URL to link to for the help-text"""
     
@@ -466,13 +918,117 @@ class HelpChoice(models.Model):
         return help_text
 
 
+class HelpChoiceIndex(object):
+    """Process-wide in-memory index of all HelpChoice rows
+
+    The index is loaded with one query on first use, and it is cleared again
+    through the post_save and post_delete signals of HelpChoice
+    """
+
+    loaded = False
+    # Keyed by field in lower case: the first HelpChoice for that field
+    by_field = {}
+
+    def load():
+        """Read all HelpChoice rows into the dictionary"""
+
+        oErr = ErrHandle()
+        try:
+            by_field = {}
+            for entry in HelpChoice.objects.all().order_by('id'):
+                by_field.setdefault(entry.field.lower(), entry)
+            HelpChoiceIndex.by_field = by_field
+            HelpChoiceIndex.loaded = True
+        except:
+            msg = oErr.get_error_message()
+            oErr.DoError("HelpChoiceIndex/load")
+
+    def invalidate():
+        """Make sure the index gets re-loaded upon next use"""
+        HelpChoiceIndex.loaded = False
+
+    def get_entry(field):
+        """Get the first HelpChoice for [field] (case-insensitive)"""
+
+        if not HelpChoiceIndex.loaded:
+            HelpChoiceIndex.load()
+        return HelpChoiceIndex.by_field.get(field.lower())
+
+
+@receiver(post_save, sender=HelpChoice)
+@receiver(post_delete, sender=HelpChoice)
+def helpchoice_changed(sender, **kwargs):
+    """Any change in the HelpChoice table invalidates the index"""
+    HelpChoiceIndex.invalidate()
+    ChoiceRegistry.changed()
+
+
+class ChoiceRegistry(object):
+    """Per-process registry of the choice lists and help texts used by the (admin) forms
+
+    FieldChoice and HelpChoice are read with one query each, through the
+    FieldChoiceIndex and HelpChoiceIndex. The lists built from them are kept
+    here, until a change in either table raises the [version].
+    """
+
+    version = 0
+    # Keyed by (field, position, subcat): list of choice-tuples
+    choices = {}
+    # Keyed by field: help text
+    helptexts = {}
+
+    def load():
+        """Load both tables, so that the forms do not need the database anymore"""
+
+        if not FieldChoiceIndex.loaded:
+            FieldChoiceIndex.load()
+        if not HelpChoiceIndex.loaded:
+            HelpChoiceIndex.load()
+
+    def changed():
+        """Either FieldChoice or HelpChoice has changed: start a new version"""
+        ChoiceRegistry.version += 1
+        ChoiceRegistry.choices = {}
+        ChoiceRegistry.helptexts = {}
+
+    def get_choices(field, position=None, subcat=None):
+        """Get a (copy of the) choice list for [field]"""
+
+        ChoiceRegistry.load()
+        key = (field, position, subcat)
+        choice_list = ChoiceRegistry.choices.get(key)
+        if choice_list is None:
+            choice_list = build_choice_list(field, position, subcat)
+            # Do not keep the default list that results from a failed load
+            if FieldChoiceIndex.loaded:
+                ChoiceRegistry.choices[key] = choice_list
+        return list(choice_list)
+
+    def get_help(field):
+        """Get the help text for [field]"""
+
+        ChoiceRegistry.load()
+        help_text = ChoiceRegistry.helptexts.get(field)
+        if help_text is None:
+            help_text = get_help(field)
+            if HelpChoiceIndex.loaded:
+                ChoiceRegistry.helptexts[field] = help_text
+        return help_text
+
+
 class CollbankModel(object):
     """This is the regular [models.Model], but then with processing functions"""
 
     specification = []
+    # Types of specification entries that create or change other rows
+    savepoint_types = ["fkc", "fkob", "m2o", "func"]
 
     def custom_add(self, oItem, oParams, **kwargs):
-        """Add an object according to the specifications provided"""
+        """Add an object according to the specifications provided
+
+        With an [errors] list in kwargs, a failing field is undone on its own and reported
+        in that list. Without it, the first failure is raised to the caller.
+        """
 
         oErr = ErrHandle()
         obj = self
@@ -490,6 +1046,11 @@ class CollbankModel(object):
             username = kwargs.get("username")
             bOverwriting = kwargs.get("overwriting", bOverwriting)
             keyfield = kwargs.get("keyfield", "path")
+            # One memo of FK targets for the whole import: it is passed on to the sub-components
+            memo = kwargs.get("memo")
+            if memo is None:
+                memo = {}
+                kwargs['memo'] = memo
 
             if not bOverwriting or bAllowOverwriting and bOverwriting:
                 # Yes, we may continue! Process all fields in the specification
@@ -503,136 +1064,145 @@ class CollbankModel(object):
                     readonly = oField.get('readonly', False)
 
                     # Can we process this entry?
-                    if value != None and value != "" and not readonly:
-                        # Get some more parameters of the entry, which are for processing
-                        path = oField.get("path")
-                        type = oField.get("type")
-
-                        # ======= DEBUGGING ===========
-                        if path.lower() == "resource":
-                            iStop = 1
-                        # =============================
-
-                        # If this is fieldchoice, we need to change the [value] appropriately
-                        fieldchoice = oField.get("fieldchoice")
-                        if not fieldchoice is None:
-                            if isinstance(value, list):
-                                vlist = []
-                                for onevalue in value:
-                                    vlist.append(choice_value(fieldchoice, onevalue))
-                                value = vlist
-                            else:
-                                iBack = choice_value(fieldchoice, value)
-                                # But what if we end up not knowing this value??
-                                if iBack < 0:
-                                    # The value is not known - do we have an alternative field??
-                                    alternative = oField.get("alternative")
-                                    if not alternative is None:
-                                        # Set the alternative field
-                                        setattr(obj, alternative, value)
-                                        # Make sure that we set the fieldchoice field to 'other'
-                                        value = choice_value(fieldchoice, "other")
+                    if value == None or value == "" or readonly:
+                        continue
+                    try:
+                        # Sub-components get their own savepoint: a failing one is undone on its own
+                        with transaction.atomic() if oField.get("type") in CollbankModel.savepoint_types else nullcontext():
+                            # Get some more parameters of the entry, which are for processing
+                            path = oField.get("path")
+                            type = oField.get("type")
+
+                            # ======= DEBUGGING ===========
+                            if path.lower() == "resource":
+                                iStop = 1
+                            # =============================
+
+                            # If this is fieldchoice, we need to change the [value] appropriately
+                            fieldchoice = oField.get("fieldchoice")
+                            if not fieldchoice is None:
+                                if isinstance(value, list):
+                                    vlist = []
+                                    for onevalue in value:
+                                        vlist.append(choice_value(fieldchoice, onevalue))
+                                    value = vlist
+                                else:
+                                    iBack = choice_value(fieldchoice, value)
+                                    # But what if we end up not knowing this value??
+                                    if iBack < 0:
+                                        # The value is not known - do we have an alternative field??
+                                        alternative = oField.get("alternative")
+                                        if not alternative is None:
+                                            # Set the alternative field
+                                            setattr(obj, alternative, value)
+                                            # Make sure that we set the fieldchoice field to 'other'
+                                            value = choice_value(fieldchoice, "other")
+                                        else:
+                                            value = iBack
                                     else:
                                         value = iBack
-                                else:
-                                    value = iBack
-
-                        # Processing depends on the [type]
-                        if type == "field":
-                            # See if this is accidentily a list
-                            if isinstance(value, list):
-                                # Get the value
-                                if len(value) == 0:
-                                    value = None
-                                else:
-                                    value = value[0]
-                            # Note overwriting
-                            old_value = getattr(obj, path)
-                            if value != old_value:
-                                # Set the correct field's value
-                                setattr(obj, path, value)
-                        elif type == "fk" or type == "fkc":
-                            fkfield = oField.get("fkfield")
-                            model = oField.get("model")
-                            vfield = oField.get("vfield")
-                            if fkfield != None and model != None:
-                                # Find an item with the name for the particular model
-                                cls = apps.app_configs[app_name].get_model(model)
-
-                                if type == "fk":
-                                    if vfield is None:
-                                        # Find this particular instance
-                                        instance = cls.objects.filter(**{"{}".format(fkfield): value}).first()
+
+                            # Processing depends on the [type]
+                            if type == "field":
+                                # See if this is accidentily a list
+                                if isinstance(value, list):
+                                    # Get the value
+                                    if len(value) == 0:
+                                        value = None
                                     else:
+                                        value = value[0]
+                                # Note overwriting
+                                old_value = getattr(obj, path)
+                                if value != old_value:
+                                    # Set the correct field's value
+                                    setattr(obj, path, value)
+                            elif type == "fk" or type == "fkc":
+                                fkfield = oField.get("fkfield")
+                                model = oField.get("model")
+                                vfield = oField.get("vfield")
+                                if fkfield != None and model != None:
+                                    # Find an item with the name for the particular model
+                                    cls = apps.app_configs[app_name].get_model(model)
+
+                                    if type == "fk":
                                         # Find this particular instance
-                                        instance = cls.objects.filter(**{"{}".format(vfield): value}).first()
-                                    if instance is None:
-                                        # There is no such instance (yet): NOW WHAT??
-                                        pass
-                                    else:
-                                        old_value = getattr(obj,path)
-                                        if instance != old_value:
+                                        lookup = fkfield if vfield is None else vfield
+                                        instance = CollbankModel.get_fk_target(memo, cls, lookup, value)
+                                        if instance is None:
+                                            # There is no such instance (yet): NOW WHAT??
+                                            pass
+                                        else:
+                                            old_value = getattr(obj,path)
+                                            if instance != old_value:
+                                                setattr(obj, path, instance)
+                                    elif type == "fkc":
+                                        # Need to create an item
+                                        if vfield is None:
+                                            # Find this particular instance
+                                            oErr.Status("custom_add: [fkc] has no [vfield] specified")
+                                            pass
+                                        else:
+                                            # Create an instance appropriately
+                                            # NOTE: this is one row per field, and its pk is needed for the FK of [obj] right away
+                                            instance = cls.objects.create(**{'{}'.format(fkfield): obj, '{}'.format(vfield): value})
+                                            # Set the FK appropriately
                                             setattr(obj, path, instance)
-                                elif type == "fkc":
-                                    # Need to create an item
-                                    if vfield is None:
-                                        # Find this particular instance
-                                        oErr.Status("custom_add: [fkc] has no [vfield] specified")
-                                        pass
-                                    else:
-                                        # Create an instance appropriately
-                                        instance = cls.objects.create(**{'{}'.format(fkfield): obj, '{}'.format(vfield): value})
-                                        # Set the FK appropriately
-                                        setattr(obj, path, instance)
-                        elif type == "fkob":
-                            if not value is None:
-                                model = oField.get("model")
-                                # Find an item with the name for the particular model
-                                cls = apps.app_configs[app_name].get_model(model)
-
-                                # Use the custom_set of that model
-                                fkob = cls.get_instance(value, params, **kwargs)
-                                # fkob.custom_add(value, params, **kwargs)
-
-                                # Make sure this is added to collection
-                                setattr(obj, path, fkob)
-
-                        elif type == "m2o":
-                            fkfield = oField.get("fkfield")
-                            model = oField.get("model")
-                            vfield = oField.get("vfield")
-                            if not fkfield is None and not model is None:
-                                # Find an item with the name for the particular model
-                                cls = apps.app_configs[app_name].get_model(model)
-                                if vfield is None:
-                                    if False:
-                                        # Divide the values
-                                        lst_val = [ value ] if isinstance(value, str) or isinstance(value, int) else value
-                                        for oneval in lst_val:
-                                            # Create a new instance
-                                            instance = cls.get_instance(oneval, params, **kwargs)
+                            elif type == "fkob":
+                                if not value is None:
+                                    model = oField.get("model")
+                                    # Find an item with the name for the particular model
+                                    cls = apps.app_configs[app_name].get_model(model)
 
-                                            # Make sure the FK is set correctly
-                                            setattr(instance, fkfield, obj)
-                                    else:
-                                        # Create a new instance
-                                        params[fkfield] = obj
-                                        if isinstance(value, list):
-                                            for onevalue in value:
-                                                instance = cls.get_instance(onevalue, params, **kwargs)
+                                    # Use the custom_set of that model
+                                    fkob = cls.get_instance(value, params, **kwargs)
+                                    # fkob.custom_add(value, params, **kwargs)
+
+                                    # Make sure this is added to collection
+                                    setattr(obj, path, fkob)
+
+                            elif type == "m2o":
+                                fkfield = oField.get("fkfield")
+                                model = oField.get("model")
+                                vfield = oField.get("vfield")
+                                if not fkfield is None and not model is None:
+                                    # Find an item with the name for the particular model
+                                    cls = apps.app_configs[app_name].get_model(model)
+                                    if vfield is None:
+                                        if False:
+                                            # Divide the values
+                                            lst_val = [ value ] if isinstance(value, str) or isinstance(value, int) else value
+                                            for oneval in lst_val:
+                                                # Create a new instance
+                                                instance = cls.get_instance(oneval, params, **kwargs)
+
+                                                # Make sure the FK is set correctly
+                                                setattr(instance, fkfield, obj)
                                         else:
-                                            instance = cls.get_instance(value, params, **kwargs)
-                                else:
-                                    # A vfield has been specified
-                                    if isinstance(value, list):
-                                        for onevalue in value:
-                                            instance = cls.objects.create(**{'{}'.format(fkfield): obj, '{}'.format(vfield): onevalue})
+                                            # Create a new instance
+                                            params[fkfield] = obj
+                                            if isinstance(value, list):
+                                                for onevalue in value:
+                                                    instance = cls.get_instance(onevalue, params, **kwargs)
+                                            else:
+                                                instance = cls.get_instance(value, params, **kwargs)
                                     else:
-                                        instance = cls.objects.create(**{'{}'.format(fkfield): obj, '{}'.format(vfield): value})
-
-                        elif type == "func":
-                            # Set the KV in a special way
-                            obj.custom_set(path, value, **kwargs)
+                                        # A vfield has been specified: add all values in one go
+                                        lst_value = value if isinstance(value, list) else [ value ]
+                                        cls.objects.bulk_create([cls(**{fkfield: obj, vfield: onevalue}) for onevalue in lst_value])
+                                        # bulk_create() does not send post_save
+                                        GraphVersion.add_changed(obj)
+
+                            elif type == "func":
+                                # Set the KV in a special way
+                                obj.custom_set(path, value, **kwargs)
+                    except:
+                        lst_error = kwargs.get("errors")
+                        if lst_error is None:
+                            # Without an error list, the caller expects the whole import to stop
+                            raise
+                        msg = oErr.get_error_message()
+                        oErr.DoError("CollbankModel/custom_add [{}]".format(oField.get('name')))
+                        lst_error.append("{}: {}".format(oField.get('name'), msg))
 
                 # Make sure to save changes
                 obj.save()
@@ -640,9 +1210,27 @@ class CollbankModel(object):
         except:
             msg = oErr.get_error_message()
             oErr.DoError("CollbankModel/custom_add")
+            lst_error = kwargs.get("errors")
+            if lst_error is None:
+                raise
+            lst_error.append(msg)
         return obj
 
 
+    def get_fk_target(memo, cls, lookup, value):
+        """Get the first [cls] instance with [lookup] equal to [value], remembering it in [memo]"""
+
+        try:
+            key = (cls.__name__, lookup, value)
+            hash(key)
+        except TypeError:
+            # Lists and dictionaries cannot be remembered
+            return cls.objects.filter(**{lookup: value}).first()
+        if not key in memo:
+            memo[key] = cls.objects.filter(**{lookup: value}).first()
+        return memo[key]
+
+
 class HelpItem(models.Model):
     """A help item that can be shown in the collbank/about page"""
 
@@ -680,7 +1268,7 @@ class Title(models.Model):
     """Title of this collection"""
 
     # [1; f]
-    name = models.TextField("Title used for the collection as a whole", help_text=get_help('title'))
+    name = models.TextField("Title used for the collection as a whole", help_text=get_help_lazy('title'))
     # [1]     Each collection can have [1-n] titles
     collection = models.ForeignKey("Collection", blank=False, null=False, default=1, on_delete=models.CASCADE, related_name="collection12m_title")
 
@@ -703,7 +1291,7 @@ class Owner(models.Model):
     """The legal owner"""
 
     # [1; f]
-    name = models.TextField("One of the collection or resource owners", help_text=get_help('owner'))
+    name = models.TextField("One of the collection or resource owners", help_text=get_help_lazy('owner'))
     # [1]     Each collection can have [0-n] owvers
     collection = models.ForeignKey("Collection", blank=False, null=False, on_delete=models.CASCADE, default=1, related_name="collection12m_owner")
 
@@ -775,7 +1363,7 @@ class Media(CollbankModel, models.Model):
 class MediaFormat(models.Model):
     """Format of a medium"""
 
-    name = models.CharField("Format of a medium", choices=build_choice_list(MEDIA_FORMAT), max_length=5, help_text=get_help(MEDIA_FORMAT), default='0')
+    name = LazyChoiceCharField("Format of a medium", choices=get_choices_lazy(MEDIA_FORMAT), max_length=5, help_text=get_help_lazy(MEDIA_FORMAT), default='0')
     # [1]     Each [Media] object can have [0-n] MediaFormat items
     media = models.ForeignKey(Media, blank=False, null=False, default=1, on_delete=models.CASCADE, related_name="mediaformat12m_media")
 
@@ -795,7 +1383,7 @@ class MediaFormat(models.Model):
 class AnnotationFormat(models.Model):
     """Format of an annotation"""
 
-    name = models.CharField("Annotation format", choices=build_choice_list(ANNOTATION_FORMAT), max_length=5, help_text=get_help(ANNOTATION_FORMAT), default='0')
+    name = LazyChoiceCharField("Annotation format", choices=get_choices_lazy(ANNOTATION_FORMAT), max_length=5, help_text=get_help_lazy(ANNOTATION_FORMAT), default='0')
     # [1] link to the parent Annotation (many-to-one relation)
     annotation = models.ForeignKey("Annotation", blank=False, null=False, default=-1, on_delete=models.CASCADE, related_name = "annotation_formats")
 
@@ -816,13 +1404,13 @@ class Annotation(CollbankModel, models.Model):
     """Description of one annotation layer in a resource"""
 
     # [1] Obligatory type, but it can be '0'
-    type = models.CharField("Kind of annotation", choices=build_choice_list(ANNOTATION_TYPE), 
-                            max_length=5, help_text=get_help(ANNOTATION_TYPE), default='0')
+    type = LazyChoiceCharField("Kind of annotation", choices=get_choices_lazy(ANNOTATION_TYPE), 
+                            max_length=5, help_text=get_help_lazy(ANNOTATION_TYPE), default='0')
     # [0-1] Optional other type in a string
     othertype = models.CharField("kind of 'other' annotation", blank=True, null=True, max_length=MAX_STRING_LEN)
     # [0-1] Optional mode (it can be '0'
-    mode = models.CharField("Annotation mode", choices=build_choice_list(ANNOTATION_MODE), 
-                            max_length=5, help_text=get_help(ANNOTATION_MODE), default='0')
+    mode = LazyChoiceCharField("Annotation mode", choices=get_choices_lazy(ANNOTATION_MODE), 
+                            max_length=5, help_text=get_help_lazy(ANNOTATION_MODE), default='0')
 
     # [1] Annotation belongs to a resource
     resource = models.ForeignKey("Resource", blank=False, null=False, default=-1 , 
@@ -907,7 +1495,7 @@ class TotalSize(CollbankModel, models.Model):
 
     # size = models.IntegerField("Size of the collection", default=0)
     size = models.CharField("Size of the collection", default="unknown", max_length=80)
-    sizeUnit = models.CharField("Units", help_text=get_help(SIZEUNIT), max_length=50, default='MB')
+    sizeUnit = models.CharField("Units", help_text=get_help_lazy(SIZEUNIT), max_length=50, default='MB')
     # [1]     Each resource can have [0-n] total-sizes
     resource = models.ForeignKey("Resource", blank=False, null=False, default=1, on_delete=models.CASCADE, related_name="totalsize12m_resource")
 
@@ -960,7 +1548,7 @@ class TotalCollectionSize(CollbankModel, models.Model):
     # [1]
     size = models.CharField("Size of the collection", default="unknown", max_length=80)
     # [1]
-    sizeUnit = models.CharField("Units", help_text=get_help(SIZEUNIT), max_length=50, default='MB')
+    sizeUnit = models.CharField("Units", help_text=get_help_lazy(SIZEUNIT), max_length=50, default='MB')
     # [1]     Each collection can have [0-n] total-sizes
     collection = models.ForeignKey("Collection", blank=False, null=False, default=1, on_delete=models.CASCADE, related_name="collection12m_totalsize")
 
@@ -1012,8 +1600,8 @@ class Modality(models.Model):
     class Meta:
         verbose_name_plural = "Modalities"
 
-    name = models.CharField("Resource modality", choices=build_choice_list(RESOURCE_MODALITY), max_length=5, 
-                            help_text=get_help(RESOURCE_MODALITY), default='0')
+    name = LazyChoiceCharField("Resource modality", choices=get_choices_lazy(RESOURCE_MODALITY), max_length=5, 
+                            help_text=get_help_lazy(RESOURCE_MODALITY), default='0')
     # [1] Link to the parent Resource instance
     resource = models.ForeignKey("Resource", blank=False, null=False, default=-1, on_delete=models.CASCADE, related_name="modalities")
 
@@ -1100,7 +1688,7 @@ class CountryIso(models.Model):
         oErr = ErrHandle()
         obj = None
         try:
-            obj = CountryIso.objects.filter(alpha2__iexact=alpha2).first()
+            obj = ReferenceIndex.get_country(alpha2)
         except:
             msg = oErr.get_error_message()
             oErr.DoError("get_byalpha2")
@@ -1113,7 +1701,7 @@ class City(models.Model):
     class Meta:
         verbose_name_plural = "Cities"
 
-    name = models.CharField("Place (city)", max_length=80, help_text=get_help(PROVENANCE_GEOGRAPHIC_PLACE))
+    name = models.CharField("Place (city)", max_length=80, help_text=get_help_lazy(PROVENANCE_GEOGRAPHIC_PLACE))
     # [1]     Each geographic provenance can have [0-n] cities
     geographicProvenance = models.ForeignKey("GeographicProvenance", blank=False, null=False, default=-1, on_delete=models.CASCADE, related_name="cities")
 
@@ -1162,7 +1750,7 @@ class GeographicProvenance(models.Model):
                 if not oCountry is None:
                     sCountryCoding = oCountry.get("CountryCoding")
                     if not sCountryCoding is None:
-                        obj = CountryIso.objects.filter(alpha2__iexact=sCountryCoding).first()
+                        obj = ReferenceIndex.get_country(sCountryCoding)
         except:
             msg = oErr.get_error_message()
             oErr.DoError("get_countryiso")
@@ -1233,7 +1821,7 @@ class Genre(models.Model):
     """Genre of collection as a whole"""
 
     # (0-n; c)
-    name = models.CharField("Collection genre", choices=build_choice_list(GENRE_NAME), max_length=5, help_text=get_help(GENRE_NAME), default='0')
+    name = LazyChoiceCharField("Collection genre", choices=get_choices_lazy(GENRE_NAME), max_length=5, help_text=get_help_lazy(GENRE_NAME), default='0')
     # [1]     Each collection can have [1-n] genres
     collection = models.ForeignKey("Collection", blank=False, null=False, default=1, on_delete=models.CASCADE, related_name="collection12m_genre")
 
@@ -1255,7 +1843,7 @@ class Genre(models.Model):
 class LingualityType(models.Model):
     """Type of linguality"""
 
-    name = models.CharField("Type of linguality", choices=build_choice_list(LINGUALITY_TYPE), max_length=5, help_text=get_help(LINGUALITY_TYPE), default='0')
+    name = LazyChoiceCharField("Type of linguality", choices=get_choices_lazy(LINGUALITY_TYPE), max_length=5, help_text=get_help_lazy(LINGUALITY_TYPE), default='0')
     # [1]     Each Linguality instance can have [0-n] linguality types
     linguality = models.ForeignKey("Linguality", blank=False, null=False, default=1, on_delete=models.CASCADE, related_name="linguality_types")
 
@@ -1278,7 +1866,7 @@ class LingualityNativeness(models.Model):
     class Meta:
         verbose_name_plural = "Linguality Nativeness Types"
 
-    name = models.CharField("Nativeness type of linguality", choices=build_choice_list(LINGUALITY_NATIVENESS), max_length=5, help_text=get_help(LINGUALITY_NATIVENESS), default='0')
+    name = LazyChoiceCharField("Nativeness type of linguality", choices=get_choices_lazy(LINGUALITY_NATIVENESS), max_length=5, help_text=get_help_lazy(LINGUALITY_NATIVENESS), default='0')
     # [1]     Each Linguality instance can have [0-n] linguality nativenesses
     linguality = models.ForeignKey("Linguality", blank=False, null=False, on_delete=models.CASCADE, default=1, related_name="linguality_nativenesses")
 
@@ -1298,7 +1886,7 @@ class LingualityNativeness(models.Model):
 class LingualityAgeGroup(models.Model):
     """Age group of linguality"""
 
-    name = models.CharField("Age group of linguality", choices=build_choice_list(LINGUALITY_AGEGROUP), max_length=5, help_text=get_help(LINGUALITY_AGEGROUP), default='0')
+    name = LazyChoiceCharField("Age group of linguality", choices=get_choices_lazy(LINGUALITY_AGEGROUP), max_length=5, help_text=get_help_lazy(LINGUALITY_AGEGROUP), default='0')
     # [1]     Each Linguality instance can have [0-n] linguality age groups
     linguality = models.ForeignKey("Linguality", blank=False, null=False, default=1, on_delete=models.CASCADE, related_name="linguality_agegroups")
 
@@ -1321,7 +1909,7 @@ class LingualityStatus(models.Model):
     class Meta:
         verbose_name_plural = "Linguality statuses"
 
-    name = models.CharField("Status of linguality", choices=build_choice_list(LINGUALITY_STATUS), max_length=5, help_text=get_help(LINGUALITY_STATUS), default='0')
+    name = LazyChoiceCharField("Status of linguality", choices=get_choices_lazy(LINGUALITY_STATUS), max_length=5, help_text=get_help_lazy(LINGUALITY_STATUS), default='0')
     # [1]     Each Linguality instance can have [0-n] linguality statuses
     linguality = models.ForeignKey("Linguality", blank=False, null=False, default=1, on_delete=models.CASCADE, related_name="linguality_statuses")
 
@@ -1341,7 +1929,7 @@ class LingualityStatus(models.Model):
 class LingualityVariant(models.Model):
     """Variant of linguality"""
 
-    name = models.CharField("Variant of linguality", choices=build_choice_list(LINGUALITY_VARIANT), max_length=5, help_text=get_help(LINGUALITY_VARIANT), default='0')
+    name = LazyChoiceCharField("Variant of linguality", choices=get_choices_lazy(LINGUALITY_VARIANT), max_length=5, help_text=get_help_lazy(LINGUALITY_VARIANT), default='0')
     # [1]     Each Linguality instance can have [0-n] linguality variants
     linguality = models.ForeignKey("Linguality", blank=False, null=False, default=1, on_delete=models.CASCADE, related_name="linguality_variants")
 
@@ -1361,7 +1949,7 @@ class LingualityVariant(models.Model):
 class MultilingualityType(models.Model):
     """Type of multi-linguality"""
 
-    name = models.CharField("Type of multi-linguality", choices=build_choice_list(LINGUALITY_MULTI), max_length=5, help_text=get_help(LINGUALITY_MULTI), default='0')
+    name = LazyChoiceCharField("Type of multi-linguality", choices=get_choices_lazy(LINGUALITY_MULTI), max_length=5, help_text=get_help_lazy(LINGUALITY_MULTI), default='0')
     # [1]     Each Linguality instance can have [0-n] multilinguality types
     linguality = models.ForeignKey("Linguality", blank=False, null=False, default=1, on_delete=models.CASCADE, related_name="multilinguality_types")
 
@@ -1505,14 +2093,14 @@ class LanguageName(models.Model):
 
                 if sLngName is None or sLngName == "":
                     # Only search for the code
-                    obj = LanguageName.objects.filter(iso__code=sCode).first()
+                    obj = ReferenceIndex.get_langname_bycode(sCode)
                 else:
                     # (1) Specific search: name + code
-                    obj = LanguageName.objects.filter(name__iexact=sLngName, iso__code=sCode).first()
+                    obj = ReferenceIndex.get_langname_bynamecode(sLngName, sCode)
 
                     # (2) Less specific?
                     if obj is None:
-                        obj = LanguageName.objects.filter(iso__code=sCode).first()
+                        obj = ReferenceIndex.get_langname_bycode(sCode)
 
         except:
             msg = oErr.get_error_message()
@@ -1520,12 +2108,118 @@ class LanguageName(models.Model):
         return obj
     
 
+
+class ReferenceIndex(object):
+    """Process-wide in-memory index of CountryIso, LanguageIso and LanguageName
+
+    The index is loaded with two queries on first use, and it is cleared again
+    through the post_save and post_delete signals of these three tables
+    """
+
+    loaded = False
+    # Keyed by alpha2 in upper case
+    country_by_alpha2 = {}
+    # Keyed by id: LanguageName (with its [iso] already filled in)
+    langname_by_id = {}
+    # Keyed by code in lower case: the first LanguageName for that code
+    langname_by_code = {}
+    # Keyed by the case-folded name: the first LanguageName with that name
+    langname_by_name = {}
+    # Keyed by (case-folded name, code in lower case)
+    langname_by_namecode = {}
+
+    def load():
+        """Read the three tables into the dictionaries"""
+
+        oErr = ErrHandle()
+        try:
+            country_by_alpha2 = {}
+            langname_by_id = {}
+            langname_by_code = {}
+            langname_by_name = {}
+            langname_by_namecode = {}
+            # Order by id, so that the first row wins, just like [.first()] did
+            for country in CountryIso.objects.all().order_by('id'):
+                country_by_alpha2.setdefault(country.alpha2.upper(), country)
+            for langname in LanguageName.objects.select_related('iso').order_by('id'):
+                sName = langname.name.casefold()
+                sCode = langname.iso.code.lower()
+                langname_by_id[langname.id] = langname
+                langname_by_code.setdefault(sCode, langname)
+                langname_by_name.setdefault(sName, langname)
+                langname_by_namecode.setdefault((sName, sCode), langname)
+            # Swap in the new dictionaries in one go
+            ReferenceIndex.country_by_alpha2 = country_by_alpha2
+            ReferenceIndex.langname_by_id = langname_by_id
+            ReferenceIndex.langname_by_code = langname_by_code
+            ReferenceIndex.langname_by_name = langname_by_name
+            ReferenceIndex.langname_by_namecode = langname_by_namecode
+            ReferenceIndex.loaded = True
+        except:
+            msg = oErr.get_error_message()
+            oErr.DoError("ReferenceIndex/load")
+
+    def invalidate():
+        """Make sure the index gets re-loaded upon next use"""
+        ReferenceIndex.loaded = False
+
+    def get_country(alpha2):
+        """Get the CountryIso for [alpha2] (case-insensitive)"""
+
+        if not ReferenceIndex.loaded:
+            ReferenceIndex.load()
+        return ReferenceIndex.country_by_alpha2.get(alpha2.strip().upper())
+
+    def get_langname(id):
+        """Get the LanguageName with this [id]"""
+
+        if not ReferenceIndex.loaded:
+            ReferenceIndex.load()
+        return ReferenceIndex.langname_by_id.get(id)
+
+    def get_langname_bycode(sCode):
+        """Get the first LanguageName for the ISO-639-3 [sCode]"""
+
+        if sCode is None:
+            return None
+        if not ReferenceIndex.loaded:
+            ReferenceIndex.load()
+        return ReferenceIndex.langname_by_code.get(sCode.strip().lower())
+
+    def get_langname_byname(sName):
+        """Get the first LanguageName called [sName] (case-insensitive)"""
+
+        if not ReferenceIndex.loaded:
+            ReferenceIndex.load()
+        return ReferenceIndex.langname_by_name.get(sName.strip().casefold())
+
+    def get_langname_bynamecode(sName, sCode):
+        """Get the first LanguageName called [sName] with the ISO-639-3 [sCode]"""
+
+        if sName is None or sCode is None:
+            return None
+        if not ReferenceIndex.loaded:
+            ReferenceIndex.load()
+        return ReferenceIndex.langname_by_namecode.get((sName.strip().casefold(), sCode.strip().lower()))
+
+
+@receiver(post_save, sender=CountryIso)
+@receiver(post_delete, sender=CountryIso)
+@receiver(post_save, sender=LanguageIso)
+@receiver(post_delete, sender=LanguageIso)
+@receiver(post_save, sender=LanguageName)
+@receiver(post_delete, sender=LanguageName)
+def reference_changed(sender, **kwargs):
+    """Any change in the reference tables invalidates the index"""
+    ReferenceIndex.invalidate()
+
+
 class Language(models.Model):
     """Language that is used in this collection"""
 
     # [1] Obligatory link to this language's entry inside the table FieldChoice
-    name = models.CharField("Language in collection", choices=build_choice_list("language.name"),
-                            max_length=5, help_text=get_help("language.name"), default='0')
+    name = LazyChoiceCharField("Language in collection", choices=get_choices_lazy("language.name"),
+                            max_length=5, help_text=get_help_lazy("language.name"), default='0')
     # [0-1] To be constructed: link to correct entry in [LanguageName]
     langname = models.ForeignKey(LanguageName, blank=True, null=True, on_delete=models.CASCADE, related_name = "langname_languages")
     
@@ -1659,7 +2353,7 @@ class LanguageDisorder(models.Model):
     """Language that is used in this collection"""
 
     # [1]
-    name = models.CharField("Language disorder", max_length=50, help_text=get_help("languagedisorder.name"), default='unknown')
+    name = models.CharField("Language disorder", max_length=50, help_text=get_help_lazy("languagedisorder.name"), default='unknown')
     # [1]     Each collection can have [0-n] language disorders
     collection = models.ForeignKey("Collection", blank=False, null=False, default=1, on_delete=models.CASCADE, related_name="collection12m_languagedisorder")
 
@@ -1683,9 +2377,9 @@ class Relation(CollbankModel, models.Model):
     """Language that is used in this collection"""
 
     # [1]
-    name = models.CharField("Summary", max_length=80, help_text=get_help(RELATION_NAME ), default='-')
+    name = models.CharField("Summary", max_length=80, help_text=get_help_lazy(RELATION_NAME ), default='-')
     # [0-1] Type of relation
-    rtype = models.CharField(choices=build_choice_list(RELATION_TYPE), max_length=5, help_text=get_help(RELATION_TYPE), default='0', verbose_name="type of relation")
+    rtype = LazyChoiceCharField(choices=get_choices_lazy(RELATION_TYPE), max_length=5, help_text=get_help_lazy(RELATION_TYPE), default='0', verbose_name="type of relation")
     # [0-1] The collection with which the relation holds
     related = models.ForeignKey("Collection", blank=True, null=True, on_delete=models.CASCADE, related_name="relatedcollection", verbose_name="with collection")
     # [0-1] The externalcollection with which the relation holds
@@ -1790,7 +2484,7 @@ class Domain(models.Model):
     """Domain"""
 
     # Description of this domain (to be copied from [DomainDescription]
-    name = models.TextField("Domain", help_text=get_help(DOMAIN_NAME), default='0')
+    name = models.TextField("Domain", help_text=get_help_lazy(DOMAIN_NAME), default='0')
     # [1]     Each collection can have [0-n] domains
     collection = models.ForeignKey("Collection", blank=False, null=False, default=1, on_delete=models.CASCADE, related_name="collection12m_domain")
 
@@ -1819,7 +2513,7 @@ class AccessAvailability(models.Model):
     class Meta:
         verbose_name_plural = "Access availabilities"
 
-    name = models.CharField("Access availability", choices=build_choice_list(ACCESS_AVAILABILITY), max_length=5, help_text=get_help(ACCESS_AVAILABILITY), default='0')
+    name = LazyChoiceCharField("Access availability", choices=get_choices_lazy(ACCESS_AVAILABILITY), max_length=5, help_text=get_help_lazy(ACCESS_AVAILABILITY), default='0')
     # [1]     Each access instance can have [0-n] availabilities
     access = models.ForeignKey("Access", blank=False, null=False, default=-1, on_delete=models.CASCADE, related_name="acc_availabilities")
 
@@ -1839,7 +2533,7 @@ class AccessAvailability(models.Model):
 class LicenseName(models.Model):
     """Name of the license"""
 
-    name = models.TextField("Name of the license", help_text=get_help('access.licenseName'))
+    name = models.TextField("Name of the license", help_text=get_help_lazy('access.licenseName'))
     # [1]     Each access instance can have [0-n] licence Names
     access = models.ForeignKey("Access", blank=False, null=False, default=-1, on_delete=models.CASCADE, related_name="acc_licnames")
 
@@ -1859,7 +2553,7 @@ class LicenseName(models.Model):
 class LicenseUrl(models.Model):
     """URL of the license"""
 
-    name = models.URLField("URL of the license", help_text=get_help('access.licenseURL'))
+    name = models.URLField("URL of the license", help_text=get_help_lazy('access.licenseURL'))
     # [1]     Each access instance can have [0-n] license URLs
     access = models.ForeignKey("Access", blank=False, null=False, default=-1, on_delete=models.CASCADE, related_name="acc_licurls")
 
@@ -1882,8 +2576,8 @@ class NonCommercialUsageOnly(models.Model):
     class Meta:
         verbose_name_plural = "Non-commercial usage only types"
 
-    name = models.CharField("Non-commercial usage only access", choices=build_choice_list(ACCESS_NONCOMMERCIAL ), 
-                            max_length=5, help_text=get_help(ACCESS_NONCOMMERCIAL ), default='0')
+    name = LazyChoiceCharField("Non-commercial usage only access", choices=get_choices_lazy(ACCESS_NONCOMMERCIAL ), 
+                            max_length=5, help_text=get_help_lazy(ACCESS_NONCOMMERCIAL ), default='0')
 
     def __str__(self):
         return choice_english(ACCESS_NONCOMMERCIAL, self.name)
@@ -1901,9 +2595,9 @@ class NonCommercialUsageOnly(models.Model):
 class AccessContact(models.Model):
     """Contact details for access"""
 
-    person = models.TextField("Access: person to contact", help_text=get_help('access.contact.person'))
-    address = models.TextField("Access: address of contact", help_text=get_help('access.contact.address'))
-    email = models.EmailField("Access: email of contact", help_text=get_help('access.contact.email'))
+    person = models.TextField("Access: person to contact", help_text=get_help_lazy('access.contact.person'))
+    address = models.TextField("Access: address of contact", help_text=get_help_lazy('access.contact.address'))
+    email = models.EmailField("Access: email of contact", help_text=get_help_lazy('access.contact.email'))
     # [1]     Each access instance can have [0-n] contacts
     access = models.ForeignKey("Access", blank=False, null=False, default=-1, on_delete=models.CASCADE, related_name="acc_contacts")
 
@@ -1945,7 +2639,7 @@ class AccessContact(models.Model):
 class AccessWebsite(models.Model):
     """Website to access the collection"""
 
-    name = models.URLField("Website to access the collection", help_text=get_help('access.website'))
+    name = models.URLField("Website to access the collection", help_text=get_help_lazy('access.website'))
     # [1]     Each access instance can have [0-n] websites
     access = models.ForeignKey("Access", blank=False, null=False, default=-1, on_delete=models.CASCADE, related_name="acc_websites")
 
@@ -1965,7 +2659,7 @@ class AccessWebsite(models.Model):
 class AccessMedium(models.Model):
     """Medium used to access a resource of the collection"""
 
-    format = models.CharField("Resource medium", choices=build_choice_list(ACCESS_MEDIUM ), max_length=5, help_text=get_help(ACCESS_MEDIUM ), default='0')
+    format = LazyChoiceCharField("Resource medium", choices=get_choices_lazy(ACCESS_MEDIUM ), max_length=5, help_text=get_help_lazy(ACCESS_MEDIUM ), default='0')
     # [1]     Each access instance can have [0-n] mediums
     access = models.ForeignKey("Access", blank=False, null=False, default=-1, on_delete=models.CASCADE, related_name="acc_mediums")
 
@@ -1992,9 +2686,9 @@ class Access(CollbankModel, models.Model):
     # nonCommercialUsageOnly (0-1;c yes; no)
     nonCommercialUsageOnly = models.ForeignKey(NonCommercialUsageOnly, blank=True, null=True, on_delete=models.SET_NULL)
     # ISBN (0-1;f)
-    ISBN = models.TextField("ISBN of collection", help_text=get_help('access.ISBN'), blank=True)
+    ISBN = models.TextField("ISBN of collection", help_text=get_help_lazy('access.ISBN'), blank=True)
     # ISLRN (0-1;f)
-    ISLRN = models.TextField("ISLRN of collection", help_text=get_help('access.ISLRN'), blank=True)
+    ISLRN = models.TextField("ISLRN of collection", help_text=get_help_lazy('access.ISLRN'), blank=True)
 
     # Scheme for downloading and uploading
     specification = [
@@ -2107,7 +2801,7 @@ class PID(models.Model):
         verbose_name_plural = "PIDs"
 
     # [1]
-    code = models.TextField("Persistent identifier of the collection", help_text=get_help('PID'))
+    code = models.TextField("Persistent identifier of the collection", help_text=get_help_lazy('PID'))
     # [1]     Each collection can have [0-n] PIDs
     collection = models.ForeignKey("Collection", blank=False, null=False, default=1, on_delete=models.CASCADE, related_name="collection12m_pid")
 
@@ -2129,7 +2823,7 @@ class PID(models.Model):
 class Organization(models.Model):
     """Name of organization"""
 
-    name = models.TextField("Name of organization", help_text=get_help('resourceCreator.organization'))
+    name = models.TextField("Name of organization", help_text=get_help_lazy('resourceCreator.organization'))
     # [1]     Each resourceCreator can have [0-n] organizations
     resourceCreator = models.ForeignKey("ResourceCreator", blank=False, null=False, default=-1, on_delete=models.CASCADE, related_name="organizations")
 
@@ -2146,7 +2840,7 @@ class Organization(models.Model):
 class Person(models.Model):
     """Name of person"""
 
-    name = models.TextField("Name of person", help_text=get_help('resourceCreator.person'))
+    name = models.TextField("Name of person", help_text=get_help_lazy('resourceCreator.person'))
     # [1]     Each resourceCreator can have [0-n] persons
     resourceCreator = models.ForeignKey("ResourceCreator", blank=False, null=False, default=-1, on_delete=models.CASCADE, related_name="persons")
 
@@ -2232,7 +2926,7 @@ class ResourceCreator(CollbankModel, models.Model):
 class DocumentationType(models.Model):
     """Kind of documentation"""
 
-    format = models.CharField("Kind of documentation", choices=build_choice_list(DOCUMENTATION_TYPE ), max_length=5, help_text=get_help(DOCUMENTATION_TYPE ), default='0')
+    format = LazyChoiceCharField("Kind of documentation", choices=get_choices_lazy(DOCUMENTATION_TYPE ), max_length=5, help_text=get_help_lazy(DOCUMENTATION_TYPE ), default='0')
     # [1]
     documentation = models.ForeignKey("Documentation", blank=False, null=False, default=1, on_delete=models.CASCADE, related_name="doc_types")
 
@@ -2252,7 +2946,7 @@ class DocumentationType(models.Model):
 class DocumentationFile(models.Model):
     """File name for documentation"""
 
-    name = models.TextField("File name for documentation", help_text=get_help('documentation.file'))
+    name = models.TextField("File name for documentation", help_text=get_help_lazy('documentation.file'))
     # [1]
     documentation = models.ForeignKey("Documentation", blank=False, null=False, default=1, on_delete=models.CASCADE, related_name="doc_files")
 
@@ -2273,7 +2967,7 @@ class DocumentationUrl(models.Model):
     """URL of documentation"""
 
     # [1] Obligatory name
-    name = models.URLField("URL of documentation", help_text=get_help('documentation.url'))
+    name = models.URLField("URL of documentation", help_text=get_help_lazy('documentation.url'))
     # [1]
     documentation = models.ForeignKey("Documentation", blank=False, null=False, default=1, on_delete=models.CASCADE, related_name="doc_urls")
 
@@ -2356,7 +3050,7 @@ class Documentation(CollbankModel, models.Model):
 class ValidationType(models.Model):
     """Validation type"""
 
-    name = models.CharField("Validation type", choices=build_choice_list(VALIDATION_TYPE), max_length=5, help_text=get_help(VALIDATION_TYPE), default='0')
+    name = LazyChoiceCharField("Validation type", choices=get_choices_lazy(VALIDATION_TYPE), max_length=5, help_text=get_help_lazy(VALIDATION_TYPE), default='0')
 
     def __str__(self):
         return choice_english(VALIDATION_TYPE, self.name)
@@ -2374,7 +3068,7 @@ class ValidationType(models.Model):
 class ValidationMethod(models.Model):
     """Validation method"""
 
-    name = models.CharField("Validation method", choices=build_choice_list(VALIDATION_METHOD), max_length=5, help_text=get_help(VALIDATION_METHOD), default='0')
+    name = LazyChoiceCharField("Validation method", choices=get_choices_lazy(VALIDATION_METHOD), max_length=5, help_text=get_help_lazy(VALIDATION_METHOD), default='0')
     # [1]
     validation = models.ForeignKey("Validation", blank=False, null=False, default=1, on_delete=models.CASCADE, related_name="validationmethods")
 
@@ -2457,7 +3151,7 @@ class Validation(CollbankModel, models.Model):
 class ProjectFunder(models.Model):
     """Funder of project"""
 
-    name = models.TextField("Funder of project", help_text=get_help('project.funder'))
+    name = models.TextField("Funder of project", help_text=get_help_lazy('project.funder'))
     # [1]
     project = models.ForeignKey("Project", blank=False, null=False, default=1, on_delete=models.CASCADE, related_name="funders")
 
@@ -2476,7 +3170,7 @@ class ProjectFunder(models.Model):
 class ProjectUrl(models.Model):
     """URL of project"""
 
-    name = models.URLField("URL of project", help_text=get_help('project.url'))
+    name = models.URLField("URL of project", help_text=get_help_lazy('project.url'))
 
     def __str__(self):
         return self.name
@@ -2492,7 +3186,7 @@ class Project(CollbankModel, models.Model):
     """Project supporting a resource from the collection"""
 
     # title (0-1; f)
-    title = models.TextField("Project title", help_text=get_help('project.title'))
+    title = models.TextField("Project title", help_text=get_help_lazy('project.title'))
     # url (0-1; f)
     URL = models.ForeignKey(ProjectUrl, blank=True, null=True, on_delete=models.SET_NULL)
 
@@ -2561,7 +3255,7 @@ class Project(CollbankModel, models.Model):
 class CharacterEncoding(models.Model):
     """Type of character-encoding"""
 
-    name = models.CharField("Character encoding", choices=build_choice_list(CHARACTERENCODING), max_length=5, help_text=get_help(CHARACTERENCODING), default='0')
+    name = LazyChoiceCharField("Character encoding", choices=get_choices_lazy(CHARACTERENCODING), max_length=5, help_text=get_help_lazy(CHARACTERENCODING), default='0')
     # [1]     Each written corpus can have [0-n] character encodings
     writtenCorpus = models.ForeignKey("WrittenCorpus", blank=False, null=False, default=1, on_delete=models.CASCADE, related_name="charenc_writtencorpora")
 
@@ -2582,9 +3276,9 @@ class WrittenCorpus(CollbankModel, models.Model):
         verbose_name_plural = "Written corpora"
 
     # numberOfAuthors:    (0-1;f)
-    numberOfAuthors = models.CharField("Number of authors", blank=True, help_text=get_help(WRITTENCORPUS_AUTHORNUMBER), max_length=20, default="unknown")
+    numberOfAuthors = models.CharField("Number of authors", blank=True, help_text=get_help_lazy(WRITTENCORPUS_AUTHORNUMBER), max_length=20, default="unknown")
     # authorDemographics: (0-1;f)
-    authorDemographics = models.TextField("Author demographics", blank=True, help_text=get_help(WRITTENCORPUS_AUTHORDEMOGRAPHICS), default='-')
+    authorDemographics = models.TextField("Author demographics", blank=True, help_text=get_help_lazy(WRITTENCORPUS_AUTHORDEMOGRAPHICS), default='-')
 
     # Scheme for downloading and uploading
     specification = [
@@ -2649,7 +3343,7 @@ class RecordingEnvironment(models.Model):
     """Environment for the recording"""
 
     # [1]
-    name = models.CharField("Environment for the recording", choices=build_choice_list(SPEECHCORPUS_RECORDINGENVIRONMENT), max_length=5, help_text=get_help(SPEECHCORPUS_RECORDINGENVIRONMENT), default='0')
+    name = LazyChoiceCharField("Environment for the recording", choices=get_choices_lazy(SPEECHCORPUS_RECORDINGENVIRONMENT), max_length=5, help_text=get_help_lazy(SPEECHCORPUS_RECORDINGENVIRONMENT), default='0')
     # [1]
     resource = models.ForeignKey("Resource", blank=False, null=False, default=-1 , on_delete=models.CASCADE, related_name="recordingenvironments")
 
@@ -2669,7 +3363,7 @@ class RecordingEnvironment(models.Model):
 class Channel(models.Model):
     """Channel for the speech corpus"""
 
-    name = models.CharField("Channel for the speech corpus", choices=build_choice_list(SPEECHCORPUS_CHANNEL), max_length=5, help_text=get_help(SPEECHCORPUS_CHANNEL), default='0')
+    name = LazyChoiceCharField("Channel for the speech corpus", choices=get_choices_lazy(SPEECHCORPUS_CHANNEL), max_length=5, help_text=get_help_lazy(SPEECHCORPUS_CHANNEL), default='0')
     # [1]
     resource = models.ForeignKey("Resource", blank=False, null=False, default=-1 , on_delete=models.CASCADE, related_name="channels")
 
@@ -2689,7 +3383,7 @@ class Channel(models.Model):
 class ConversationalType(models.Model):
     """Type of conversation"""
 
-    name = models.CharField("Type of conversation", choices=build_choice_list(SPEECHCORPUS_CONVERSATIONALTYPE), max_length=5, help_text=get_help(SPEECHCORPUS_CONVERSATIONALTYPE), default='0')
+    name = LazyChoiceCharField("Type of conversation", choices=get_choices_lazy(SPEECHCORPUS_CONVERSATIONALTYPE), max_length=5, help_text=get_help_lazy(SPEECHCORPUS_CONVERSATIONALTYPE), default='0')
     # [1]     Each speech corpus can have [0-n] conversational types
     speechCorpus = models.ForeignKey("SpeechCorpus", blank=False, null=False, default=1, on_delete=models.CASCADE, related_name="conversationaltypes")
 
@@ -2709,7 +3403,7 @@ class ConversationalType(models.Model):
 class RecordingCondition(models.Model):
     """Recording condition"""
 
-    name = models.TextField("Recording condition", help_text=get_help('speechcorpus.recordingConditions'))
+    name = models.TextField("Recording condition", help_text=get_help_lazy('speechcorpus.recordingConditions'))
     # [1]
     resource = models.ForeignKey("Resource", blank=False, null=False, default=-1 , on_delete=models.CASCADE, related_name="recordingconditions")
 
@@ -2730,7 +3424,7 @@ class RecordingCondition(models.Model):
 class SocialContext(models.Model):
     """Social context"""
 
-    name = models.CharField("Social context", choices=build_choice_list(SPEECHCORPUS_SOCIALCONTEXT), max_length=5, help_text=get_help(SPEECHCORPUS_SOCIALCONTEXT), default='0')
+    name = LazyChoiceCharField("Social context", choices=get_choices_lazy(SPEECHCORPUS_SOCIALCONTEXT), max_length=5, help_text=get_help_lazy(SPEECHCORPUS_SOCIALCONTEXT), default='0')
     # [1]
     resource = models.ForeignKey("Resource", blank=False, null=False, default=-1 , on_delete=models.CASCADE, related_name="socialcontexts")
 
@@ -2750,7 +3444,7 @@ class SocialContext(models.Model):
 class PlanningType(models.Model):
     """Type of planning"""
 
-    name = models.CharField("Type of planning", choices=build_choice_list(SPEECHCORPUS_PLANNINGTYPE), max_length=5, help_text=get_help(SPEECHCORPUS_PLANNINGTYPE), default='0')
+    name = LazyChoiceCharField("Type of planning", choices=get_choices_lazy(SPEECHCORPUS_PLANNINGTYPE), max_length=5, help_text=get_help_lazy(SPEECHCORPUS_PLANNINGTYPE), default='0')
     # [1]
     resource = models.ForeignKey("Resource", blank=False, null=False, default=-1 , on_delete=models.CASCADE, related_name="planningtypes")
 
@@ -2773,7 +3467,7 @@ class Interactivity(models.Model):
     class Meta:
         verbose_name_plural = "Interactivities"
 
-    name = models.CharField("Interactivity", choices=build_choice_list(SPEECHCORPUS_INTERACTIVITY), max_length=5, help_text=get_help(SPEECHCORPUS_INTERACTIVITY), default='0')
+    name = LazyChoiceCharField("Interactivity", choices=get_choices_lazy(SPEECHCORPUS_INTERACTIVITY), max_length=5, help_text=get_help_lazy(SPEECHCORPUS_INTERACTIVITY), default='0')
     # [1]
     resource = models.ForeignKey("Resource", blank=False, null=False, default=-1 , on_delete=models.CASCADE, related_name="interactivities")
 
@@ -2793,7 +3487,7 @@ class Interactivity(models.Model):
 class Involvement(models.Model):
     """Type of involvement"""
 
-    name = models.CharField("Type of involvement", choices=build_choice_list(SPEECHCORPUS_INVOLVEMENT), max_length=5, help_text=get_help(SPEECHCORPUS_INVOLVEMENT), default='0')
+    name = LazyChoiceCharField("Type of involvement", choices=get_choices_lazy(SPEECHCORPUS_INVOLVEMENT), max_length=5, help_text=get_help_lazy(SPEECHCORPUS_INVOLVEMENT), default='0')
     # [1]
     resource = models.ForeignKey("Resource", blank=False, null=False, default=-1 , on_delete=models.CASCADE, related_name="involvements")
 
@@ -2813,7 +3507,7 @@ class Involvement(models.Model):
 class Audience(models.Model):
     """Audience"""
 
-    name = models.CharField("Audience", choices=build_choice_list(SPEECHCORPUS_AUDIENCE), max_length=5, help_text=get_help(SPEECHCORPUS_AUDIENCE), default='0')
+    name = LazyChoiceCharField("Audience", choices=get_choices_lazy(SPEECHCORPUS_AUDIENCE), max_length=5, help_text=get_help_lazy(SPEECHCORPUS_AUDIENCE), default='0')
     # [1]
     resource = models.ForeignKey("Resource", blank=False, null=False, default=-1 , on_delete=models.CASCADE, related_name="audiences")
 
@@ -2834,13 +3528,13 @@ class AudioFormat(models.Model):
     """AudioFormat"""
 
     # speechCoding (0-1; f)
-    speechCoding = models.CharField("Speech coding", blank=True, help_text=get_help(AUDIOFORMAT_SPEECHCODING), max_length=25, default='unknown')
+    speechCoding = models.CharField("Speech coding", blank=True, help_text=get_help_lazy(AUDIOFORMAT_SPEECHCODING), max_length=25, default='unknown')
     # samplingFrequency (0-1; f)
-    samplingFrequency = models.CharField("Sampling frequency", blank=True, help_text=get_help('audioformat.samplingFrequency'), max_length=25, default='unknown')
+    samplingFrequency = models.CharField("Sampling frequency", blank=True, help_text=get_help_lazy('audioformat.samplingFrequency'), max_length=25, default='unknown')
     # compression  (0-1; f)
-    compression = models.CharField("Compression", blank=True, help_text=get_help('audioformat.compression'), max_length=25, default='unknown')
+    compression = models.CharField("Compression", blank=True, help_text=get_help_lazy('audioformat.compression'), max_length=25, default='unknown')
     # bitResolution  (0-1; f)
-    bitResolution = models.CharField("Bit resolution", blank=True, help_text=get_help('audioformat.bitResolution'), max_length=25, default='unknown')
+    bitResolution = models.CharField("Bit resolution", blank=True, help_text=get_help_lazy('audioformat.bitResolution'), max_length=25, default='unknown')
     # [1]     Each speech corpus can have [0-n] AudioFormats
     speechCorpus = models.ForeignKey("SpeechCorpus", blank=False, null=False, default=1, on_delete=models.CASCADE, related_name="audioformats")
 
@@ -2866,14 +3560,14 @@ class SpeechCorpus(CollbankModel, models.Model):
         verbose_name_plural = "Speech corpora"
 
     # durationOfEffectiveSpeech (0-1; f)
-    durationOfEffectiveSpeech = models.TextField("Duration of effective speech",blank=True, help_text=get_help('speechcorpus.durationOfEffectiveSpeech'), default='0')
+    durationOfEffectiveSpeech = models.TextField("Duration of effective speech",blank=True, help_text=get_help_lazy('speechcorpus.durationOfEffectiveSpeech'), default='0')
     # durationOfFullDatabase (0-1; f)
-    durationOfFullDatabase = models.TextField("Duration of full database",blank=True, help_text=get_help('speechcorpus.durationOfFullDatabase'), default='0')
+    durationOfFullDatabase = models.TextField("Duration of full database",blank=True, help_text=get_help_lazy('speechcorpus.durationOfFullDatabase'), default='0')
     # numberOfSpeakers (0-1; f)
-    numberOfSpeakers = models.CharField("Number of speakers", blank=True, help_text=get_help('speechcorpus.numberOfSpeakers'), max_length=20, default='unknown')
-    additional = models.IntegerField("Number of speakers", blank=True, help_text=get_help('speechcorpus.numberOfSpeakers'), default=0)
+    numberOfSpeakers = models.CharField("Number of speakers", blank=True, help_text=get_help_lazy('speechcorpus.numberOfSpeakers'), max_length=20, default='unknown')
+    additional = models.IntegerField("Number of speakers", blank=True, help_text=get_help_lazy('speechcorpus.numberOfSpeakers'), default=0)
     # speakerDemographics (0-1; f)
-    speakerDemographics = models.TextField("Speaker demographics",blank=True, help_text=get_help('speechcorpus.speakerDemographics'), default='-')
+    speakerDemographics = models.TextField("Speaker demographics",blank=True, help_text=get_help_lazy('speechcorpus.speakerDemographics'), default='-')
 
     # Scheme for downloading and uploading
     specification = [
@@ -2925,15 +3619,15 @@ class Resource(CollbankModel, models.Model):
     # (0-1)
     description = models.TextField("Description of this resource", blank=True)
     # (1;c)
-    type = models.CharField("Type of this resource", choices=build_choice_list(RESOURCE_TYPE), max_length=5,
-                            help_text=get_help(RESOURCE_TYPE))
+    type = LazyChoiceCharField("Type of this resource", choices=get_choices_lazy(RESOURCE_TYPE), max_length=5,
+                            help_text=get_help_lazy(RESOURCE_TYPE))
     # NEW: type >> [DCtype] + [subtype]
     # (1;c) DCtype
-    DCtype = models.CharField("DCtype of this resource", choices=build_choice_list(RESOURCE_TYPE, 'before'), max_length=5,
-                            help_text=get_help(RESOURCE_DCTYPE), default='0')
+    DCtype = LazyChoiceCharField("DCtype of this resource", choices=get_choices_lazy(RESOURCE_TYPE, 'before'), max_length=5,
+                            help_text=get_help_lazy(RESOURCE_DCTYPE), default='0')
     # (0-1) subtype
-    subtype = models.CharField("Subtype of this resource (optional)", choices=build_choice_list(RESOURCE_TYPE), max_length=5,
-                            help_text=get_help(RESOURCE_SUBTYPE), blank=True, null=True)
+    subtype = LazyChoiceCharField("Subtype of this resource (optional)", choices=get_choices_lazy(RESOURCE_TYPE), max_length=5,
+                            help_text=get_help_lazy(RESOURCE_SUBTYPE), blank=True, null=True)
 
     # [1]     Each collection can have [1-n] resources
     collection = models.ForeignKey("Collection", blank=False, null=False, default=1, on_delete=models.CASCADE, related_name="collection12m_resource")
@@ -3115,9 +3809,9 @@ class ExtColl(models.Model):
     # identifier (1) MUST BE UNIQUE
     identifier = models.CharField("Unique short collection identifier (10 characters max)", unique=True, max_length=MAX_IDENTIFIER_LEN, default='-')
     # Full title [1; f]
-    title = models.TextField("Full title for this collection", help_text=get_help('title'))
+    title = models.TextField("Full title for this collection", help_text=get_help_lazy('title'))
     # == description (0-1;f) 
-    description = models.TextField("Description", blank=True, help_text=get_help('description'))
+    description = models.TextField("Description", blank=True, help_text=get_help_lazy('description'))
 
     def __str__(self):
         # We are known by our identifier
@@ -3142,20 +3836,22 @@ class Collection(models.Model, CollbankModel, Custom):
     # identifier (1) MUST BE UNIQUE
     identifier = models.CharField("Unique short collection identifier (10 characters max)", unique=True, max_length=MAX_IDENTIFIER_LEN, default='-')
     # Landing Page (1)
-    landingPage = models.URLField("URL of the landing page", help_text=get_help(INTERNAL_LANDINGPAGE), default='')
+    landingPage = models.URLField("URL of the landing page", help_text=get_help_lazy(INTERNAL_LANDINGPAGE), default='')
     # Search Page (0-1)
-    searchPage = models.URLField("URL of the search page", help_text=get_help(INTERNAL_SEARCHPAGE), blank=True, null=True)
+    searchPage = models.URLField("URL of the search page", help_text=get_help_lazy(INTERNAL_SEARCHPAGE), blank=True, null=True)
     # Internal-only: last saved
     updated_at = models.DateTimeField(auto_now=True, blank=True, null=True)
+    # Internal-only: raised whenever an object in the graph of this collection changes
+    graphversion = models.IntegerField("Graph version", default=0)
 
 
     # ============ OTHER TEXT FIELDS ===================================================================================
     # == description (0-1;f) 
-    description = models.TextField("Describes the collection as a whole", blank=True, help_text=get_help('description'))
+    description = models.TextField("Describes the collection as a whole", blank=True, help_text=get_help_lazy('description'))
     # == clarinCentre (0-1; f)
-    clarinCentre = models.TextField("Clarin centre in charge", blank=True, help_text=get_help('clarincentre.name'))
+    clarinCentre = models.TextField("Clarin centre in charge", blank=True, help_text=get_help_lazy('clarincentre.name'))
     # == version (0-1; f)
-    version = models.TextField("Version of the collection", blank=True, help_text=get_help('version'))
+    version = models.TextField("Version of the collection", blank=True, help_text=get_help_lazy('version'))
 
     # ============ OTHER FK FIELDS =====================================================================================
     # linguality (0-1)
@@ -3248,6 +3944,9 @@ class Collection(models.Model, CollbankModel, Custom):
         # Validate
         if pidservice == None or sPidName == "": 
             return False
+        # Nothing needs to be checked if this PID has recently been verified
+        if self.pidname == sPidName and PidCache.is_current(self, pidservice):
+            return True
         bNeedSaving = False
         # Check if the handle domain is there 
         sHandleDomain = pidservice.getdomain()
@@ -3272,6 +3971,8 @@ class Collection(models.Model, CollbankModel, Custom):
         # Need saving?
         if bNeedSaving:
             self.save()
+        # Remember that this PID is okay now
+        PidCache.store(self, pidservice)
         # Return positively
         return True
 
@@ -3330,23 +4031,90 @@ class Collection(models.Model, CollbankModel, Custom):
         # Return the new copy
         return new_copy
 
+    def get_graph(qs=None):
+        """Return collection queryset [qs] with all the objects of the CMDI graph pre-loaded
+
+        Exporting, showing or validating a collection walks all its one-to-many children.
+        This plan fetches each level of that tree with one query per table, 
+        so that the number of queries does not depend on the number of resources, provenances etc.
+        """
+
+        if qs is None:
+            qs = Collection.objects.all()
+        qs = qs.select_related(
+            'publication', 'linguality', 'access', 'access__nonCommercialUsageOnly', 
+            'documentation', 'validation', 'validation__type')
+        qs = qs.prefetch_related(
+            # Collection level one-to-many
+            'collection12m_title', 'collection12m_owner', 'collection12m_genre',
+            'collection12m_languagedisorder', 'collection12m_domain', 'collection12m_pid',
+            'collection12m_totalsize',
+            Prefetch('collection12m_relation', queryset=Relation.objects.select_related('related', 'extrel')),
+            Prefetch('coll_languages', queryset=CollectionLanguage.objects.select_related('langname__iso')),
+            'collection12m_resourcecreator__organizations', 'collection12m_resourcecreator__persons',
+            Prefetch('collection12m_project', queryset=Project.objects.select_related('URL')),
+            'collection12m_project__funders',
+            # Resources and everything below them
+            Prefetch('collection12m_resource', queryset=Resource.objects.select_related('speechCorpus', 'writtenCorpus')),
+            'collection12m_resource__modalities', 'collection12m_resource__recordingenvironments',
+            'collection12m_resource__recordingconditions', 'collection12m_resource__channels',
+            'collection12m_resource__socialcontexts', 'collection12m_resource__planningtypes',
+            'collection12m_resource__interactivities', 'collection12m_resource__involvements',
+            'collection12m_resource__audiences', 'collection12m_resource__totalsize12m_resource',
+            'collection12m_resource__annotations__annotation_formats',
+            'collection12m_resource__media_items__mediaformat12m_media',
+            'collection12m_resource__speechCorpus__conversationaltypes',
+            'collection12m_resource__speechCorpus__audioformats',
+            'collection12m_resource__writtenCorpus__charenc_writtencorpora',
+            # Provenance
+            Prefetch('collection12m_provenance', queryset=Provenance.objects.select_related('temporalProvenance')),
+            Prefetch('collection12m_provenance__g_provenances', queryset=GeographicProvenance.objects.select_related('countryiso')),
+            'collection12m_provenance__g_provenances__cities',
+            # Linguality
+            'linguality__linguality_types', 'linguality__linguality_nativenesses', 'linguality__linguality_agegroups',
+            'linguality__linguality_statuses', 'linguality__linguality_variants', 'linguality__multilinguality_types',
+            # Access
+            'access__acc_availabilities', 'access__acc_licnames', 'access__acc_licurls',
+            'access__acc_websites', 'access__acc_contacts', 'access__acc_mediums',
+            # Documentation
+            Prefetch('documentation__doc_languages', queryset=DocumentationLanguage.objects.select_related('langname__iso')),
+            'documentation__doc_types', 'documentation__doc_files', 'documentation__doc_urls',
+            # Validation
+            'validation__validationmethods')
+        return qs
+
+    def get_graph_version(self):
+        """Get a string that changes whenever this collection or any object in its graph has been edited"""
+
+        sBack = "{}".format(self.graphversion)
+        if self.updated_at != None:
+            sBack = "{}/{}".format(sBack, self.updated_at.isoformat())
+        return sBack
+
     def get_identifier(self):
         """Get a proper copy of the identifier as string"""
         return self.identifier.value_to_string()
 
+    def get_xml_identifier(oItem):
+        """Get the identifier of the collection described by [oItem], which is the shortest title"""
+
+        shortest = None
+        titles = oItem.get("title")
+        if isinstance(titles, str):
+            titles = [ titles ]
+        for onevalue in titles or []:
+            # Keep track of what the shortest is (for title)
+            if not isinstance(onevalue, str):
+                continue
+            if shortest is None:
+                shortest = onevalue
+            elif len(onevalue) < len(shortest):
+                shortest = onevalue
+        return shortest
+
     def get_instance(oItem):
         """kkk"""
 
-        def get_shortest(lst_value):
-            shortest = None
-            for onevalue in lst_value:
-                # Keep track of what the shortest is (for title)
-                if shortest is None:
-                    shortest = onevalue
-                elif len(onevalue) < len(shortest):
-                    shortest = onevalue
-            return shortest
-
         bOverwriting = False
         instance = None
         oErr = ErrHandle()
@@ -3356,7 +4124,7 @@ class Collection(models.Model, CollbankModel, Custom):
             oItem['title'] = [ titles ] if isinstance(titles, str) else titles
 
             # Get to the identifier, which is the shortest title
-            identifier = get_shortest(oItem.get("title"))
+            identifier = Collection.get_xml_identifier(oItem)
             if identifier is None or identifier == "":
                 oErr.DoError("Collection/get_instance: no [identifier] provided")
             else:
@@ -3373,6 +4141,23 @@ class Collection(models.Model, CollbankModel, Custom):
             oErr.DoError("Collection/get_instance")
         return bOverwriting, instance
 
+    def has_registered_pid(self):
+        """Has this collection got a handle (which may not yet be verified)?"""
+
+        sPidName = self.pidname
+        return not (sPidName is None or sPidName == "" or self.handledomain == "" or
+                    sPidName.startswith(("empty", "cbmetadata")))
+
+    def get_selflink(self):
+        """Get the self link: the handle, or provisionally the registry URL when there is no handle yet"""
+
+        if self.has_registered_pid():
+            # The selflink is the persistent identifier, preceded by 'hdl:'
+            sBack = "hdl:{}/{}".format(self.handledomain, self.pidname)
+        else:
+            sBack = self.get_targeturl()
+        return sBack
+
     def get_pidname(self, pidservice = None):
         """Get the persistent identifier and create it if it is not there"""
         bNeedSaving = False
@@ -3429,45 +4214,28 @@ class Collection(models.Model, CollbankModel, Custom):
         return sPublish
 
     def publishdate(self):
+        """Get the date of the last publication from the publication ledger"""
 
-        sPublishPath = self.get_publisfilename()
-        if os.path.isfile(sPublishPath):
-            fDate = os.path.getmtime(sPublishPath)
-            oDate = datetime.fromtimestamp( fDate)
-            sDate = oDate.strftime("%d/%b/%Y %H:%M:%S")
+        if hasattr(self, "pubdate"):
+            # The date has been annotated by Publication.annotate_status()
+            oDate = self.pubdate
         else:
-            sDate = 'unpublished'
-        return sDate
+            ledger = getattr(self, "publication", None)
+            oDate = None if ledger == None else ledger.published
+        return get_publication_date(oDate)
 
     def get_status(self):
-        """Get the status of this colletion: has it been published or not?"""
-
-        sPublishPath = self.get_publisfilename()
-        sStatusP = 'p' if os.path.isfile(sPublishPath) else 'u'
-        # If it is published, get its publication date and compare it to 
-        sStatusD = 'n'
-        # Has it been published?
-        if sStatusP == 'p':
-            if self.updated_at == None:
-                # If it is published, but no 'updated_at' yet, it is 'up to date'
-                sStatusD = 'd' 
-            else:
-                # It is published: get the file date
-                saved_at = os.path.getmtime(sPublishPath)
-                updated_at = datetime.timestamp( self.updated_at)
-                sStatusD = 's' if saved_at < updated_at else 'd'
-        # Combine states
-        if sStatusP == 'u':
-            sStatus = 'not-published'
-        else:
-            if sStatusD == 'n':
-                sStatus = 'unknown'
-            elif sStatusD == 'd':
-                sStatus = 'published'
-            else:
-                sStatus = 'stale' 
-        # Return the combined status
-        return sStatus
+        """Get the status of this colletion: has it been published or not?
+        
+        The status is calculated from the publication ledger, without looking at the files
+        """
+
+        if hasattr(self, "pubstatus"):
+            # The status has been annotated by Publication.annotate_status()
+            return self.pubstatus
+        ledger = getattr(self, "publication", None)
+        oDate = None if ledger == None else ledger.published
+        return get_publication_status(oDate, self.updated_at)
 
     def get_targeturl(self):
         """Get the URL where the XML data should be made available"""
@@ -3510,6 +4278,9 @@ class Collection(models.Model, CollbankModel, Custom):
         if pidservice == None:
             # Make sure the caller understands something is wrong
             return False
+        # The handle service need not be asked, if the PID has recently been verified
+        if PidCache.is_current(self, pidservice):
+            return True
         # Look for a record with this name in the PID service
         sResponse = pidservice.getpid(self)
         if sResponse == "":
@@ -3517,7 +4288,7 @@ class Collection(models.Model, CollbankModel, Custom):
             return False
         elif sResponse == "-":
             # There is no registration yet: create one
-            oResponse = pidservice.createpid(self)
+            oResponse = pidservice.createpid(self, bSearch=False)
             if oResponse != None and 'status' in oResponse and oResponse['status'] == "ok":
                 sPidName = oResponse['pid']
                 # Adapt the PID if it contains a /
@@ -3560,3 +4331,221 @@ class Collection(models.Model, CollbankModel, Custom):
         # Return the number of relations saved
         return iSaved
 
+
+class Publication(models.Model):
+    """Ledger entry of what has last been published for a collection"""
+
+    # [1] The collection that has been published
+    collection = models.OneToOneField(Collection, on_delete=models.CASCADE, related_name="publication")
+    # [1] Outcome of the last attempt to publish: 'published' or 'error'
+    status = models.CharField("Status", max_length=MAX_NAME_LEN, default="published")
+    # [1] The graph version of the collection at the time of publication
+    version = models.CharField("Graph version", max_length=MAX_STRING_LEN, default="")
+    # [1] The SHA-256 hash of the XML that has been written
+    xmlhash = models.CharField("Hash of the XML", max_length=64, default="")
+    # [1] The size of the XML file in bytes
+    size = models.IntegerField("Size", default=0)
+    # [0-1] The moment the XML was last written (empty if it has never been written)
+    published = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return "{}: {}".format(self.collection.identifier, get_publication_date(self.published))
+
+    def annotate_status(qs):
+        """Add [pubstatus] and [pubdate] to the collections in [qs] within the same query"""
+
+        return qs.annotate(pubstatus=get_publication_status_expression(), pubdate=F('publication__published'))
+
+    def get_hash(sXmlText):
+        """Calculate the content hash of an XML text"""
+        return hashlib.sha256(sXmlText.encode("utf-8")).hexdigest()
+
+    def is_current(coll):
+        """Check if the ledger says that [coll] has been published in its present version"""
+
+        ledger = getattr(coll, "publication", None)
+        return (ledger != None and ledger.published != None and ledger.version == coll.get_graph_version())
+
+    def set_error(coll):
+        """Record that publishing [coll] failed; what has been written before stays valid"""
+
+        obj, created = Publication.objects.update_or_create(collection=coll, defaults={'status': 'error'})
+        coll.publication = obj
+        return obj
+
+    def set_published(coll, sXmlHash, iSize):
+        """Record that [coll] has been published with XML hash [sXmlHash] and file size [iSize]"""
+
+        obj, created = Publication.objects.update_or_create(
+            collection=coll, defaults={'status': 'published', 'version': coll.get_graph_version(), 
+                                       'xmlhash': sXmlHash, 'size': iSize, 'published': get_current_datetime()})
+        coll.publication = obj
+        return obj
+
+
+# ============ Graph version: propagate changes of child objects to their collection ==============
+
+# For each model: the lookup path(s) from Collection to objects of that model
+COLLECTION_GRAPH_PATHS = {
+    'Title':                    ['collection12m_title'],
+    'Owner':                    ['collection12m_owner'],
+    'Genre':                    ['collection12m_genre'],
+    'LanguageDisorder':         ['collection12m_languagedisorder'],
+    'Domain':                   ['collection12m_domain'],
+    'PID':                      ['collection12m_pid'],
+    'TotalCollectionSize':      ['collection12m_totalsize'],
+    'Relation':                 ['collection12m_relation'],
+    'ExtColl':                  ['collection12m_relation__extrel'],
+    'CollectionLanguage':       ['coll_languages'],
+    'LanguageName':             ['coll_languages__langname', 'documentation__doc_languages__langname'],
+    'LanguageIso':              ['coll_languages__langname__iso', 'documentation__doc_languages__langname__iso'],
+    'ResourceCreator':          ['collection12m_resourcecreator'],
+    'Organization':             ['collection12m_resourcecreator__organizations'],
+    'Person':                   ['collection12m_resourcecreator__persons'],
+    'Project':                  ['collection12m_project'],
+    'ProjectFunder':            ['collection12m_project__funders'],
+    'ProjectUrl':               ['collection12m_project__URL'],
+    'Resource':                 ['collection12m_resource'],
+    'Modality':                 ['collection12m_resource__modalities'],
+    'RecordingEnvironment':     ['collection12m_resource__recordingenvironments'],
+    'RecordingCondition':       ['collection12m_resource__recordingconditions'],
+    'Channel':                  ['collection12m_resource__channels'],
+    'SocialContext':            ['collection12m_resource__socialcontexts'],
+    'PlanningType':             ['collection12m_resource__planningtypes'],
+    'Interactivity':            ['collection12m_resource__interactivities'],
+    'Involvement':              ['collection12m_resource__involvements'],
+    'Audience':                 ['collection12m_resource__audiences'],
+    'TotalSize':                ['collection12m_resource__totalsize12m_resource'],
+    'Annotation':               ['collection12m_resource__annotations'],
+    'AnnotationFormat':         ['collection12m_resource__annotations__annotation_formats'],
+    'Media':                    ['collection12m_resource__media_items'],
+    'MediaFormat':              ['collection12m_resource__media_items__mediaformat12m_media'],
+    'SpeechCorpus':             ['collection12m_resource__speechCorpus'],
+    'ConversationalType':       ['collection12m_resource__speechCorpus__conversationaltypes'],
+    'AudioFormat':              ['collection12m_resource__speechCorpus__audioformats'],
+    'WrittenCorpus':            ['collection12m_resource__writtenCorpus'],
+    'CharacterEncoding':        ['collection12m_resource__writtenCorpus__charenc_writtencorpora'],
+    'Provenance':               ['collection12m_provenance'],
+    'TemporalProvenance':       ['collection12m_provenance__temporalProvenance'],
+    'GeographicProvenance':     ['collection12m_provenance__g_provenances'],
+    'City':                     ['collection12m_provenance__g_provenances__cities'],
+    'CountryIso':               ['collection12m_provenance__g_provenances__countryiso'],
+    'Linguality':               ['linguality'],
+    'LingualityType':           ['linguality__linguality_types'],
+    'LingualityNativeness':     ['linguality__linguality_nativenesses'],
+    'LingualityAgeGroup':       ['linguality__linguality_agegroups'],
+    'LingualityStatus':         ['linguality__linguality_statuses'],
+    'LingualityVariant':        ['linguality__linguality_variants'],
+    'MultilingualityType':      ['linguality__multilinguality_types'],
+    'Access':                   ['access'],
+    'AccessAvailability':       ['access__acc_availabilities'],
+    'LicenseName':              ['access__acc_licnames'],
+    'LicenseUrl':               ['access__acc_licurls'],
+    'NonCommercialUsageOnly':   ['access__nonCommercialUsageOnly'],
+    'AccessContact':            ['access__acc_contacts'],
+    'AccessWebsite':            ['access__acc_websites'],
+    'AccessMedium':             ['access__acc_mediums'],
+    'Documentation':            ['documentation'],
+    'DocumentationType':        ['documentation__doc_types'],
+    'DocumentationFile':        ['documentation__doc_files'],
+    'DocumentationUrl':         ['documentation__doc_urls'],
+    'DocumentationLanguage':    ['documentation__doc_languages'],
+    'Validation':               ['validation'],
+    'ValidationType':           ['validation__type'],
+    'ValidationMethod':         ['validation__validationmethods'],
+    }
+
+
+class GraphVersion(object):
+    """Raise the [graphversion] of every collection that contains a changed object
+
+    Changes are gathered per thread and transaction, and handled once when the transaction
+    commits (or immediately, when there is no transaction)
+    """
+
+    pending = threading.local()
+
+    def get_pending():
+        """Get the changes of the current transaction that have not been handled yet
+
+        The changes of a transaction register one flush upon commit. When that registration
+        is gone without a commit, the transaction (or savepoint) has been rolled back, and
+        its changes are dropped, so that the next transaction does not handle them.
+        """
+
+        connection = transaction.get_connection()
+        oPending = getattr(GraphVersion.pending, "changes", None)
+        if oPending != None and connection.in_atomic_block:
+            if not any(func is oPending['flush'] for (sids, func, robust) in connection.run_on_commit):
+                oPending = None
+        if oPending == None or not connection.in_atomic_block:
+            oPending = {'ids': set(), 'objs': {}, 'registered': False}
+            oPending['flush'] = lambda: GraphVersion.flush(oPending)
+            if connection.in_atomic_block:
+                GraphVersion.pending.changes = oPending
+        return oPending
+
+    def register(oPending):
+        """Handle [oPending] when the transaction commits (or now, without a transaction)"""
+
+        if not oPending['registered']:
+            oPending['registered'] = True
+            transaction.on_commit(oPending['flush'])
+
+    def get_collection_ids(sModel, lst_pk):
+        """Get the ids of the collections that contain objects of type [sModel] with a pk in [lst_pk]"""
+
+        lst_id = set()
+        for path in COLLECTION_GRAPH_PATHS[sModel]:
+            qs = Collection.objects.filter(**{"{}__in".format(path): lst_pk})
+            lst_id.update(qs.values_list('id', flat=True))
+        return lst_id
+
+    def add_changed(obj):
+        """Register a change under [obj] that did not send post_save (e.g. a bulk_create)"""
+
+        oPending = GraphVersion.get_pending()
+        sModel = obj.__class__.__name__
+        if isinstance(obj, Collection):
+            oPending['ids'].add(obj.pk)
+        elif sModel in COLLECTION_GRAPH_PATHS:
+            oPending['objs'].setdefault(sModel, set()).add(obj.pk)
+        GraphVersion.register(oPending)
+
+    def changed(sender, instance, **kwargs):
+        """An object of a model in the graph has been saved"""
+
+        oPending = GraphVersion.get_pending()
+        oPending['objs'].setdefault(sender.__name__, set()).add(instance.pk)
+        GraphVersion.register(oPending)
+
+    def deleting(sender, instance, **kwargs):
+        """An object of a model in the graph is about to be deleted"""
+
+        # The collections must be looked up while the object still exists
+        oPending = GraphVersion.get_pending()
+        oPending['ids'].update(GraphVersion.get_collection_ids(sender.__name__, [instance.pk]))
+        GraphVersion.register(oPending)
+
+    def flush(oPending):
+        """Raise the graph version of all collections affected by the changes in [oPending]"""
+
+        oErr = ErrHandle()
+        try:
+            if getattr(GraphVersion.pending, "changes", None) is oPending:
+                GraphVersion.pending.changes = None
+            lst_id = set(oPending['ids'])
+            for sModel, lst_pk in oPending['objs'].items():
+                lst_id.update(GraphVersion.get_collection_ids(sModel, list(lst_pk)))
+            if len(lst_id) > 0:
+                # A queryset update() does not send any signals itself
+                Collection.objects.filter(id__in=lst_id).update(
+                    graphversion=F('graphversion') + 1, updated_at=get_current_datetime())
+        except:
+            msg = oErr.get_error_message()
+            oErr.DoError("GraphVersion/flush")
+
+
+for sModel in COLLECTION_GRAPH_PATHS:
+    post_save.connect(GraphVersion.changed, sender=globals()[sModel], dispatch_uid="graph_save_{}".format(sModel))
+    pre_delete.connect(GraphVersion.deleting, sender=globals()[sModel], dispatch_uid="graph_delete_{}".format(sModel))
@@ -0,0 +1,112 @@
+"""
+Reference data for the CollBank application
+
+The ISO-3166 country codes are kept in a tab-separated file in collection/data.
+They used to be part of settings.py, but they are now only read when they are
+needed, and then only once per process. The languages are in the database,
+see LanguageIso and LanguageName.
+"""
+
+import csv
+import os
+import threading
+
+from collbank.basic.utils import ErrHandle
+
+DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "data"))
+COUNTRY_FILE = os.path.join(DATA_DIR, "countrycodes.csv")
+
+
+def read_code_file(sFile):
+    """Read a tab-separated file with a header line into a list of tuples"""
+
+    lst_back = []
+    with open(sFile, "r", encoding="utf-8", newline="") as f:
+        csvreader = csv.reader(f, delimiter="\t")
+        # Skip the header
+        next(csvreader, None)
+        for row in csvreader:
+            if len(row) > 0:
+                lst_back.append(tuple(row))
+    return lst_back
+
+
+class CountryCodes(object):
+    """The ISO-3166 country codes, indexed by alpha2, alpha3, numeric and English name
+
+    Each country is a tuple: (Alpha2, EnglishShort, FrenchShort, Alpha3, Numeric)
+    """
+
+    loaded = False
+    lock = threading.Lock()
+    countries = []
+    by_alpha2 = {}
+    by_alpha3 = {}
+    by_numeric = {}
+    by_english = {}
+
+    def load():
+        """Read the country file into the dictionaries (only once)"""
+
+        oErr = ErrHandle()
+        try:
+            with CountryCodes.lock:
+                if not CountryCodes.loaded:
+                    countries = read_code_file(COUNTRY_FILE)
+                    by_alpha2 = {}
+                    by_alpha3 = {}
+                    by_numeric = {}
+                    by_english = {}
+                    for tplCountry in countries:
+                        by_alpha2.setdefault(tplCountry[0].upper(), tplCountry)
+                        by_alpha3.setdefault(tplCountry[3].upper(), tplCountry)
+                        by_numeric.setdefault(int(tplCountry[4]), tplCountry)
+                        # Names like "Netherlands (the)" can also be found without the " (the)"
+                        sEnglish = tplCountry[1].lower()
+                        by_english.setdefault(sEnglish, tplCountry)
+                        if sEnglish.endswith(" (the)"):
+                            by_english.setdefault(sEnglish[:-6], tplCountry)
+                    CountryCodes.countries = countries
+                    CountryCodes.by_alpha2 = by_alpha2
+                    CountryCodes.by_alpha3 = by_alpha3
+                    CountryCodes.by_numeric = by_numeric
+                    CountryCodes.by_english = by_english
+                    CountryCodes.loaded = True
+        except:
+            msg = oErr.get_error_message()
+            oErr.DoError("CountryCodes/load")
+
+    def get_list():
+        """Get all countries in the original order"""
+
+        if not CountryCodes.loaded:
+            CountryCodes.load()
+        return CountryCodes.countries
+
+    def get_by_alpha2(sCode):
+        if not CountryCodes.loaded:
+            CountryCodes.load()
+        return CountryCodes.by_alpha2.get(sCode.strip().upper())
+
+    def get_by_alpha3(sCode):
+        if not CountryCodes.loaded:
+            CountryCodes.load()
+        return CountryCodes.by_alpha3.get(sCode.strip().upper())
+
+    def get_by_numeric(numeric):
+        """Get the country by its numeric code: 4, "4" and "004" are all the same"""
+
+        if not CountryCodes.loaded:
+            CountryCodes.load()
+        try:
+            return CountryCodes.by_numeric.get(int(numeric))
+        except (TypeError, ValueError):
+            return None
+
+    def get_by_english(sName):
+        """Get the country by its English short name (case-insensitive)"""
+
+        if not CountryCodes.loaded:
+            CountryCodes.load()
+        return CountryCodes.by_english.get(sName.strip().lower())
+
@@ -9,19 +9,239 @@ import json
 import lxml
 import requests
 import sys
+import threading
 import time
 from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # From own application
 from collbank.basic.views import ErrHandle
-from collbank.settings import WRITABLE_DIR, PUBLISH_DIR
+from collbank.settings import WRITABLE_DIR, PUBLISH_DIR, PID_TIMEOUT, PID_RETRIES, PID_BACKOFF, PID_POOLSIZE, \
+    BREAKER_FAILURES, BREAKER_RESET, OAI_STATUS_TTL
 
 OAI_HOME = 'http://localhost:8080/oai'
 
+
+class BackendUnavailable(Exception):
+    """A back-end is not called, because its circuit breaker is open"""
+    pass
+
+
+class CircuitBreaker(object):
+    """The health of an external back-end, shared by all callers in this process
+
+    closed:     calls go through; after BREAKER_FAILURES failures in a row the breaker opens
+    open:       calls fail at once with BackendUnavailable, until BREAKER_RESET seconds have passed
+    half-open:  one call is let through as a probe: success closes the breaker, failure opens it again
+    """
+
+    breakers = {}
+    lock = threading.Lock()
+
+    def __init__(self, name, label):
+        self.name = name
+        self.label = label
+        self.state = "closed"
+        self.failures = 0
+        self.msg = ""
+        self.opened = 0.0
+        self.probed = 0.0
+
+    def get(name, label=""):
+        """Get the breaker for back-end [name], creating it when needed"""
+
+        with CircuitBreaker.lock:
+            breaker = CircuitBreaker.breakers.get(name)
+            if breaker is None:
+                breaker = CircuitBreaker(name, label or name)
+                CircuitBreaker.breakers[name] = breaker
+            return breaker
+
+    def allow(self):
+        """May the back-end be called now?"""
+
+        with CircuitBreaker.lock:
+            now = time.monotonic()
+            if self.state == "closed":
+                return True
+            elif self.state == "open" and now - self.opened < BREAKER_RESET:
+                return False
+            elif self.state == "half-open" and now - self.probed < BREAKER_RESET:
+                # Another caller is probing already
+                return False
+            # Let this call through as the probe
+            self.state = "half-open"
+            self.probed = now
+            return True
+
+    def is_open(self):
+        """Would a call be refused now? (without taking the probe)"""
+
+        now = time.monotonic()
+        if self.state == "open":
+            return now - self.opened < BREAKER_RESET
+        elif self.state == "half-open":
+            return now - self.probed < BREAKER_RESET
+        return False
+
+    def success(self):
+        with CircuitBreaker.lock:
+            self.state = "closed"
+            self.failures = 0
+            self.msg = ""
+
+    def failure(self, msg):
+        with CircuitBreaker.lock:
+            self.failures += 1
+            self.msg = msg
+            if self.state == "half-open" or self.failures >= BREAKER_FAILURES:
+                self.state = "open"
+                self.opened = time.monotonic()
+
+    def reset(self):
+        self.success()
+
+    def get_message(self):
+        iWait = max(0, int(BREAKER_RESET - (time.monotonic() - self.opened)))
+        return "The {} is unavailable ({}); it will be tried again in {}s".format(self.label, self.msg, iWait)
+
+    def get_status(self):
+        """Get the health of this back-end as a dictionary"""
+
+        oBack = dict(name=self.name, label=self.label, state=self.state, failures=self.failures, msg="")
+        if self.state != "closed":
+            oBack['msg'] = self.get_message()
+        return oBack
+
+    def call(self, sMethod, sUrl, session=None, **kwargs):
+        """Issue a request through this breaker
+
+        A connection error or a 5xx response counts as a failure. When the breaker is open,
+        BackendUnavailable is raised at once.
+        """
+
+        if not self.allow():
+            raise BackendUnavailable(self.get_message())
+        try:
+            r = (session or requests).request(sMethod, sUrl, **kwargs)
+        except requests.RequestException as ex:
+            self.failure(ex.__class__.__name__)
+            raise
+        if r.status_code >= 500:
+            self.failure("code {}".format(r.status_code))
+        else:
+            self.success()
+        return r
+
+
+def get_backend_status():
+    """Get the health of the external back-ends"""
+
+    return [CircuitBreaker.get(name).get_status() for name in ["epic", "oai"]]
+
+# The known back-ends
+CircuitBreaker.get("epic", "handle service (ePIC)")
+CircuitBreaker.get("oai", "OAI back-end (jOAI)")
+# The last result of get_oai_status()
+oai_status_cache = dict(time=0.0, status=None)
+
+
+class PidClient(object):
+    """Shared HTTP client for the ePIC handle service
+
+    Each thread keeps one requests.Session per service account, so that the calls made while
+    registering a collection re-use one connection instead of doing a handshake each time.
+    GET and PUT are retried with backoff on connection errors and on 502, 503 and 504.
+    A POST creates a handle, so it is only retried when the connection could not be made at all.
+    All calls go through the "epic" circuit breaker.
+    The duration of the calls is kept in [metrics], per call name.
+    """
+
+    local = threading.local()
+    lock = threading.Lock()
+    metrics = {}
+
+    def get_session(user, passwd):
+        """Get the session for this account in this thread (and process)"""
+
+        pid = os.getpid()
+        if getattr(PidClient.local, "pid", None) != pid:
+            # New thread, or a forked worker process: do not share the parent's connections
+            PidClient.local.pid = pid
+            PidClient.local.sessions = {}
+        sessions = PidClient.local.sessions
+        session = sessions.get((user, passwd))
+        if session is None:
+            session = requests.Session()
+            session.auth = (user, passwd)
+            retry = Retry(total=PID_RETRIES, backoff_factor=PID_BACKOFF, status_forcelist=[502, 503, 504],
+                          allowed_methods=["GET", "HEAD", "PUT"], raise_on_status=False)
+            adapter = HTTPAdapter(pool_connections=PID_POOLSIZE, pool_maxsize=PID_POOLSIZE, max_retries=retry)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            sessions[(user, passwd)] = session
+        return session
+
+    def request(pidservice, sMethod, sUrl, sCall="", **kwargs):
+        """Issue one request to the ePIC service [pidservice] and keep track of its duration"""
+
+        kwargs.setdefault("timeout", PID_TIMEOUT)
+        session = PidClient.get_session(pidservice.user, pidservice.passwd)
+        bError = True
+        started = time.perf_counter()
+        try:
+            r = CircuitBreaker.get("epic").call(sMethod, sUrl, session=session, **kwargs)
+            bError = (r.status_code >= 500)
+            return r
+        finally:
+            PidClient.add_metric(sCall or sMethod, time.perf_counter() - started, bError)
+
+    def add_metric(sCall, fSeconds, bError):
+        with PidClient.lock:
+            oMetric = PidClient.metrics.get(sCall)
+            if oMetric is None:
+                oMetric = dict(calls=0, errors=0, seconds=0.0, max=0.0)
+                PidClient.metrics[sCall] = oMetric
+            oMetric['calls'] += 1
+            oMetric['seconds'] += fSeconds
+            if bError:
+                oMetric['errors'] += 1
+            if fSeconds > oMetric['max']:
+                oMetric['max'] = fSeconds
+
+    def get_metrics():
+        """Get a copy of the metrics, including the average duration of each call"""
+
+        oBack = {}
+        with PidClient.lock:
+            for sCall, oMetric in PidClient.metrics.items():
+                oCopy = dict(oMetric)
+                oCopy['avg'] = oMetric['seconds'] / oMetric['calls']
+                oBack[sCall] = oCopy
+        return oBack
+
+    def reset_metrics():
+        with PidClient.lock:
+            PidClient.metrics = {}
+
+    def close():
+        """Close the sessions of this thread"""
+
+        for session in getattr(PidClient.local, "sessions", {}).values():
+            session.close()
+        PidClient.local.sessions = {}
+
 def get_oai_status():
-    """Mimic reading the OAI interface, asking for a list of available metadata records"""
+    """Mimic reading the OAI interface, asking for a list of available metadata records
+    
+    A successful result is re-used for OAI_STATUS_TTL seconds
+    """
 
     oErr = ErrHandle()
+    # Can we use the last result?
+    if not oai_status_cache['status'] is None and time.monotonic() - oai_status_cache['time'] < OAI_STATUS_TTL:
+        return dict(oai_status_cache['status'])
     # Default reply
     oBack = {}
     try:
@@ -29,7 +249,11 @@ def get_oai_status():
         url = OAI_HOME + "/provider?verb=ListIdentifiers&metadataPrefix=cmdi"
         r = None
         try:
-            r = requests.get(url, timeout=3)
+            r = CircuitBreaker.get("oai").call("GET", url, timeout=3)
+        except BackendUnavailable as ex:
+            # Do not even try
+            oBack['status'] = 'degraded'
+            oBack['msg'] = str(ex)
         except:
             # Getting an exception here probably means that the back-end is not reachable (down)
             oBack['status'] = 'error'
@@ -52,7 +276,11 @@ def get_oai_status():
                 identifiers = docroot.xpath("//ListIdentifiers/header/identifier")
 
                 msg = "{} identifiers found".format(len(identifiers))
+                oBack['status'] = 'ok'
                 oBack['msg'] = msg
+            else:
+                oBack['status'] = 'error'
+                oBack['msg'] = "The OAI interface returned code {}".format(r.status_code)
 
     except:
         msg = oErr.get_error_message()
@@ -60,6 +288,12 @@ def get_oai_status():
         oBack['status'] = "error"
         oBack['msg'] = msg
 
+    # Remember a successful result for a while: a failure is checked again next time
+    if oBack.get('status') == "ok":
+        oai_status_cache['time'] = time.monotonic()
+        oai_status_cache['status'] = dict(oBack)
+    else:
+        oai_status_cache['status'] = None
     # Return the correct object
     return oBack
 
@@ -78,7 +312,12 @@ def reindex_oai():
         url = OAI_HOME + "/provider?verb=ListIdentifiers&metadataPrefix=cmdi"
         r = None
         try:
-            r = requests.get(url, timeout=5)
+            r = CircuitBreaker.get("oai").call("GET", url, timeout=5)
+        except BackendUnavailable as ex:
+            # Fail fast: there is no point in re-indexing now
+            oBack['status'] = 'degraded'
+            oBack['msg'] = str(ex)
+            return oBack
         except:
             # Getting an exception here probably means that the back-end is not reachable (down)
             oBack['status'] = 'error'
@@ -121,7 +360,10 @@ def reindex_oai():
                           button="Reindex")
             url = OAI_HOME + "/admin/data-provider.do"
             try:
-                r = requests.post(url, json=oToOAI)
+                r = CircuitBreaker.get("oai").call("POST", url, json=oToOAI, timeout=5)
+            except BackendUnavailable as ex:
+                oBack['status'] = 'degraded'
+                oBack['msg'] = str(ex)
             except:
                 # Getting an exception here probably means that the back-end is not reachable (down)
                 oBack['status'] = 'error'
@@ -135,7 +377,7 @@ def reindex_oai():
                     oBack['msg'] = "Re-indexing was done successfully"
                 else:
                     oBack['status'] = "error"
-                    oBack['msg'] = "The OAI interface returned: " + r.status_code;
+                    oBack['msg'] = "The OAI interface returned: {}".format(r.status_code)
         else:
             msg = "{} identifiers found - no need to repair".format(len(identifiers))
             oBack['msg'] = msg
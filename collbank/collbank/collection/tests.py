@@ -6,7 +6,36 @@ Replace this with more appropriate tests for your application.
 """
 
 import django
-from django.test import TestCase
+import io
+import logging
+import multiprocessing
+import os
+import subprocess
+import sys
+import tarfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from unittest import mock
+import lxml.etree as ET
+from xml.dom import minidom
+
+from collbank.collection.models import *
+from collbank.collection.fakeepic import FakeEpicServer
+from collbank.collection.refdata import CountryCodes
+from collbank.collection.services import BackendUnavailable, CircuitBreaker, PidClient, get_oai_status, oai_status_cache
+from collbank.collection.views import add_collection_xml, make_collection_top, process_pid_queue, publish_collection, \
+    get_xml_pretty, archive_collections, publish_worker_init, publish_chunk
+from collbank.collection import views as collection_views
+
+logger = logging.getLogger(__name__)
 
 # TODO: Configure your database in settings.py and sync before running tests.
 
@@ -23,3 +52,520 @@ class SimpleTest(TestCase):
         Tests that 1 + 1 always equals 2.
         """
         self.assertEqual(1 + 1, 2)
+
+
+class CollectionGraphTest(TestCase):
+    """The number of queries to export a collection should not depend on its size"""
+
+    def add_collection(self, sIdentifier, iResources):
+        coll = Collection.objects.create(identifier=sIdentifier, landingPage="http://localhost/{}".format(sIdentifier))
+        Title.objects.create(collection=coll, name="Title of {}".format(sIdentifier))
+        for idx in range(iResources):
+            res = Resource.objects.create(collection=coll, DCtype="0", description="Resource {}".format(idx))
+            Modality.objects.create(resource=res, name="0")
+            TotalSize.objects.create(resource=res, size="1", sizeUnit="GB")
+            ann = Annotation.objects.create(resource=res, type="0")
+            AnnotationFormat.objects.create(annotation=ann, name="0")
+            med = Media.objects.create(resource=res)
+            MediaFormat.objects.create(media=med, name="0")
+        for idx in range(iResources):
+            Relation.objects.create(collection=coll, name="relation {}".format(idx))
+        return coll
+
+    def count_export_queries(self, coll):
+        # Make sure the choice and reference indexes are not loaded during the measurement
+        FieldChoiceIndex.load()
+        ReferenceIndex.load()
+        with CaptureQueriesContext(connection) as ctx:
+            coll_this = Collection.get_graph().get(id=coll.id)
+            top = make_collection_top(coll_this, "tester", "http://localhost/")
+            add_collection_xml(coll_this, ET.SubElement(top, "CorpusCollection"))
+        return len(ctx.captured_queries)
+
+    def test_constant_query_count(self):
+        iSmall = self.count_export_queries(self.add_collection("small", 1))
+        iLarge = self.count_export_queries(self.add_collection("large", 6))
+        logger.info("Queries for exporting a collection: {}".format(iLarge))
+        self.assertEqual(iSmall, iLarge)
+
+
+class GraphVersionTest(TestCase):
+    """Changes raise the graph version once per transaction, and a rollback leaves it alone"""
+
+    def get_versions(self, *lst_coll):
+        return [Collection.objects.get(id=x.id).graphversion for x in lst_coll]
+
+    def test_rollback(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            coll1 = Collection.objects.create(identifier="graph1")
+            coll2 = Collection.objects.create(identifier="graph2")
+        lst_start = self.get_versions(coll1, coll2)
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with transaction.atomic():
+                Title.objects.create(collection=coll1, name="first")
+                Title.objects.create(collection=coll1, name="second")
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(self.get_versions(coll1, coll2), [lst_start[0] + 1, lst_start[1]])
+
+        # The change of the rolled back transaction is not handled by the next one
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    Title.objects.create(collection=coll2, name="undone")
+                    raise ValueError("rollback")
+            except ValueError:
+                pass
+            with transaction.atomic():
+                Title.objects.create(collection=coll1, name="third")
+        self.assertEqual(self.get_versions(coll1, coll2), [lst_start[0] + 2, lst_start[1]])
+
+    def test_bulk_create(self):
+        """Values that custom_add() adds with bulk_create() also raise the graph version"""
+
+        with self.captureOnCommitCallbacks(execute=True):
+            coll = Collection.objects.create(identifier="bulk")
+        iStart = self.get_versions(coll)[0]
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                coll.custom_add({'title': ["bulk", "bulk title"], 'owner': ["one", "two"]}, dict(overwriting=False), errors=[])
+        self.assertEqual(Title.objects.filter(collection=coll).count(), 2)
+        self.assertEqual(self.get_versions(coll), [iStart + 1])
+
+
+class PrettyXmlTest(TestCase):
+    """The published XML should stay byte-identical to minidom's toprettyxml(indent="  ")"""
+
+    # As written by minidom
+    fixture = '<?xml version="1.0" ?>\n' + \
+        '<CMD CMDVersion="1.2" note="say &quot;hi&quot; &amp; &lt;bye&gt;">\n' + \
+        '  <Header>\n' + \
+        '    <MdCreator>The &quot;RU&quot; &lt;team&gt; &amp; co</MdCreator>\n' + \
+        '    <Empty/>\n' + \
+        '  </Header>\n' + \
+        '  <Title>It\'s &quot;quoted&quot;</Title>\n' + \
+        '</CMD>\n'
+
+    def test_fixture(self):
+        top = ET.Element("CMD", {"CMDVersion": "1.2", "note": 'say "hi" & <bye>'})
+        header = ET.SubElement(top, "Header")
+        ET.SubElement(header, "MdCreator").text = 'The "RU" <team> & co'
+        ET.SubElement(header, "Empty")
+        ET.SubElement(top, "Title").text = 'It\'s "quoted"'
+        self.assertEqual(get_xml_pretty(top), self.fixture)
+
+    def test_collection(self):
+        coll = Collection.objects.create(identifier="quotes", landingPage="http://localhost/quotes")
+        Title.objects.create(collection=coll, name='The "quoted" title')
+        Collection.objects.filter(id=coll.id).update(description='A <b> "description" & more')
+        coll_this = Collection.get_graph().get(id=coll.id)
+        top = make_collection_top(coll_this, "tester", "http://localhost/")
+        add_collection_xml(coll_this, ET.SubElement(top, "CorpusCollection"))
+        sMinidom = minidom.parseString(ET.tostring(top)).toprettyxml(indent="  ")
+        self.assertIn("&quot;quoted&quot;", sMinidom)
+        self.assertEqual(get_xml_pretty(top), sMinidom)
+
+
+class ArchiveTest(TestCase):
+    """A streamed archive can be opened again, and a failure does not end it as if it were complete"""
+
+    def setUp(self):
+        for idx in range(3):
+            coll = Collection.objects.create(identifier="arch{}".format(idx), landingPage="http://localhost/arch{}".format(idx))
+            Title.objects.create(collection=coll, name="Archive {}".format(idx))
+        self.qs = Collection.objects.filter(identifier__startswith="arch").order_by("identifier")
+        self.names = ["arch0.xml", "arch1.xml", "arch2.xml"]
+
+    def get_archive(self, sType):
+        return io.BytesIO(b"".join(archive_collections(self.qs, "tester", "http://localhost/", sType)))
+
+    def test_tar(self):
+        with tarfile.open(fileobj=self.get_archive("tar"), mode="r:gz") as archive:
+            self.assertEqual(archive.getnames(), self.names)
+            self.assertIn(b"Archive 1", archive.extractfile("arch1.xml").read())
+
+    def test_zip(self):
+        with zipfile.ZipFile(self.get_archive("zip")) as archive:
+            self.assertEqual(archive.namelist(), self.names)
+            self.assertIsNone(archive.testzip())
+            self.assertIn(b"Archive 1", archive.read("arch1.xml"))
+
+    def test_error(self):
+        with mock.patch("collbank.collection.views.create_collection_xml", side_effect=RuntimeError("broken")):
+            for sType in ["tar", "zip"]:
+                self.assertRaises(RuntimeError, self.get_archive, sType)
+
+
+def get_worker_locks():
+    """Try to take the locks in a publishing worker"""
+
+    lst_lock = [collection_views.schema_lock, CircuitBreaker.lock, PidClient.lock]
+    return all(lock.acquire(timeout=2) for lock in lst_lock)
+
+
+class PublishWorkerTest(SimpleTestCase):
+    """A worker does not inherit the locks that another thread holds at the time of the fork"""
+
+    def test_locks(self):
+        if not "fork" in multiprocessing.get_all_start_methods():
+            self.skipTest("fork is not available")
+        with collection_views.schema_lock, CircuitBreaker.lock:
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("fork"),
+                                     initializer=publish_worker_init) as executor:
+                self.assertTrue(executor.submit(get_worker_locks).result())
+
+
+class OaiStatusTest(SimpleTestCase):
+    """Only a successful OAI status is cached"""
+
+    def setUp(self):
+        oai_status_cache['status'] = None
+        CircuitBreaker.get("oai").reset()
+
+    def tearDown(self):
+        oai_status_cache['status'] = None
+        CircuitBreaker.get("oai").reset()
+
+    def test_cache(self):
+        breaker = CircuitBreaker.get("oai")
+        for idx in range(settings.BREAKER_FAILURES):
+            breaker.failure("code 503")
+        self.assertEqual(get_oai_status()['status'], "degraded")
+        self.assertIsNone(oai_status_cache['status'])
+
+        # As soon as the back-end is available again, that is what the status says
+        breaker.reset()
+        reply = mock.Mock(status_code=200, text="<OAI-PMH><ListIdentifiers><header><identifier>x</identifier>" +
+                                                "</header></ListIdentifiers></OAI-PMH>")
+        with mock.patch("collbank.collection.services.requests.request", return_value=reply) as request:
+            self.assertEqual(get_oai_status()['status'], "ok")
+            self.assertEqual(get_oai_status()['msg'], "1 identifiers found")
+        self.assertEqual(request.call_count, 1)
+
+
+class PidTestCase(TestCase):
+    """Base class for tests against a fake ePIC service, with a fresh client and circuit breaker"""
+
+    # Seconds that the fake service takes for each request
+    latency = 0.0
+
+    def setUp(self):
+        self.fake = FakeEpicServer(latency=self.latency).start()
+        self.pidservice = PidService.objects.create(name=PIDSERVICE_NAME, url=self.fake.url, user="user", passwd="passwd")
+        PidClient.close()
+        PidClient.reset_metrics()
+        CircuitBreaker.get("epic").reset()
+
+    def tearDown(self):
+        PidClient.close()
+        self.fake.stop()
+
+
+class PidClientTest(PidTestCase):
+    """Registering a PID re-uses one connection to the ePIC service"""
+
+    def test_register(self):
+        self.assertEqual(self.pidservice.authenticate()['status'], "ok")
+        iCount = 20
+        lst_coll = [Collection.objects.create(identifier="pid{}".format(idx)) for idx in range(iCount)]
+        started = time.perf_counter()
+        for coll in lst_coll:
+            self.assertTrue(coll.register_pid())
+        fRate = iCount / (time.perf_counter() - started)
+        coll = Collection.objects.get(id=lst_coll[0].id)
+        self.assertTrue(coll.pidname.startswith("COLL-"))
+        self.assertEqual(self.fake.handles[coll.pidname], coll.get_targeturl())
+        # Registering again finds the existing handle
+        self.assertEqual(self.pidservice.getpid(coll), coll.pidname)
+
+        oMetrics = PidClient.get_metrics()
+        logger.info("PID registration: {:.1f} collections/s, {} requests over {} connection(s)".format(
+            fRate, self.fake.requests, self.fake.connections))
+        self.assertEqual(self.fake.connections, 1)
+        self.assertEqual(oMetrics['createpid']['calls'], iCount)
+        self.assertEqual(oMetrics['getpid']['calls'], iCount + 1)
+
+    def test_cache(self):
+        lst_coll = [Collection.objects.create(identifier="cache{}".format(idx)) for idx in range(5)]
+        for coll in lst_coll:
+            self.assertTrue(coll.register_pid())
+        self.assertEqual(PidCache.objects.count(), 5)
+
+        # Publishing again does not need the handle service
+        iRequests = self.fake.requests
+        for coll in Collection.objects.filter(identifier__startswith="cache"):
+            self.assertTrue(coll.register_pid())
+            self.assertTrue(coll.get_pidname().startswith("COLL-"))
+        self.assertEqual(self.fake.requests, iRequests)
+
+        # An expired entry is verified again
+        coll = Collection.objects.get(id=lst_coll[0].id)
+        PidCache.objects.filter(name=coll.get_xmlfilename()).update(verified=get_current_datetime() - timedelta(days=365))
+        self.assertTrue(coll.register_pid())
+        self.assertEqual(self.fake.requests, iRequests + 2)
+        self.assertTrue(PidCache.is_current(coll, self.pidservice))
+
+    def test_retry(self):
+        coll = Collection.objects.create(identifier="retry")
+        self.fake.fail_next['GET'] = [503, 503]
+        self.assertEqual(self.pidservice.getpid(coll), "-")
+        self.assertEqual(self.fake.requests, 3)
+        # A failed creation is not retried: that could make two handles
+        self.fake.fail_next['POST'] = [503]
+        self.assertEqual(self.pidservice.createpid(coll)['status'], "error")
+        self.assertEqual(len(self.fake.handles), 0)
+
+    def test_breaker(self):
+        coll = Collection.objects.create(identifier="breaker")
+        breaker = CircuitBreaker.get("epic")
+        # Three calls that fail after all their retries open the breaker
+        self.fake.fail_next['GET'] = [503] * 12
+        for idx in range(3):
+            self.assertEqual(self.pidservice.getpid(coll), "")
+        self.assertEqual(breaker.state, "open")
+
+        # Now the handle service is not called at all
+        iRequests = self.fake.requests
+        self.assertRaises(BackendUnavailable, self.pidservice.getpid, coll)
+        self.assertRaises(BackendUnavailable, coll.register_pid)
+        self.assertEqual(self.fake.requests, iRequests)
+
+        # The queue is left alone while the breaker is open
+        PidQueue.objects.create(collection=coll)
+        oBack = process_pid_queue()
+        self.assertEqual(oBack['status'], "degraded")
+        self.assertEqual(PidQueue.objects.get(collection=coll).attempts, 0)
+
+        # After BREAKER_RESET seconds one probe is let through, and its success closes the breaker
+        breaker.opened -= settings.BREAKER_RESET
+        self.assertEqual(process_pid_queue()['done'], 1)
+        self.assertEqual(breaker.state, "closed")
+        self.assertEqual(PidQueue.objects.count(), 0)
+
+
+class PidQueueTest(PidTestCase):
+    """Publishing does not wait for the handle service"""
+
+    # A slow handle service
+    latency = 0.5
+
+    def publish(self, coll):
+        coll_this = Collection.get_graph(Collection.objects.filter(id=coll.id)).first()
+        started = time.perf_counter()
+        oBack = publish_collection(coll_this, "tester", "http://localhost/")
+        self.assertEqual(oBack['status'], "ok")
+        return time.perf_counter() - started
+
+    def read_published(self, coll):
+        with open(coll.get_publisfilename(), "r", encoding="utf-8") as f:
+            return f.read()
+
+    def test_queue(self):
+        coll = Collection.objects.create(identifier="queued", landingPage="http://localhost/queued")
+        Title.objects.create(collection=coll, name="queued")
+        fSeconds = self.publish(coll)
+        logger.info("Publishing with a slow handle service: {:.3f}s".format(fSeconds))
+        self.assertEqual(self.fake.requests, 0)
+        self.assertTrue(PidQueue.objects.filter(collection=coll).exists())
+        self.assertIn("<MdSelfLink>{}</MdSelfLink>".format(coll.get_targeturl()), self.read_published(coll))
+
+        # The worker registers the PID and publishes the collection again
+        stdout = io.StringIO()
+        call_command("pidqueue", stdout=stdout)
+        self.assertIn("1 registered", stdout.getvalue())
+        coll = Collection.objects.get(id=coll.id)
+        self.assertTrue(coll.pidname.startswith("COLL-"))
+        self.assertFalse(PidQueue.objects.exists())
+        self.assertIn("<MdSelfLink>hdl:21.11114/{}</MdSelfLink>".format(coll.pidname), self.read_published(coll))
+
+        # Publishing again does not queue it
+        self.publish(coll)
+        self.assertFalse(PidQueue.objects.exists())
+
+    def test_retry_later(self):
+        coll = Collection.objects.create(identifier="unreachable")
+        PidQueue.add(coll)
+        self.fake.latency = 0
+        self.fake.fail_next['GET'] = [401]
+        oBack = process_pid_queue()
+        self.assertEqual(oBack['errors'], 1)
+        entry = PidQueue.objects.get(collection=coll)
+        self.assertEqual(entry.attempts, 1)
+        self.assertGreater(entry.nextattempt, get_current_datetime())
+        # It is not due yet
+        self.assertEqual(process_pid_queue()['errors'], 0)
+
+    def test_breaker_open(self):
+        """Without the queue, an open breaker still lets the XML of each collection be written"""
+
+        lst_coll = []
+        for sName in ["open1", "open2"]:
+            coll = Collection.objects.create(identifier=sName, landingPage="http://localhost/{}".format(sName))
+            Title.objects.create(collection=coll, name=sName)
+            lst_coll.append(coll)
+        breaker = CircuitBreaker.get("epic")
+        for idx in range(settings.BREAKER_FAILURES):
+            breaker.failure("code 503")
+        with mock.patch("collbank.collection.views.PID_QUEUE", False):
+            lst_result = publish_chunk([x.id for x in lst_coll], "tester", "http://localhost/")
+        self.assertEqual([x['status'] for x in lst_result], ["ok", "ok"])
+        self.assertIn("PID pending", lst_result[0]['msg'])
+        self.assertEqual(self.fake.requests, 0)
+        for coll in lst_coll:
+            self.assertIn("<MdSelfLink>{}</MdSelfLink>".format(coll.get_targeturl()), self.read_published(coll))
+        self.assertEqual(PidQueue.objects.count(), 2)
+
+
+class PidReconcileTest(PidTestCase):
+    """All handles are matched against the collections with a few calls"""
+
+    def test_reconcile(self):
+        lst_coll = [Collection.objects.create(identifier="rec{}".format(idx)) for idx in range(4)]
+        self.assertTrue(lst_coll[0].register_pid())
+        # A handle that is not known to the collection, two handles for one collection and an orphan
+        self.fake.handles["COLL-1001"] = lst_coll[1].get_targeturl()
+        self.fake.handles["COLL-1002"] = lst_coll[2].get_targeturl()
+        self.fake.handles["COLL-1003"] = lst_coll[2].get_targeturl()
+        self.fake.handles["COLL-1004"] = REGISTRY_URL + "cbmetadata_99999"
+
+        self.assertEqual(len(self.pidservice.listpids(iPageSize=2)), 5)
+        self.assertEqual(PidClient.get_metrics()['listpids']['calls'], 3)
+
+        iRequests = self.fake.requests
+        oBack = self.pidservice.reconcile(bFix=True)
+        self.assertEqual(self.fake.requests, iRequests + 1)
+        self.assertEqual(oBack['handles'], 5)
+        self.assertEqual(oBack['ok'], 1)
+        self.assertEqual(oBack['mismatches'], [lst_coll[1].get_xmlfilename()])
+        self.assertEqual(oBack['duplicates'], {lst_coll[2].get_xmlfilename(): ["COLL-1002", "COLL-1003"]})
+        self.assertEqual(oBack['missing'], [lst_coll[3].get_xmlfilename()])
+        self.assertEqual(oBack['orphans'], ["COLL-1004"])
+
+        # The fixed collection does not need the handle service any more
+        coll = Collection.objects.get(id=lst_coll[1].id)
+        self.assertEqual(coll.pidname, "COLL-1001")
+        self.assertTrue(coll.register_pid())
+        self.assertEqual(self.fake.requests, iRequests + 1)
+
+
+class ReferenceIndexTest(TestCase):
+    """Languages and countries should be resolved without per-item queries"""
+
+    languages = [("nld", "Dutch"), ("eng", "English"), ("deu", "German"), ("fra", "French"), ("fry", "Western Frisian")]
+
+    def setUp(self):
+        for sCode, sName in self.languages:
+            iso = LanguageIso.objects.create(code=sCode)
+            LanguageName.objects.create(iso=iso, name=sName)
+        CountryIso.objects.create(alpha2="NL", alpha3="NLD", numeric=528, english="Netherlands (the)", french="Pays-Bas (les)")
+
+    def test_language_lookup(self):
+        ReferenceIndex.load()
+        with CaptureQueriesContext(connection) as ctx:
+            for sCode, sName in self.languages:
+                # Name in another case, the code only and an unknown name
+                oItem = {"LanguageName": sName.upper(), "ISO639": {"iso-639-3-code": sCode}}
+                self.assertEqual(LanguageName.get_instance(oItem, {}).name, sName)
+                oItem = {"ISO639": {"iso-639-3-code": sCode}}
+                self.assertEqual(LanguageName.get_instance(oItem, {}).iso.code, sCode)
+                oItem = {"LanguageName": "unknown", "ISO639": {"iso-639-3-code": sCode}}
+                self.assertEqual(LanguageName.get_instance(oItem, {}).name, sName)
+            self.assertEqual(CountryIso.get_byalpha2("nl").alpha3, "NLD")
+        self.assertEqual(len(ctx.captured_queries), 0)
+
+    def test_refresh(self):
+        self.assertIsNone(ReferenceIndex.get_langname_bycode("ita"))
+        iso = LanguageIso.objects.create(code="ita")
+        LanguageName.objects.create(iso=iso, name="Italian")
+        self.assertEqual(ReferenceIndex.get_langname_bycode("ita").name, "Italian")
+
+
+class AdminChoicesTest(TestCase):
+    """The admin forms should share one load of FieldChoice and HelpChoice"""
+
+    def count_choice_queries(self, coll):
+        # Start from an empty registry, as if a choice had just been changed
+        FieldChoiceIndex.invalidate()
+        HelpChoiceIndex.invalidate()
+        ChoiceRegistry.changed()
+        url = "/admin/collection/collection/{}/change/".format(coll.id)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        lst_table = ['"collection_fieldchoice"', '"collection_helpchoice"']
+        return len([x for x in ctx.captured_queries if any(table in x['sql'] for table in lst_table)])
+
+    def test_choice_queries(self):
+        self.client.force_login(User.objects.create_superuser("admin", "admin@localhost", "admin"))
+        iSmall = self.count_choice_queries(CollectionGraphTest.add_collection(self, "small", 1))
+        iLarge = self.count_choice_queries(CollectionGraphTest.add_collection(self, "large", 6))
+        logger.info("Choice queries for the collection change page: {}".format(iLarge))
+        self.assertEqual(iSmall, 2)
+        self.assertEqual(iLarge, 2)
+
+
+class StartupTest(SimpleTestCase):
+    """Loading the models should not touch the database"""
+
+    # Count the queries issued by django.setup() in a fresh interpreter
+    startup_script = """
+import time, django
+from django.db import connection
+queries = []
+def count_query(execute, sql, params, many, context):
+    queries.append(sql)
+    return execute(sql, params, many, context)
+started = time.perf_counter()
+with connection.execute_wrapper(count_query):
+    django.setup()
+print(len(queries), time.perf_counter() - started)
+"""
+
+    def test_startup_queries(self):
+        env = dict(os.environ)
+        env['DJANGO_SETTINGS_MODULE'] = settings.SETTINGS_MODULE
+        output = subprocess.run([sys.executable, "-c", self.startup_script], cwd=settings.BASE_DIR,
+                                env=env, capture_output=True, text=True, check=True).stdout
+        sCount, sTime = output.strip().split("\n")[-1].split()
+        logger.info("Startup: {} queries, {:.3f}s".format(sCount, float(sTime)))
+        self.assertEqual(int(sCount), 0)
+
+
+class ReferenceDataTest(SimpleTestCase):
+    """The country codes are looked up through their indexes"""
+
+    def test_country_codes(self):
+        self.assertEqual(len(CountryCodes.get_list()), 250)
+        tplCountry = CountryCodes.get_by_alpha2("nl")
+        self.assertEqual(tplCountry, ("NL", "Netherlands (the)", "Pays-Bas (les)", "NLD", "528"))
+        self.assertIs(CountryCodes.get_by_alpha3("NLD"), tplCountry)
+        self.assertIs(CountryCodes.get_by_numeric("528"), tplCountry)
+        self.assertIs(CountryCodes.get_by_english("Netherlands (the)"), tplCountry)
+        self.assertIs(CountryCodes.get_by_english("netherlands"), tplCountry)
+        self.assertEqual(CountryCodes.get_by_numeric("004")[0], "AF")
+        self.assertIsNone(CountryCodes.get_by_alpha2("XX"))
+
+
+class UpgradeSchemaTest(TransactionTestCase):
+    """An existing database gets the new tables and columns, once"""
+
+    def test_upgrade(self):
+        from collbank.reader.models import VloItem, VloPublication
+        with connection.schema_editor() as editor:
+            editor.delete_model(VloPublication)
+            editor.delete_model(PidCache)
+            editor.remove_field(VloItem, VloItem._meta.get_field("filehash"))
+            editor.remove_field(Collection, Collection._meta.get_field("graphversion"))
+        stdout = io.StringIO()
+        call_command("upgradeschema", stdout=stdout)
+        self.assertIn("Created table collection_pidcache", stdout.getvalue())
+        self.assertIn("Added column reader_vloitem.filehash", stdout.getvalue())
+        self.assertEqual(stdout.getvalue().count("upgradeschema:"), 4)
+        coll = Collection.objects.create(identifier="upgraded")
+        self.assertEqual(Collection.objects.get(id=coll.id).graphversion, 0)
+        self.assertEqual(PidCache.objects.count(), 0)
+
+        # Nothing is left to do
+        stdout = io.StringIO()
+        call_command("upgradeschema", stdout=stdout)
+        self.assertIn("up to date", stdout.getvalue())
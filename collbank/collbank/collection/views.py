@@ -6,8 +6,9 @@ from django.contrib.admin.templatetags.admin_list import result_headers
 from django.contrib.auth import login, authenticate
 from django.contrib.auth.models import Group, User
 from django.urls import reverse
+from django.db import connections
 from django.db.models.functions import Lower
-from django.http import HttpRequest, HttpResponse, HttpResponseRedirect, JsonResponse
+from django.http import HttpRequest, HttpResponse, HttpResponseRedirect, JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, render, redirect
 from django.template import RequestContext, loader
 from django.utils import timezone
@@ -17,26 +18,29 @@ from wsgiref import util
 from wsgiref.util import FileWrapper
 import json
 from datetime import datetime
-from xml.dom import minidom
-import xml.etree.ElementTree as ET
 import lxml
 from lxml import etree
+import lxml.etree as ET
 import os
 import tarfile
 import zipfile
 import tempfile
 import io
 import re
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from requests import request
 
 from collbank.collection.models import *
-from collbank.settings import APP_PREFIX, WSGI_FILE, STATIC_ROOT, WRITABLE_DIR, COUNTRY_CODES # , LANGUAGE_CODE_LIST
+from collbank.settings import APP_PREFIX, WSGI_FILE, STATIC_ROOT, WRITABLE_DIR, PUBLISH_WORKERS, PID_QUEUE
 # Not used anymore: OUTPUT_XML
 from collbank.collection.admin import CollectionAdmin
 from collbank.collection.forms import *
 from collbank.collection.adaptations import listview_adaptations
 from collbank.basic.utils import ErrHandle
-from collbank.collection.services import get_oai_status, reindex_oai
+from collbank.collection.services import get_oai_status, reindex_oai, get_backend_status, BackendUnavailable, CircuitBreaker, PidClient
+from collbank.collection.refdata import CountryCodes
 
 from collbank.basic.views import BasicDetails, BasicList
 
@@ -47,12 +51,44 @@ XSI_CMD = "http://www.clarin.eu/cmd/"
 # Draft publication version:
 XSD_ID = "clarin.eu:cr1:p_1493735943947"
 XSI_XSD = "https://catalog.clarin.eu/ds/ComponentRegistry/rest/registry/1.x/profiles/" + XSD_ID + "/xsd/"
+XSI_INSTANCE = "http://www.w3.org/2001/XMLSchema-instance"
+CMD_NSMAP = {None: XSI_CMD, 'xsd': "http://www.w3.org/2001/XMLSchema/", 'xsi': XSI_INSTANCE}
 
 app_user = "RegistryUser"
 app_editor = "RegistryEditor"
 app_moderator = "RegistryModerator"
 bDebug = False
 
+# Process-wide cache of the compiled XSD schema, keyed by the mtime of the XSD file
+schema_cache = {'path': None, 'mtime': None, 'schema': None}
+schema_lock = threading.Lock()
+# Text content in serialized XML: lxml escapes '<' and '>' everywhere, also in attribute values
+re_xml_text = re.compile(r'>[^<]*"[^<]*<')
+
+
+class ArchiveStream(object):
+    """Write-only file object that collects the bytes a tarfile or zipfile writes to it
+
+    The caller takes the collected bytes out with [pop()] and sends them on
+    """
+
+    def __init__(self):
+        self.buffer = io.BytesIO()
+
+    def write(self, data):
+        return self.buffer.write(data)
+
+    def flush(self):
+        pass
+
+    def pop(self):
+        """Return the bytes written so far and empty the buffer"""
+        data = self.buffer.getvalue()
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        return data
+
+
 # General help functions
 def add_collection_xml(col_this, crp):
     """Add the collection information from [col_this] to XML element [crp]"""
@@ -379,6 +415,49 @@ def add_element(optionality, col_this, el_name, crp, **kwargs):
     # Return positively
     return True
     
+def archive_collections(qs, sUserName, sHomeUrl, sType="tar"):
+    """Generator that yields a tar.gz or zip archive with the XML of all collections in [qs]
+
+    Each collection is converted and added to the archive just before its bytes are yielded,
+    so the archive is never kept in memory as a whole. An error is raised again after it has
+    been logged: the response has already started, and the connection must be aborted, so
+    that the client does not take a truncated archive for a complete one.
+    """
+
+    oErr = ErrHandle()
+    stream = ArchiveStream()
+    try:
+        if sType == "zip":
+            # A zipfile that cannot seek writes a data descriptor after each member
+            archive = zipfile.ZipFile(stream, 'w', compression=zipfile.ZIP_DEFLATED)
+        else:
+            # The "w|gz" mode writes a gzip-compressed stream of tar blocks
+            archive = tarfile.open(fileobj=stream, mode="w|gz")
+        with archive:
+            # Load the graph of a limited number of collections at a time
+            for coll_this in Collection.get_graph(qs).iterator(chunk_size=20):
+                # Get the XML text of this object
+                (bValid, sXmlText) = create_collection_xml(coll_this, sUserName, sHomeUrl)
+                if bValid:
+                    sName = coll_this.identifier + ".xml"
+                    if sType == "zip":
+                        archive.writestr(sName, sXmlText)
+                    else:
+                        sEnc = sXmlText.encode('utf-8')
+                        info = tarfile.TarInfo(name=sName)
+                        info.size = len(sEnc)
+                        archive.addfile(tarinfo=info, fileobj=io.BytesIO(sEnc))
+                    # The compressor may still hold on to the data
+                    data = stream.pop()
+                    if len(data) > 0:
+                        yield data
+        # Closing the archive writes the trailer
+        yield stream.pop()
+    except:
+        msg = oErr.get_error_message()
+        oErr.DoError("archive_collections")
+        raise
+
 def create_collection_xml(collection_this, sUserName, sHomeUrl):
     """Convert the 'collection' object from the context to XML
     
@@ -401,12 +480,17 @@ def create_collection_xml(collection_this, sUserName, sHomeUrl):
         # Add this collection to the xml
         add_collection_xml(collection_this, collroot )
 
+        # Put all elements into the CMD namespace
+        set_cmd_namespace(top)
+
         # Convert the XML to a string
-        xmlstr = minidom.parseString(ET.tostring(top,encoding='utf-8')).toprettyxml(indent="  ")
+        xmlstr = get_xml_pretty(top)
 
-        # Validate the XML against the XSD
-        (bValid, oError) = validateXml(xmlstr)
+        # Validate the XML tree against the XSD
+        (bValid, oError) = validateXml(top)
         if not bValid:
+            # Validate the string once more, so that the errors refer to its lines
+            (bValid, oError) = validateXml(xmlstr)
             # Get error messages for all the errors
             return (False, xsd_error_list(oError, xmlstr))
 
@@ -434,13 +518,11 @@ def get_country(cntryCode):
 
     # Get the country string according to field-choice
     sCountry = choice_english(PROVENANCE_GEOGRAPHIC_COUNTRY, cntryCode).strip()
-    sCountryAlt = sCountry + " (the)"
-    # Walk all country codes
-    for tplCountry in COUNTRY_CODES:
-        # Check for country name or alternative country name
-        if sCountry == tplCountry[1] or sCountryAlt == tplCountry[1]:
-            # REturn the correct country name and code
-            return (tplCountry[1], tplCountry[0])
+    # Look up the country name (with or without " (the)")
+    tplCountry = CountryCodes.get_by_english(sCountry)
+    if not tplCountry is None:
+        # REturn the correct country name and code
+        return (tplCountry[1], tplCountry[0])
     # Empty
     return (None, None)
 
@@ -449,19 +531,59 @@ def get_language_code_name(lng_obj):
 
     sLanguage = None
     code = None
-    if not lng_obj is None:
-        sLanguage = lng_obj.langname.name
-        code = lng_obj.langname.iso.code
+    if not lng_obj is None and not lng_obj.langname_id is None:
+        # Take the LanguageName from the reference index, so that no query is needed
+        langname = ReferenceIndex.get_langname(lng_obj.langname_id)
+        if langname is None:
+            langname = lng_obj.langname
+        sLanguage = langname.name
+        code = langname.iso.code
     return (sLanguage, code)
 
+def get_xml_pretty(top):
+    """Pretty-print the XML tree [top] in the layout of minidom's toprettyxml(indent="  ")
+
+    lxml escapes a double quote only in attribute values, while minidom writes it as &quot;
+    in text content too. The text between '>' and '<' is escaped afterwards, so that the
+    output stays byte-identical to what was published before.
+    """
+
+    sXml = ET.tostring(top, pretty_print=True, encoding="unicode")
+    sXml = re_xml_text.sub(lambda m: m.group(0).replace('"', "&quot;"), sXml)
+    sBack = '<?xml version="1.0" ?>\n' + sXml
+    return sBack
+
 def getSchema():
+    """Get the compiled XSD schema, re-compiling it only when the XSD file has changed"""
     
     oErr = ErrHandle()
-    pattern = r'\<xs\:attribute [a-z]*\=\"xml\:[a-z0-9]+.*\>'
     try:
         # Get the XSD file into an LXML structure
         fSchema = os.path.abspath(os.path.join(WRITABLE_DIR, "xsd", "CorpusCollection.xsd.txt"))
+        fMtime = os.path.getmtime(fSchema)
+    except:
+        msg = oErr.get_error_message()
+        oErr.DoError("getSchema")
+        return None
+
+    with schema_lock:
+        # Can we use the schema that has already been compiled?
+        if schema_cache['schema'] != None and schema_cache['path'] == fSchema and schema_cache['mtime'] == fMtime:
+            return schema_cache['schema']
+
+        schema = compileSchema(fSchema)
+        if schema != None:
+            schema_cache['path'] = fSchema
+            schema_cache['mtime'] = fMtime
+            schema_cache['schema'] = schema
+    return schema
 
+def compileSchema(fSchema):
+    """Read, fix and compile the XSD schema in file [fSchema]"""
+
+    oErr = ErrHandle()
+    pattern = r'\<xs\:attribute [a-z]*\=\"xml\:[a-z0-9]+.*\>'
+    try:
         with open(fSchema, mode="rb") as f:  
             sText = f.read()    
             
@@ -475,7 +597,7 @@ def getSchema():
         
     except:
         msg = oErr.get_error_message()
-        oErr.DoError("getSchema")
+        oErr.DoError("compileSchema")
         return None
 
     # Load the schema
@@ -490,13 +612,9 @@ def make_collection_top(colThis, sUserName, sHomeUrl):
     """Create the top-level elements for a collection"""
 
     # Define the top-level of the xml output
-    topattributes = {'xmlns': "http://www.clarin.eu/cmd/" ,
-                     'xmlns:xsd':"http://www.w3.org/2001/XMLSchema/",
-                     'xmlns:xsi': "http://www.w3.org/2001/XMLSchema-instance",
-                     'xsi:schemaLocation': XSI_CMD + " " + XSI_XSD,
-                     'CMDVersion':'1.1'}
-    # topattributes = {'CMDVersion':'1.1'}
-    top = ET.Element('CMD', topattributes)
+    top = ET.Element('CMD', nsmap=CMD_NSMAP)
+    top.set("{{{}}}schemaLocation".format(XSI_INSTANCE), XSI_CMD + " " + XSI_XSD)
+    top.set('CMDVersion', '1.1')
 
     # Add a header
     hdr = ET.SubElement(top, "Header", {})
@@ -505,10 +623,8 @@ def make_collection_top(colThis, sUserName, sHomeUrl):
     mdCreator.text = sUserName
     mdSelf = ET.SubElement(hdr, "MdSelfLink")
 
-    # If published: add the self link
-    if colThis.pidname != None:
-        # The selflink is the persistent identifier, preceded by 'hdl:'
-        mdSelf.text = "hdl:{}/{}".format(colThis.handledomain, colThis.pidname)
+    # Add the self link: the handle, or a provisional link while it is being registered
+    mdSelf.text = colThis.get_selflink()
     mdProf = ET.SubElement(hdr, "MdProfile")
     mdProf.text = XSD_ID
 
@@ -572,35 +688,174 @@ def make_collection_top(colThis, sUserName, sHomeUrl):
     # Return the resulting top-level element
     return top     
             
-def publish_collection(coll_this, sUserName, sHomeUrl):
-    """Create the XML of this collection and put it in a publishing directory"""
+def publish_collection(coll_this, sUserName, sHomeUrl, bIncremental=False):
+    """Create the XML of this collection and put it in a publishing directory
+    
+    When [bIncremental] is set, a collection is skipped if the publication ledger 
+    shows that it has not changed since it was last published
+    """
 
     # Create an object to return
     oBack = {'status': 'ok', 'msg': ''}
+    # Do we need to do anything at all?
+    if bIncremental and Publication.is_current(coll_this):
+        oBack['status'] = 'skipped'
+        return oBack
     # Make sure this record has a registered PID
-    coll_this.register_pid()
+    if PID_QUEUE:
+        # Do not wait for the handle service: the PID queue takes care of it
+        PidQueue.add(coll_this, sUserName, sHomeUrl, bRepublish=True)
+    else:
+        try:
+            coll_this.register_pid()
+        except BackendUnavailable as ex:
+            # Publish with the current self link, and let the PID queue register it later
+            PidQueue.add(coll_this, sUserName, sHomeUrl, bRepublish=True)
+            oBack['msg'] = "PID pending: {}".format(ex)
     # Save the relation files
     coll_this.save_relations()
     # Get the XML text of this object
     (bValid, sXmlText) = create_collection_xml(coll_this, sUserName, sHomeUrl)
     if bValid:
-        # Get the full path to the registry file
-        fPublish = coll_this.get_publisfilename()
-        # Write it to a file in the XML directory
-        with open(fPublish, encoding="utf-8", mode="w") as f:  
-            f.write(sXmlText)
-
-        # Publish the .cmdi.xml
-        fPublish = coll_this.get_publisfilename("joai")
-        # Write it to a file in the XML directory
-        with open(fPublish, encoding="utf-8", mode="w") as f:  
-            f.write(sXmlText)
+        sXmlHash = Publication.get_hash(sXmlText)
+        ledger = getattr(coll_this, "publication", None)
+        if bIncremental and ledger != None and ledger.xmlhash == sXmlHash:
+            # The edits did not change the XML: there is no need to write it again
+            oBack['status'] = 'skipped'
+        else:
+            # Write the registry file and the .cmdi.xml for jOAI, unless they already have this content
+            write_published_xml(sXmlText, [coll_this.get_publisfilename(), coll_this.get_publisfilename("joai")])
+        # Keep track of what has been published
+        Publication.set_published(coll_this, sXmlHash, len(sXmlText.encode("utf-8")))
     else:
+        Publication.set_error(coll_this)
         oBack['status'] = 'error'
         oBack['msg'] = sXmlText
         oBack['coll'] = coll_this
     return oBack
 
+def process_pid_queue(iMax=0):
+    """Register the PIDs of the collections in the PID queue that are due
+
+    A collection that has been published with a provisional self link is published again,
+    so that its XML gets the handle. Failed attempts are tried again later.
+    """
+
+    oBack = {'status': 'ok', 'msg': '', 'done': 0, 'errors': 0}
+    oErr = ErrHandle()
+    try:
+        qs = PidQueue.objects.filter(nextattempt__lte=get_current_datetime()).select_related("collection").order_by("nextattempt")
+        if iMax > 0:
+            qs = qs[:iMax]
+        for entry in qs:
+            breaker = CircuitBreaker.get("epic")
+            if breaker.is_open():
+                # Leave the rest of the queue alone, without using up attempts
+                oBack['status'] = 'degraded'
+                oBack['msg'] = breaker.get_message()
+                break
+            coll_this = entry.collection
+            try:
+                bOkay = coll_this.register_pid()
+                msg = "" if bOkay else "The handle service did not register the PID"
+            except:
+                bOkay = False
+                msg = oErr.get_error_message()
+            if bOkay and entry.republish:
+                # Publish it again with the handle as self link
+                coll_this = Collection.get_graph(Collection.objects.filter(id=coll_this.id)).first()
+                oPublish = publish_collection(coll_this, entry.username or "", entry.homeurl or "")
+                if oPublish['status'] == 'error':
+                    bOkay = False
+                    msg = oPublish['msg']
+            if bOkay:
+                entry.delete()
+                oBack['done'] += 1
+            else:
+                entry.set_error(msg)
+                oBack['errors'] += 1
+    except:
+        msg = oErr.get_error_message()
+        oErr.DoError("process_pid_queue")
+        oBack['status'] = 'error'
+        oBack['msg'] = msg
+    return oBack
+
+def publish_chunk(lst_id, sUserName, sHomeUrl, bRepublish=False, bIncremental=False):
+    """Publish the collections with an id in [lst_id] and return a list of results
+
+    This is called directly for serial publishing, and inside a worker process for parallel publishing.
+    The results only contain plain values, so that they can be passed back from a worker.
+    """
+
+    lst_back = []
+    oErr = ErrHandle()
+    try:
+        # Load the graph of all the collections in this chunk at once
+        qs = Collection.get_graph(Collection.objects.filter(id__in=lst_id))
+        for coll_this in qs:
+            oResult = {'id': coll_this.id, 'status': 'skipped', 'msg': ''}
+            # Check if publishing is needed
+            if bRepublish:
+                bDoPublish = (coll_this.get_status() == "published")
+            else:
+                bDoPublish = True
+            if bDoPublish:
+                try:
+                    oPublish = publish_collection(coll_this, sUserName, sHomeUrl, bIncremental)
+                    oResult['status'] = oPublish['status']
+                    oResult['msg'] = oPublish['msg']
+                except:
+                    # Only this collection fails: continue with the rest of the chunk
+                    oResult['status'] = 'error'
+                    oResult['msg'] = oErr.get_error_message()
+                    oErr.DoError("publish_chunk [{}]".format(coll_this.id))
+            lst_back.append(oResult)
+    except:
+        msg = oErr.get_error_message()
+        oErr.DoError("publish_chunk")
+        # Report the collections that have not been done yet as errors
+        lst_done = [x['id'] for x in lst_back]
+        for id in lst_id:
+            if not id in lst_done:
+                lst_back.append({'id': id, 'status': 'error', 'msg': msg})
+    return lst_back
+
+def publish_worker_init():
+    """Initialize a publishing worker process"""
+
+    global schema_lock
+
+    # The worker is forked from a process that may have other threads: a lock that was held
+    #   by one of those threads at the time of the fork would never be released here
+    schema_lock = threading.Lock()
+    CircuitBreaker.lock = threading.Lock()
+    PidClient.lock = threading.Lock()
+    CountryCodes.lock = threading.Lock()
+    # Each worker compiles its own copy of the XSD schema
+    schema_cache['path'] = None
+    schema_cache['mtime'] = None
+    schema_cache['schema'] = None
+    # Each worker opens its own database connection upon first use
+    for conn in connections.all():
+        conn.close()
+
+def set_cmd_namespace(top):
+    """Put [top] and all elements under it in the CMD namespace
+    
+    The tree is built with plain tag names; this single pass over the tree replaces
+    the serialize/parse round trip that used to give the elements their namespace.
+    """
+
+    sNamespace = "{{{}}}".format(XSI_CMD)
+    for el in top.iter():
+        if not el.tag.startswith("{"):
+            el.tag = sNamespace + el.tag
+        # Empty strings should be serialized as empty elements
+        if el.text == "":
+            el.text = None
+    return top
+
 def treat_bom(sHtml):
     """REmove the BOM marker except at the beginning of the string"""
 
@@ -646,7 +901,7 @@ def user_is_superuser(request):
 def validateXml(xmlstr):
     """Validate an XML string against an XSD schema
     
-    The first argument is a string containing the XML.
+    The first argument is a string containing the XML, or an lxml element that is validated in memory.
     The XSD schema that is being used must be present in the static files section.
     """
 
@@ -664,13 +919,17 @@ def validateXml(xmlstr):
                 return (False, oMsg, )
 
         # Load the XML string into a document
-        xml = etree.XML(xmlstr)
+        if isinstance(xmlstr, str) or isinstance(xmlstr, bytes):
+            xml = etree.XML(xmlstr)
+        else:
+            xml = xmlstr
 
-        # Perform the validation
-        validation = schema.validate(xml)
+        # Perform the validation: the error log belongs to the (shared) schema
+        with schema_lock:
+            validation = schema.validate(xml)
+            oMsg = schema.error_log.copy()
 
         bBack = validation
-        oMsg = schema.error_log
     except:
         oMsg['error'] = oErr.get_error_message()
         oErr.DoError("validateXml")
@@ -716,6 +975,12 @@ def xsd_error_as_simple_string(error):
     ]
     return ':'.join([str(item) for item in parts])
 
+def warm_schema():
+    """Compile the XSD schema ahead of time, so that the first publication does not pay for it"""
+
+    schema = getSchema()
+    return (schema != None)
+
 
 
 # ============= Standard Views ==============================================
@@ -738,6 +1003,8 @@ def home(request):
             context['oai_status'] = oOAI['msg']
         else:
             context['oai_status'] = "No response from OAI"
+        # Show the back-ends that are not available
+        context['backends'] = [x for x in get_backend_status() if x['state'] != "closed"]
 
 
         # Create a response
@@ -932,6 +1199,15 @@ class CollectionListView(ListView):
             else:
                 # Return a positive result
                 return super(CollectionListView, self).render_to_response(context, **response_kwargs)
+        elif sType == 'update':
+            # Only publish what has changed since the last publication
+            context['publish'] = self.publish_xml(context, False, True)
+            if context['publish']['status'] == 'error':
+                sHtml = context['publish']['html']
+                return HttpResponse(sHtml)
+            else:
+                # Return a positive result
+                return super(CollectionListView, self).render_to_response(context, **response_kwargs)
         elif sType == 'republish':
             # Perform the publishing
             context['publish'] = self.publish_xml(context, True)
@@ -979,7 +1255,8 @@ class CollectionListView(ListView):
             qs = Collection.objects.order_by(order)
         if not bAscending:
             qs = qs.reverse()
-        context['overview_list'] = qs.select_related()
+        # The publication status comes from the ledger, in the same query
+        context['overview_list'] = Publication.annotate_status(qs.select_related())
         context['order_heads'] = self.order_heads
         # Return the calculated context
         return context
@@ -987,68 +1264,28 @@ class CollectionListView(ListView):
     def download_to_tar(self, context):
         """Make the XML representation of ALL collections downloadable as a tar.gz"""
 
-        # Get the overview list
-        qs = context['overview_list']
-        if qs != None and len(qs) > 0:
-            out = io.BytesIO()
-            # Combine the files
-            with tarfile.open(fileobj=out, mode="w:gz") as tar:
-                for coll_this in qs:
-                    sHomeUrl = request.build_absolute_uri(reverse('home'))
-                    sUserName = request.user.username
-                    # Get the XML text of this object
-                    (bValid, sXmlText) = create_collection_xml(coll_this, sUserName, sHomeUrl)
-                    if bValid:
-                        sEnc = sXmlText.encode('utf-8')
-                        bData = io.BytesIO(sEnc)
-
-                        info = tarfile.TarInfo(name=coll_this.identifier + ".xml")
-                        info.size = len(sEnc)
-                        tar.addfile(tarinfo=info, fileobj=bData)
-                    else:
-                        # Return the error response
-                        response = HttpResponse(sXmlText)
-
-            # Create the HttpResponse object with the appropriate header.
-            response = HttpResponse(out.getvalue(), content_type='application/x-gzip')
-            response['Content-Disposition'] = 'attachment; filename="collbank_all.tar.gz"'
-        else:
-            # Return the error response
-            response = HttpResponse("<div>The overview list is empty</div><div><a href=\"/"+APP_PREFIX+"\">Back</a></div>")
-
-        # Return the result
-        return response
+        return self.download_archive(context, "tar")
 
     def download_to_zip(self, context):
         """Make the XML representation of ALL collections downloadable as a .zip"""
 
+        return self.download_archive(context, "zip")
+
+    def download_archive(self, context, sType):
+        """Stream an archive of type [sType] (tar or zip) with the XML of all collections"""
+
         # Get the overview list
         qs = context['overview_list']
-        if qs != None and len(qs) > 0:
-            temp = tempfile.TemporaryFile()
-            # Combine the files
-            with zipfile.ZipFile(temp, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
-                for coll_this in qs:
-                    sHomeUrl = request.build_absolute_uri(reverse('home'))
-                    sUserName = request.user.username
-                    # Get the XML text of this object
-                    (bValid, sXmlText) = create_collection_xml(coll_this, sUserName, sHomeUrl)
-                    if bValid:
-                        archive.writestr(coll_this.identifier + ".xml", sXmlText)
-                    else:
-                        # Return the error response
-                        response = HttpResponse(sXmlText)
-                # Do some checking
-                x = 1
-            # Get file information
-            iLength = temp.tell()
-            temp.seek(0)
-            # Use a wrapper to chunk-send it
-            wrapper = FileWrapper(temp)
-            # Create the HttpResponse object with the appropriate header.
-            response = HttpResponse(wrapper, content_type='application/zip')
-            response['Content-Disposition'] = 'attachment; filename="collbank_all.zip"'
-            response['Content-Length'] = iLength
+        if qs != None and qs.exists():
+            sHomeUrl = self.request.build_absolute_uri(reverse('home'))
+            sUserName = self.request.user.username
+            # The archive is produced while it is being sent
+            if sType == "zip":
+                response = StreamingHttpResponse(archive_collections(qs, sUserName, sHomeUrl, "zip"), content_type='application/zip')
+                response['Content-Disposition'] = 'attachment; filename="collbank_all.zip"'
+            else:
+                response = StreamingHttpResponse(archive_collections(qs, sUserName, sHomeUrl, "tar"), content_type='application/x-gzip')
+                response['Content-Disposition'] = 'attachment; filename="collbank_all.tar.gz"'
         else:
             # Return the error response
             response = HttpResponse("<div>The overview list is empty</div><div><a href=\"/"+APP_PREFIX+"\">Back</a></div>")
@@ -1056,42 +1293,66 @@ class CollectionListView(ListView):
         # Return the result
         return response
 
-    def publish_xml(self, context, bRepublish=False):
-        """Create XML of all collections, give them a PID and save them in the /database/xml directory"""
+    def publish_xml(self, context, bRepublish=False, bIncremental=False):
+        """Create XML of all collections, give them a PID and save them in the /database/xml directory
+        
+        The collections are divided over PUBLISH_WORKERS worker processes
+        With [bIncremental] only collections that changed since their last publication are done
+        """
 
         # Get the overview list -- which is what I am able to publish myself anyway
         qs = context['overview_list']
         oBack = {'status': 'unknown', 'written': 0}
         iWritten = 0
         iErrors = 0
+        iSkipped = 0
+        oErr = ErrHandle()
         if qs != None and len(qs) > 0:
-            # Assuming all goes well
-            oBack['status'] = 'published'
-            coll_list = []
-            sHomeUrl = self.request.build_absolute_uri(reverse('home'))
-            sUserName = self.request.user.username
-            iTotal = qs.count()
-            iCount = 0
-            # Walk all the descriptors in the queryset
-            for coll_this in qs: 
-                iCount += 1
-                print("publish_xml: {}/{}".format(iCount, iTotal))
-                # Check if publishing is needed
-                if bRepublish:
-                    bDoPublish = (coll_this.get_status() == "published")
+            try:
+                # Assuming all goes well
+                oBack['status'] = 'published'
+                coll_list = []
+                sHomeUrl = self.request.build_absolute_uri(reverse('home'))
+                sUserName = self.request.user.username
+                lst_id = [x.id for x in qs]
+                iTotal = len(lst_id)
+                iWorkers = min(PUBLISH_WORKERS, iTotal)
+                lst_result = []
+                if iWorkers > 1 and "fork" in multiprocessing.get_all_start_methods():
+                    # Divide the work into chunks: several per worker, so that slow collections get spread out
+                    iSize = max(1, iTotal // (iWorkers * 4))
+                    lst_chunk = [lst_id[i:i+iSize] for i in range(0, iTotal, iSize)]
+                    # Workers must not share our database connection
+                    connections.close_all()
+                    with ProcessPoolExecutor(max_workers=iWorkers, mp_context=multiprocessing.get_context("fork"),
+                                             initializer=publish_worker_init) as executor:
+                        lst_future = [executor.submit(publish_chunk, lst_chunk_ids, sUserName, sHomeUrl, bRepublish, bIncremental) for lst_chunk_ids in lst_chunk]
+                        for future in lst_future:
+                            lst_result.extend(future.result())
+                            oErr.Status("publish_xml: {}/{}".format(len(lst_result), iTotal))
                 else:
-                    bDoPublish = True
-                if bDoPublish:
-                    oPublish = publish_collection(coll_this, sUserName, sHomeUrl)
-                    if oPublish['status'] == 'error':
+                    lst_result = publish_chunk(lst_id, sUserName, sHomeUrl, bRepublish, bIncremental)
+
+                # Aggregate the results
+                coll_dict = {x.id: x for x in qs}
+                for oResult in lst_result:
+                    if oResult['status'] == 'error':
                         iErrors += 1
-                        coll_list.append(oPublish)
-                    else:
+                        coll_list.append({'status': 'error', 'msg': oResult['msg'], 'coll': coll_dict.get(oResult['id'])})
+                    elif oResult['status'] == 'ok':
                         iWritten += 1
-            # Adapt the status
-            oBack['written'] = iWritten
-            oBack['errors'] = iErrors
-            oBack['coll_list'] = coll_list
+                    else:
+                        iSkipped += 1
+                # Adapt the status
+                oBack['written'] = iWritten
+                oBack['skipped'] = iSkipped
+                oBack['errors'] = iErrors
+                oBack['coll_list'] = coll_list
+            except:
+                msg = oErr.get_error_message()
+                oErr.DoError("CollectionListView/publish_xml")
+                oBack['status'] = 'error'
+                oBack['html'] = msg
         else:
             oBack['status'] = 'empty'
 
@@ -1127,8 +1388,11 @@ class CollectionDetailView(DetailView):
             if kwargs['type'] == 'handle':
                 # Get the View object in the standard way
                 self.object = self.get_object()
-                # Make sure the PID is registered
-                self.instance.register_pid()
+                # Make sure the PID is (going to be) registered
+                if PID_QUEUE:
+                    PidQueue.add(self.instance)
+                else:
+                    self.instance.register_pid()
                 # Get the correct slug name
                 sSlug = self.instance.get_xmlfilename()
                 return HttpResponseRedirect(reverse('registry', kwargs={'type': 'registry', 'slug': sSlug}))
@@ -1315,6 +1579,12 @@ class CollectionDetailView(DetailView):
         # Return the evaluation
         return evaluate
 
+    def get_queryset(self):
+        # Showing, validating, publishing and exporting all walk the whole collection graph
+        if self.kwargs.get('type') in ['registry', 'handle']:
+            return Collection.objects.all()
+        return Collection.get_graph()
+
     def get_object(self):
         obj = super(CollectionDetailView,self).get_object()
         self.instance = obj
@@ -12,11 +12,13 @@ import xmltodict
 import lxml.etree as ET
 import os
 import json
+import hashlib
 
 
 from collbank.basic.models import LONG_STRING
 from collbank.basic.utils import ErrHandle
-from collbank.collection.models import PidService, PIDSERVICE_NAME, MAX_STRING_LEN, MAX_NAME_LEN, Resource
+from collbank.collection.models import Collection, PidCache, PidService, PIDSERVICE_NAME, MAX_STRING_LEN, MAX_NAME_LEN, Resource, \
+    Publication, get_publication_date, get_publication_status, write_published_xml
 from collbank.settings import MEDIA_ROOT, REGISTRY_URL, REGISTRY_DIR, PUBLISH_DIR
 
 def get_current_datetime():
@@ -31,7 +33,9 @@ def vloitem_path(instance, filename):
     try:
         sBack = os.path.join("collbank", filename)
         sAbsPath = os.path.abspath(os.path.join(MEDIA_ROOT, "collbank", filename))
-        if os.path.exists(sAbsPath):
+        # Another VloItem may still use the old file: then the storage picks a new name
+        bInUse = VloItem.objects.filter(file=sBack).exclude(id=instance.id).exists()
+        if os.path.exists(sAbsPath) and not bInUse:
             # Remove it
             os.remove(sAbsPath)
     except:
@@ -40,6 +44,42 @@ def vloitem_path(instance, filename):
     return sBack
 
 
+def get_file_hash(data_file):
+    """Get the SHA-256 of [data_file], which is bytes, an uploaded file or a stored FieldFile"""
+
+    oHash = hashlib.sha256()
+    if isinstance(data_file, bytes):
+        oHash.update(data_file)
+    else:
+        data_file.open("rb")
+        for chunk in data_file.chunks():
+            oHash.update(chunk)
+        data_file.seek(0)
+    return oHash.hexdigest()
+
+def set_upload_hash(instance):
+    """Set the .filehash of a SourceInfo or VloItem that has a file
+
+    Each row keeps its own file: the hash only serves to recognize an identical upload.
+    """
+
+    oErr = ErrHandle()
+    try:
+        data_file = instance.file
+        if not data_file:
+            instance.filehash = None
+        elif not data_file._committed:
+            # This is a new upload
+            instance.filehash = get_file_hash(data_file)
+        elif instance.filehash is None and data_file.storage.exists(data_file.name):
+            # A file that was stored before there were hashes
+            instance.filehash = get_file_hash(data_file)
+            data_file.close()
+    except:
+        msg = oErr.get_error_message()
+        oErr.DoError("set_upload_hash")
+
+
 # Create your models here.
 
 class SourceInfo(models.Model):
@@ -55,6 +95,10 @@ class SourceInfo(models.Model):
     collector = models.CharField("Collected by", max_length=LONG_STRING)
     # [0-1] Link to the actual user
     user = models.ForeignKey(User, on_delete=models.SET_NULL, blank=True, null=True, related_name="user_sourceinfos")
+    # [0-1] SHA-256 of the file, to recognize identical uploads
+    filehash = models.CharField("File hash", null=True, blank=True, max_length=64, db_index=True)
+    # [0-1] The collection that has been imported from the file
+    collection = models.ForeignKey(Collection, on_delete=models.SET_NULL, blank=True, null=True, related_name="collection_sourceinfos")
 
     # [1] Obligatory time of extraction
     created = models.DateTimeField(default=get_current_datetime)
@@ -72,10 +116,23 @@ class SourceInfo(models.Model):
 
         result = True
 
+    def save(self, **kwargs):
+        set_upload_hash(self)
+        return super(SourceInfo, self).save(**kwargs)
+
     def get_created(self):
         sBack = self.created.strftime("%d/%b/%Y %H:%M")
         return sBack
 
+    def get_identical(self):
+        """Get an earlier upload of the same file by the same user, from which a collection has been imported"""
+
+        obj = None
+        if not self.filehash is None and not self.user is None:
+            obj = SourceInfo.objects.filter(filehash=self.filehash, user=self.user, collection__isnull=False).exclude(
+                id=self.id).order_by("-created").first()
+        return obj
+
     def get_code_html(self):
         sCode = "-" if self.code == None else self.code
         if len(sCode) > 80:
@@ -131,6 +188,9 @@ class VloItem(models.Model):
     # [0-1] File that was used for uploading
     file = models.FileField("File", null=True, blank=True, upload_to=vloitem_path)  # upload_to="collbank/")
 
+    # [0-1] SHA-256 of the file, to recognize identical uploads
+    filehash = models.CharField("File hash", null=True, blank=True, max_length=64, db_index=True)
+
     # [0-1] A VloItem should have a title - this can be changed by the user
     title = models.CharField("Title", null=True, blank=True, max_length=LONG_STRING)
 
@@ -175,6 +235,22 @@ class VloItem(models.Model):
             sBack = self.file
         return sBack
 
+    def get_identical(self):
+        """Get an earlier VloItem of the same user with the same file, which has already been read"""
+
+        obj = None
+        if not self.filehash is None and not self.user is None:
+            obj = VloItem.objects.filter(filehash=self.filehash, user=self.user, xmlcontent__isnull=False).exclude(
+                xmlcontent="").exclude(id=self.id).order_by("-created").first()
+        return obj
+
+    def delete_upload(self):
+        """Delete this VloItem, including its file, unless another VloItem uses that file"""
+
+        if self.file and not VloItem.objects.filter(file=self.file.name).exclude(id=self.id).exists():
+            self.file.delete(save=False)
+        self.delete()
+
     def check_pid(self, pidservice, sPidName):
         """Check the PID against [sPidName] and brush up .url and .handledomain too"""
 
@@ -184,6 +260,9 @@ class VloItem(models.Model):
             # Validate
             if pidservice == None or sPidName == "": 
                 return False
+            # Nothing needs to be checked if this PID has recently been verified
+            if self.pidname == sPidName and PidCache.is_current(self, pidservice):
+                return True
             bNeedSaving = False
             # Check if the handle domain is there 
             sHandleDomain = pidservice.getdomain()
@@ -208,6 +287,8 @@ class VloItem(models.Model):
             # Need saving?
             if bNeedSaving:
                 self.save()
+            # Remember that this PID is okay now
+            PidCache.store(self, pidservice)
         except:
             msg = oErr.get_error_message()
             oErr.DoError("VloItem/check_pid")
@@ -301,17 +382,13 @@ class VloItem(models.Model):
         return sPublish
 
     def publishdate(self):
+        """Get the date of the last publication from the publication record"""
 
         sDate = "-"
         oErr = ErrHandle()
         try:
-            sPublishPath = self.get_publisfilename()
-            if os.path.isfile(sPublishPath):
-                fDate = os.path.getmtime(sPublishPath)
-                oDate = datetime.fromtimestamp( fDate)
-                sDate = oDate.strftime("%d/%b/%Y %H:%M:%S")
-            else:
-                sDate = 'unpublished'
+            ledger = getattr(self, "publication", None)
+            sDate = get_publication_date(None if ledger == None else ledger.published)
         except:
             msg = oErr.get_error_message()
             oErr.DoError("VloItem/publishdate")
@@ -334,35 +411,16 @@ class VloItem(models.Model):
         return sBack
 
     def get_status(self):
-        """Get the status of this colletion: has it been published or not?"""
+        """Get the status of this item: has it been published or not?
+        
+        The status is calculated from the publication record, without looking at the files
+        """
 
         sStatus = "-"
         oErr = ErrHandle()
         try:
-            sPublishPath = self.get_publisfilename()
-            sStatusP = 'p' if os.path.isfile(sPublishPath) else 'u'
-            # If it is published, get its publication date and compare it to 
-            sStatusD = 'n'
-            # Has it been published?
-            if sStatusP == 'p':
-                if self.updated_at == None:
-                    # If it is published, but no 'updated_at' yet, it is 'up to date'
-                    sStatusD = 'd' 
-                else:
-                    # It is published: get the file date
-                    saved_at = os.path.getmtime(sPublishPath)
-                    updated_at = datetime.timestamp( self.updated_at)
-                    sStatusD = 's' if saved_at < updated_at else 'd'
-            # Combine states
-            if sStatusP == 'u':
-                sStatus = 'not-published'
-            else:
-                if sStatusD == 'n':
-                    sStatus = 'unknown'
-                elif sStatusD == 'd':
-                    sStatus = 'published'
-                else:
-                    sStatus = 'stale' 
+            ledger = getattr(self, "publication", None)
+            sStatus = get_publication_status(None if ledger == None else ledger.published, self.updated_at)
         except:
             msg = oErr.get_error_message()
             oErr.DoError("VloItem/get_status")
@@ -423,18 +481,11 @@ class VloItem(models.Model):
             instance = self
             sXmlText = instance.xmlcontent
             if not sXmlText is None and sXmlText != "":
-                # Get the full path to the registry file
-                fPublish = instance.get_publisfilename()
-                # Write it to a file in the XML directory
-                with open(fPublish, encoding="utf-8", mode="w") as f:  
-                    f.write(sXmlText)
-
-                # Publish the .cmdi.xml
-                fPublish = instance.get_publisfilename("joai")
-                # Write it to a file in the XML directory
-                with open(fPublish, encoding="utf-8", mode="w") as f:  
-                    f.write(sXmlText)
+                # Write the registry file and the .cmdi.xml for jOAI, unless they already have this content
+                write_published_xml(sXmlText, [instance.get_publisfilename(), instance.get_publisfilename("joai")])
                 sContent = sXmlText
+                # Keep track of what has been published
+                VloPublication.set_published(instance, sXmlText)
         except:
             msg = oErr.get_error_message()
             oErr.DoError("VloItem/publish")
@@ -804,6 +855,9 @@ class VloItem(models.Model):
             if pidservice == None:
                 # Make sure the caller understands something is wrong
                 return False
+            # The handle service need not be asked, if the PID has recently been verified
+            if PidCache.is_current(self, pidservice):
+                return True
             # Look for a record with this name in the PID service
             sResponse = pidservice.getpid(self)
             if sResponse == "":
@@ -811,7 +865,7 @@ class VloItem(models.Model):
                 return False
             elif sResponse == "-":
                 # There is no registration yet: create one
-                oResponse = pidservice.createpid(self)
+                oResponse = pidservice.createpid(self, bSearch=False)
                 if oResponse != None and 'status' in oResponse and oResponse['status'] == "ok":
                     sPidName = oResponse['pid']
                     # Adapt the PID if it contains a /
@@ -841,6 +895,8 @@ class VloItem(models.Model):
     def save(self, **kwargs):
         oErr = ErrHandle()
         try:
+            # Possibly re-use an identical file that has already been uploaded
+            set_upload_hash(self)
             # Check if a .vloname has been specified, when a .file is known
             if not self.file is None and not self.file.name is None and self.file != "":
                 # Get what should be the VLONAME
@@ -858,5 +914,28 @@ class VloItem(models.Model):
 # ========= End ==============================
 
 
+class VloPublication(models.Model):
+    """Record of what has last been published for a VloItem"""
+
+    # [1] The item that has been published
+    vloitem = models.OneToOneField(VloItem, on_delete=models.CASCADE, related_name="publication")
+    # [1] Outcome of the last attempt to publish
+    status = models.CharField("Status", max_length=MAX_NAME_LEN, default="published")
+    # [1] The SHA-256 hash of the XML that has been written
+    xmlhash = models.CharField("Hash of the XML", max_length=64, default="")
+    # [1] The size of the XML file in bytes
+    size = models.IntegerField("Size", default=0)
+    # [0-1] The moment the XML was last written
+    published = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return "{}: {}".format(self.vloitem.id, get_publication_date(self.published))
 
+    def set_published(vloitem, sXmlText):
+        """Record that [vloitem] has been published with the XML text [sXmlText]"""
 
+        obj, created = VloPublication.objects.update_or_create(
+            vloitem=vloitem, defaults={'status': 'published', 'xmlhash': Publication.get_hash(sXmlText),
+                                       'size': len(sXmlText.encode("utf-8")), 'published': get_current_datetime()})
+        vloitem.publication = obj
+        return obj
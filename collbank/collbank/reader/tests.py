@@ -6,7 +6,30 @@ Replace this with more appropriate tests for your application.
 """
 
 import django
-from django.test import TestCase
+import io
+import json
+import os
+import logging
+import tempfile
+import time
+import tracemalloc
+import xmltodict
+import zipfile
+from unittest import mock
+from django.conf import settings
+from django.contrib.auth.models import Group, User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import IntegrityError, connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from collbank.basic.models import Status
+from collbank.basic.views import app_uploader
+from collbank.collection.models import Collection, Owner, Title
+from collbank.reader.models import SourceInfo, VloItem
+from collbank.reader.views import import_collection, parse_collection_xml, parse_import_file, preflight_xml_files
+
+logger = logging.getLogger(__name__)
 
 # TODO: Configure your database in settings.py and sync before running tests.
 
@@ -23,4 +46,301 @@ class SimpleTest(TestCase):
         """
         Tests that 1 + 1 always equals 2.
         """
-        self.assertEqual(1 + 1, 2)
\ No newline at end of file
+        self.assertEqual(1 + 1, 2)
+
+
+def make_cmdi(sTitle, sLandingPage="http://localhost/landing", sOwner=""):
+    """A minimal CMDI description of a collection"""
+
+    lst_proxy = []
+    if sLandingPage != "":
+        lst_proxy.append("<ResourceProxy id='lp'><ResourceType>LandingPage</ResourceType>" +
+                         "<ResourceRef>{}</ResourceRef></ResourceProxy>".format(sLandingPage))
+    return ("<CMD><Header/><Resources><ResourceProxyList>{}</ResourceProxyList></Resources>" +
+            "<Components><CorpusCollection><title>{}</title><description>Bulk import test</description>{}" +
+            "</CorpusCollection></Components></CMD>").format("".join(lst_proxy), sTitle,
+            "<owner>{}</owner>".format(sOwner) if sOwner else "").encode("utf-8")
+
+
+class ImportTransactionTest(TestCase):
+    """A collection is imported completely or not at all"""
+
+    def test_import(self):
+        oParsed = parse_collection_xml(make_cmdi("complete", sOwner="Radboud University"))
+        oBack = import_collection(oParsed['coll_info'])
+        self.assertEqual(oBack['status'], "ok")
+        self.assertEqual(Owner.objects.get(collection=oBack['collection']).name, "Radboud University")
+
+    def test_rollback(self):
+        oParsed = parse_collection_xml(make_cmdi("halfway", sOwner="Radboud University"))
+        # The titles are added first, and then adding the owner fails
+        with mock.patch.object(Owner.objects, "bulk_create", side_effect=IntegrityError("owner failed")):
+            oBack = import_collection(oParsed['coll_info'])
+        self.assertEqual(oBack['status'], "error")
+        self.assertIn("owner failed", oBack['msg'])
+        self.assertFalse(Collection.objects.filter(identifier="halfway").exists())
+        self.assertFalse(Title.objects.filter(name="halfway").exists())
+
+    def test_no_error_list(self):
+        """A caller that does not collect the errors gets the exception"""
+
+        oParsed = parse_collection_xml(make_cmdi("legacy", sOwner="Radboud University"))
+        collection = Collection.objects.create(identifier="legacy")
+        with mock.patch.object(Owner.objects, "bulk_create", side_effect=IntegrityError("owner failed")):
+            with self.assertRaises(IntegrityError):
+                collection.custom_add(oParsed['coll_info'], dict(overwriting=False))
+
+
+def make_rich_cmdi(sTitle, iValues):
+    """A CMDI description of a collection with [iValues] titles, owners, genres and domains"""
+
+    lst_value = ["<title>{}</title>".format(sTitle)]
+    for idx in range(1, iValues):
+        lst_value.append("<title>{} title {}</title>".format(sTitle, idx))
+    for sTag in ["owner", "genre", "domain"]:
+        for idx in range(iValues):
+            lst_value.append("<{0}>{0} {1}</{0}>".format(sTag, idx))
+    return ("<CMD><Header/><Resources><ResourceProxyList><ResourceProxy id='lp'>" +
+            "<ResourceType mimetype='text/html'>LandingPage</ResourceType><ResourceRef>http://localhost/{0}</ResourceRef>" +
+            "</ResourceProxy></ResourceProxyList></Resources><Components><CorpusCollection>{1}" +
+            "</CorpusCollection></Components></CMD>").format(sTitle, "".join(lst_value)).encode("utf-8")
+
+
+class StreamingReaderTest(TestCase):
+    """The streaming reader gives the same collection info as xmltodict, with less memory"""
+
+    cmdi = ('<?xml version="1.0" encoding="UTF-8"?>'
+            '<CMD xmlns="http://www.clarin.eu/cmd/" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" CMDVersion="1.1">'
+            '<Header><MdSelfLink>hdl:1839/00-0000-0000-0001</MdSelfLink></Header><Resources><ResourceProxyList>{}'
+            '</ResourceProxyList></Resources><Components><CorpusCollection>'
+            '<title xml:lang="en">Streaming</title><title>Second title</title><!-- a comment -->'
+            '<description>Some <b>bold</b> text</description><owner/>'
+            '<Resource><DCtype>corpus</DCtype><Modality>spoken</Modality></Resource>'
+            '</CorpusCollection></Components></CMD>')
+
+    def make_proxies(self, iCount):
+        return "".join(["<ResourceProxy id='lp{0}'><ResourceType mimetype='text/html'>LandingPage</ResourceType>"
+                        "<ResourceRef>http://localhost/{0}</ResourceRef></ResourceProxy>".format(idx)
+                        for idx in range(iCount)])
+
+    def test_same_as_xmltodict(self):
+        sXml = self.cmdi.format(self.make_proxies(2))
+        oParsed = parse_collection_xml(sXml.encode("utf-8"))
+        self.assertEqual(oParsed['status'], "ok")
+        coll_info = oParsed['coll_info']
+        self.assertEqual(coll_info.pop('landingpage'), ["http://localhost/0", "http://localhost/1"])
+        coll_info.pop('searchpage')
+        oExpected = xmltodict.parse(sXml, process_namespaces=False)['CMD']['Components']['CorpusCollection']
+        self.assertEqual(json.loads(json.dumps(coll_info)), json.loads(json.dumps(oExpected)))
+
+    def test_not_cmd(self):
+        oParsed = parse_collection_xml(b"<collection><title>x</title></collection>")
+        self.assertEqual(oParsed['status'], "error")
+
+    def test_memory(self):
+        bData = self.cmdi.format(self.make_proxies(20000)).encode("utf-8")
+        tracemalloc.start()
+        xmltodict.parse(bData)
+        iDict = tracemalloc.get_traced_memory()[1]
+        tracemalloc.reset_peak()
+        oParsed = parse_collection_xml(io.BytesIO(bData))
+        iStream = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        logger.info("Peak memory for {} bytes: xmltodict {} kB, streaming {} kB".format(len(bData), iDict // 1024, iStream // 1024))
+        self.assertEqual(len(oParsed['coll_info']['landingpage']), 20000)
+        self.assertLess(iStream, iDict)
+
+
+class PreflightTest(TestCase):
+    """Uploaded files can be checked without writing anything"""
+
+    def get_files(self):
+        lst_file = [("coll{}.xml".format(idx), make_cmdi("good{}".format(idx))) for idx in range(10)]
+        lst_file.append(("existing.xml", make_cmdi("existing")))
+        lst_file.append(("twice.xml", make_cmdi("good3")))
+        lst_file.append(("nolanding.xml", make_cmdi("nolanding", "")))
+        lst_file.append(("broken.xml", b"<CMD><Components>"))
+        return lst_file
+
+    def test_report(self):
+        Collection.objects.create(identifier="existing")
+        lst_file = self.get_files()
+        with CaptureQueriesContext(connection) as ctx:
+            oReport = preflight_xml_files(lst_file)
+        # One query for the identifiers of the whole batch, and nothing is written
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertEqual(oReport['total'], len(lst_file))
+        self.assertEqual(oReport['good'], 10)
+        self.assertEqual(oReport['errors'], 4)
+        oFiles = {x['name']: x for x in oReport['files']}
+        self.assertEqual(oFiles['coll0.xml']['identifier'], "good0")
+        self.assertIn("already", oFiles['existing.xml']['errors'][0])
+        self.assertIn("more than once", oFiles['twice.xml']['errors'][0])
+        self.assertIn("landingpage", oFiles['nolanding.xml']['errors'][0])
+        self.assertEqual(oFiles['broken.xml']['status'], "error")
+
+    def test_view(self):
+        user = User.objects.create_user("uploader", "uploader@localhost", "uploader")
+        user.groups.add(Group.objects.create(name=app_uploader))
+        self.client.force_login(user)
+        lst_upload = [SimpleUploadedFile(sName, bData, content_type="text/xml") for sName, bData in self.get_files()]
+        response = self.client.post("/source/preflight/", {"files_field": lst_upload})
+        oReport = response.json()['report']
+        # There is no existing collection here
+        self.assertEqual(oReport['good'], 11)
+        self.assertEqual(Collection.objects.count(), 0)
+        self.assertEqual(SourceInfo.objects.count(), 0)
+        self.assertFalse(Status.objects.filter(user="uploader").exists())
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class DuplicateUploadTest(TestCase):
+    """Identical uploads of the same user are not imported twice"""
+
+    def test_sourceinfo(self):
+        user = User.objects.create_user("uploader", "uploader@localhost", "uploader")
+        self.client.force_login(user)
+        bData = make_cmdi("duplicate")
+        first = SourceInfo.objects.create(collector="uploader", user=user, file=SimpleUploadedFile("first.xml", bData))
+        second = SourceInfo.objects.create(collector="uploader", user=user, file=SimpleUploadedFile("second.xml", bData))
+        self.assertEqual(len(first.filehash), 64)
+        self.assertEqual(second.filehash, first.filehash)
+        # Each upload keeps its own file
+        self.assertNotEqual(second.file.name, first.file.name)
+
+        response = self.client.get("/source/load/{}/".format(first.id))
+        self.assertEqual(response.json()['status'], "ok")
+        first.refresh_from_db()
+        self.assertEqual(first.collection.identifier, "duplicate")
+
+        # The second upload is not even parsed
+        with mock.patch("collbank.reader.views.parse_collection_xml") as parse:
+            response = self.client.get("/source/load/{}/".format(second.id))
+        parse.assert_not_called()
+        self.assertIn("identical", response.json()['html'])
+        self.assertEqual(Collection.objects.filter(identifier="duplicate").count(), 1)
+
+        # Another user does not get to see the collection of the first one
+        other = User.objects.create_user("other", "other@localhost", "other")
+        third = SourceInfo.objects.create(collector="other", user=other, file=SimpleUploadedFile("third.xml", bData))
+        self.assertIsNone(third.get_identical())
+
+    def test_vloitem(self):
+        user = User.objects.create_user("vlo", "vlo@localhost", "vlo")
+        user.is_superuser = True
+        user.save()
+        self.client.force_login(user)
+        bData = make_cmdi("vlo")
+        first = VloItem.objects.create(user=user, file=SimpleUploadedFile("vlo_first.xml", bData), xmlcontent="<CMD/>")
+        second = VloItem.objects.create(user=user, file=SimpleUploadedFile("vlo_second.xml", bData))
+        other = VloItem.objects.create(user=user, file=SimpleUploadedFile("vlo_other.xml", make_cmdi("other")))
+        self.assertNotEqual(second.file.name, first.file.name)
+        self.assertEqual(second.get_identical(), first)
+        self.assertIsNone(other.get_identical())
+
+        # Reading the second one points to the first, and removes the second one with its file
+        sSecond = second.file.path
+        response = self.client.get("/vloitem/load/{}/".format(second.id))
+        self.assertIn("identical", response.json()['html'])
+        self.assertFalse(VloItem.objects.filter(id=second.id).exists())
+        self.assertFalse(os.path.exists(sSecond))
+        self.assertTrue(os.path.exists(first.file.path))
+
+    def test_same_name(self):
+        """A new upload with the name of a file that is in use does not replace that file"""
+
+        # vloitem_path() looks for the existing file in MEDIA_ROOT
+        with mock.patch("collbank.reader.models.MEDIA_ROOT", settings.MEDIA_ROOT):
+            first = VloItem.objects.create(file=SimpleUploadedFile("vlo_same.xml", make_cmdi("one")))
+            second = VloItem.objects.create(file=SimpleUploadedFile("vlo_same.xml", make_cmdi("two")))
+        self.assertNotEqual(second.file.name, first.file.name)
+        with open(first.file.path, "rb") as f:
+            self.assertIn(b"<title>one</title>", f.read())
+
+
+class ImportRateTest(TestCase):
+    """Benchmark: the number of collections that can be imported per second"""
+
+    def count_import_queries(self, sTitle, iValues):
+        oParsed = parse_collection_xml(make_rich_cmdi(sTitle, iValues))
+        with CaptureQueriesContext(connection) as ctx:
+            oBack = import_collection(oParsed['coll_info'])
+        self.assertEqual(oBack['status'], "ok")
+        return len(ctx.captured_queries)
+
+    def test_import_rate(self):
+        # The number of queries does not depend on the number of values
+        iSmall = self.count_import_queries("small", 2)
+        iLarge = self.count_import_queries("large", 20)
+        self.assertEqual(iSmall, iLarge)
+
+        iCount = 50
+        lst_parsed = [parse_collection_xml(make_rich_cmdi("rate{}".format(idx), 10)) for idx in range(iCount)]
+        started = time.perf_counter()
+        for oParsed in lst_parsed:
+            import_collection(oParsed['coll_info'])
+        fRate = iCount / (time.perf_counter() - started)
+        logger.info("Import rate: {:.1f} collections/s ({} queries per collection)".format(fRate, iLarge))
+        self.assertEqual(Title.objects.filter(collection__identifier__startswith="rate").count(), iCount * 10)
+
+
+class CollectionImportTest(TransactionTestCase):
+    """Bulk import of collection XML files from an archive"""
+
+    def test_import_archive(self):
+        user = User.objects.create_user("uploader", "uploader@localhost", "uploader")
+        user.groups.add(Group.objects.create(name=app_uploader))
+        self.client.force_login(user)
+        Collection.objects.create(identifier="existing")
+
+        iCount = 40
+        zip_data = io.BytesIO()
+        with zipfile.ZipFile(zip_data, "w") as zipf:
+            for idx in range(iCount):
+                zipf.writestr("coll{}.xml".format(idx), make_cmdi("bulk{}".format(idx)))
+            zipf.writestr("nolanding.xml", make_cmdi("nolanding", ""))
+            zipf.writestr("existing.xml", make_cmdi("existing"))
+            zipf.writestr("broken.xml", b"<CMD><Components>")
+            zipf.writestr("readme.txt", b"not an xml file")
+        upload = SimpleUploadedFile("catalogue.zip", zip_data.getvalue(), content_type="application/zip")
+
+        started = time.perf_counter()
+        response = self.client.post("/source/import/", {"files_field": [upload]})
+        logger.info("Bulk import: {} files in {:.2f}s".format(iCount + 3, time.perf_counter() - started))
+        self.assertEqual(response.json()['status'], "ok")
+
+        self.assertEqual(Collection.objects.filter(identifier__startswith="bulk").count(), iCount)
+        self.assertFalse(Collection.objects.filter(identifier="nolanding").exists())
+        oCount = json.loads(Status.objects.get(user="uploader").count)
+        self.assertEqual(oCount['total'], iCount + 3)
+        self.assertEqual(oCount['imported'], iCount)
+        self.assertEqual(oCount['errors'], 3)
+        self.assertEqual(len(oCount['files']), iCount + 3)
+
+    def test_invalid_xsd(self):
+        """A file that does not match the XSD is reported, and it is not imported"""
+
+        def validate(bData):
+            bValid = not b"invalid" in bData
+            return bValid, ({} if bValid else {'error': "<script>x</script> does not match the schema"})
+
+        with mock.patch("collbank.reader.views.validateXml", side_effect=validate):
+            oInvalid = parse_import_file("invalid.xml", make_cmdi("invalid"))
+            self.assertEqual(oInvalid['status'], "error")
+            self.assertIn("schema", oInvalid['msg'])
+
+            user = User.objects.create_user("uploader", "uploader@localhost", "uploader")
+            user.groups.add(Group.objects.create(name=app_uploader))
+            self.client.force_login(user)
+            lst_upload = [SimpleUploadedFile("valid.xml", make_cmdi("valid"), content_type="text/xml"),
+                          SimpleUploadedFile("invalid.xml", make_cmdi("invalid"), content_type="text/xml")]
+            response = self.client.post("/source/import/", {"files_field": lst_upload})
+        # The messages come from the uploaded XML, so they are escaped in the report
+        self.assertNotIn("<script>", response.json()['html'])
+        self.assertIn("&lt;script&gt;", response.json()['html'])
+        self.assertTrue(Collection.objects.filter(identifier="valid").exists())
+        self.assertFalse(Collection.objects.filter(identifier="invalid").exists())
+        oFiles = {x['name']: x for x in json.loads(Status.objects.get(user="uploader").count)['files']}
+        self.assertEqual(oFiles['valid.xml']['status'], "ok")
+        self.assertEqual(oFiles['invalid.xml']['status'], "error")
+        self.assertIn("schema", oFiles['invalid.xml']['msg'])
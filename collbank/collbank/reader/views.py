@@ -9,7 +9,7 @@ from django.contrib.auth.models import Group, User
 from django.db.models.fields.related import OneToOneField
 from django.urls import reverse
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
-from django.db import transaction
+from django.db import connections, transaction
 from django.db.models import Q, Prefetch, Count, F
 from django.db.models.functions import Lower
 from django.db.models.query import QuerySet 
@@ -30,8 +30,12 @@ import operator
 from operator import itemgetter
 from functools import reduce
 from time import sleep 
+from concurrent.futures import ProcessPoolExecutor
 import fnmatch
+import multiprocessing
 import sys, os
+import tarfile
+import zipfile
 import base64
 import json
 import csv, re
@@ -39,26 +43,30 @@ import requests
 import openpyxl
 import xmltodict
 from openpyxl.utils.cell import get_column_letter
-from io import StringIO
+from io import BytesIO, StringIO
 from itertools import chain
 
 # Imports needed for working with XML and other file formats
 from xml.dom import minidom
 # See: http://effbot.org/zone/celementtree.htm
 import xml.etree.ElementTree as ElementTree
+import lxml.etree as ET
  
 # ======= imports from my own application ======
-from collbank.settings import APP_PREFIX, MEDIA_DIR, WRITABLE_DIR
+from collbank.settings import APP_PREFIX, MEDIA_DIR, WRITABLE_DIR, IMPORT_WORKERS
 from collbank.basic.utils import ErrHandle
-from collbank.basic.views import BasicDetails, BasicList, BasicPart
+from collbank.basic.views import BasicDetails, BasicList, BasicPart, app_uploader
 from collbank.basic.models import get_crpp_date, Status
 from collbank.reader.forms import UploadFileForm, UploadFilesForm, SourceInfoForm, VloItemForm
 from collbank.reader.models import get_current_datetime, SourceInfo, VloItem
 from collbank.collection.models import Collection, Title, Genre, Owner, Resource, Linguality
 from collbank.collection.adaptations import listview_adaptations
+from collbank.collection.views import validateXml, publish_worker_init
 
 # =================== This is imported by seeker/views.py ===============
 reader_uploads = [
+    {"title": "collections", "label": "Collection XML files", "url": "import_collections", "type": "multiple",
+     "msg": "Upload CMDI collection XML files, or zip/tar archives that contain them"}
     ]
 # Global debugging 
 bDebug = False
@@ -66,6 +74,338 @@ bDebug = False
 
 # =============== Helper functions ======================================
 
+CMDI_COMPONENTS = ["Header", "ResourceProxy", "CorpusCollection"]
+XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+
+def get_xml_name(el, sName):
+    """Get the (attribute) name the way xmltodict has it: with its prefix, but without namespace URI"""
+
+    if sName.startswith("{"):
+        sNamespace, sLocal = sName[1:].split("}", 1)
+        if sNamespace == XML_NAMESPACE:
+            return "xml:{}".format(sLocal)
+        for sPrefix, sUri in el.nsmap.items():
+            if sUri == sNamespace and not sPrefix is None:
+                return "{}:{}".format(sPrefix, sLocal)
+        return sLocal
+    return sName
+
+def element_to_dict(el):
+    """Convert an lxml element into the same structure that xmltodict.parse() makes of it
+
+    The element names are taken without their namespace.
+    """
+
+    oBack = {}
+    for sName, sValue in el.attrib.items():
+        oBack["@{}".format(get_xml_name(el, sName))] = sValue
+    lst_text = [] if el.text is None else [el.text]
+    for child in el:
+        if not isinstance(child.tag, str):
+            # Skip comments and processing instructions
+            pass
+        else:
+            sName = ET.QName(child).localname
+            value = element_to_dict(child)
+            if not sName in oBack:
+                oBack[sName] = value
+            elif isinstance(oBack[sName], list):
+                oBack[sName].append(value)
+            else:
+                oBack[sName] = [oBack[sName], value]
+        if not child.tail is None:
+            lst_text.append(child.tail)
+    sText = "".join(lst_text).strip()
+    if len(oBack) == 0:
+        # Only text (or nothing at all)
+        return sText if sText != "" else None
+    if sText != "":
+        oBack['#text'] = sText
+    return oBack
+
+def iter_cmdi_components(data_file):
+    """Read a CMDI file piece by piece, yielding (name, dict) for the components in CMDI_COMPONENTS
+
+    Each component is converted with element_to_dict() once it is complete, and is then
+    removed from the tree. Memory therefore depends on the largest component, not on the 
+    size of the file. The first item is always (root name, None).
+    """
+
+    if isinstance(data_file, str):
+        data_file = data_file.encode("utf-8")
+    if isinstance(data_file, bytes):
+        data_file = BytesIO(data_file)
+    elif hasattr(data_file, "open"):
+        # A FieldFile: make sure it is opened (again)
+        data_file.open("rb")
+    bRoot = True
+    for event, el in ET.iterparse(data_file, events=("start", "end"), resolve_entities=False, no_network=True):
+        if event == "start":
+            if bRoot:
+                sRoot = ET.QName(el).localname
+                yield sRoot, None
+                if sRoot != "CMD":
+                    return
+                bRoot = False
+        else:
+            sName = ET.QName(el).localname if isinstance(el.tag, str) else ""
+            if sName in CMDI_COMPONENTS:
+                yield sName, element_to_dict(el)
+                # Free what we have read so far
+                el.clear(keep_tail=True)
+                while not el.getprevious() is None:
+                    del el.getparent()[0]
+
+def parse_collection_xml(data_file):
+    """Parse a CMDI XML description of a collection and check that it can be imported
+
+    The [data_file] is a string, bytes, a file or a FieldFile.
+    This does not touch the database, so that it can run in a worker process.
+    On success, [coll_info] contains the 'CorpusCollection' component, 
+    including the landingpage and searchpage from the resource proxies.
+    """
+
+    oErr = ErrHandle()
+    oBack = dict(status="ok", msg="", coll_info=None)
+    try:
+        # Read the XML component by component
+        # NOTE: recognized resources are: LandingPage and SearchPage
+        lst_searchpage = []
+        lst_landingpage = []
+        coll_info = None
+        sRoot = None
+        for sName, oComponent in iter_cmdi_components(data_file):
+            if sRoot is None:
+                # The first item is the root
+                sRoot = sName
+            elif sName == "ResourceProxy":
+                oResType = oComponent.get("ResourceType")
+                # Without a @mimetype attribute, there is just the text
+                resource_type = oResType if isinstance(oResType, str) else oResType.get("#text")
+                resource_type = resource_type.lower()
+                resource_ref = oComponent.get("ResourceRef")
+
+                # Process the resource
+                if resource_type == "landingpage":
+                    lst_landingpage.append(resource_ref)
+                elif resource_type == "searchpage":
+                    lst_searchpage.append(resource_ref)
+            elif sName == "CorpusCollection" and coll_info is None:
+                coll_info = oComponent
+        if sRoot != "CMD":
+            msg = "read_xml: unable to import the XML, since there is no <CMD>"
+            oErr.Status(msg)
+            oBack['status'] = 'error'
+            oBack['msg'] = msg
+            return oBack
+
+        # Before we proceed: we need to have a landingpage
+        bNoLandingPage = (lst_landingpage is None or len(lst_landingpage) == 0 or \
+                          lst_landingpage[0] is None or lst_landingpage[0] == "")
+        if bNoLandingPage:
+            # Warn the user
+            oBack['status'] = 'error'
+            oBack['msg'] = "The XML does not (correctly) specify a landingpage"
+            return oBack
+
+        if coll_info is None:
+            # This is not good...
+            oBack['status'] = "error"
+            oBack['msg'] = "Cannot find [CorpusCollection]"
+        else:
+            # Adapt the coll_info a little bit
+            coll_info['landingpage'] = lst_landingpage
+            coll_info['searchpage'] = lst_searchpage
+            oBack['coll_info'] = coll_info
+    except:
+        msg = oErr.get_error_message()
+        oBack['status'] = 'error'
+        oBack['msg'] = msg
+    return oBack
+
+def get_xsd_errors(bData):
+    """Validate [bData] against the (cached) XSD schema and return a list of error messages"""
+
+    lst_back = []
+    bValid, oMsg = validateXml(bData)
+    if not bValid:
+        if isinstance(oMsg, dict):
+            lst_back.append("XSD: {}".format(oMsg.get('error', "invalid")))
+        else:
+            for oError in oMsg:
+                lst_back.append("XSD line {}: {}".format(oError.line, oError.message))
+    return lst_back
+
+def parse_import_file(sName, bData):
+    """Validate and parse one uploaded XML file (in a worker process)"""
+
+    oErr = ErrHandle()
+    try:
+        lst_error = get_xsd_errors(bData)
+    except:
+        lst_error = [oErr.get_error_message()]
+    if len(lst_error) > 0:
+        oBack = dict(status="error", msg="; ".join(lst_error), coll_info=None)
+    else:
+        oBack = parse_collection_xml(bData)
+    oBack['name'] = sName
+    return oBack
+
+def import_collection(coll_info, **kwargs):
+    """Add the collection described by [coll_info] (from parse_collection_xml) to the database
+
+    Everything happens in one transaction, and each sub-component of custom_add() has its
+    own savepoint. If anything fails, the whole collection is rolled back, so that no
+    half-imported collection is ever visible, and nothing needs to be deleted afterwards.
+    An existing collection is never overwritten (issue #79).
+    """
+
+    oErr = ErrHandle()
+    oBack = dict(status="ok", msg="", collection=None, identifier="", overwriting=False)
+    try:
+        lst_error = []
+        with transaction.atomic():
+            bOverwriting, collection = Collection.get_instance(coll_info)
+            if collection is None:
+                oBack['status'] = "error"
+                oBack['msg'] = "No identifier could be determined"
+            elif bOverwriting:
+                oBack['status'] = "error"
+                oBack['msg'] = "There already is a collection with identifier [{}]".format(collection.identifier)
+                oBack['identifier'] = collection.identifier
+                oBack['overwriting'] = True
+            else:
+                params = dict(overwriting=False)
+                collection.custom_add(coll_info, params, errors=lst_error, **kwargs)
+                oBack['identifier'] = collection.identifier
+                if len(lst_error) > 0:
+                    # Undo everything that has been added for this collection
+                    transaction.set_rollback(True)
+                    oBack['status'] = "error"
+                    oBack['msg'] = "Errors in [{}]: {}".format(collection.identifier, "; ".join(lst_error))
+                else:
+                    oBack['collection'] = collection
+    except:
+        # Leaving the atomic block with an exception has rolled everything back
+        oBack['status'] = "error"
+        oBack['msg'] = oErr.get_error_message()
+        oBack['collection'] = None
+    return oBack
+
+def get_import_files(lst_upload):
+    """Get (name, data) of all XML files in the uploaded files, which may also be zip or tar archives"""
+
+    for upload in lst_upload:
+        sName = upload.name
+        sLower = sName.lower()
+        if sLower.endswith(".zip"):
+            with zipfile.ZipFile(upload) as zipf:
+                for info in zipf.infolist():
+                    if not info.is_dir() and info.filename.lower().endswith(".xml"):
+                        yield "{}/{}".format(sName, info.filename), zipf.read(info)
+        elif sLower.endswith(".tar") or sLower.endswith(".tar.gz") or sLower.endswith(".tgz"):
+            with tarfile.open(fileobj=upload, mode="r:*") as tarf:
+                for info in tarf:
+                    if info.isfile() and info.name.lower().endswith(".xml"):
+                        yield "{}/{}".format(sName, info.name), tarf.extractfile(info).read()
+        else:
+            yield sName, upload.read()
+
+def get_vlo_identifier(data_file):
+    """Get the title of a VLO item XML, which is where VloItem.repair_xml() takes it from"""
+
+    sTitle = None
+    root = ET.parse(BytesIO(data_file) if isinstance(data_file, bytes) else data_file).getroot()
+    for el in root.iter():
+        if not isinstance(el.tag, str):
+            continue
+        sName = ET.QName(el).localname
+        if sName == "OralHistoryInterviewCRF":
+            sTitle = el.attrib.get("Title")
+            break
+        elif sName == "CorpusCollection_CSD":
+            for child in el:
+                if isinstance(child.tag, str) and ET.QName(child).localname == "title":
+                    sTitle = child.text
+                    break
+            break
+    return sTitle
+
+def preflight_xml_files(lst_file, bVlo=False):
+    """Check uploaded XML files, without writing anything to the database
+
+    [lst_file] is a list of (name, data), as given by get_import_files().
+    Collection XML files are validated against the (cached) XSD schema, and they must have a
+    landing page. For VLO items ([bVlo] is True) only the landing page is checked.
+    The identifiers (or VLO titles) are checked for uniqueness with one query for all files.
+    The report contains the overall numbers and the result per file.
+    """
+
+    oErr = ErrHandle()
+    oReport = dict(status="ok", msg="", total=len(lst_file), good=0, errors=0, files=[])
+    try:
+        lst_result = []
+        for sName, bData in lst_file:
+            oResult = dict(name=sName, status="ok", identifier="", errors=[], warnings=[])
+            try:
+                if not bVlo:
+                    # Validate against the XSD, if there is one
+                    oResult['errors'].extend(get_xsd_errors(bData))
+
+                # Check the CMD structure and the landing page
+                oParsed = parse_collection_xml(bData)
+                if oParsed['status'] == "error":
+                    bMissing = bVlo and oParsed['msg'].startswith("Cannot find")
+                    if not bMissing:
+                        oResult['errors'].append(oParsed['msg'])
+                if bVlo:
+                    oResult['identifier'] = get_vlo_identifier(bData) or ""
+                elif not oParsed['coll_info'] is None:
+                    oResult['identifier'] = Collection.get_xml_identifier(oParsed['coll_info']) or ""
+                    if oResult['identifier'] == "":
+                        oResult['errors'].append("No identifier could be determined")
+            except:
+                oResult['errors'].append(oErr.get_error_message())
+            lst_result.append(oResult)
+
+        # Check the identifiers of all files in one go
+        lst_ident = [x['identifier'] for x in lst_result if x['identifier'] != ""]
+        if len(lst_ident) > 0:
+            if bVlo:
+                qs = VloItem.objects.filter(title__in=lst_ident).values_list("title", flat=True)
+            else:
+                qs = Collection.objects.filter(identifier__in=lst_ident).values_list("identifier", flat=True)
+            existing = set(qs)
+            seen = set()
+            for oResult in lst_result:
+                identifier = oResult['identifier']
+                if identifier == "":
+                    continue
+                if identifier in existing:
+                    msg = "There already is a {} with identifier [{}]".format("VLO item" if bVlo else "collection", identifier)
+                    # Existing VLO titles are allowed, but collections may not be overwritten (issue #79)
+                    oResult['warnings' if bVlo else 'errors'].append(msg)
+                if identifier in seen:
+                    oResult['errors'].append("The identifier [{}] occurs more than once in this upload".format(identifier))
+                seen.add(identifier)
+
+        for oResult in lst_result:
+            if len(oResult['errors']) > 0:
+                oResult['status'] = "error"
+                oReport['errors'] += 1
+            else:
+                oReport['good'] += 1
+        oReport['files'] = lst_result
+        if oReport['errors'] > 0:
+            oReport['status'] = "error"
+            oReport['msg'] = "{} of {} files cannot be imported".format(oReport['errors'], oReport['total'])
+    except:
+        msg = oErr.get_error_message()
+        oErr.DoError("preflight_xml_files")
+        oReport['status'] = "error"
+        oReport['msg'] = msg
+    return oReport
+
 def getText(nodeStart):
     # Iterate all Nodes aggregate TEXT_NODE
     rc = []
@@ -208,7 +548,7 @@ class ReaderImport(View):
                     lHeader = ['status', 'msg', 'name', 'yearstart', 'yearfinish', 'library', 'idno', 'filename', 'url']
 
                     # Get user
-                    user = User.models.filter(username=username).first() 
+                    user = User.objects.filter(username=username).first() 
                     
                     # Create a SourceInfo object for this extraction
                     source = SourceInfo.objects.create(url=self.sourceinfo_url, collector=username, user=user)
@@ -285,7 +625,7 @@ class ReaderImport(View):
             # Provide error message
             self.data['html'] = "Please log in to work on this project"
             return False
-        elif not user_is_ingroup(request, 'lila_uploader'):
+        elif not user_is_ingroup(request, app_uploader):
             # Provide error message
             self.data['html'] = "Sorry, you do not have the rights to upload anything"
             return False
@@ -298,6 +638,111 @@ class ReaderImport(View):
         return bOkay, code
 
 
+class CollectionImport(ReaderImport):
+    """Import any number of CMDI collection XML files, possibly inside zip or tar archives"""
+
+    import_type = "collections"
+    template_name = "reader/import_collections.html"
+
+    def process_files(self, request, source, lResults, lHeader):
+        """Parse the files in a pool of workers and then add each collection in its own transaction"""
+
+        oErr = ErrHandle()
+        bOkay = True
+        code = ""
+        oStatus = self.oStatus
+        try:
+            user = request.user
+            kwargs = {'user': user, 'username': user.username}
+            lHeader[:] = ['status', 'msg', 'name', 'identifier']
+
+            # Read all XML files from the upload(s)
+            lst_file = list(get_import_files(request.FILES.getlist("files_field")))
+            iTotal = len(lst_file)
+            oCount = dict(total=iTotal, done=0, imported=0, errors=0, files=[])
+            oStatus.set("parsing", oCount=oCount)
+
+            # Validate, parse and check the XML files: this does not need the database
+            lst_name = [x[0] for x in lst_file]
+            lst_data = [x[1] for x in lst_file]
+            iWorkers = min(IMPORT_WORKERS, iTotal)
+            if iWorkers > 1 and "fork" in multiprocessing.get_all_start_methods():
+                # Workers must not share our database connection
+                connections.close_all()
+                with ProcessPoolExecutor(max_workers=iWorkers, mp_context=multiprocessing.get_context("fork"),
+                                         initializer=publish_worker_init) as executor:
+                    iSize = max(1, iTotal // (iWorkers * 4))
+                    lst_parsed = list(executor.map(parse_import_file, lst_name, lst_data, chunksize=iSize))
+            else:
+                lst_parsed = [parse_import_file(sName, bData) for sName, bData in lst_file]
+            # Free the raw data
+            lst_file = None
+            lst_data = None
+
+            # Add the collections one by one, each in its own transaction
+            for oParsed in lst_parsed:
+                oResult = dict(status="ok", msg="", name=oParsed['name'], identifier="", collection=None)
+                if oParsed['status'] == "error":
+                    oResult['status'] = "error"
+                    oResult['msg'] = oParsed['msg']
+                else:
+                    oImport = import_collection(oParsed['coll_info'], **kwargs)
+                    oResult['status'] = oImport['status']
+                    oResult['msg'] = oImport['msg']
+                    oResult['identifier'] = oImport['identifier']
+                    oResult['collection'] = oImport['collection']
+
+                # Report on this file
+                lResults.append(oResult)
+                oCount['done'] += 1
+                if oResult['status'] == "error":
+                    oCount['errors'] += 1
+                else:
+                    oCount['imported'] += 1
+                oCount['files'].append(dict(name=oResult['name'], status=oResult['status'], msg=oResult['msg']))
+                oStatus.set("importing", oCount=oCount, msg=oResult['name'])
+
+            code = "Imported {} of {} collection XML files ({} errors) by {}".format(
+                oCount['imported'], iTotal, oCount['errors'], user.username)
+        except:
+            msg = oErr.get_error_message()
+            oErr.DoError("CollectionImport/process_files")
+            bOkay = False
+            code = msg
+        return bOkay, code
+
+
+class CollectionPreflight(ReaderImport):
+    """Check any number of CMDI collection XML files without importing them"""
+
+    import_type = "preflight"
+    template_name = "reader/preflight_report.html"
+
+    def post(self, request, pk=None):
+        """Return a report on the uploaded files: nothing is written to the database"""
+
+        self.initializations(request, pk)
+        self.data = dict(status="ok", html="")
+        if self.checkAuthentication(request):
+            form = self.mForm(request.POST, request.FILES)
+            if form.is_valid():
+                oErr = ErrHandle()
+                try:
+                    lst_file = list(get_import_files(request.FILES.getlist("files_field")))
+                    oReport = preflight_xml_files(lst_file)
+                    self.data['report'] = oReport
+                    self.data['html'] = render_to_string(self.template_name, dict(report=oReport), request)
+                except:
+                    msg = oErr.get_error_message()
+                    oErr.DoError("CollectionPreflight")
+                    self.data['html'] = msg
+                    self.data['status'] = "error"
+            else:
+                self.data['html'] = 'invalid form: {}'.format(form.errors)
+                self.data['status'] = "error"
+        return JsonResponse(self.data)
+
+
 # ======================== SourceInfo =======================================
 
 class SourceInfoList(BasicList):
@@ -306,6 +751,7 @@ class SourceInfoList(BasicList):
     model = SourceInfo
     listform = SourceInfoForm
     prefix = "srci"
+    uploads = reader_uploads
     order_cols = ['user__username', 'code', 'created']
     order_default = order_cols
     order_heads = [
@@ -397,13 +843,20 @@ class SourceInfoLoadXml(BasicPart):
         oErr = ErrHandle()
         try:
             instance = self.obj
-            if not instance is None:
+            if not instance is None and self.qd.get("dryrun", "") in ["1", "true"]:
+                # Only check the file and report on it
+                data_file = instance.file
+                data_file.open("rb")
+                context['report'] = preflight_xml_files([(data_file.name, data_file.read())])
+                self.template_name = "reader/preflight_report.html"
+            elif not instance is None:
                 # Perform the actual uploading
                 oBack = self.read_xml(instance)
                 if oBack['status'] == "error":
                     self.arErr.append( oBack['msg'] )
                 else:
                     context['collection'] = oBack['collection']
+                    context['identical'] = oBack.get('identical')
         except:
             msg = oErr.get_error_message()
             oErr.DoError("SourceInfoLoadXml/initializations")
@@ -488,121 +941,49 @@ class SourceInfoLoadXml(BasicPart):
             username = user.username
             kwargs = {'user': user, 'username': username}
 
+            # Has exactly this file been imported before?
+            identical = instance.get_identical()
+            if not identical is None:
+                # Then there is no need to read it again
+                oBack['collection'] = identical.collection
+                oBack['identical'] = identical
+                return oBack
 
-            # Get the file and read it
+            # Get the file, read it and check it
             data_file = instance.file
-
-            # Convert the XML immediately into a dictionary
-            doc = xmltodict.parse(data_file)
-            oCollection = doc.get("CMD")
-            if not oCollection is None:
-                # For debugging: get a string of the object
-                sCMD = json.dumps(oCollection, indent=2)
-
-                # get the header 
-                oHeader = oCollection.get('Header')
-                # Process the header information
-
-                # Get the resources
-                # NOTE: recognized are: LandingPage and SearchPage
-                oResources = oCollection.get('Resources')
-                lst_searchpage = []
-                lst_landingpage = []
-                if not oResources is None:
-                    # If there are any resources, process them
-                    oResourceProxyList = oResources.get("ResourceProxyList")
-                    if not oResourceProxyList is None:
-                        lst_proxy = []
-                        lResourceProxy = oResourceProxyList.get("ResourceProxy")
-                        if isinstance(lResourceProxy, list):
-                            lst_proxy = lResourceProxy
-                        else:
-                            lst_proxy.append(lResourceProxy)
-
-                        for oResourceProxy in lst_proxy:
-                            oResType = oResourceProxy.get("ResourceType")
-                            resource_type = oResType.get("#text").lower()
-                            resource_mtype = oResType.get("@mimetype")
-                            resource_ref = oResourceProxy.get("ResourceRef")
-
-                            # Process the resource
-                            if resource_type == "landingpage":
-                                lst_landingpage.append(resource_ref)
-                            elif resource_type == "searchpage":
-                                lst_searchpage.append(resource_ref)
-                        xx = isinstance(lResourceProxy, list)
-                # Before we proceed: we need to have a landingpage
-                bNoLandingPage = (lst_landingpage is None or len(lst_landingpage) == 0 or \
-                                  lst_landingpage[0] is None or lst_landingpage[0] == "")
-                if bNoLandingPage:
-                    # Warn the user
-                    oBack['status'] = 'error'
-                    oBack['msg'] = "The XML does not (correctly) specify a landingpage"
-                    return oBack
-
-                # Get the components
-                oComponents = oCollection.get("Components")
-
-                # Get a [Collection] instance based on the 'CorpusCollection' component
-                coll_info = oComponents.get("CorpusCollection")
-                ## august 2025
-                #if coll_info is None:
-                #    # Try to get an alternative collection
-                #    coll_info = oComponents.get("CorpusCollection_CSD")
-                # Double check
-                if coll_info is None:
-                    # This is not good...
-                    oBack['status'] = "error"
-                    oBack['msg'] = "Cannot find [CorpusCollection]"
-                else:
-                    bOverwriting, collection = Collection.get_instance(coll_info)
-                    x = Collection.objects.all().order_by('id').last()
-                    # issue #79: may not overwrite
-                    if bOverwriting:
-                        html = []
-                        html.append("<p>Importing this XML is an attempt to overwrite the collection with identifier [{}].</p>".format(collection.identifier))
-                        html.append("<p>Overwriting is <b>not</b> allowed!</p>")
-                        html.append("<p>Your options:")
-                        html.append("<ul><li>Rename the identifier in the XML you are trying to import</li>")
-                        html.append("<li>Delete the existing [{}] and then import the new one</li></ul>".format(collection.identifier))
-                        msg = "\n".join(html)
-                        oBack['status'] = 'error'
-                        oBack['msg'] = msg
-
-                        # ========= IMPORTANT ============================
-                        # Immediately return this [oBack] to make sure it does not get distorted!!!
-                        return oBack
-
-                    elif not collection is None:
-                        # Adapt the coll_info a little bit
-                        coll_info['landingpage'] = lst_landingpage
-                        coll_info['searchpage'] = lst_searchpage
-
-                        # Add any other information from [coll_info]
-                        params = dict(overwriting=bOverwriting)
-                        collection.custom_add(coll_info, params, **kwargs)
-
-                        oBack['collection'] = collection
-
-            else:
-                msg = "read_xml: unable to import the XML, since there is no <CMD>"
-                oErr.Status(msg)
+            oParsed = parse_collection_xml(data_file)
+            if oParsed['status'] == "error":
+                oBack['status'] = 'error'
+                oBack['msg'] = oParsed['msg']
+                return oBack
+
+            # Add the collection in one transaction
+            oImport = import_collection(oParsed['coll_info'], **kwargs)
+            if oImport['overwriting']:
+                # issue #79: may not overwrite
+                identifier = oImport['identifier']
+                html = []
+                html.append("<p>Importing this XML is an attempt to overwrite the collection with identifier [{}].</p>".format(identifier))
+                html.append("<p>Overwriting is <b>not</b> allowed!</p>")
+                html.append("<p>Your options:")
+                html.append("<ul><li>Rename the identifier in the XML you are trying to import</li>")
+                html.append("<li>Delete the existing [{}] and then import the new one</li></ul>".format(identifier))
                 oBack['status'] = 'error'
-                oBack['msg'] = msg
+                oBack['msg'] = "\n".join(html)
+            elif oImport['status'] == "error":
+                oBack['status'] = 'error'
+                oBack['msg'] = oImport['msg']
+            else:
+                oBack['collection'] = oImport['collection']
+                # Remember which collection came from this file
+                instance.collection = oImport['collection']
+                instance.save(update_fields=["collection"])
 
         except:
             msg = oErr.get_error_message()
-            # oBack['filename'] = filename
             oBack['status'] = 'error'
             oBack['msg'] = msg
 
-        # Double check if there were errors
-        if oBack['status'] == "error":
-            # Check if a collection has been made
-            if not collection is None:
-                # Since there were errors, it needs to be removed again
-                collection.delete()
-    
         # Return the object that has been created
         return oBack
 
@@ -805,6 +1186,12 @@ class VloItemList(BasicList):
         {'name': 'Created', 'order': 'o=5', 'type': 'str', 'custom': 'created', 'linkdetails': True},
     ]
 
+    def get_queryset(self, request = None):
+        qs = super(VloItemList, self).get_queryset(request)
+        # The publication status is read from the publication records
+        self.qs = qs.select_related('publication')
+        return self.qs
+
     def get_context_data(self, **kwargs):
         # ======== One-time adaptations ==============
         listview_adaptations("vloitem_list")
@@ -1017,13 +1404,20 @@ class VloItemLoadXml(BasicPart):
         oErr = ErrHandle()
         try:
             instance = self.obj
-            if not instance is None:
+            if not instance is None and self.qd.get("dryrun", "") in ["1", "true"]:
+                # Only check the file and report on it
+                data_file = instance.file
+                data_file.open("rb")
+                context['report'] = preflight_xml_files([(data_file.name, data_file.read())], bVlo=True)
+                self.template_name = "reader/preflight_report.html"
+            elif not instance is None:
                 # Perform the actual uploading
                 oBack = self.read_xml(instance)
                 if oBack['status'] == "error":
                     self.arErr.append( oBack['msg'] )
                 else:
                     context['vloitem'] = oBack['vloitem']
+                    context['identical'] = oBack.get('identical')
         except:
             msg = oErr.get_error_message()
             oErr.DoError("VloItemLoadXml/initializations")
@@ -1041,6 +1435,15 @@ class VloItemLoadXml(BasicPart):
             username = user.username
             kwargs = {'user': user, 'username': username}
 
+            # Has exactly this file been read before?
+            identical = instance.get_identical()
+            if not identical is None:
+                # Then point to that VloItem instead of reading it again, and drop the new one
+                instance.delete_upload()
+                oBack['vloitem'] = identical
+                oBack['identical'] = identical
+                return oBack
+
             # Perform the reading
             sContent = instance.read_xml()
 
@@ -56,6 +56,27 @@ WSGI_FILE = os.path.abspath(os.path.join(BASE_DIR,"collbank/wsgi.py"))
 
 REGISTRY_URL = "http://cls.ru.nl/registry/"
 
+# Number of worker processes used to (re)publish all collections at once
+#   Set to 1 to publish serially within the web process
+PUBLISH_WORKERS = min(4, os.cpu_count() or 1)
+# Number of worker processes used to parse uploaded collection XML files
+IMPORT_WORKERS = min(4, os.cpu_count() or 1)
+# Calls to the ePIC handle service: (connect, read) timeout in seconds, number of retries,
+#   the backoff factor between retries and the number of pooled connections per host
+PID_TIMEOUT = (3.05, 10)
+PID_RETRIES = 3
+PID_BACKOFF = 0.5
+PID_POOLSIZE = 4
+# Number of days that a verified PID is trusted, before the handle service is asked again
+PID_CACHE_DAYS = 7
+# Publishing does not wait for the handle service: PIDs are registered by 'manage.py pidqueue'
+PID_QUEUE = True
+# External back-ends (ePIC, jOAI) are not called for BREAKER_RESET seconds after BREAKER_FAILURES failures in a row
+BREAKER_FAILURES = 3
+BREAKER_RESET = 30
+# Number of seconds that the OAI status on the home page is re-used
+OAI_STATUS_TTL = 60
+
 # publishing on a sub-url
 # NOTE: possibly remove this for the production environment...
 # FORCE_SCRIPT_NAME = "/ru"
@@ -170,7952 +191,8 @@ USE_L10N = True
 
 USE_TZ = True
 
-# See [https://www.iso.org/obp/ui/#search]
-# Order: Alpha2, EnglishShort, FrenchShort, Alpha3, Numeric
-# - alpha2 = ISO-3166
-# - alpha3 = ISO-3166
-# - Numeric = ISO-3166 (3 digits, prepend zero)
-COUNTRY_CODES = [
-        ("AF", "Afghanistan", "Afghanistan (l')", "AFG", "4"),
-        ("AX", "Åland Islands", "Åland(les Îles)", "ALA", "248"),
-        ("AL", "Albania", "Albanie (l')", "ALB", "8"),
-        ("DZ", "Algeria", "Algérie (l')", "DZA", "12"),
-        ("AS", "American Samoa", "Samoa américaines (les)", "ASM", "16"),
-        ("AD", "Andorra", "Andorre (l')", "AND", "20"),
-        ("AO", "Angola", "Angola (l')", "AGO", "24"),
-        ("AI", "Anguilla", "Anguilla", "AIA", "660"),
-        ("AQ", "Antarctica", "Antarctique (l')", "ATA", "10"),
-        ("AG", "Antigua and Barbuda", "Antigua-et-Barbuda", "ATG", "28"),
-        ("AR", "Argentina", "Argentine (l')", "ARG", "32"),
-        ("AM", "Armenia", "Arménie (l')", "ARM", "51"),
-        ("AW", "Aruba", "Aruba", "ABW", "533"),
-        ("AU", "Australia", "Australie (l')", "AUS", "36"),
-        ("AT", "Austria", "Autriche (l')", "AUT", "40"),
-        ("AZ", "Azerbaijan", "Azerbaïdjan (l')", "AZE", "31"),
-        ("BS", "Bahamas (the)", "Bahamas (les)", "BHS", "44"),
-        ("BH", "Bahrain", "Bahreïn", "BHR", "48"),
-        ("BD", "Bangladesh", "Bangladesh (le)", "BGD", "50"),
-        ("BB", "Barbados", "Barbade (la)", "BRB", "52"),
-        ("BY", "Belarus", "Bélarus (le)", "BLR", "112"),
-        ("BE", "Belgium", "Belgique (la)", "BEL", "56"),
-        ("BZ", "Belize", "Belize (le)", "BLZ", "84"),
-        ("BJ", "Benin", "Bénin (le)", "BEN", "204"),
-        ("BM", "Bermuda", "Bermudes (les)", "BMU", "60"),
-        ("BT", "Bhutan", "Bhoutan (le)", "BTN", "64"),
-        ("BO", "Bolivia (Plurinational State of)", "Bolivie (État plurinational de)", "BOL", "68"),
-        ("BQ", "Bonaire, Sint Eustatius and Saba", "Bonaire, Saint-Eustache et Saba", "BES", "535"),
-        ("BA", "Bosnia and Herzegovina", "Bosnie-Herzégovine (la)", "BIH", "70"),
-        ("BW", "Botswana", "Botswana (le)", "BWA", "72"),
-        ("BV", "Bouvet Island", "Bouvet (l'Île)", "BVT", "74"),
-        ("BR", "Brazil", "Brésil (le)", "BRA", "76"),
-        ("IO", "British Indian Ocean Territory (the)", "Indien (le Territoire britannique de l'océan)", "IOT", "86"),
-        ("BN", "Brunei Darussalam", "Brunéi Darussalam (le)", "BRN", "96"),
-        ("BG", "Bulgaria", "Bulgarie (la)", "BGR", "100"),
-        ("BF", "Burkina Faso", "Burkina Faso (le)", "BFA", "854"),
-        ("BI", "Burundi", "Burundi (le)", "BDI", "108"),
-        ("CV", "Cabo Verde", "Cabo Verde", "CPV", "132"),
-        ("KH", "Cambodia", "Cambodge (le)", "KHM", "116"),
-        ("CM", "Cameroon", "Cameroun (le)", "CMR", "120"),
-        ("CA", "Canada", "Canada (le)", "CAN", "124"),
-        ("KY", "Cayman Islands (the)", "Caïmans (les Îles)", "CYM", "136"),
-        ("CF", "Central African Republic (the)", "République centrafricaine (la)", "CAF", "140"),
-        ("TD", "Chad", "Tchad (le)", "TCD", "148"),
-        ("CL", "Chile", "Chili (le)", "CHL", "152"),
-        ("CN", "China", "Chine (la)", "CHN", "156"),
-        ("CX", "Christmas Island", "Christmas (l'Île)", "CXR", "162"),
-        ("CC", "Cocos (Keeling) Islands (the)", "Cocos (les Îles)/ Keeling (les Îles)", "CCK", "166"),
-        ("CO", "Colombia", "Colombie (la)", "COL", "170"),
-        ("KM", "Comoros (the)", "Comores (les)", "COM", "174"),
-        ("CD", "Congo (the Democratic Republic of the)", "Congo (la République démocratique du)", "COD", "180"),
-        ("CG", "Congo (the)", "Congo (le)", "COG", "178"),
-        ("CK", "Cook Islands (the)", "Cook (les Îles)", "COK", "184"),
-        ("CR", "Costa Rica", "Costa Rica (le)", "CRI", "188"),
-        ("CI", "Côte d'Ivoire", "Côte d'Ivoire (la)", "CIV", "384"),
-        ("HR", "Croatia", "Croatie (la)", "HRV", "191"),
-        ("CU", "Cuba", "Cuba", "CUB", "192"),
-        ("CW", "Curaçao", "Curaçao", "CUW", "531"),
-        ("CY", "Cyprus", "Chypre", "CYP", "196"),
-        ("CZ", "Czechia", "Tchéquie (la)", "CZE", "203"),
-        ("DK", "Denmark", "Danemark (le)", "DNK", "208"),
-        ("DJ", "Djibouti", "Djibouti", "DJI", "262"),
-        ("DM", "Dominica", "Dominique (la)", "DMA", "212"),
-        ("DO", "Dominican Republic (the)", "dominicaine (la République)", "DOM", "214"),
-        ("EC", "Ecuador", "Équateur (l')", "ECU", "218"),
-        ("EG", "Egypt", "Égypte (l')", "EGY", "818"),
-        ("SV", "El Salvador", "El Salvador", "SLV", "222"),
-        ("GQ", "Equatorial Guinea", "Guinée équatoriale (la)", "GNQ", "226"),
-        ("ER", "Eritrea", "Érythrée (l')", "ERI", "232"),
-        ("EE", "Estonia", "Estonie (l')", "EST", "233"),
-        ("ET", "Ethiopia", "Éthiopie (l')", "ETH", "231"),
-        ("FK", "Falkland Islands (the) [Malvinas]", "Falkland (les Îles)/Malouines (les Îles)", "FLK", "238"),
-        ("FO", "Faroe Islands (the)", "Féroé (les Îles)", "FRO", "234"),
-        ("FJ", "Fiji", "Fidji (les)", "FJI", "242"),
-        ("FI", "Finland", "Finlande (la)", "FIN", "246"),
-        ("FR", "France", "France (la)", "FRA", "250"),
-        ("GF", "French Guiana", "Guyane française (la )", "GUF", "254"),
-        ("PF", "French Polynesia", "Polynésie française (la)", "PYF", "258"),
-        ("TF", "French Southern Territories (the)", "Terres australes françaises (les)", "ATF", "260"),
-        ("GA", "Gabon", "Gabon (le)", "GAB", "266"),
-        ("GM", "Gambia (the)", "Gambie (la)", "GMB", "270"),
-        ("GE", "Georgia", "Géorgie (la)", "GEO", "268"),
-        ("DE", "Germany", "Allemagne (l')", "DEU", "276"),
-        ("GH", "Ghana", "Ghana (le)", "GHA", "288"),
-        ("GI", "Gibraltar", "Gibraltar", "GIB", "292"),
-        ("GR", "Greece", "Grèce (la)", "GRC", "300"),
-        ("GL", "Greenland", "Groenland (le)", "GRL", "304"),
-        ("GD", "Grenada", "Grenade (la)", "GRD", "308"),
-        ("GP", "Guadeloupe", "Guadeloupe (la)", "GLP", "312"),
-        ("GU", "Guam", "Guam", "GUM", "316"),
-        ("GT", "Guatemala", "Guatemala (le)", "GTM", "320"),
-        ("GG", "Guernsey", "Guernesey", "GGY", "831"),
-        ("GN", "Guinea", "Guinée (la)", "GIN", "324"),
-        ("GW", "Guinea-Bissau", "Guinée-Bissau (la)", "GNB", "624"),
-        ("GY", "Guyana", "Guyana (le)", "GUY", "328"),
-        ("HT", "Haiti", "Haïti", "HTI", "332"),
-        ("HM", "Heard Island and McDonald Islands", "Heard-et-Îles MacDonald (l'Île)", "HMD", "334"),
-        ("VA", "Holy See (the)", "Saint-Siège (le)", "VAT", "336"),
-        ("HN", "Honduras", "Honduras (le)", "HND", "340"),
-        ("HK", "Hong Kong", "Hong Kong", "HKG", "344"),
-        ("HU", "Hungary", "Hongrie (la)", "HUN", "348"),
-        ("IS", "Iceland", "Islande (l')", "ISL", "352"),
-        ("IN", "India", "Inde (l')", "IND", "356"),
-        ("ID", "Indonesia", "Indonésie (l')", "IDN", "360"),
-        ("IR", "Iran (Islamic Republic of)", "Iran (République Islamique d')", "IRN", "364"),
-        ("IQ", "Iraq", "Iraq (l')", "IRQ", "368"),
-        ("IE", "Ireland", "Irlande (l')", "IRL", "372"),
-        ("IM", "Isle of Man", "Île de Man", "IMN", "833"),
-        ("IL", "Israel", "Israël", "ISR", "376"),
-        ("IT", "Italy", "Italie (l')", "ITA", "380"),
-        ("JM", "Jamaica", "Jamaïque (la)", "JAM", "388"),
-        ("JP", "Japan", "Japon (le)", "JPN", "392"),
-        ("JE", "Jersey", "Jersey", "JEY", "832"),
-        ("JO", "Jordan", "Jordanie (la)", "JOR", "400"),
-        ("KZ", "Kazakhstan", "Kazakhstan (le)", "KAZ", "398"),
-        ("KE", "Kenya", "Kenya (le)", "KEN", "404"),
-        ("KI", "Kiribati", "Kiribati", "KIR", "296"),
-        ("KP", "Korea (the Democratic People's Republic of)", "Corée (la République populaire démocratique de)", "PRK", "408"),
-        ("KR", "Korea (the Republic of)", "Corée (la République de)", "KOR", "410"),
-        ("KW", "Kuwait", "Koweït (le)", "KWT", "414"),
-        ("KG", "Kyrgyzstan", "Kirghizistan (le)", "KGZ", "417"),
-        ("LA", "Lao People's Democratic Republic (the)", "Lao, République démocratique populaire", "LAO", "418"),
-        ("LV", "Latvia", "Lettonie (la)", "LVA", "428"),
-        ("LB", "Lebanon", "Liban (le)", "LBN", "422"),
-        ("LS", "Lesotho", "Lesotho (le)", "LSO", "426"),
-        ("LR", "Liberia", "Libéria (le)", "LBR", "430"),
-        ("LY", "Libya", "Libye (la)", "LBY", "434"),
-        ("LI", "Liechtenstein", "Liechtenstein (le)", "LIE", "438"),
-        ("LT", "Lithuania", "Lituanie (la)", "LTU", "440"),
-        ("LU", "Luxembourg", "Luxembourg (le)", "LUX", "442"),
-        ("MO", "Macao", "Macao", "MAC", "446"),
-        ("MK", "Macedonia (the former Yugoslav Republic of)", "Macédoine (l'ex-République yougoslave de)", "MKD", "807"),
-        ("MG", "Madagascar", "Madagascar", "MDG", "450"),
-        ("MW", "Malawi", "Malawi (le)", "MWI", "454"),
-        ("MY", "Malaysia", "Malaisie (la)", "MYS", "458"),
-        ("MV", "Maldives", "Maldives (les)", "MDV", "462"),
-        ("ML", "Mali", "Mali (le)", "MLI", "466"),
-        ("MT", "Malta", "Malte", "MLT", "470"),
-        ("MH", "Marshall Islands (the)", "Marshall (Îles)", "MHL", "584"),
-        ("MQ", "Martinique", "Martinique (la)", "MTQ", "474"),
-        ("MR", "Mauritania", "Mauritanie (la)", "MRT", "478"),
-        ("MU", "Mauritius", "Maurice", "MUS", "480"),
-        ("YT", "Mayotte", "Mayotte", "MYT", "175"),
-        ("MX", "Mexico", "Mexique (le)", "MEX", "484"),
-        ("FM", "Micronesia (Federated States of)", "Micronésie (États fédérés de)", "FSM", "583"),
-        ("MD", "Moldova (the Republic of)", "Moldova, République de", "MDA", "498"),
-        ("MC", "Monaco", "Monaco", "MCO", "492"),
-        ("MN", "Mongolia", "Mongolie (la)", "MNG", "496"),
-        ("ME", "Montenegro", "Monténégro (le)", "MNE", "499"),
-        ("MS", "Montserrat", "Montserrat", "MSR", "500"),
-        ("MA", "Morocco", "Maroc (le)", "MAR", "504"),
-        ("MZ", "Mozambique", "Mozambique (le)", "MOZ", "508"),
-        ("MM", "Myanmar", "Myanmar (le)", "MMR", "104"),
-        ("NA", "Namibia", "Namibie (la)", "NAM", "516"),
-        ("NR", "Nauru", "Nauru", "NRU", "520"),
-        ("NP", "Nepal", "Népal (le)", "NPL", "524"),
-        ("NL", "Netherlands (the)", "Pays-Bas (les)", "NLD", "528"),
-        ("NC", "New Caledonia", "Nouvelle-Calédonie (la)", "NCL", "540"),
-        ("NZ", "New Zealand", "Nouvelle-Zélande (la)", "NZL", "554"),
-        ("NI", "Nicaragua", "Nicaragua (le)", "NIC", "558"),
-        ("NE", "Niger (the)", "Niger (le)", "NER", "562"),
-        ("NG", "Nigeria", "Nigéria (le)", "NGA", "566"),
-        ("NU", "Niue", "Niue", "NIU", "570"),
-        ("NF", "Norfolk Island", "Norfolk (l'Île)", "NFK", "574"),
-        ("MP", "Northern Mariana Islands (the)", "Mariannes du Nord (les Îles)", "MNP", "580"),
-        ("NO", "Norway", "Norvège (la)", "NOR", "578"),
-        ("OM", "Oman", "Oman", "OMN", "512"),
-        ("PK", "Pakistan", "Pakistan (le)", "PAK", "586"),
-        ("PW", "Palau", "Palaos (les)", "PLW", "585"),
-        ("PS", "Palestine, State of", "Palestine, État de", "PSE", "275"),
-        ("PA", "Panama", "Panama (le)", "PAN", "591"),
-        ("PG", "Papua New Guinea", "Papouasie-Nouvelle-Guinée (la)", "PNG", "598"),
-        ("PY", "Paraguay", "Paraguay (le)", "PRY", "600"),
-        ("PE", "Peru", "Pérou (le)", "PER", "604"),
-        ("PH", "Philippines (the)", "Philippines (les)", "PHL", "608"),
-        ("PN", "Pitcairn", "Pitcairn", "PCN", "612"),
-        ("PL", "Poland", "Pologne (la)", "POL", "616"),
-        ("PT", "Portugal", "Portugal (le)", "PRT", "620"),
-        ("PR", "Puerto Rico", "Porto Rico", "PRI", "630"),
-        ("QA", "Qatar", "Qatar (le)", "QAT", "634"),
-        ("RE", "Réunion", "Réunion (La)", "REU", "638"),
-        ("RO", "Romania", "Roumanie (la)", "ROU", "642"),
-        ("RU", "Russian Federation (the)", "Russie (la Fédération de)", "RUS", "643"),
-        ("RW", "Rwanda", "Rwanda (le)", "RWA", "646"),
-        ("BL", "Saint Barthélemy", "Saint-Barthélemy", "BLM", "652"),
-        ("SH", "Saint Helena, Ascension and Tristan da Cunha", "Sainte-Hélène, Ascension et Tristan da Cunha", "SHN", "654"),
-        ("KN", "Saint Kitts and Nevis", "Saint-Kitts-et-Nevis", "KNA", "659"),
-        ("LC", "Saint Lucia", "Sainte-Lucie", "LCA", "662"),
-        ("MF", "Saint Martin (French part)", "Saint-Martin (partie française)", "MAF", "663"),
-        ("PM", "Saint Pierre and Miquelon", "Saint-Pierre-et-Miquelon", "SPM", "666"),
-        ("VC", "Saint Vincent and the Grenadines", "Saint-Vincent-et-les Grenadines", "VCT", "670"),
-        ("WS", "Samoa", "Samoa (le)", "WSM", "882"),
-        ("SM", "San Marino", "Saint-Marin", "SMR", "674"),
-        ("ST", "Sao Tome and Principe", "Sao Tomé-et-Principe", "STP", "678"),
-        ("SA", "Saudi Arabia", "Arabie saoudite (l')", "SAU", "682"),
-        ("SN", "Senegal", "Sénégal (le)", "SEN", "686"),
-        ("RS", "Serbia", "Serbie (la)", "SRB", "688"),
-        ("SC", "Seychelles", "Seychelles (les)", "SYC", "690"),
-        ("SL", "Sierra Leone", "Sierra Leone (la)", "SLE", "694"),
-        ("SG", "Singapore", "Singapour", "SGP", "702"),
-        ("SX", "Sint Maarten (Dutch part)", "Saint-Martin (partie néerlandaise)", "SXM", "534"),
-        ("SK", "Slovakia", "Slovaquie (la)", "SVK", "703"),
-        ("SI", "Slovenia", "Slovénie (la)", "SVN", "705"),
-        ("SB", "Solomon Islands", "Salomon (Îles)", "SLB", "90"),
-        ("SO", "Somalia", "Somalie (la)", "SOM", "706"),
-        ("ZA", "South Africa", "Afrique du Sud (l')", "ZAF", "710"),
-        ("GS", "South Georgia and the South Sandwich Islands", "Géorgie du Sud-et-les Îles Sandwich du Sud (la)", "SGS", "239"),
-        ("SS", "South Sudan", "Soudan du Sud (le)", "SSD", "728"),
-        ("ES", "Spain", "Espagne (l')", "ESP", "724"),
-        ("LK", "Sri Lanka", "Sri Lanka", "LKA", "144"),
-        ("SD", "Sudan (the)", "Soudan (le)", "SDN", "729"),
-        ("SR", "Suriname", "Suriname (le)", "SUR", "740"),
-        ("SJ", "Svalbard and Jan Mayen", "Svalbard et l'Île Jan Mayen (le)", "SJM", "744"),
-        ("SZ", "Swaziland", "Swaziland (le)", "SWZ", "748"),
-        ("SE", "Sweden", "Suède (la)", "SWE", "752"),
-        ("CH", "Switzerland", "Suisse (la)", "CHE", "756"),
-        ("SY", "Syrian Arab Republic", "République arabe syrienne (la)", "SYR", "760"),
-        ("TW", "Taiwan (Province of China)", "Taïwan (Province de Chine)", "TWN", "158"),
-        ("TJ", "Tajikistan", "Tadjikistan (le)", "TJK", "762"),
-        ("TZ", "Tanzania, United Republic of", "Tanzanie, République-Unie de", "TZA", "834"),
-        ("TH", "Thailand", "Thaïlande (la)", "THA", "764"),
-        ("TL", "Timor-Leste", "Timor-Leste (le)", "TLS", "626"),
-        ("TG", "Togo", "Togo (le)", "TGO", "768"),
-        ("TK", "Tokelau", "Tokelau (les)", "TKL", "772"),
-        ("TO", "Tonga", "Tonga (les)", "TON", "776"),
-        ("TT", "Trinidad and Tobago", "Trinité-et-Tobago (la)", "TTO", "780"),
-        ("TN", "Tunisia", "Tunisie (la)", "TUN", "788"),
-        ("TR", "Turkey", "Turquie (la)", "TUR", "792"),
-        ("TM", "Turkmenistan", "Turkménistan (le)", "TKM", "795"),
-        ("TC", "Turks and Caicos Islands (the)", "Turks-et-Caïcos (les Îles)", "TCA", "796"),
-        ("TV", "Tuvalu", "Tuvalu (les)", "TUV", "798"),
-        ("UG", "Uganda", "Ouganda (l')", "UGA", "800"),
-        ("UA", "Ukraine", "Ukraine (l')", "UKR", "804"),
-        ("AE", "United Arab Emirates (the)", "Émirats arabes unis (les)", "ARE", "784"),
-        ("GB", "United Kingdom of Great Britain and Northern Ireland (the)", "Royaume-Uni de Grande-Bretagne et d'Irlande du Nord (le)", "GBR", "826"),
-        ("GB", "United Kingdom of Great Britain and Northern", "Royaume-Uni de Grande-Bretagne et d'Irlande du Nord (le)", "GBR", "826"),
-        ("UM", "United States Minor Outlying Islands (the)", "Îles mineures éloignées des États-Unis (les)", "UMI", "581"),
-        ("US", "United States of America (the)", "États-Unis d'Amérique (les)", "USA", "840"),
-        ("UY", "Uruguay", "Uruguay (l')", "URY", "858"),
-        ("UZ", "Uzbekistan", "Ouzbékistan (l')", "UZB", "860"),
-        ("VU", "Vanuatu", "Vanuatu (le)", "VUT", "548"),
-        ("VE", "Venezuela (Bolivarian Republic of)", "Venezuela (République bolivarienne du)", "VEN", "862"),
-        ("VN", "Viet Nam", "Viet Nam (le)", "VNM", "704"),
-        ("VG", "Virgin Islands (British)", "Vierges britanniques (les Îles)", "VGB", "92"),
-        ("VI", "Virgin Islands (U.S.)", "Vierges des États-Unis (les Îles)", "VIR", "850"),
-        ("WF", "Wallis and Futuna", "Wallis-et-Futuna", "WLF", "876"),
-        ("EH", "Western Sahara*", "Sahara occidental (le)*", "ESH", "732"),
-        ("YE", "Yemen", "Yémen (le)", "YEM", "887"),
-        ("ZM", "Zambia", "Zambie (la)", "ZMB", "894"),
-        ("ZW", "Zimbabwe", "Zimbabwe (le)", "ZWE", "716")
-]
-
-#LANGUAGE_CODE_LIST = [
-#        ("aaa", "00132443-001", "Ghotuo"),
-#        ("aab", "00133770-001", "Alumu-Tesu"),
-#        ("aac", "00133769-001", "Ari"),
-#        ("aad", "00133768-001", "Amal"),
-#        ("aae", "00133767-001", "Arbëreshë Albanian"),
-#        ("aaf", "00133766-001", "Aranadan"),
-#        ("aag", "00133765-001", "Ambrak"),
-#        ("aah", "00133756-001", "Abu' Arapesh"),
-#        ("aai", "00133763-001", "Arifama-Miniafia"),
-#        ("aak", "00133771-001", "Ankave"),
-#        ("aal", "00133761-001", "Afade"),
-#        ("aam", "00133760-001", "Aramanik"),
-#        ("aan", "00133759-001", "Anambé"),
-#        ("aao", "00133758-001", "Algerian Saharan Arabic"),
-#        ("aap", "00133757-001", "Pará Arára"),
-#        ("aaq", "00137967-001", "Eastern Abnaki"),
-#        ("aar", "00138650-001", "Afar"),
-#        ("aas", "00133779-001", "Aasáx"),
-#        ("aat", "00133781-001", "Arvanitika Albanian"),
-#        ("aau", "00133764-001", "Abau"),
-#        ("aaw", "00133786-001", "Solong"),
-#        ("aax", "00133785-001", "Mandobo Atas"),
-#        ("aaz", "00133784-001", "Amarasi"),
-#        ("aba", "00133783-001", "Abé"),
-#        ("abb", "00133782-001", "Bankon"),
-#        ("abc", "00133772-001", "Ambala Ayta"),
-#        ("abd", "00133780-001", "Camarines Norte Agta"),
-#        ("abe", "00133788-001", "Western Abnaki"),
-#        ("abf", "00133778-001", "Abai Sungai"),
-#        ("abg", "00133777-001", "Abaga"),
-#        ("abh", "00133776-001", "Tajiki Arabic"),
-#        ("abi", "00133775-001", "Abidji"),
-#        ("abj", "00138051-001", "Aka-Bea"),
-#        ("abk", "00138467-001", "Abkhazian; Abkhaz"),
-#        ("abl", "00133774-001", "Lampung Nyo"),
-#        ("abm", "00133748-001", "Abanyom"),
-#        ("abn", "00133787-001", "Abua"),
-#        ("abo", "00133762-001", "Abon"),
-#        ("abp", "00133889-001", "Abenlen Ayta"),
-#        ("abq", "00133888-001", "Abaza"),
-#        ("abr", "00133910-001", "Abron"),
-#        ("abs", "00133912-001", "Ambonese Malay"),
-#        ("abt", "00133895-001", "Ambulas"),
-#        ("abu", "00133917-001", "Abure"),
-#        ("abv", "00133916-001", "Baharna Arabic"),
-#        ("abw", "00133915-001", "Pal"),
-#        ("abx", "00133914-001", "Inabaknon"),
-#        ("aby", "00133913-001", "Aneme Wake"),
-#        ("abz", "00133903-001", "Abui"),
-#        ("aca", "00133911-001", "Achagua"),
-#        ("acb", "00133919-001", "Áncá"),
-#        ("acd", "00133909-001", "Gikyode"),
-#        ("ace", "00133908-001", "Achinese"),
-#        ("acf", "00133907-001", "Saint Lucian Creole French"),
-#        ("ach", "00133906-001", "Acoli"),
-#        ("aci", "00137919-001", "Aka-Cari"),
-#        ("ack", "00137943-001", "Aka-Kora"),
-#        ("acl", "00137955-001", "Akar-Bale"),
-#        ("acm", "00133905-001", "Mesopotamian Arabic"),
-#        ("acn", "00133879-001", "Achang"),
-#        ("acp", "00133918-001", "Eastern Acipa"),
-#        ("acq", "00133893-001", "Ta'izzi-Adeni Arabic"),
-#        ("acr", "00133869-001", "Achi"),
-#        ("acs", "00137937-001", "Acroá"),
-#        ("act", "00133868-001", "Achterhoeks"),
-#        ("acu", "00133867-001", "Achuar-Shiwiar"),
-#        ("acv", "00133866-001", "Achumawi"),
-#        ("acw", "00133865-001", "Hijazi Arabic"),
-#        ("acx", "00133864-001", "Omani Arabic"),
-#        ("acy", "00133855-001", "Cypriot Arabic"),
-#        ("acz", "00133862-001", "Acheron"),
-#        ("ada", "00133870-001", "Adangme"),
-#        ("adb", "00133860-001", "Adabe"),
-#        ("add", "00133859-001", "Dzodinka"),
-#        ("ade", "00133858-001", "Adele"),
-#        ("adf", "00133857-001", "Dhofari Arabic"),
-#        ("adg", "00133877-001", "Andegerebinha"),
-#        ("adh", "00133861-001", "Adhola"),
-#        ("adi", "00133863-001", "Adi"),
-#        ("adj", "00133885-001", "Adioukrou"),
-#        ("adl", "00133884-001", "Galo"),
-#        ("adn", "00133883-001", "Adang"),
-#        ("ado", "00133882-001", "Abu"),
-#        ("adp", "00133881-001", "Adap"),
-#        ("adq", "00133880-001", "Adangbe"),
-#        ("adr", "00133871-001", "Adonara"),
-#        ("ads", "00133878-001", "Adamorobe Sign Language"),
-#        ("adt", "00133886-001", "Adnyamathanha"),
-#        ("adu", "00133876-001", "Aduge"),
-#        ("adw", "00133875-001", "Amundava"),
-#        ("adx", "00133874-001", "Amdo Tibetan"),
-#        ("ady", "00133873-001", "Adyghe; Adygei"),
-#        ("adz", "00133921-001", "Adzera"),
-#        ("aea", "00133856-001", "Areba"),
-#        ("aeb", "00133904-001", "Tunisian Arabic"),
-#        ("aec", "00133966-001", "Saidi Arabic"),
-#        ("aed", "00133965-001", "Argentine Sign Language"),
-#        ("aee", "00133964-001", "Northeast Pashayi"),
-#        ("aek", "00133963-001", "Haeke"),
-#        ("ael", "00133962-001", "Ambele"),
-#        ("aem", "00133961-001", "Arem"),
-#        ("aen", "00133952-001", "Armenian Sign Language"),
-#        ("aeq", "00133959-001", "Aer"),
-#        ("aer", "00133967-001", "Eastern Arrernte"),
-#        ("aes", "00138050-001", "Alsea"),
-#        ("aeu", "00133957-001", "Akeu"),
-#        ("aew", "00133956-001", "Ambakich"),
-#        ("aey", "00133955-001", "Amele"),
-#        ("aez", "00133954-001", "Aeka"),
-#        ("afb", "00133953-001", "Gulf Arabic"),
-#        ("afd", "00133975-001", "Andai"),
-#        ("afe", "00133977-001", "Putukwam"),
-#        ("afg", "00133960-001", "Afghan Sign Language"),
-#        ("afh", "00138350-001", "Afrihili"),
-#        ("afi", "00133982-001", "Akrukay"),
-#        ("afk", "00133981-001", "Nanubae"),
-#        ("afn", "00133980-001", "Defaka"),
-#        ("afo", "00133979-001", "Eloyi"),
-#        ("afp", "00133978-001", "Tapei"),
-#        ("afr", "00138469-001", "Afrikaans"),
-#        ("afs", "00133968-001", "Afro-Seminole Creole"),
-#        ("aft", "00133976-001", "Afitti"),
-#        ("afu", "00133984-001", "Awutu"),
-#        ("afz", "00133974-001", "Obokuitai"),
-#        ("aga", "00138115-001", "Aguano"),
-#        ("agb", "00133973-001", "Legbo"),
-#        ("agc", "00133972-001", "Agatu"),
-#        ("agd", "00133971-001", "Agarabi"),
-#        ("age", "00133970-001", "Angal"),
-#        ("agf", "00133944-001", "Arguni"),
-#        ("agg", "00133983-001", "Angor"),
-#        ("agh", "00133958-001", "Ngelima"),
-#        ("agi", "00133934-001", "Agariya"),
-#        ("agj", "00133933-001", "Argobba"),
-#        ("agk", "00133932-001", "Isarog Agta"),
-#        ("agl", "00133931-001", "Fembe"),
-#        ("agm", "00133930-001", "Angaataha"),
-#        ("agn", "00133929-001", "Agutaynen"),
-#        ("ago", "00133920-001", "Tainae"),
-#        ("agp", "00133927-001", "Paranan"),
-#        ("agq", "00133935-001", "Aghem"),
-#        ("agr", "00133925-001", "Aguaruna"),
-#        ("ags", "00133924-001", "Esimbi"),
-#        ("agt", "00133923-001", "Central Cagayan Agta"),
-#        ("agu", "00133922-001", "Aguacateco"),
-#        ("agv", "00133942-001", "Remontado Agta"),
-#        ("agw", "00133926-001", "Kahua"),
-#        ("agx", "00133928-001", "Aghul"),
-#        ("agy", "00133950-001", "Southern Alta"),
-#        ("agz", "00133949-001", "Mt. Iriga Agta"),
-#        ("aha", "00133948-001", "Ahanta"),
-#        ("ahb", "00133947-001", "Axamb"),
-#        ("ahg", "00133946-001", "Qimant"),
-#        ("ahh", "00133945-001", "Aghu"),
-#        ("ahi", "00133936-001", "Tiagbamrin Aizi"),
-#        ("ahk", "00133943-001", "Akha"),
-#        ("ahl", "00133951-001", "Igo"),
-#        ("ahm", "00133941-001", "Mobumrin Aizi"),
-#        ("ahn", "00133940-001", "Àhàn"),
-#        ("aho", "00137981-001", "Ahom"),
-#        ("ahp", "00133939-001", "Aproumu Aizi"),
-#        ("ahr", "00133938-001", "Ahirani"),
-#        ("ahs", "00133509-001", "Ashe"),
-#        ("aht", "00134067-001", "Ahtena"),
-#        ("aia", "00133676-001", "Arosi"),
-#        ("aib", "00133249-001", "Ainu"),
-#        ("aic", "00133248-001", "Ainbai"),
-#        ("aid", "00133247-001", "Alngith"),
-#        ("aie", "00133246-001", "Amara"),
-#        ("aif", "00133245-001", "Agi"),
-#        ("aig", "00133244-001", "Antigua and Barbuda Creole English"),
-#        ("aih", "00133235-001", "Ai-Cham"),
-#        ("aii", "00133242-001", "Assyrian Neo-Aramaic"),
-#        ("aij", "00133250-001", "Lishanid Noshan"),
-#        ("aik", "00133240-001", "Ake"),
-#        ("ail", "00133239-001", "Aimele"),
-#        ("aim", "00133238-001", "Aimol"),
-#        ("ain", "00133237-001", "Ainu"),
-#        ("aio", "00133236-001", "Aiton"),
-#        ("aip", "00133258-001", "Burumakok"),
-#        ("aiq", "00133260-001", "Aimaq"),
-#        ("air", "00133243-001", "Airoran"),
-#        ("ais", "00133265-001", "Nataoran Amis"),
-#        ("ait", "00138315-001", "Arikem"),
-#        ("aiw", "00133264-001", "Aari"),
-#        ("aix", "00133263-001", "Aighon"),
-#        ("aiy", "00133262-001", "Ali"),
-#        ("aja", "00133261-001", "Aja"),
-#        ("ajg", "00133251-001", "Aja"),
-#        ("aji", "00133259-001", "Ajië"),
-#        ("ajp", "00133267-001", "South Levantine Arabic"),
-#        ("ajt", "00133257-001", "Judeo-Tunisian Arabic"),
-#        ("aju", "00133256-001", "Judeo-Moroccan Arabic"),
-#        ("ajw", "00138303-001", "Ajawa"),
-#        ("ajz", "00133255-001", "Amri Karbi"),
-#        ("aka", "00138470-001", "Akan"),
-#        ("akb", "00133254-001", "Batak Angkola"),
-#        ("akc", "00133253-001", "Mpur"),
-#        ("akd", "00133227-001", "Ukpet-Ehom"),
-#        ("ake", "00133266-001", "Akawaio"),
-#        ("akf", "00133241-001", "Akpa"),
-#        ("akg", "00133217-001", "Anakalangu"),
-#        ("akh", "00133216-001", "Angal Heneng"),
-#        ("aki", "00133215-001", "Aiome"),
-#        ("akj", "00138328-001", "Aka-Jeru"),
-#        ("akk", "00138360-001", "Akkadian"),
-#        ("akl", "00133214-001", "Aklanon"),
-#        ("akm", "00138140-001", "Aka-Bo"),
-#        ("ako", "00133213-001", "Akurio"),
-#        ("akp", "00133212-001", "Siwu"),
-#        ("akq", "00133203-001", "Ak"),
-#        ("akr", "00133210-001", "Araki"),
-#        ("aks", "00133218-001", "Akaselem"),
-#        ("akt", "00133208-001", "Akolet"),
-#        ("aku", "00133207-001", "Akum"),
-#        ("akv", "00133206-001", "Akhvakh"),
-#        ("akw", "00133205-001", "Akwa"),
-#        ("akx", "00138157-001", "Aka-Kede"),
-#        ("aky", "00138217-001", "Aka-Kol"),
-#        ("akz", "00133225-001", "Alabama"),
-#        ("ala", "00133209-001", "Alago"),
-#        ("alc", "00133211-001", "Qawasqar"),
-#        ("ald", "00133233-001", "Alladian"),
-#        ("ale", "00133232-001", "Aleut"),
-#        ("alf", "00133231-001", "Alege"),
-#        ("alh", "00133230-001", "Alawa"),
-#        ("ali", "00133229-001", "Amaimon"),
-#        ("alj", "00133228-001", "Alangan"),
-#        ("alk", "00133219-001", "Alak"),
-#        ("all", "00133226-001", "Allar"),
-#        ("alm", "00133234-001", "Amblong"),
-#        ("aln", "00133224-001", "Gheg Albanian"),
-#        ("alo", "00133223-001", "Larike-Wakasihu"),
-#        ("alp", "00133222-001", "Alune"),
-#        ("alq", "00133221-001", "Algonquin"),
-#        ("alr", "00133269-001", "Alutor"),
-#        ("als", "00133204-001", "Tosk Albanian"),
-#        ("alt", "00133252-001", "Southern Altai"),
-#        ("alu", "00133314-001", "'Are'are"),
-#        ("alw", "00133313-001", "Alaba-K’abeena"),
-#        ("alx", "00133312-001", "Amol"),
-#        ("aly", "00133311-001", "Alyawarr"),
-#        ("alz", "00133310-001", "Alur"),
-#        ("ama", "00138167-001", "Amanayé"),
-#        ("amb", "00133309-001", "Ambo"),
-#        ("amc", "00133300-001", "Amahuaca"),
-#        ("ame", "00133307-001", "Yanesha'"),
-#        ("amf", "00133315-001", "Hamer-Banna"),
-#        ("amg", "00133305-001", "Amarag"),
-#        ("amh", "00138471-001", "Amharic"),
-#        ("ami", "00133304-001", "Amis"),
-#        ("amj", "00133303-001", "Amdang"),
-#        ("amk", "00133302-001", "Ambai"),
-#        ("aml", "00133301-001", "War-Jaintia"),
-#        ("amm", "00133323-001", "Ama"),
-#        ("amn", "00133325-001", "Amanab"),
-#        ("amo", "00133308-001", "Amo"),
-#        ("amp", "00133330-001", "Alamblak"),
-#        ("amq", "00133329-001", "Amahai"),
-#        ("amr", "00133328-001", "Amarakaeri"),
-#        ("ams", "00133327-001", "Southern Amami-Oshima"),
-#        ("amt", "00133326-001", "Amto"),
-#        ("amu", "00133316-001", "Guerrero Amuzgo"),
-#        ("amv", "00133324-001", "Ambelau"),
-#        ("amw", "00133332-001", "Western Neo-Aramaic"),
-#        ("amx", "00133322-001", "Anmatyerre"),
-#        ("amy", "00133321-001", "Ami"),
-#        ("amz", "00133320-001", "Atampaya"),
-#        ("ana", "00138177-001", "Andaqui"),
-#        ("anb", "00138178-001", "Andoa"),
-#        ("anc", "00133319-001", "Ngas"),
-#        ("and", "00133318-001", "Ansus"),
-#        ("ane", "00133292-001", "Xârâcùù"),
-#        ("anf", "00133331-001", "Animere"),
-#        ("ang", "00137851-001", "Old English"),
-#        ("anh", "00133306-001", "Nend"),
-#        ("ani", "00133282-001", "Andi"),
-#        ("anj", "00133281-001", "Anor"),
-#        ("ank", "00133280-001", "Goemai"),
-#        ("anl", "00133279-001", "Anu"),
-#        ("anm", "00133278-001", "Anal"),
-#        ("ann", "00133277-001", "Obolo"),
-#        ("ano", "00133268-001", "Andoque"),
-#        ("anp", "00133275-001", "Angika"),
-#        ("anq", "00133283-001", "Jarawa"),
-#        ("anr", "00133273-001", "Andh"),
-#        ("ans", "00138129-001", "Anserma"),
-#        ("ant", "00133272-001", "Antakarinya"),
-#        ("anu", "00133271-001", "Anuak"),
-#        ("anv", "00133270-001", "Denya"),
-#        ("anw", "00133290-001", "Anaang"),
-#        ("anx", "00133274-001", "Andra-Hus"),
-#        ("any", "00133276-001", "Anyin"),
-#        ("anz", "00133298-001", "Anem"),
-#        ("aoa", "00133297-001", "Angolar"),
-#        ("aob", "00133296-001", "Abom"),
-#        ("aoc", "00133295-001", "Pemon"),
-#        ("aod", "00133294-001", "Andarum"),
-#        ("aoe", "00133293-001", "Angal Enen"),
-#        ("aof", "00133284-001", "Bragat"),
-#        ("aog", "00133291-001", "Angoram"),
-#        ("aoh", "00138130-001", "Arma"),
-#        ("aoi", "00133299-001", "Anindilyakwa"),
-#        ("aoj", "00133289-001", "Mufian"),
-#        ("aok", "00133288-001", "Arhö"),
-#        ("aol", "00133287-001", "Alor"),
-#        ("aom", "00133286-001", "Ömie"),
-#        ("aon", "00133285-001", "Bumbita Arapesh"),
-#        ("aor", "00133187-001", "Aore"),
-#        ("aos", "00133090-001", "Taikat"),
-#        ("aot", "00133220-001", "A'tong"),
-#        ("aox", "00133118-001", "Atorada"),
-#        ("aoz", "00133117-001", "Uab Meto"),
-#        ("apb", "00133116-001", "Sa'a"),
-#        ("apc", "00133115-001", "North Levantine Arabic"),
-#        ("apd", "00133114-001", "Sudanese Arabic"),
-#        ("ape", "00133105-001", "Bukiyip"),
-#        ("apg", "00133112-001", "Ampanang"),
-#        ("aph", "00133120-001", "Athpariya"),
-#        ("api", "00133110-001", "Apiaká"),
-#        ("apj", "00133109-001", "Jicarilla Apache"),
-#        ("apk", "00133108-001", "Kiowa Apache"),
-#        ("apl", "00133107-001", "Lipan Apache"),
-#        ("apm", "00133106-001", "Mescalero-Chiricahua Apache"),
-#        ("apn", "00133128-001", "Apinayé"),
-#        ("apo", "00133130-001", "Apalik"),
-#        ("app", "00133113-001", "Apma"),
-#        ("apq", "00133135-001", "A-Pucikwar"),
-#        ("apr", "00133134-001", "Arop-Lokep"),
-#        ("aps", "00133133-001", "Arop-Sissano"),
-#        ("apt", "00133132-001", "Apatani"),
-#        ("apu", "00133131-001", "Apurinã"),
-#        ("apv", "00138137-001", "Alapmunte"),
-#        ("apw", "00133121-001", "Western Apache"),
-#        ("apx", "00133129-001", "Aputai"),
-#        ("apy", "00133137-001", "Apalaí"),
-#        ("apz", "00133127-001", "Safeyoka"),
-#        ("aqc", "00133126-001", "Archi"),
-#        ("aqg", "00133125-001", "Arigidi"),
-#        ("aqm", "00133124-001", "Atohwaim"),
-#        ("aqn", "00133123-001", "Northern Alta"),
-#        ("aqp", "00138138-001", "Atakapa"),
-#        ("aqr", "00133097-001", "Arhâ"),
-#        ("ara", "00138473-001", "Arabic"),
-#        ("arb", "00133136-001", "Standard Arabic"),
-#        ("arc", "00138362-001", "Official Aramaic; Imperial Aramaic"),
-#        ("ard", "00133111-001", "Arabana"),
-#        ("are", "00133087-001", "Western Arrarnta"),
-#        ("arg", "00138472-001", "Aragonese"),
-#        ("arh", "00133086-001", "Arhuaco"),
-#        ("ari", "00133085-001", "Arikara"),
-#        ("arj", "00138344-001", "Arapaso"),
-#        ("ark", "00134801-001", "Arikapú"),
-#        ("arl", "00134800-001", "Arabela"),
-#        ("arn", "00134822-001", "Mapudungun; Mapuche"),
-#        ("aro", "00134824-001", "Araona"),
-#        ("arp", "00134807-001", "Arapaho"),
-#        ("arq", "00134829-001", "Algerian Arabic"),
-#        ("arr", "00134828-001", "Karo"),
-#        ("ars", "00134827-001", "Najdi Arabic"),
-#        ("aru", "00138247-001", "Aruá"),
-#        ("arv", "00134826-001", "Arbore"),
-#        ("arw", "00134825-001", "Arawak"),
-#        ("arx", "00134815-001", "Aruá"),
-#        ("ary", "00134823-001", "Moroccan Arabic"),
-#        ("arz", "00134831-001", "Egyptian Arabic"),
-#        ("asa", "00134821-001", "Asu"),
-#        ("asb", "00134820-001", "Assiniboine"),
-#        ("asc", "00134819-001", "Casuarina Coast Asmat"),
-#        ("asd", "00134818-001", "Asas"),
-#        ("ase", "00134817-001", "American Sign Language"),
-#        ("asf", "00134791-001", "Australian Sign Language"),
-#        ("asg", "00134830-001", "Cishingini"),
-#        ("ash", "00138252-001", "Abishira"),
-#        ("asi", "00134805-001", "Buruwai"),
-#        ("asj", "00134781-001", "Nsari"),
-#        ("ask", "00134780-001", "Ashkun"),
-#        ("asl", "00134779-001", "Asilulu"),
-#        ("asm", "00138474-001", "Assamese"),
-#        ("asn", "00134778-001", "Xingú Asuriní"),
-#        ("aso", "00134777-001", "Dano"),
-#        ("asp", "00134776-001", "Algerian Sign Language"),
-#        ("asq", "00134767-001", "Austrian Sign Language"),
-#        ("asr", "00134774-001", "Asuri"),
-#        ("ass", "00134782-001", "Ipulo"),
-#        ("ast", "00134772-001", "Asturian; Bable; Leonese; Asturleonese"),
-#        ("asu", "00134771-001", "Tocantins Asurini"),
-#        ("asv", "00134770-001", "Asoa"),
-#        ("asw", "00134769-001", "Australian Aborigines Sign Language"),
-#        ("asx", "00134789-001", "Muratayak"),
-#        ("asy", "00134773-001", "Yaosakor Asmat"),
-#        ("asz", "00134775-001", "As"),
-#        ("ata", "00134797-001", "Pele-Ata"),
-#        ("atb", "00134796-001", "Zaiwa"),
-#        ("atc", "00138282-001", "Atsahuaca"),
-#        ("atd", "00134795-001", "Ata Manobo"),
-#        ("ate", "00134794-001", "Atemble"),
-#        ("atg", "00134793-001", "Ivbie North-Okpela-Arhe"),
-#        ("ati", "00134792-001", "Attié"),
-#        ("atj", "00134783-001", "Atikamekw"),
-#        ("atk", "00134790-001", "Ati"),
-#        ("atl", "00134798-001", "Mt. Iraya Agta"),
-#        ("atm", "00134788-001", "Ata"),
-#        ("atn", "00134787-001", "Ashtiani"),
-#        ("ato", "00134786-001", "Atong"),
-#        ("atp", "00134785-001", "Pudtol Atta"),
-#        ("atq", "00134784-001", "Aralle-Tabulahan"),
-#        ("atr", "00134846-001", "Waimiri-Atroari"),
-#        ("ats", "00134896-001", "Gros Ventre"),
-#        ("att", "00134816-001", "Pamplona Atta"),
-#        ("atu", "00134878-001", "Reel"),
-#        ("atv", "00134877-001", "Northern Altai"),
-#        ("atw", "00134876-001", "Atsugewi"),
-#        ("atx", "00134875-001", "Arutani"),
-#        ("aty", "00134874-001", "Aneityum"),
-#        ("atz", "00134865-001", "Arta"),
-#        ("aua", "00134872-001", "Asumboa"),
-#        ("aub", "00134880-001", "Alugu"),
-#        ("auc", "00134870-001", "Waorani"),
-#        ("aud", "00134869-001", "Anuta"),
-#        ("aue", "00134868-001", "=/Kx'au//'ein"),
-#        ("aug", "00134867-001", "Aguna"),
-#        ("auh", "00134866-001", "Aushi"),
-#        ("aui", "00134888-001", "Anuki"),
-#        ("auj", "00134890-001", "Awjilah"),
-#        ("auk", "00134873-001", "Heyo"),
-#        ("aul", "00134895-001", "Aulua"),
-#        ("aum", "00134894-001", "Asu"),
-#        ("aun", "00134893-001", "Molmo One"),
-#        ("auo", "00138006-001", "Auyokawa"),
-#        ("aup", "00134892-001", "Makayam"),
-#        ("auq", "00134891-001", "Anus"),
-#        ("aur", "00134881-001", "Aruek"),
-#        ("aut", "00134889-001", "Austral"),
-#        ("auu", "00134897-001", "Auye"),
-#        ("auw", "00134887-001", "Awyi"),
-#        ("aux", "00134886-001", "Aurá"),
-#        ("auy", "00134885-001", "Awiyaana"),
-#        ("auz", "00134884-001", "Uzbeki Arabic"),
-#        ("ava", "00138475-001", "Avar; Avarish; Avaric"),
-#        ("avb", "00134883-001", "Avau"),
-#        ("avd", "00134882-001", "Alviri-Vidari"),
-#        ("ave", "00138468-001", "Avestan"),
-#        ("avi", "00134863-001", "Avikam"),
-#        ("avk", "00138358-001", "Kotava"),
-#        ("avl", "00134838-001", "Eastern Egyptian Bedawi Arabic"),
-#        ("avn", "00134871-001", "Avatime"),
-#        ("avo", "00137991-001", "Agavotaguerra"),
-#        ("avs", "00137969-001", "Aushiri"),
-#        ("avt", "00134845-001", "Au"),
-#        ("avu", "00134844-001", "Avokaya"),
-#        ("avv", "00134843-001", "Avá-Canoeiro"),
-#        ("awa", "00134842-001", "Awadhi"),
-#        ("awb", "00134841-001", "Awa"),
-#        ("awc", "00134832-001", "Cicipu"),
-#        ("awe", "00134839-001", "Awetí"),
-#        ("awh", "00134847-001", "Awbono"),
-#        ("awi", "00134837-001", "Aekyom"),
-#        ("awk", "00137953-001", "Awabakal"),
-#        ("awm", "00134836-001", "Arawum"),
-#        ("awn", "00134835-001", "Awngi"),
-#        ("awo", "00134834-001", "Awak"),
-#        ("awr", "00134833-001", "Awera"),
-#        ("aws", "00134855-001", "South Awyu"),
-#        ("awt", "00134857-001", "Araweté"),
-#        ("awu", "00134840-001", "Central Awyu"),
-#        ("awv", "00134862-001", "Jair Awyu"),
-#        ("aww", "00134861-001", "Awun"),
-#        ("awx", "00134860-001", "Awara"),
-#        ("awy", "00134859-001", "Edera Awyu"),
-#        ("axb", "00138024-001", "Abipon"),
-#        ("axg", "00138090-001", "Mato Grosso Arára"),
-#        ("axk", "00134858-001", "Yaka"),
-#        ("axm", "00137871-001", "Middle Armenian"),
-#        ("axx", "00134848-001", "Xaragure"),
-#        ("aya", "00134856-001", "Awar"),
-#        ("ayb", "00134864-001", "Ayizo Gbe"),
-#        ("ayc", "00134854-001", "Southern Aymara"),
-#        ("ayd", "00134853-001", "Ayabadhu"),
-#        ("aye", "00134852-001", "Ayere"),
-#        ("ayg", "00134851-001", "Ginyanga"),
-#        ("ayh", "00134850-001", "Hadrami Arabic"),
-#        ("ayi", "00134751-001", "Leyigha"),
-#        ("ayk", "00134879-001", "Akuku"),
-#        ("ayl", "00134768-001", "Libyan Arabic"),
-#        ("aym", "00138476-001", "Aymara"),
-#        ("ayn", "00134683-001", "Sanaani Arabic"),
-#        ("ayo", "00134682-001", "Ayoreo"),
-#        ("ayp", "00134681-001", "North Mesopotamian Arabic"),
-#        ("ayq", "00134680-001", "Ayi"),
-#        ("ayr", "00134679-001", "Central Aymara"),
-#        ("ays", "00134678-001", "Sorsogon Ayta"),
-#        ("ayt", "00134669-001", "Bataan Ayta"),
-#        ("ayu", "00134676-001", "Ayu"),
-#        ("ayx", "00134684-001", "Ayi"),
-#        ("ayy", "00138037-001", "Tayabas Ayta"),
-#        ("ayz", "00134674-001", "Mai Brat"),
-#        ("aza", "00134673-001", "Azha"),
-#        ("azb", "00134672-001", "South Azerbaijani"),
-#        ("aze", "00138477-001", "Azerbaijani"),
-#        ("azg", "00134671-001", "San Pedro Amuzgos Amuzgo"),
-#        ("azj", "00134670-001", "North Azerbaijani"),
-#        ("azm", "00134692-001", "Ipalapa Amuzgo"),
-#        ("azo", "00134694-001", "Awing"),
-#        ("azt", "00134677-001", "Faire Atta"),
-#        ("azz", "00134699-001", "Highland Puebla Nahuatl"),
-#        ("baa", "00134698-001", "Babatana"),
-#        ("bab", "00134697-001", "Bainouk-Gunyuńo"),
-#        ("bac", "00134696-001", "Badui"),
-#        ("bae", "00138013-001", "Baré"),
-#        ("baf", "00134695-001", "Nubaca"),
-#        ("bag", "00134685-001", "Tuki"),
-#        ("bah", "00134693-001", "Bahamas Creole English"),
-#        ("baj", "00134701-001", "Barakai"),
-#        ("bak", "00138478-001", "Bashkir"),
-#        ("bal", "00131002-001", "Baluchi"),
-#        ("bam", "00138482-001", "Bambara"),
-#        ("ban", "00134691-001", "Balinese"),
-#        ("bao", "00134690-001", "Waimaha"),
-#        ("bap", "00134689-001", "Bantawa"),
-#        ("bar", "00134688-001", "Bavarian"),
-#        ("bas", "00134687-001", "Basa"),
-#        ("bau", "00134661-001", "Bada"),
-#        ("bav", "00134700-001", "Vengo"),
-#        ("baw", "00134675-001", "Bambili-Bambui"),
-#        ("bax", "00134651-001", "Bamun"),
-#        ("bay", "00134650-001", "Batuley"),
-#        ("baz", "00134649-001", "Tunen"),
-#        ("bba", "00134648-001", "Baatonum"),
-#        ("bbb", "00134647-001", "Barai"),
-#        ("bbc", "00134646-001", "Batak Toba"),
-#        ("bbd", "00134637-001", "Bau"),
-#        ("bbe", "00134644-001", "Bangba"),
-#        ("bbf", "00134652-001", "Baibai"),
-#        ("bbg", "00134642-001", "Barama"),
-#        ("bbh", "00134641-001", "Bugan"),
-#        ("bbi", "00134640-001", "Barombi"),
-#        ("bbj", "00134639-001", "Ghomálá'"),
-#        ("bbk", "00134659-001", "Babanki"),
-#        ("bbl", "00134643-001", "Bats"),
-#        ("bbm", "00134645-001", "Babango"),
-#        ("bbn", "00134667-001", "Uneapa"),
-#        ("bbo", "00134666-001", "Northern Bobo Madaré"),
-#        ("bbp", "00134665-001", "West Central Banda"),
-#        ("bbq", "00134664-001", "Bamali"),
-#        ("bbr", "00134663-001", "Girawa"),
-#        ("bbs", "00134662-001", "Bakpinka"),
-#        ("bbt", "00134653-001", "Mburku"),
-#        ("bbu", "00134660-001", "Kulung"),
-#        ("bbv", "00134668-001", "Karnai"),
-#        ("bbw", "00134658-001", "Baba"),
-#        ("bbx", "00134657-001", "Bubia"),
-#        ("bby", "00134656-001", "Befang"),
-#        ("bbz", "00134655-001", "Babalia Creole Arabic"),
-#        ("bca", "00134703-001", "Central Bai"),
-#        ("bcb", "00134638-001", "Bainouk-Samik"),
-#        ("bcc", "00134686-001", "Southern Balochi"),
-#        ("bcd", "00134748-001", "North Babar"),
-#        ("bce", "00134747-001", "Bamenyam"),
-#        ("bcf", "00134746-001", "Bamu"),
-#        ("bcg", "00134745-001", "Baga Binari"),
-#        ("bch", "00134744-001", "Bariai"),
-#        ("bci", "00134743-001", "Baoulé"),
-#        ("bcj", "00134734-001", "Bardi"),
-#        ("bck", "00134741-001", "Bunaba"),
-#        ("bcl", "00134749-001", "Central Bicolano"),
-#        ("bcm", "00134739-001", "Bannoni"),
-#        ("bcn", "00134738-001", "Bali"),
-#        ("bco", "00134737-001", "Kaluli"),
-#        ("bcp", "00134736-001", "Bali"),
-#        ("bcq", "00134735-001", "Bench"),
-#        ("bcr", "00134757-001", "Babine"),
-#        ("bcs", "00134759-001", "Kohumono"),
-#        ("bct", "00134742-001", "Bendi"),
-#        ("bcu", "00134764-001", "Awad Bing"),
-#        ("bcv", "00134763-001", "Shoo-Minda-Nye"),
-#        ("bcw", "00134762-001", "Bana"),
-#        ("bcy", "00134761-001", "Bacama"),
-#        ("bcz", "00134760-001", "Bainouk-Gunyaamolo"),
-#        ("bda", "00134750-001", "Bayot"),
-#        ("bdb", "00134758-001", "Basap"),
-#        ("bdc", "00134766-001", "Emberá-Baudó"),
-#        ("bdd", "00134756-001", "Bunama"),
-#        ("bde", "00134755-001", "Bade"),
-#        ("bdg", "00134754-001", "Bonggi"),
-#        ("bdh", "00134753-001", "Baka"),
-#        ("bdi", "00134752-001", "Burun"),
-#        ("bdj", "00134726-001", "Bai"),
-#        ("bdk", "00134765-001", "Budukh"),
-#        ("bdl", "00134740-001", "Indonesian Bajau"),
-#        ("bdm", "00134716-001", "Buduma"),
-#        ("bdn", "00134715-001", "Baldemu"),
-#        ("bdo", "00134714-001", "Morom"),
-#        ("bdp", "00134713-001", "Bende"),
-#        ("bdq", "00134712-001", "Bahnar"),
-#        ("bdr", "00134711-001", "West Coast Bajau"),
-#        ("bds", "00134702-001", "Burunge"),
-#        ("bdt", "00134709-001", "Bokoto"),
-#        ("bdu", "00134717-001", "Oroko"),
-#        ("bdv", "00134707-001", "Bodo Parja"),
-#        ("bdw", "00134706-001", "Baham"),
-#        ("bdx", "00134705-001", "Budong-Budong"),
-#        ("bdy", "00134704-001", "Bandjalang"),
-#        ("bdz", "00134724-001", "Badeshi"),
-#        ("bea", "00134708-001", "Beaver"),
-#        ("beb", "00134710-001", "Bebele"),
-#        ("bec", "00134732-001", "Iceve-Maci"),
-#        ("bed", "00134731-001", "Bedoanas"),
-#        ("bee", "00134730-001", "Byangsi"),
-#        ("bef", "00134729-001", "Benabena"),
-#        ("beg", "00134728-001", "Belait"),
-#        ("beh", "00134727-001", "Biali"),
-#        ("bei", "00134718-001", "Bekati'"),
-#        ("bej", "00134725-001", "Beja; Bedawiyet"),
-#        ("bek", "00134733-001", "Bebeli"),
-#        ("bel", "00138479-001", "Belarusian"),
-#        ("bem", "00134723-001", "Bemba"),
-#        ("ben", "00138483-001", "Bengali; Bangla"),
-#        ("beo", "00134722-001", "Beami"),
-#        ("bep", "00134721-001", "Besoa"),
-#        ("beq", "00134720-001", "Beembe"),
-#        ("ber", "Collective",   "Berber languages"),
-#        ("bes", "00134915-001", "Besme"),
-#        ("bet", "00133738-001", "Guiberoua Béte"),
-#        ("beu", "00133737-001", "Blagar"),
-#        ("bev", "00133736-001", "Daloa Bété"),
-#        ("bew", "00133735-001", "Betawi"),
-#        ("bex", "00133734-001", "Jur Modo"),
-#        ("bey", "00133733-001", "Beli"),
-#        ("bez", "00133724-001", "Bena"),
-#        ("bfa", "00133731-001", "Bari"),
-#        ("bfb", "00133739-001", "Pauri Bareli"),
-#        ("bfc", "00133729-001", "Northern Bai"),
-#        ("bfd", "00133728-001", "Bafut"),
-#        ("bfe", "00133727-001", "Betaf"),
-#        ("bff", "00133726-001", "Bofi"),
-#        ("bfg", "00133746-001", "Busang Kayan"),
-#        ("bfh", "00133730-001", "Blafe"),
-#        ("bfi", "00133732-001", "British Sign Language"),
-#        ("bfj", "00133754-001", "Bafanji"),
-#        ("bfk", "00133753-001", "Ban Khor Sign Language"),
-#        ("bfl", "00133752-001", "Banda-Ndélé"),
-#        ("bfm", "00133751-001", "Mmen"),
-#        ("bfn", "00133750-001", "Bunak"),
-#        ("bfo", "00133749-001", "Malba Birifor"),
-#        ("bfp", "00133740-001", "Beba"),
-#        ("bfq", "00133747-001", "Badaga"),
-#        ("bfr", "00133755-001", "Bazigar"),
-#        ("bfs", "00133745-001", "Southern Bai"),
-#        ("bft", "00133744-001", "Balti"),
-#        ("bfu", "00133743-001", "Gahri"),
-#        ("bfw", "00133742-001", "Bondo"),
-#        ("bfy", "00133741-001", "Bagheli"),
-#        ("bfz", "00133803-001", "Mahasu Pahari"),
-#        ("bga", "00133853-001", "Gwamhi-Wuri"),
-#        ("bgb", "00133773-001", "Bobongko"),
-#        ("bgc", "00133835-001", "Haryanvi"),
-#        ("bgd", "00133834-001", "Rathwi Bareli"),
-#        ("bge", "00133833-001", "Bauria"),
-#        ("bgf", "00133832-001", "Bangandu"),
-#        ("bgg", "00133831-001", "Bugun"),
-#        ("bgi", "00133822-001", "Giangan"),
-#        ("bgj", "00133829-001", "Bangolan"),
-#        ("bgk", "00133837-001", "Bit"),
-#        ("bgl", "00133827-001", "Bo"),
-#        ("bgm", "00133826-001", "Baga Mboteni"),
-#        ("bgn", "00133825-001", "Western Balochi"),
-#        ("bgo", "00133824-001", "Baga Koga"),
-#        ("bgp", "00133823-001", "Eastern Balochi"),
-#        ("bgq", "00133845-001", "Bagri"),
-#        ("bgr", "00133847-001", "Bawm Chin"),
-#        ("bgs", "00133830-001", "Tagabawa"),
-#        ("bgt", "00133852-001", "Bughotu"),
-#        ("bgu", "00133851-001", "Mbongno"),
-#        ("bgv", "00133850-001", "Warkay-Bipim"),
-#        ("bgw", "00133849-001", "Bhatri"),
-#        ("bgx", "00133848-001", "Balkan Gagauz Turkish"),
-#        ("bgy", "00133838-001", "Benggoi"),
-#        ("bgz", "00133846-001", "Banggai"),
-#        ("bha", "00133854-001", "Bharia"),
-#        ("bhb", "00133844-001", "Bhili"),
-#        ("bhc", "00133843-001", "Biga"),
-#        ("bhd", "00133842-001", "Bhadrawahi"),
-#        ("bhe", "00133841-001", "Bhaya"),
-#        ("bhf", "00133840-001", "Odiai"),
-#        ("bhg", "00133839-001", "Binandere"),
-#        ("bhh", "00133820-001", "Bukharic"),
-#        ("bhi", "00133795-001", "Bhilali"),
-#        ("bhj", "00133828-001", "Bahing"),
-#        ("bhk", "00133802-001", "Albay Bicolano"),
-#        ("bhl", "00133801-001", "Bimin"),
-#        ("bhm", "00133800-001", "Bathari"),
-#        ("bhn", "00133799-001", "Bohtan Neo-Aramaic"),
-#        ("bho", "00133798-001", "Bhojpuri"),
-#        ("bhp", "00133789-001", "Bima"),
-#        ("bhq", "00133796-001", "Tukang Besi South"),
-#        ("bhr", "00133804-001", "Bara Malagasy"),
-#        ("bhs", "00133794-001", "Buwal"),
-#        ("bht", "00133793-001", "Bhattiyali"),
-#        ("bhu", "00133792-001", "Bhunjia"),
-#        ("bhv", "00133791-001", "Bahau"),
-#        ("bhw", "00133790-001", "Biak"),
-#        ("bhx", "00133812-001", "Bhalay"),
-#        ("bhy", "00133814-001", "Bhele"),
-#        ("bhz", "00133797-001", "Bada"),
-#        ("bia", "00133819-001", "Badimaya"),
-#        ("bib", "00133818-001", "Bissa"),
-#        ("bic", "00133817-001", "Bikaru"),
-#        ("bid", "00133816-001", "Bidiyo"),
-#        ("bie", "00133815-001", "Bepour"),
-#        ("bif", "00133805-001", "Biafada"),
-#        ("big", "00133813-001", "Biangai"),
-#        ("bij", "00133821-001", "Vaghat-Ya-Bijim-Legeri"),
-#        ("bik", "00130981-001", "Bikol"),
-#        ("bil", "00133811-001", "Bile"),
-#        ("bim", "00133810-001", "Bimoba"),
-#        ("bin", "00133809-001", "Bini; Edo"),
-#        ("bio", "00133808-001", "Nai"),
-#        ("bip", "00133807-001", "Bila"),
-#        ("biq", "00133708-001", "Bipi"),
-#        ("bir", "00133836-001", "Bisorio"),
-#        ("bis", "00138481-001", "Bislama"),
-#        ("bit", "00133725-001", "Berinomo"),
-#        ("biu", "00133640-001", "Biete"),
-#        ("biv", "00133639-001", "Southern Birifor"),
-#        ("biw", "00133638-001", "Kol"),
-#        ("bix", "00133637-001", "Bijori"),
-#        ("biy", "00133636-001", "Birhor"),
-#        ("biz", "00133635-001", "Baloi"),
-#        ("bja", "00133626-001", "Budza"),
-#        ("bjb", "00137987-001", "Banggarla"),
-#        ("bjc", "00133633-001", "Bariji"),
-#        ("bjd", "00133641-001", "Bandjigali"),
-#        ("bje", "00133631-001", "Biao-Jiao Mien"),
-#        ("bjf", "00133630-001", "Barzani Jewish Neo-Aramaic"),
-#        ("bjg", "00133629-001", "Bidyogo"),
-#        ("bjh", "00133628-001", "Bahinemo"),
-#        ("bji", "00133627-001", "Burji"),
-#        ("bjj", "00133649-001", "Kanauji"),
-#        ("bjk", "00133651-001", "Barok"),
-#        ("bjl", "00133634-001", "Bulu"),
-#        ("bjm", "00133656-001", "Bajelani"),
-#        ("bjn", "00133655-001", "Banjar"),
-#        ("bjo", "00133654-001", "Mid-Southern Banda"),
-#        ("bjq", "00133653-001", "Southern Betsimisaraka Malagasy"),
-#        ("bjr", "00133652-001", "Binumarien"),
-#        ("bjs", "00133642-001", "Bajan"),
-#        ("bjt", "00133650-001", "Balanta-Ganja"),
-#        ("bju", "00133658-001", "Busuu"),
-#        ("bjv", "00133648-001", "Bedjond"),
-#        ("bjw", "00133647-001", "Bakwé"),
-#        ("bjx", "00133646-001", "Banao Itneg"),
-#        ("bjy", "00138103-001", "Bayali"),
-#        ("bjz", "00133645-001", "Baruga"),
-#        ("bka", "00133644-001", "Kyak"),
-#        ("bkb", "00133618-001", "Finallig"),
-#        ("bkc", "00133657-001", "Baka"),
-#        ("bkd", "00133632-001", "Binukid"),
-#        ("bkf", "00133608-001", "Beeke"),
-#        ("bkg", "00133607-001", "Buraka"),
-#        ("bkh", "00133606-001", "Bakoko"),
-#        ("bki", "00133605-001", "Baki"),
-#        ("bkj", "00133604-001", "Pande"),
-#        ("bkk", "00133603-001", "Brokskat"),
-#        ("bkl", "00133594-001", "Berik"),
-#        ("bkm", "00133601-001", "Kom"),
-#        ("bkn", "00133609-001", "Bukitan"),
-#        ("bko", "00133599-001", "Kwa'"),
-#        ("bkp", "00133598-001", "Boko"),
-#        ("bkq", "00133597-001", "Bakairí"),
-#        ("bkr", "00133596-001", "Bakumpai"),
-#        ("bks", "00133616-001", "Masbate Sorsogon"),
-#        ("bkt", "00133600-001", "Boloki"),
-#        ("bku", "00133602-001", "Buhid"),
-#        ("bkv", "00133624-001", "Bekwarra"),
-#        ("bkw", "00133623-001", "Bekwil"),
-#        ("bkx", "00133622-001", "Baikeno"),
-#        ("bky", "00133621-001", "Bokyi"),
-#        ("bkz", "00133620-001", "Bungku"),
-#        ("bla", "00133619-001", "Siksika"),
-#        ("blb", "00133610-001", "Bilua"),
-#        ("blc", "00133617-001", "Bella Coola"),
-#        ("bld", "00133625-001", "Bolango"),
-#        ("ble", "00133615-001", "Balanta-Kentohe"),
-#        ("blf", "00133614-001", "Buol"),
-#        ("blg", "00133613-001", "Balau"),
-#        ("blh", "00133612-001", "Kuwaa"),
-#        ("bli", "00133660-001", "Bolia"),
-#        ("blj", "00133595-001", "Bolongan"),
-#        ("blk", "00133643-001", "Pa'o Karen"),
-#        ("bll", "00138312-001", "Biloxi"),
-#        ("blm", "00133705-001", "Beli"),
-#        ("bln", "00133704-001", "Southern Catanduanes Bicolano"),
-#        ("blo", "00133703-001", "Anii"),
-#        ("blp", "00133702-001", "Blablanga"),
-#        ("blq", "00133701-001", "Baluan-Pam"),
-#        ("blr", "00133700-001", "Blang"),
-#        ("bls", "00133691-001", "Balaesang"),
-#        ("blt", "00133698-001", "Tai Dam"),
-#        ("blv", "00133706-001", "Bolo"),
-#        ("blw", "00133696-001", "Balangao"),
-#        ("blx", "00133695-001", "Mag-Indi Ayta"),
-#        ("bly", "00133694-001", "Notre"),
-#        ("blz", "00133693-001", "Balantak"),
-#        ("bma", "00133692-001", "Lame"),
-#        ("bmb", "00133714-001", "Bembe"),
-#        ("bmc", "00133716-001", "Biem"),
-#        ("bmd", "00133699-001", "Baga Manduri"),
-#        ("bme", "00133721-001", "Limassa"),
-#        ("bmf", "00133720-001", "Bom"),
-#        ("bmg", "00133719-001", "Bamwe"),
-#        ("bmh", "00133718-001", "Kein"),
-#        ("bmi", "00133717-001", "Bagirmi"),
-#        ("bmj", "00133707-001", "Bote-Majhi"),
-#        ("bmk", "00133715-001", "Ghayavi"),
-#        ("bml", "00133723-001", "Bomboli"),
-#        ("bmm", "00133713-001", "Northern Betsimisaraka Malagasy"),
-#        ("bmn", "00138171-001", "Bina"),
-#        ("bmo", "00133712-001", "Bambalang"),
-#        ("bmp", "00133711-001", "Bulgebi"),
-#        ("bmq", "00133710-001", "Bomu"),
-#        ("bmr", "00133709-001", "Muinane"),
-#        ("bms", "00133683-001", "Bilma Kanuri"),
-#        ("bmt", "00133722-001", "Biao Mon"),
-#        ("bmu", "00133697-001", "Burum-Mindik"),
-#        ("bmv", "00133673-001", "Bum"),
-#        ("bmw", "00133672-001", "Bomwali"),
-#        ("bmx", "00133671-001", "Baimak"),
-#        ("bmy", "00133670-001", "Bemba"),
-#        ("bmz", "00133669-001", "Baramu"),
-#        ("bna", "00133668-001", "Bonerate"),
-#        ("bnb", "00133659-001", "Bookan"),
-#        ("bnc", "00133666-001", "Central Bontoc"),
-#        ("bnd", "00133674-001", "Banda"),
-#        ("bne", "00133664-001", "Bintauna"),
-#        ("bnf", "00133663-001", "Masiwang"),
-#        ("bng", "00133662-001", "Benga"),
-#        ("bni", "00133661-001", "Bangi"),
-#        ("bnj", "00133681-001", "Eastern Tawbuid"),
-#        ("bnk", "00133665-001", "Bierebo"),
-#        ("bnl", "00133667-001", "Boon"),
-#        ("bnm", "00133689-001", "Batanga"),
-#        ("bnn", "00133688-001", "Bunun"),
-#        ("bno", "00133687-001", "Bantoanon"),
-#        ("bnp", "00133686-001", "Bola"),
-#        ("bnq", "00133685-001", "Bantik"),
-#        ("bnr", "00133684-001", "Butmas-Tur"),
-#        ("bns", "00133675-001", "Bundeli"),
-#        ("bnu", "00133682-001", "Bentong"),
-#        ("bnv", "00133690-001", "Bonerif"),
-#        ("bnw", "00133680-001", "Bisis"),
-#        ("bnx", "00133679-001", "Bangubangu"),
-#        ("bny", "00133678-001", "Bintulu"),
-#        ("bnz", "00133677-001", "Beezen"),
-#        ("boa", "00133872-001", "Bora"),
-#        ("bob", "00133611-001", "Aweer"),
-#        ("bod", "00138484-001", "Tibetan"),
-#        ("boe", "00133806-001", "Mundabli"),
-#        ("bof", "00134031-001", "Bolon"),
-#        ("bog", "00134030-001", "Bamako Sign Language"),
-#        ("boh", "00134029-001", "Boma"),
-#        ("boi", "00138223-001", "Barbareńo"),
-#        ("boj", "00134028-001", "Anjam"),
-#        ("bok", "00134027-001", "Bonjo"),
-#        ("bol", "00134026-001", "Bole"),
-#        ("bom", "00134017-001", "Berom"),
-#        ("bon", "00134024-001", "Bine"),
-#        ("boo", "00134032-001", "Tiemacèwè Bozo"),
-#        ("bop", "00134022-001", "Bonkiman"),
-#        ("boq", "00134021-001", "Bogaya"),
-#        ("bor", "00134020-001", "Borôro"),
-#        ("bos", "00138486-001", "Bosnian"),
-#        ("bot", "00134019-001", "Bongo"),
-#        ("bou", "00134018-001", "Bondei"),
-#        ("bov", "00134040-001", "Tuwuli"),
-#        ("bow", "00138190-001", "Rema"),
-#        ("box", "00134042-001", "Buamu"),
-#        ("boy", "00134025-001", "Bodo"),
-#        ("boz", "00134047-001", "Tiéyaxo Bozo"),
-#        ("bpa", "00134046-001", "Dakaka"),
-#        ("bpb", "00138203-001", "Barbacoas"),
-#        ("bpd", "00134045-001", "Banda-Banda"),
-#        ("bpg", "00134044-001", "Bonggo"),
-#        ("bph", "00134043-001", "Botlikh"),
-#        ("bpi", "00134033-001", "Bagupi"),
-#        ("bpj", "00134041-001", "Binji"),
-#        ("bpk", "00134049-001", "Orowe"),
-#        ("bpl", "00134039-001", "Broome Pearling Lugger Pidgin"),
-#        ("bpm", "00134038-001", "Biyom"),
-#        ("bpn", "00134037-001", "Dzao Min"),
-#        ("bpo", "00134036-001", "Anasi"),
-#        ("bpp", "00134035-001", "Kaure"),
-#        ("bpq", "00134009-001", "Banda Malay"),
-#        ("bpr", "00134048-001", "Koronadal Blaan"),
-#        ("bps", "00134023-001", "Sarangani Blaan"),
-#        ("bpt", "00133999-001", "Barrow Point"),
-#        ("bpu", "00133998-001", "Bongu"),
-#        ("bpv", "00133997-001", "Bian Marind"),
-#        ("bpw", "00133996-001", "Bo"),
-#        ("bpx", "00133995-001", "Palya Bareli"),
-#        ("bpy", "00133994-001", "Bishnupriya"),
-#        ("bpz", "00133985-001", "Bilba"),
-#        ("bqa", "00133992-001", "Tchumbuli"),
-#        ("bqb", "00134000-001", "Bagusa"),
-#        ("bqc", "00133990-001", "Boko"),
-#        ("bqd", "00133989-001", "Bung"),
-#        ("bqf", "00138235-001", "Baga Kaloum"),
-#        ("bqg", "00133988-001", "Bago-Kusuntu"),
-#        ("bqh", "00133987-001", "Baima"),
-#        ("bqi", "00134007-001", "Bakhtiari"),
-#        ("bqj", "00133991-001", "Bandial"),
-#        ("bqk", "00133993-001", "Banda-Mbrès"),
-#        ("bql", "00134015-001", "Bilakura"),
-#        ("bqm", "00134014-001", "Wumboko"),
-#        ("bqn", "00134013-001", "Bulgarian Sign Language"),
-#        ("bqo", "00134012-001", "Balo"),
-#        ("bqp", "00134011-001", "Busa"),
-#        ("bqq", "00134010-001", "Biritai"),
-#        ("bqr", "00134001-001", "Burusu"),
-#        ("bqs", "00134008-001", "Bosngun"),
-#        ("bqt", "00134016-001", "Bamukumbit"),
-#        ("bqu", "00134006-001", "Boguru"),
-#        ("bqv", "00134005-001", "Begbere-Ejar"),
-#        ("bqw", "00134004-001", "Buru"),
-#        ("bqx", "00134003-001", "Baangi"),
-#        ("bqy", "00134002-001", "Bengkala Sign Language"),
-#        ("bqz", "00134064-001", "Bakaka"),
-#        ("bra", "00134114-001", "Braj"),
-#        ("brb", "00134034-001", "Lave"),
-#        ("brc", "00134096-001", "Berbice Creole Dutch"),
-#        ("brd", "00134095-001", "Baraamu"),
-#        ("bre", "00138485-001", "Breton"),
-#        ("brf", "00134094-001", "Bera"),
-#        ("brg", "00134093-001", "Baure"),
-#        ("brh", "00134092-001", "Brahui"),
-#        ("bri", "00134083-001", "Mokpwe"),
-#        ("brj", "00134090-001", "Bieria"),
-#        ("brk", "00138134-001", "Birked"),
-#        ("brl", "00134098-001", "Birwa"),
-#        ("brm", "00134088-001", "Barambu"),
-#        ("brn", "00134087-001", "Boruca"),
-#        ("bro", "00134086-001", "Brokkat"),
-#        ("brp", "00134085-001", "Barapasi"),
-#        ("brq", "00134084-001", "Breri"),
-#        ("brr", "00134106-001", "Birao"),
-#        ("brs", "00134108-001", "Baras"),
-#        ("brt", "00134091-001", "Bitare"),
-#        ("bru", "00134113-001", "Eastern Bru"),
-#        ("brv", "00134112-001", "Western Bru"),
-#        ("brw", "00134111-001", "Bellari"),
-#        ("brx", "00134110-001", "Bodo"),
-#        ("bry", "00134109-001", "Burui"),
-#        ("brz", "00134099-001", "Bilbil"),
-#        ("bsa", "00134107-001", "Abinomn"),
-#        ("bsb", "00134115-001", "Brunei Bisaya"),
-#        ("bsc", "00134105-001", "Bassari"),
-#        ("bse", "00134104-001", "Wushi"),
-#        ("bsf", "00134103-001", "Bauchi"),
-#        ("bsg", "00134102-001", "Bashkardi"),
-#        ("bsh", "00134101-001", "Kati"),
-#        ("bsi", "00134100-001", "Bassossi"),
-#        ("bsj", "00134081-001", "Bangwinji"),
-#        ("bsk", "00134056-001", "Burushaski"),
-#        ("bsl", "00138165-001", "Basa-Gumna"),
-#        ("bsm", "00134089-001", "Busami"),
-#        ("bsn", "00134063-001", "Barasana-Eduria"),
-#        ("bso", "00134062-001", "Buso"),
-#        ("bsp", "00134061-001", "Baga Sitemu"),
-#        ("bsq", "00134060-001", "Bassa"),
-#        ("bsr", "00134059-001", "Bassa-Kontagora"),
-#        ("bss", "00134050-001", "Akoose"),
-#        ("bst", "00134057-001", "Basketo"),
-#        ("bsu", "00134065-001", "Bahonsuai"),
-#        ("bsv", "00138325-001", "Baga Sobané"),
-#        ("bsw", "00134055-001", "Baiso"),
-#        ("bsx", "00134054-001", "Yangkam"),
-#        ("bsy", "00134053-001", "Sabah Bisaya"),
-#        ("bta", "00134052-001", "Bata"),
-#        ("btb", "00134051-001", "Beti"),
-#        ("btc", "00134073-001", "Bati"),
-#        ("btd", "00134075-001", "Batak Dairi"),
-#        ("bte", "00138343-001", "Gamo-Ningi"),
-#        ("btf", "00134058-001", "Birgit"),
-#        ("btg", "00134080-001", "Gagnoa Bété"),
-#        ("bth", "00134079-001", "Biatah Bidayuh"),
-#        ("bti", "00134078-001", "Burate"),
-#        ("btj", "00134077-001", "Bacanese Malay"),
-#        ("btl", "00134076-001", "Bhatola"),
-#        ("btm", "00134066-001", "Batak Mandailing"),
-#        ("btn", "00134074-001", "Ratagnon"),
-#        ("bto", "00134082-001", "Iriga Bicolano"),
-#        ("btp", "00134072-001", "Budibud"),
-#        ("btq", "00134071-001", "Batek"),
-#        ("btr", "00134070-001", "Baetora"),
-#        ("bts", "00134069-001", "Batak Simalungun"),
-#        ("btt", "00134068-001", "Bete-Bendi"),
-#        ("btu", "00133969-001", "Batu"),
-#        ("btv", "00134097-001", "Bateri"),
-#        ("btw", "00133986-001", "Butuanon"),
-#        ("btx", "00133901-001", "Batak Karo"),
-#        ("bty", "00133900-001", "Bobot"),
-#        ("btz", "00133899-001", "Batak Alas-Kluet"),
-#        ("bua", "00130997-001", "Buriat"),
-#        ("bub", "00133898-001", "Bua"),
-#        ("buc", "00133897-001", "Bushi"),
-#        ("bud", "00133896-001", "Ntcham"),
-#        ("bue", "00138047-001", "Beothuk"),
-#        ("buf", "00133887-001", "Bushoong"),
-#        ("bug", "00133894-001", "Buginese"),
-#        ("buh", "00133902-001", "Younuo Bunu"),
-#        ("bui", "00133892-001", "Bongili"),
-#        ("buj", "00133891-001", "Basa-Gurmana"),
-#        ("buk", "00133890-001", "Bugawac"),
-#        ("bul", "00138480-001", "Bulgarian"),
-#        ("bum", "00134654-001", "Bulu"),
-#        ("bun", "00134849-001", "Sherbro"),
-#        ("buo", "00135074-001", "Terei"),
-#        ("bup", "00135073-001", "Busoa"),
-#        ("buq", "00135072-001", "Brem"),
-#        ("bus", "00135071-001", "Bokobaru"),
-#        ("but", "00135070-001", "Bungain"),
-#        ("buu", "00135069-001", "Budu"),
-#        ("buv", "00135060-001", "Bun"),
-#        ("buw", "00135067-001", "Bubi"),
-#        ("bux", "00135075-001", "Boghom"),
-#        ("buy", "00135065-001", "Bullom So"),
-#        ("buz", "00135064-001", "Bukwen"),
-#        ("bva", "00135063-001", "Barein"),
-#        ("bvb", "00135062-001", "Bube"),
-#        ("bvc", "00135061-001", "Baelelea"),
-#        ("bvd", "00135083-001", "Baeggu"),
-#        ("bve", "00135085-001", "Berau Malay"),
-#        ("bvf", "00135068-001", "Boor"),
-#        ("bvg", "00135090-001", "Bonkeng"),
-#        ("bvh", "00135089-001", "Bure"),
-#        ("bvi", "00135088-001", "Belanda Viri"),
-#        ("bvj", "00135087-001", "Baan"),
-#        ("bvk", "00135086-001", "Bukat"),
-#        ("bvl", "00135076-001", "Bolivian Sign Language"),
-#        ("bvm", "00135084-001", "Bamunka"),
-#        ("bvn", "00135092-001", "Buna"),
-#        ("bvo", "00135082-001", "Bolgo"),
-#        ("bvq", "00135081-001", "Birri"),
-#        ("bvr", "00135080-001", "Burarra"),
-#        ("bvt", "00135079-001", "Bati"),
-#        ("bvu", "00135078-001", "Bukit Malay"),
-#        ("bvv", "00138093-001", "Baniva"),
-#        ("bvw", "00135052-001", "Boga"),
-#        ("bvx", "00135091-001", "Dibole"),
-#        ("bvz", "00135066-001", "Bauzi"),
-#        ("bwa", "00135042-001", "Bwatoo"),
-#        ("bwb", "00135041-001", "Namosi-Naitasiri-Serua"),
-#        ("bwc", "00135040-001", "Bwile"),
-#        ("bwd", "00135039-001", "Bwaidoka"),
-#        ("bwe", "00134998-001", "Bwe Karen"),
-#        ("bwf", "00134997-001", "Boselewa"),
-#        ("bwg", "00134996-001", "Barwe"),
-#        ("bwh", "00135018-001", "Bishuo"),
-#        ("bwi", "00135020-001", "Baniwa"),
-#        ("bwj", "00135003-001", "Láá Láá Bwamu"),
-#        ("bwk", "00135025-001", "Bauwaki"),
-#        ("bwl", "00135024-001", "Bwela"),
-#        ("bwm", "00135023-001", "Biwat"),
-#        ("bwn", "00135022-001", "Wunai Bunu"),
-#        ("bwo", "00135021-001", "Boro"),
-#        ("bwp", "00135011-001", "Mandobo Bawah"),
-#        ("bwq", "00135019-001", "Southern Bobo Madaré"),
-#        ("bwr", "00135027-001", "Bura-Pabir"),
-#        ("bws", "00135017-001", "Bomboma"),
-#        ("bwt", "00135016-001", "Bafaw-Balong"),
-#        ("bwu", "00135015-001", "Buli"),
-#        ("bww", "00135014-001", "Bwa"),
-#        ("bwx", "00135013-001", "Bu-Nao Bunu"),
-#        ("bwy", "00134987-001", "Cwi Bwamu"),
-#        ("bwz", "00135026-001", "Bwisi"),
-#        ("bxa", "00135001-001", "Bauro"),
-#        ("bxb", "00134977-001", "Belanda Bor"),
-#        ("bxc", "00134976-001", "Molengue"),
-#        ("bxd", "00134975-001", "Pela"),
-#        ("bxe", "00134974-001", "Birale"),
-#        ("bxf", "00134973-001", "Bilur"),
-#        ("bxg", "00134972-001", "Bangala"),
-#        ("bxh", "00134963-001", "Buhutu"),
-#        ("bxi", "00138320-001", "Pirlatapa"),
-#        ("bxj", "00134970-001", "Bayungu"),
-#        ("bxk", "00134978-001", "Bukusu"),
-#        ("bxl", "00134968-001", "Jalkunan"),
-#        ("bxm", "00134967-001", "Mongolia Buriat"),
-#        ("bxn", "00134966-001", "Burduna"),
-#        ("bxo", "00134965-001", "Barikanchi"),
-#        ("bxp", "00134985-001", "Bebil"),
-#        ("bxq", "00134969-001", "Beele"),
-#        ("bxr", "00134971-001", "Russia Buriat"),
-#        ("bxs", "00134993-001", "Busam"),
-#        ("bxu", "00134992-001", "China Buriat"),
-#        ("bxv", "00134991-001", "Berakou"),
-#        ("bxw", "00134990-001", "Bankagooma"),
-#        ("bxx", "00134989-001", "Borna"),
-#        ("bxz", "00134988-001", "Binahari"),
-#        ("bya", "00134979-001", "Batak"),
-#        ("byb", "00134986-001", "Bikya"),
-#        ("byc", "00134994-001", "Ubaghara"),
-#        ("byd", "00134984-001", "Benyadu'"),
-#        ("bye", "00134983-001", "Pouye"),
-#        ("byf", "00134982-001", "Bete"),
-#        ("byg", "00138164-001", "Baygo"),
-#        ("byh", "00134981-001", "Bujhyal"),
-#        ("byi", "00134552-001", "Buyu"),
-#        ("byj", "00135110-001", "Bina"),
-#        ("byk", "00134719-001", "Biao"),
-#        ("byl", "00134292-001", "Bayono"),
-#        ("bym", "00134291-001", "Bidyara"),
-#        ("byn", "00134290-001", "Blin; Bilin"),
-#        ("byo", "00134289-001", "Biyo"),
-#        ("byp", "00134288-001", "Bumaji"),
-#        ("byq", "00138172-001", "Basay"),
-#        ("byr", "00134287-001", "Baruya"),
-#        ("bys", "00134278-001", "Burak"),
-#        ("byt", "00138174-001", "Berti"),
-#        ("byv", "00134285-001", "Medumba"),
-#        ("byw", "00134293-001", "Belhariya"),
-#        ("byx", "00134283-001", "Qaqet"),
-#        ("byy", "00134282-001", "Buya"),
-#        ("byz", "00134281-001", "Banaro"),
-#        ("bza", "00134280-001", "Bandi"),
-#        ("bzb", "00134279-001", "Andio"),
-#        ("bzd", "00134301-001", "Bribri"),
-#        ("bze", "00134303-001", "Jenaama Bozo"),
-#        ("bzf", "00134286-001", "Boikin"),
-#        ("bzg", "00134308-001", "Babuza"),
-#        ("bzh", "00134307-001", "Mapos Buang"),
-#        ("bzi", "00134306-001", "Bisu"),
-#        ("bzj", "00134305-001", "Belize Kriol English"),
-#        ("bzk", "00134304-001", "Nicaragua Creole English"),
-#        ("bzl", "00134294-001", "Boano"),
-#        ("bzm", "00134302-001", "Bolondo"),
-#        ("bzn", "00134310-001", "Boano"),
-#        ("bzo", "00134300-001", "Bozaba"),
-#        ("bzp", "00134299-001", "Kemberano"),
-#        ("bzq", "00134298-001", "Buli"),
-#        ("bzr", "00138136-001", "Biri"),
-#        ("bzs", "00134297-001", "Brazilian Sign Language"),
-#        ("bzt", "00138354-001", "Brithenig"),
-#        ("bzu", "00134296-001", "Burmeso"),
-#        ("bzv", "00134270-001", "Bebe"),
-#        ("bzw", "00134309-001", "Basa"),
-#        ("bzx", "00134284-001", "Hainyaxo Bozo"),
-#        ("bzy", "00134260-001", "Obanliku"),
-#        ("bzz", "00134259-001", "Evant"),
-#        ("caa", "00134258-001", "Chortí"),
-#        ("cab", "00134257-001", "Garifuna"),
-#        ("cac", "00134256-001", "Chuj"),
-#        ("cad", "00134255-001", "Caddo"),
-#        ("cae", "00134246-001", "Lehar"),
-#        ("caf", "00134253-001", "Southern Carrier"),
-#        ("cag", "00134261-001", "Nivaclé"),
-#        ("cah", "00134251-001", "Cahuarano"),
-#        ("caj", "00138151-001", "Chané"),
-#        ("cak", "00134250-001", "Kaqchikel"),
-#        ("cal", "00134249-001", "Carolinian"),
-#        ("cam", "00134248-001", "Cemuhî"),
-#        ("can", "00134268-001", "Chambri"),
-#        ("cao", "00134252-001", "Chácobo"),
-#        ("cap", "00134254-001", "Chipaya"),
-#        ("caq", "00134276-001", "Car Nicobarese"),
-#        ("car", "00134275-001", "Galibi Carib"),
-#        ("cas", "00134274-001", "Tsimané"),
-#        ("cat", "00138487-001", "Catalan; Valencian"),
-#        ("cav", "00134273-001", "Cavineńa"),
-#        ("caw", "00134272-001", "Callawalla"),
-#        ("cax", "00134271-001", "Chiquitano"),
-#        ("cay", "00134262-001", "Cayuga"),
-#        ("caz", "00138224-001", "Canichana"),
-#        ("cbb", "00134269-001", "Cabiyarí"),
-#        ("cbc", "00134277-001", "Carapana"),
-#        ("cbd", "00134267-001", "Carijona"),
-#        ("cbe", "00138228-001", "Chipiajes"),
-#        ("cbg", "00134266-001", "Chimila"),
-#        ("cbh", "00138230-001", "Cagua"),
-#        ("cbi", "00134265-001", "Chachi"),
-#        ("cbj", "00134264-001", "Ede Cabe"),
-#        ("cbk", "00134312-001", "Chavacano"),
-#        ("cbl", "00134247-001", "Bualkhaw Chin"),
-#        ("cbn", "00134295-001", "Nyahkur"),
-#        ("cbo", "00134357-001", "Izora"),
-#        ("cbr", "00134356-001", "Cashibo-Cacataibo"),
-#        ("cbs", "00134355-001", "Cashinahua"),
-#        ("cbt", "00134354-001", "Chayahuita"),
-#        ("cbu", "00134353-001", "Candoshi-Shapra"),
-#        ("cbv", "00134352-001", "Cacua"),
-#        ("cby", "00134343-001", "Carabayo"),
-#        ("cca", "00138243-001", "Cauca"),
-#        ("ccc", "00134350-001", "Chamicuro"),
-#        ("ccd", "00134358-001", "Cafundo Creole"),
-#        ("cce", "00134348-001", "Chopi"),
-#        ("ccg", "00134347-001", "Samba Daka"),
-#        ("cch", "00134346-001", "Atsam"),
-#        ("ccj", "00134345-001", "Kasanga"),
-#        ("ccl", "00134344-001", "Cutchi-Swahili"),
-#        ("ccm", "00134366-001", "Malaccan Creole Malay"),
-#        ("cco", "00134368-001", "Comaltepec Chinantec"),
-#        ("ccp", "00134351-001", "Chakma"),
-#        ("ccq", "00134373-001", "Chaungtha"),
-#        ("ccr", "00138194-001", "Cacaopera"),
-#        ("cda", "00134372-001", "Choni"),
-#        ("cde", "00134371-001", "Chenchu"),
-#        ("cdf", "00134370-001", "Chiru"),
-#        ("cdg", "00134369-001", "Chamari"),
-#        ("cdh", "00134359-001", "Chambeali"),
-#        ("cdi", "00134367-001", "Chodri"),
-#        ("cdj", "00134375-001", "Churahi"),
-#        ("cdm", "00133084-001", "Chepang"),
-#        ("cdn", "00133083-001", "Chaudangsi"),
-#        ("cdo", "00133082-001", "Min Dong Chinese"),
-#        ("cdr", "00133073-001", "Cinda-Regi-Tiyal"),
-#        ("cds", "00133080-001", "Chadian Sign Language"),
-#        ("cdy", "00133088-001", "Chadong"),
-#        ("cdz", "00133078-001", "Koda"),
-#        ("cea", "00138155-001", "Lower Chehalis"),
-#        ("ceb", "00133077-001", "Cebuano"),
-#        ("ceg", "00133076-001", "Chamacoco"),
-#        ("cen", "00133075-001", "Cen"),
-#        ("ces", "00138492-001", "Czech"),
-#        ("cet", "00133095-001", "Centúúm"),
-#        ("cfa", "00133079-001", "Dijim-Bwilim"),
-#        ("cfd", "00133081-001", "Cara"),
-#        ("cfg", "00133103-001", "Como Karim"),
-#        ("cfm", "00133102-001", "Falam Chin"),
-#        ("cga", "00133101-001", "Changriwa"),
-#        ("cgc", "00133100-001", "Kagayanen"),
-#        ("cgg", "00133099-001", "Chiga"),
-#        ("cgk", "00133098-001", "Chocangacakha"),
-#        ("cha", "00138489-001", "Chamorro"),
-#        ("chb", "00138143-001", "Chibcha"),
-#        ("chc", "00138144-001", "Catawba"),
-#        ("chd", "00133089-001", "Highland Oaxaca Chontal"),
-#        ("che", "00138488-001", "Chechen"),
-#        ("chf", "00133096-001", "Tabasco Chontal"),
-#        ("chg", "00138146-001", "Chagatai"),
-#        ("chh", "00133104-001", "Chinook"),
-#        ("chj", "00133094-001", "Ojitlán Chinantec"),
-#        ("chk", "00133093-001", "Chuukese"),
-#        ("chl", "00133092-001", "Cahuilla"),
-#        ("chm", "00130994-001", "Mari"),
-#        ("chn", "00133091-001", "Chinook jargon"),
-#        ("cho", "00133139-001", "Choctaw"),
-#        ("chp", "00133074-001", "Chipewyan; Dene Suline"),
-#        ("chq", "00133122-001", "Quiotepec Chinantec"),
-#        ("chr", "00133184-001", "Cherokee"),
-#        ("cht", "00138154-001", "Cholón"),
-#        ("chu", "00138493-001", "Church Slavic; Old Slavonic; Old Church Slavonic; Church Slavonic; Old Bulgarian"),
-#        ("chv", "00138494-001", "Chuvash"),
-#        ("chw", "00133183-001", "Chuwabu"),
-#        ("chx", "00133182-001", "Chantyal"),
-#        ("chy", "00133181-001", "Cheyenne"),
-#        ("chz", "00133180-001", "Ozumacín Chinantec"),
-#        ("cia", "00133179-001", "Cia-Cia"),
-#        ("cib", "00133170-001", "Ci Gbe"),
-#        ("cic", "00133177-001", "Chickasaw"),
-#        ("cid", "00138219-001", "Chimariko"),
-#        ("cie", "00133185-001", "Cineni"),
-#        ("cih", "00133175-001", "Chinali"),
-#        ("cik", "00133174-001", "Chitkuli Kinnauri"),
-#        ("cim", "00133173-001", "Cimbrian"),
-#        ("cin", "00133172-001", "Cinta Larga"),
-#        ("cip", "00133171-001", "Chiapanec"),
-#        ("cir", "00133193-001", "Tiri"),
-#        ("ciw", "00133195-001", "Chippewa"),
-#        ("ciy", "00133178-001", "Chaima"),
-#        ("cja", "00133200-001", "Western Cham"),
-#        ("cje", "00133199-001", "Chru"),
-#        ("cjh", "00138226-001", "Upper Chehalis"),
-#        ("cji", "00133198-001", "Chamalal"),
-#        ("cjk", "00133197-001", "Chokwe"),
-#        ("cjm", "00133196-001", "Eastern Cham"),
-#        ("cjn", "00133186-001", "Chenapian"),
-#        ("cjo", "00133194-001", "Ashéninka Pajonal"),
-#        ("cjp", "00133202-001", "Cabécar"),
-#        ("cjr", "00138234-001", "Chorotega"),
-#        ("cjs", "00133192-001", "Shor"),
-#        ("cjv", "00133191-001", "Chuave"),
-#        ("cjy", "00133190-001", "Jinyu Chinese"),
-#        ("cka", "00133189-001", "Khumi Awa Chin"),
-#        ("ckb", "00133188-001", "Central Kurdish"),
-#        ("ckh", "00133162-001", "Chak"),
-#        ("ckl", "00133201-001", "Cibak"),
-#        ("cko", "00133176-001", "Anufo"),
-#        ("ckq", "00133152-001", "Kajakse"),
-#        ("ckr", "00133151-001", "Kairak"),
-#        ("cks", "00133150-001", "Tayo"),
-#        ("ckt", "00133149-001", "Chukot"),
-#        ("cku", "00133148-001", "Koasati"),
-#        ("ckv", "00133147-001", "Kavalan"),
-#        ("ckx", "00133138-001", "Caka"),
-#        ("cky", "00133145-001", "Cakfem-Mushere"),
-#        ("ckz", "00133153-001", "Cakchiquel-Quiché Mixed Language"),
-#        ("cla", "00133143-001", "Ron"),
-#        ("clc", "00133142-001", "Chilcotin"),
-#        ("cld", "00133141-001", "Chaldean Neo-Aramaic"),
-#        ("cle", "00133140-001", "Lealao Chinantec"),
-#        ("clh", "00133160-001", "Chilisso"),
-#        ("cli", "00133144-001", "Chakali"),
-#        ("clk", "00133146-001", "Idu-Mishmi"),
-#        ("cll", "00133168-001", "Chala"),
-#        ("clm", "00133167-001", "Clallam"),
-#        ("clo", "00133166-001", "Lowland Oaxaca Chontal"),
-#        ("clu", "00133165-001", "Caluyanun"),
-#        ("clw", "00133164-001", "Chulym"),
-#        ("cly", "00133163-001", "Eastern Highland Chatino"),
-#        ("cma", "00133154-001", "Maa"),
-#        ("cme", "00133161-001", "Cerma"),
-#        ("cmg", "00137855-001", "Classical Mongolian"),
-#        ("cmi", "00133169-001", "Emberá-Chamí"),
-#        ("cmk", "00138188-001", "Chimakum"),
-#        ("cml", "00133159-001", "Campalagian"),
-#        ("cmm", "00138192-001", "Michigamea"),
-#        ("cmn", "00133158-001", "Mandarin Chinese"),
-#        ("cmo", "00133157-001", "Central Mnong"),
-#        ("cmr", "00133156-001", "Mro Chin"),
-#        ("cms", "00138372-001", "Messapic"),
-#        ("cmt", "00133155-001", "Camtho"),
-#        ("cna", "00133350-001", "Changthang"),
-#        ("cnb", "00133545-001", "Chinbon Chin"),
-#        ("cnc", "00133317-001", "Côông"),
-#        ("cng", "00133508-001", "Northern Qiang"),
-#        ("cnh", "00133507-001", "Haka Chin"),
-#        ("cni", "00133506-001", "Asháninka"),
-#        ("cnk", "00133505-001", "Khumi Chin"),
-#        ("cnl", "00133504-001", "Lalana Chinantec"),
-#        ("cno", "00133495-001", "Con"),
-#        ("cns", "00133502-001", "Central Asmat"),
-#        ("cnt", "00133510-001", "Tepetotutla Chinantec"),
-#        ("cnu", "00133500-001", "Chenoua"),
-#        ("cnw", "00133499-001", "Ngawn Chin"),
-#        ("cnx", "00137850-001", "Middle Cornish"),
-#        ("coa", "00133498-001", "Cocos Islands Malay"),
-#        ("cob", "00138209-001", "Chicomuceltec"),
-#        ("coc", "00133497-001", "Cocopa"),
-#        ("cod", "00133496-001", "Cocama-Cocamilla"),
-#        ("coe", "00133518-001", "Koreguaje"),
-#        ("cof", "00133520-001", "Colorado"),
-#        ("cog", "00133503-001", "Chong"),
-#        ("coh", "00133525-001", "Chonyi-Dzihana-Kauma"),
-#        ("coj", "00138210-001", "Cochimi"),
-#        ("cok", "00133524-001", "Santa Teresa Cora"),
-#        ("col", "00133523-001", "Columbia-Wenatchi"),
-#        ("com", "00133522-001", "Comanche"),
-#        ("con", "00133521-001", "Cofán"),
-#        ("coo", "00133511-001", "Comox"),
-#        ("cop", "00138207-001", "Coptic"),
-#        ("coq", "00138204-001", "Coquille"),
-#        ("cor", "00138554-001", "Cornish"),
-#        ("cos", "00138490-001", "Corsican"),
-#        ("cot", "00133519-001", "Caquinte"),
-#        ("cou", "00133527-001", "Wamey"),
-#        ("cov", "00133517-001", "Cao Miao"),
-#        ("cow", "00138202-001", "Cowlitz"),
-#        ("cox", "00133516-001", "Nanti"),
-#        ("coy", "00138186-001", "Coyaima"),
-#        ("coz", "00133515-001", "Chochotec"),
-#        ("cpa", "00133514-001", "Palantla Chinantec"),
-#        ("cpb", "00133513-001", "Ucayali-Yurúa Ashéninka"),
-#        ("cpc", "00133487-001", "Ajyíninka Apurucayali"),
-#        ("cpg", "00138197-001", "Cappadocian Greek"),
-#        ("cpi", "00133526-001", "Chinese Pidgin English"),
-#        ("cpn", "00133501-001", "Cherepon"),
-#        ("cps", "00133477-001", "Capiznon"),
-#        ("cpu", "00133476-001", "Pichis Ashéninka"),
-#        ("cpx", "00133475-001", "Pu-Xian Chinese"),
-#        ("cpy", "00133474-001", "South Ucayali Ashéninka"),
-#        ("cqd", "00133473-001", "Chuanqiandian Cluster Miao"),
-#        ("cqu", "00133472-001", "Chilean Quechua"),
-#        ("cra", "00133463-001", "Chara"),
-#        ("crb", "00138229-001", "Island Carib"),
-#        ("crc", "00133470-001", "Lonwolwol"),
-#        ("crd", "00133478-001", "Coeur d'Alene"),
-#        ("cre", "00138491-001", "Cree"),
-#        ("crf", "00138201-001", "Caramanta"),
-#        ("crg", "00133468-001", "Michif"),
-#        ("crh", "00133467-001", "Crimean Tatar; Crimean Turkish"),
-#        ("cri", "00133466-001", "Sãotomense"),
-#        ("crj", "00133465-001", "Southern East Cree"),
-#        ("crk", "00133485-001", "Plains Cree"),
-#        ("crl", "00133469-001", "Northern East Cree"),
-#        ("crm", "00133471-001", "Moose Cree"),
-#        ("crn", "00133493-001", "El Nayar Cora"),
-#        ("cro", "00133492-001", "Crow"),
-#        ("crq", "00133491-001", "Iyo'wujwa Chorote"),
-#        ("crr", "00138242-001", "Carolina Algonquian"),
-#        ("crs", "00133490-001", "Seselwa Creole French"),
-#        ("crt", "00133489-001", "Iyojwa'ja Chorote"),
-#        ("crv", "00133488-001", "Chaura"),
-#        ("crw", "00133479-001", "Chrau"),
-#        ("crx", "00133486-001", "Carrier"),
-#        ("cry", "00133494-001", "Cori"),
-#        ("crz", "00138240-001", "Cruzeńo"),
-#        ("csa", "00133484-001", "Chiltepec Chinantec"),
-#        ("csb", "00133483-001", "Kashubian"),
-#        ("csc", "00133482-001", "Catalan Sign Language"),
-#        ("csd", "00133481-001", "Chiangmai Sign Language"),
-#        ("cse", "00133480-001", "Czech Sign Language"),
-#        ("csf", "00133542-001", "Cuba Sign Language"),
-#        ("csg", "00133592-001", "Chilean Sign Language"),
-#        ("csh", "00133512-001", "Asho Chin"),
-#        ("csi", "00138236-001", "Coast Miwok"),
-#        ("csk", "00133574-001", "Jola-Kasa"),
-#        ("csl", "00133573-001", "Chinese Sign Language"),
-#        ("csm", "00133572-001", "Central Sierra Miwok"),
-#        ("csn", "00133571-001", "Colombian Sign Language"),
-#        ("cso", "00133570-001", "Sochiapam Chinantec"),
-#        ("csq", "00133561-001", "Croatia Sign Language"),
-#        ("csr", "00133568-001", "Costa Rican Sign Language"),
-#        ("css", "00138233-001", "Southern Ohlone"),
-#        ("cst", "00138227-001", "Northern Ohlone"),
-#        ("csw", "00133576-001", "Swampy Cree"),
-#        ("csy", "00133566-001", "Siyin Chin"),
-#        ("csz", "00133565-001", "Coos"),
-#        ("cta", "00133564-001", "Tataltepec Chatino"),
-#        ("ctc", "00133563-001", "Chetco"),
-#        ("ctd", "00133562-001", "Tedim Chin"),
-#        ("cte", "00133584-001", "Tepinapa Chinantec"),
-#        ("ctg", "00133586-001", "Chittagonian"),
-#        ("ctl", "00133569-001", "Tlacoatzintepec Chinantec"),
-#        ("ctm", "00138222-001", "Chitimacha"),
-#        ("ctn", "00133591-001", "Chhintange"),
-#        ("cto", "00133590-001", "Emberá-Catío"),
-#        ("ctp", "00133589-001", "Western Highland Chatino"),
-#        ("cts", "00133588-001", "Northern Catanduanes Bicolano"),
-#        ("ctt", "00133587-001", "Wayanad Chetti"),
-#        ("ctu", "00133577-001", "Chol"),
-#        ("ctz", "00133585-001", "Zacatepec Chatino"),
-#        ("cua", "00133593-001", "Cua"),
-#        ("cub", "00133583-001", "Cubeo"),
-#        ("cuc", "00133582-001", "Usila Chinantec"),
-#        ("cug", "00133581-001", "Cung"),
-#        ("cuh", "00133580-001", "Chuka"),
-#        ("cui", "00133579-001", "Cuiba"),
-#        ("cuj", "00133578-001", "Mashco Piro"),
-#        ("cuk", "00133559-001", "San Blas Kuna"),
-#        ("cul", "00133534-001", "Culina"),
-#        ("cum", "00138152-001", "Cumeral"),
-#        ("cuo", "00138148-001", "Cumanagoto"),
-#        ("cup", "00138147-001", "Cupeńo"),
-#        ("cuq", "00133567-001", "Cun"),
-#        ("cur", "00133541-001", "Chhulung"),
-#        ("cut", "00133540-001", "Teutila Cuicatec"),
-#        ("cuu", "00133539-001", "Tai Ya"),
-#        ("cuv", "00133538-001", "Cuvok"),
-#        ("cuw", "00133537-001", "Chukwa"),
-#        ("cux", "00133528-001", "Tepeuxila Cuicatec"),
-#        ("cvg", "00133535-001", "Chug"),
-#        ("cvn", "00133543-001", "Valle Nacional Chinantec"),
-#        ("cwa", "00133533-001", "Kabwa"),
-#        ("cwb", "00133532-001", "Maindo"),
-#        ("cwd", "00133531-001", "Woods Cree"),
-#        ("cwe", "00133530-001", "Kwere"),
-#        ("cwg", "00133529-001", "Chewong"),
-#        ("cwt", "00133551-001", "Kuwaataay"),
-#        ("cya", "00133553-001", "Nopala Chatino"),
-#        ("cyb", "00138127-001", "Cayubaba"),
-#        ("cym", "00138495-001", "Welsh"),
-#        ("cyo", "00133536-001", "Cuyonon"),
-#        ("czh", "00133558-001", "Huizhou Chinese"),
-#        ("czk", "00138141-001", "Knaanic"),
-#        ("czn", "00133557-001", "Zenzontepec Chatino"),
-#        ("czo", "00133556-001", "Min Zhong Chinese"),
-#        ("czt", "00133555-001", "Zotung Chin"),
-#        ("daa", "00133554-001", "Dangaléat"),
-#        ("dac", "00133544-001", "Dambi"),
-#        ("dad", "00133552-001", "Marik"),
-#        ("dae", "00133560-001", "Duupa"),
-#        ("daf", "00133550-001", "Dan"),
-#        ("dag", "00133549-001", "Dagbani"),
-#        ("dah", "00133548-001", "Gwahatike"),
-#        ("dai", "00133547-001", "Day"),
-#        ("daj", "00133546-001", "Dar Fur Daju"),
-#        ("dak", "00133447-001", "Dakota"),
-#        ("dal", "00133575-001", "Dahalo"),
-#        ("dam", "00133464-001", "Damakawa"),
-#        ("dan", "00138496-001", "Danish"),
-#        ("dao", "00133379-001", "Daai Chin"),
-#        ("dap", "00133378-001", "Nisi"),
-#        ("daq", "00133377-001", "Dandami Maria"),
-#        ("dar", "00133376-001", "Dargwa"),
-#        ("das", "00133375-001", "Daho-Doo"),
-#        ("dau", "00133374-001", "Dar Sila Daju"),
-#        ("dav", "00133365-001", "Taita"),
-#        ("daw", "00133372-001", "Davawenyo"),
-#        ("dax", "00133380-001", "Dayi"),
-#        ("daz", "00133370-001", "Dao"),
-#        ("dba", "00133369-001", "Bangi Me"),
-#        ("dbb", "00133368-001", "Deno"),
-#        ("dbd", "00133367-001", "Dadiya"),
-#        ("dbe", "00133366-001", "Dabe"),
-#        ("dbf", "00133388-001", "Edopi"),
-#        ("dbg", "00133390-001", "Dogul Dom Dogon"),
-#        ("dbi", "00133373-001", "Doka"),
-#        ("dbj", "00133395-001", "Ida'an"),
-#        ("dbl", "00133394-001", "Dyirbal"),
-#        ("dbm", "00133393-001", "Duguri"),
-#        ("dbn", "00133392-001", "Duriankere"),
-#        ("dbo", "00133391-001", "Dulbu"),
-#        ("dbp", "00133381-001", "Duwai"),
-#        ("dbq", "00133389-001", "Daba"),
-#        ("dbr", "00133397-001", "Dabarre"),
-#        ("dbu", "00133387-001", "Bondum Dom Dogon"),
-#        ("dbv", "00133386-001", "Dungu"),
-#        ("dby", "00133385-001", "Dibiyaso"),
-#        ("dcc", "00133384-001", "Deccan"),
-#        ("dcr", "00138135-001", "Negerhollands"),
-#        ("ddd", "00133383-001", "Dongotono"),
-#        ("dde", "00133357-001", "Doondo"),
-#        ("ddg", "00133396-001", "Fataluku"),
-#        ("ddi", "00133371-001", "Diodio"),
-#        ("ddj", "00133347-001", "Jaru"),
-#        ("ddn", "00133346-001", "Dendi"),
-#        ("ddo", "00133345-001", "Dido"),
-#        ("dds", "00133344-001", "Donno So Dogon"),
-#        ("ddw", "00133343-001", "Dawera-Daweloor"),
-#        ("dec", "00133342-001", "Dagik"),
-#        ("ded", "00133333-001", "Dedua"),
-#        ("dee", "00133340-001", "Dewoin"),
-#        ("def", "00133348-001", "Dezfuli"),
-#        ("deg", "00133338-001", "Degema"),
-#        ("deh", "00133337-001", "Dehwari"),
-#        ("dei", "00133336-001", "Demisa"),
-#        ("dek", "00133335-001", "Dek"),
-#        ("del", "00130980-001", "Delaware"),
-#        ("dem", "00133355-001", "Dem"),
-#        ("den", "00130996-001", "Slave (Athapascan)"),
-#        ("dep", "00138128-001", "Pidgin Delaware"),
-#        ("deq", "00133339-001", "Dendi"),
-#        ("der", "00133341-001", "Deori"),
-#        ("des", "00133363-001", "Desano"),
-#        ("deu", "00138497-001", "German"),
-#        ("dev", "00133362-001", "Domung"),
-#        ("dez", "00133361-001", "Dengese"),
-#        ("dga", "00133360-001", "Southern Dagaare"),
-#        ("dgb", "00133359-001", "Bunoge Dogon"),
-#        ("dgc", "00133358-001", "Casiguran Dumagat Agta"),
-#        ("dgd", "00133349-001", "Dagaari Dioula"),
-#        ("dge", "00133356-001", "Degenan"),
-#        ("dgg", "00133364-001", "Doga"),
-#        ("dgh", "00133354-001", "Dghwede"),
-#        ("dgi", "00133353-001", "Northern Dagara"),
-#        ("dgk", "00133352-001", "Dagba"),
-#        ("dgn", "00138142-001", "Dagoman"),
-#        ("dgo", "00133351-001", "Dogri"),
-#        ("dgr", "00133399-001", "Dogrib"),
-#        ("dgs", "00133334-001", "Dogoso"),
-#        ("dgu", "00133382-001", "Degaru"),
-#        ("dgx", "00133444-001", "Doghoro"),
-#        ("dgz", "00133443-001", "Daga"),
-#        ("dha", "00133442-001", "Dhanwar"),
-#        ("dhd", "00133441-001", "Dhundari"),
-#        ("dhg", "00133440-001", "Dhangu"),
-#        ("dhi", "00133439-001", "Dhimal"),
-#        ("dhl", "00133430-001", "Dhalandji"),
-#        ("dhm", "00133437-001", "Zemba"),
-#        ("dhn", "00133445-001", "Dhanki"),
-#        ("dho", "00133435-001", "Dhodia"),
-#        ("dhr", "00133434-001", "Dhargari"),
-#        ("dhs", "00133433-001", "Dhaiso"),
-#        ("dhu", "00138176-001", "Dhurga"),
-#        ("dhv", "00133432-001", "Dehu"),
-#        ("dhw", "00133431-001", "Dhanwar"),
-#        ("dia", "00133453-001", "Dia"),
-#        ("dib", "00133455-001", "South Central Dinka"),
-#        ("dic", "00133438-001", "Lakota Dida"),
-#        ("did", "00133460-001", "Didinga"),
-#        ("dif", "00138185-001", "Dieri"),
-#        ("dig", "00133459-001", "Digo"),
-#        ("dih", "00133458-001", "Kumiai"),
-#        ("dii", "00133457-001", "Dimbong"),
-#        ("dij", "00133456-001", "Dai"),
-#        ("dik", "00133446-001", "Southwestern Dinka"),
-#        ("dil", "00133454-001", "Dilling"),
-#        ("dim", "00133462-001", "Dime"),
-#        ("din", "00130992-001", "Dinka"),
-#        ("dio", "00133452-001", "Dibo"),
-#        ("dip", "00133451-001", "Northeastern Dinka"),
-#        ("diq", "00133450-001", "Dimli"),
-#        ("dir", "00133449-001", "Dirim"),
-#        ("dis", "00133448-001", "Dimasa"),
-#        ("dit", "00133422-001", "Dirari"),
-#        ("diu", "00133461-001", "Diriku"),
-#        ("div", "00138498-001", "Divehi; Dhivehi; Maldivian"),
-#        ("diw", "00133436-001", "Northwestern Dinka"),
-#        ("dix", "00133412-001", "Dixon Reef"),
-#        ("diy", "00133411-001", "Diuwe"),
-#        ("diz", "00133410-001", "Ding"),
-#        ("djb", "00133409-001", "Djinba"),
-#        ("djc", "00133408-001", "Dar Daju Daju"),
-#        ("djd", "00133407-001", "Djamindjung"),
-#        ("dje", "00133398-001", "Zarma"),
-#        ("djf", "00133405-001", "Djangun"),
-#        ("dji", "00133413-001", "Djinang"),
-#        ("djj", "00133403-001", "Djeebbana"),
-#        ("djk", "00133402-001", "Aukan"),
-#        ("djl", "00133401-001", "Djiwarli"),
-#        ("djm", "00133400-001", "Jamsay Dogon"),
-#        ("djn", "00133420-001", "Djauan"),
-#        ("djo", "00133404-001", "Jangkang"),
-#        ("djr", "00133406-001", "Djambarrpuyngu"),
-#        ("dju", "00133428-001", "Kapriman"),
-#        ("djw", "00133427-001", "Djawi"),
-#        ("dka", "00133426-001", "Dakpakha"),
-#        ("dkk", "00133425-001", "Dakka"),
-#        ("dkl", "00133424-001", "Kolum So Dogon"),
-#        ("dkr", "00133423-001", "Kuijau"),
-#        ("dks", "00133414-001", "Southeastern Dinka"),
-#        ("dkx", "00133421-001", "Mazagway"),
-#        ("dlg", "00133429-001", "Dolgan"),
-#        ("dlm", "00138302-001", "Dalmatian"),
-#        ("dln", "00133419-001", "Darlong"),
-#        ("dma", "00133418-001", "Duma"),
-#        ("dmc", "00133417-001", "Dimir"),
-#        ("dme", "00133416-001", "Dugwor"),
-#        ("dmg", "00134162-001", "Upper Kinabatangan"),
-#        ("dmk", "00133119-001", "Domaaki"),
-#        ("dml", "00133937-001", "Dameli"),
-#        ("dmm", "00134813-001", "Dama"),
-#        ("dmo", "00134812-001", "Kemezung"),
-#        ("dmr", "00134811-001", "East Damar"),
-#        ("dms", "00134810-001", "Dampelas"),
-#        ("dmu", "00134809-001", "Dubu"),
-#        ("dmv", "00134808-001", "Dumpas"),
-#        ("dmx", "00134799-001", "Dema"),
-#        ("dmy", "00134806-001", "Demta"),
-#        ("dna", "00134814-001", "Upper Grand Valley Dani"),
-#        ("dnd", "00134804-001", "Daonda"),
-#        ("dne", "00134803-001", "Ndendeule"),
-#        ("dng", "00134802-001", "Dungan"),
-#        ("dni", "00134365-001", "Lower Grand Valley Dani"),
-#        ("dnk", "00134364-001", "Dengka"),
-#        ("dnn", "00134363-001", "Dzùùngoo"),
-#        ("dnr", "00134362-001", "Danaru"),
-#        ("dnt", "00134361-001", "Mid Grand Valley Dani"),
-#        ("dnu", "00134335-001", "Danau"),
-#        ("dnw", "00134374-001", "Western Dani"),
-#        ("dny", "00134349-001", "Dení"),
-#        ("doa", "00134325-001", "Dom"),
-#        ("dob", "00134324-001", "Dobu"),
-#        ("doc", "00134323-001", "Northern Dong"),
-#        ("doe", "00134322-001", "Doe"),
-#        ("dof", "00134321-001", "Domu"),
-#        ("doh", "00134320-001", "Dong"),
-#        ("doi", "00130993-001", "Dogri"),
-#        ("dok", "00134311-001", "Dondo"),
-#        ("dol", "00134318-001", "Doso"),
-#        ("don", "00134326-001", "Toura"),
-#        ("doo", "00134316-001", "Dongo"),
-#        ("dop", "00134315-001", "Lukpa"),
-#        ("doq", "00134314-001", "Dominican Sign Language"),
-#        ("dor", "00134313-001", "Dori'o"),
-#        ("dos", "00134333-001", "Dogosé"),
-#        ("dot", "00134317-001", "Dass"),
-#        ("dov", "00134319-001", "Dombe"),
-#        ("dow", "00134341-001", "Doyayo"),
-#        ("dox", "00134340-001", "Bussa"),
-#        ("doy", "00134339-001", "Dompo"),
-#        ("doz", "00134338-001", "Dorze"),
-#        ("dpp", "00134337-001", "Papar"),
-#        ("drb", "00134336-001", "Dair"),
-#        ("drd", "00134327-001", "Darmiya"),
-#        ("dre", "00134334-001", "Dolpo"),
-#        ("drg", "00134342-001", "Rungus"),
-#        ("drh", "00134332-001", "Darkhat"),
-#        ("dri", "00134331-001", "C'lela"),
-#        ("drl", "00134330-001", "Darling"),
-#        ("drn", "00134329-001", "West Damar"),
-#        ("dro", "00134328-001", "Daro-Matu Melanau"),
-#        ("drq", "00138133-001", "Dura"),
-#        ("drr", "00138132-001", "Dororo"),
-#        ("drs", "00134230-001", "Gedeo"),
-#        ("drt", "00134133-001", "Drents"),
-#        ("dru", "00134263-001", "Rukai"),
-#        ("drw", "00134161-001", "Darwazi"),
-#        ("dry", "00134160-001", "Darai"),
-#        ("dsb", "00134159-001", "Lower Sorbian"),
-#        ("dse", "00134158-001", "Dutch Sign Language"),
-#        ("dsh", "00134157-001", "Daasanach"),
-#        ("dsi", "00134148-001", "Disa"),
-#        ("dsl", "00134155-001", "Danish Sign Language"),
-#        ("dsn", "00134163-001", "Dusner"),
-#        ("dso", "00134153-001", "Desiya"),
-#        ("dsq", "00134152-001", "Tadaksahak"),
-#        ("dta", "00134151-001", "Daur"),
-#        ("dtb", "00134150-001", "Labuk-Kinabatangan Kadazan"),
-#        ("dti", "00134149-001", "Ana Tinga Dogon"),
-#        ("dtk", "00134171-001", "Tene Kan Dogon"),
-#        ("dtm", "00134173-001", "Tomo Kan Dogon"),
-#        ("dtp", "00134156-001", "Central Dusun"),
-#        ("dtr", "00134178-001", "Lotud"),
-#        ("dts", "00134177-001", "Toro So Dogon"),
-#        ("dtt", "00134176-001", "Toro Tegu Dogon"),
-#        ("dtu", "00134175-001", "Tebul Ure Dogon"),
-#        ("dua", "00134174-001", "Duala"),
-#        ("dub", "00134164-001", "Dubli"),
-#        ("duc", "00134172-001", "Duna"),
-#        ("dud", "00134180-001", "Hun-Saare"),
-#        ("due", "00134170-001", "Umiray Dumaget Agta"),
-#        ("duf", "00134169-001", "Dumbea"),
-#        ("dug", "00134168-001", "Duruma"),
-#        ("duh", "00134167-001", "Dungra Bhil"),
-#        ("dui", "00134166-001", "Dumun"),
-#        ("duj", "00134140-001", "Dhuwal"),
-#        ("duk", "00134179-001", "Duduela"),
-#        ("dul", "00134154-001", "Alabat Island Agta"),
-#        ("dum", "00137903-001", "Middle Dutch"),
-#        ("dun", "00134130-001", "Dusun Deyah"),
-#        ("duo", "00134129-001", "Dupaninan Agta"),
-#        ("dup", "00134128-001", "Duano"),
-#        ("duq", "00134127-001", "Dusun Malang"),
-#        ("dur", "00134126-001", "Dii"),
-#        ("dus", "00134125-001", "Dumi"),
-#        ("duu", "00134116-001", "Drung"),
-#        ("duv", "00134123-001", "Duvle"),
-#        ("duw", "00134131-001", "Dusun Witu"),
-#        ("dux", "00134121-001", "Duungooma"),
-#        ("duy", "00138310-001", "Dicamay Agta"),
-#        ("duz", "00138309-001", "Duli"),
-#        ("dva", "00134120-001", "Duau"),
-#        ("dwa", "00134119-001", "Diri"),
-#        ("dwl", "00134118-001", "Walo Kumbe Dogon"),
-#        ("dwr", "00134138-001", "Dawro"),
-#        ("dws", "00138351-001", "Dutton World Speedwords"),
-#        ("dww", "00134122-001", "Dawawa"),
-#        ("dya", "00134124-001", "Dyan"),
-#        ("dyb", "00134146-001", "Dyaberdyaber"),
-#        ("dyd", "00134145-001", "Dyugun"),
-#        ("dyg", "00138340-001", "Villa Viciosa Agta"),
-#        ("dyi", "00134144-001", "Djimini Senoufo"),
-#        ("dym", "00134143-001", "Yanda Dom Dogon"),
-#        ("dyn", "00134142-001", "Dyangadi"),
-#        ("dyo", "00134141-001", "Jola-Fonyi"),
-#        ("dyu", "00134132-001", "Dyula"),
-#        ("dyy", "00134139-001", "Dyaabugay"),
-#        ("dza", "00134147-001", "Tunzu"),
-#        ("dzd", "00134137-001", "Daza"),
-#        ("dzg", "00134136-001", "Dazaga"),
-#        ("dzl", "00134135-001", "Dzalakha"),
-#        ("dzn", "00134134-001", "Dzando"),
-#        ("dzo", "00138499-001", "Dzongkha; Bhutani; Butanese"),
-#        ("ebg", "00134182-001", "Ebughu"),
-#        ("ebo", "00134117-001", "Teke-Ebo"),
-#        ("ebr", "00134165-001", "Ebrié"),
-#        ("ebu", "00134227-001", "Embu"),
-#        ("ecr", "00138418-001", "Eteocretan"),
-#        ("ecs", "00134226-001", "Ecuadorian Sign Language"),
-#        ("ecy", "00138415-001", "Eteocypriot"),
-#        ("eee", "00134225-001", "E"),
-#        ("efa", "00134224-001", "Efai"),
-#        ("efe", "00134223-001", "Efe"),
-#        ("efi", "00134222-001", "Efik"),
-#        ("ega", "00134213-001", "Ega"),
-#        ("egl", "00134220-001", "Emilian"),
-#        ("ego", "00134228-001", "Eggon"),
-#        ("egy", "00138408-001", "Egyptian (Ancient)"),
-#        ("ehu", "00134218-001", "Ehueun"),
-#        ("eip", "00134217-001", "Eipomek"),
-#        ("eit", "00134216-001", "Eitiep"),
-#        ("eiv", "00134215-001", "Askopan"),
-#        ("eja", "00134214-001", "Ejamat"),
-#        ("eka", "00134236-001", "Ekajuk"),
-#        ("eke", "00134238-001", "Ekit"),
-#        ("ekg", "00134221-001", "Ekari"),
-#        ("eki", "00134243-001", "Eki"),
-#        ("ekk", "00134242-001", "Standard Estonian"),
-#        ("ekl", "00134241-001", "Kol"),
-#        ("ekm", "00134240-001", "Elip"),
-#        ("eko", "00134239-001", "Koti"),
-#        ("ekp", "00134229-001", "Ekpeye"),
-#        ("ekr", "00134237-001", "Yace"),
-#        ("eky", "00134245-001", "Eastern Kayah"),
-#        ("ele", "00134235-001", "Elepi"),
-#        ("elh", "00134234-001", "El Hugeirat"),
-#        ("eli", "00134233-001", "Nding"),
-#        ("elk", "00134232-001", "Elkei"),
-#        ("ell", "00138501-001", "Modern Greek"),
-#        ("elm", "00134231-001", "Eleme"),
-#        ("elo", "00134205-001", "El Molo"),
-#        ("elp", "00134244-001", "Elpaputih"),
-#        ("elu", "00134219-001", "Elu"),
-#        ("elx", "00138425-001", "Elamite"),
-#        ("ema", "00134195-001", "Emai-Iuleha-Ora"),
-#        ("emb", "00134194-001", "Embaloh"),
-#        ("eme", "00134193-001", "Emerillon"),
-#        ("emg", "00134192-001", "Eastern Meohang"),
-#        ("emi", "00134191-001", "Mussau-Emira"),
-#        ("emk", "00134190-001", "Eastern Maninkakan"),
-#        ("emm", "00138276-001", "Mamulique"),
-#        ("emn", "00134181-001", "Eman"),
-#        ("emo", "00138275-001", "Emok"),
-#        ("emp", "00134188-001", "Northern Emberá"),
-#        ("ems", "00134196-001", "Pacific Gulf Yupik"),
-#        ("emu", "00134186-001", "Eastern Muria"),
-#        ("emw", "00134185-001", "Emplawas"),
-#        ("emy", "00137979-001", "Epigraphic Mayan"),
-#        ("ena", "00134184-001", "Apali"),
-#        ("enb", "00134183-001", "Markweeta"),
-#        ("enc", "00134203-001", "En"),
-#        ("end", "00134187-001", "Ende"),
-#        ("enf", "00134189-001", "Forest Enets"),
-#        ("eng", "00138502-001", "English"),
-#        ("enh", "00134211-001", "Tundra Enets"),
-#        ("enm", "00137907-001", "Middle English"),
-#        ("enn", "00134210-001", "Engenni"),
-#        ("eno", "00134209-001", "Enggano"),
-#        ("enq", "00134208-001", "Enga"),
-#        ("enr", "00134207-001", "Emumu"),
-#        ("enu", "00134206-001", "Enu"),
-#        ("env", "00134197-001", "Enwan"),
-#        ("enw", "00134204-001", "Enwan"),
-#        ("eot", "00134212-001", "Beti"),
-#        ("epi", "00134202-001", "Epie"),
-#        ("epo", "00138503-001", "Esperanto"),
-#        ("era", "00134201-001", "Eravallan"),
-#        ("erg", "00134200-001", "Sie"),
-#        ("erh", "00134199-001", "Eruwa"),
-#        ("eri", "00134198-001", "Ogea"),
-#        ("erk", "00134393-001", "South Efate"),
-#        ("ero", "00134588-001", "Horpa"),
-#        ("err", "00134360-001", "Erre"),
-#        ("ers", "00134551-001", "Ersu"),
-#        ("ert", "00134550-001", "Eritai"),
-#        ("erw", "00134549-001", "Erokwanas"),
-#        ("ese", "00135038-001", "Ese Ejja"),
-#        ("esh", "00135037-001", "Eshtehardi"),
-#        ("esi", "00135028-001", "North Alaskan Inupiatun"),
-#        ("esk", "00135035-001", "Northwest Alaska Inupiatun"),
-#        ("esl", "00135043-001", "Egypt Sign Language"),
-#        ("esm", "00137936-001", "Esuma"),
-#        ("esn", "00135033-001", "Salvadoran Sign Language"),
-#        ("eso", "00135032-001", "Estonian Sign Language"),
-#        ("esq", "00137939-001", "Esselen"),
-#        ("ess", "00135031-001", "Central Siberian Yupik"),
-#        ("est", "00138505-001", "Estonian"),
-#        ("esu", "00135030-001", "Central Yupik"),
-#        ("etb", "00135050-001", "Etebi"),
-#        ("etc", "00137928-001", "Etchemin"),
-#        ("eth", "00135034-001", "Ethiopian Sign Language"),
-#        ("etn", "00135036-001", "Eton"),
-#        ("eto", "00135058-001", "Eton"),
-#        ("etr", "00135057-001", "Edolo"),
-#        ("ets", "00135056-001", "Yekhee"),
-#        ("ett", "00138404-001", "Etruscan"),
-#        ("etu", "00135055-001", "Ejagham"),
-#        ("etx", "00135054-001", "Eten"),
-#        ("etz", "00135053-001", "Semimi"),
-#        ("eus", "00138506-001", "Basque"),
-#        ("eve", "00135044-001", "Even"),
-#        ("evh", "00135051-001", "Uvbie"),
-#        ("evn", "00135059-001", "Evenki"),
-#        ("ewe", "00138500-001", "Ewe"),
-#        ("ewo", "00135049-001", "Ewondo"),
-#        ("ext", "00135048-001", "Extremaduran"),
-#        ("eya", "00137918-001", "Eyak"),
-#        ("eyo", "00135047-001", "Keiyo"),
-#        ("eze", "00135046-001", "Uzekwe"),
-#        ("faa", "00135045-001", "Fasu"),
-#        ("fab", "00135107-001", "Fa D'ambu"),
-#        ("fad", "00135157-001", "Wagi"),
-#        ("faf", "00135077-001", "Fagani"),
-#        ("fag", "00135139-001", "Finongan"),
-#        ("fah", "00135138-001", "Baissa Fali"),
-#        ("fai", "00135137-001", "Faiwol"),
-#        ("faj", "00135136-001", "Faita"),
-#        ("fak", "00135135-001", "Fang"),
-#        ("fal", "00135126-001", "South Fali"),
-#        ("fam", "00135133-001", "Fam"),
-#        ("fan", "00135141-001", "Fang"),
-#        ("fao", "00138511-001", "Faroese; Faeroese"),
-#        ("fap", "00135131-001", "Palor"),
-#        ("far", "00135130-001", "Fataleka"),
-#        ("fas", "00138507-001", "Farsi; Persian"),
-#        ("fat", "00135129-001", "Fanti"),
-#        ("fau", "00135128-001", "Fayu"),
-#        ("fax", "00135127-001", "Fala"),
-#        ("fay", "00135149-001", "Southwestern Fars"),
-#        ("faz", "00135151-001", "Northwestern Fars"),
-#        ("fcs", "00135134-001", "Quebec Sign Language"),
-#        ("fer", "00135156-001", "Feroge"),
-#        ("ffi", "00135155-001", "Foia Foia"),
-#        ("ffm", "00135154-001", "Maasina Fulfulde"),
-#        ("fgr", "00135153-001", "Fongoro"),
-#        ("fia", "00135152-001", "Nobiin"),
-#        ("fie", "00135142-001", "Fyer"),
-#        ("fij", "00138510-001", "Fijian"),
-#        ("fil", "00135150-001", "Filipino; Pilipino"),
-#        ("fin", "00138509-001", "Finnish"),
-#        ("fip", "00135158-001", "Fipa"),
-#        ("fir", "00135148-001", "Firan"),
-#        ("fit", "00135147-001", "Tornedalen Finnish"),
-#        ("fiw", "00135146-001", "Fiwaga"),
-#        ("fkv", "00135145-001", "Kven Finnish"),
-#        ("fla", "00135144-001", "Kalispel-Pend d'Oreille"),
-#        ("flh", "00135143-001", "Foau"),
-#        ("fli", "00135124-001", "Fali"),
-#        ("fll", "00135099-001", "North Fali"),
-#        ("fln", "00135132-001", "Flinders Island"),
-#        ("flr", "00135106-001", "Fuliiru"),
-#        ("fly", "00135105-001", "Tsotsitaal"),
-#        ("fmp", "00135104-001", "Fe'fe'"),
-#        ("fmu", "00135103-001", "Far Western Muria"),
-#        ("fng", "00135102-001", "Fanagalo"),
-#        ("fni", "00135093-001", "Fania"),
-#        ("fod", "00135100-001", "Foodo"),
-#        ("foi", "00135108-001", "Foi"),
-#        ("fom", "00135098-001", "Foma"),
-#        ("fon", "00135097-001", "Fon"),
-#        ("for", "00135096-001", "Fore"),
-#        ("fos", "00137958-001", "Siraya"),
-#        ("fpe", "00135095-001", "Fernando Po Creole English"),
-#        ("fqs", "00135094-001", "Fas"),
-#        ("fra", "00138512-001", "French"),
-#        ("frc", "00135116-001", "Cajun French"),
-#        ("frd", "00135118-001", "Fordata"),
-#        ("frk", "00137963-001", "Frankish"),
-#        ("frm", "00137862-001", "Middle French"),
-#        ("fro", "00137860-001", "Old French"),
-#        ("frp", "00135101-001", "Franco-Provençal"),
-#        ("frq", "00135123-001", "Forak"),
-#        ("frr", "00135122-001", "Northern Frisian"),
-#        ("frs", "00135121-001", "Eastern Frisian"),
-#        ("frt", "00135120-001", "Fortsenal"),
-#        ("fry", "00138513-001", "Western Frisian"),
-#        ("fse", "00135119-001", "Finnish Sign Language"),
-#        ("fsl", "00135109-001", "French Sign Language"),
-#        ("fss", "00135117-001", "Finland-Swedish Sign Language"),
-#        ("fub", "00135125-001", "Adamawa Fulfulde"),
-#        ("fuc", "00135115-001", "Pulaar"),
-#        ("fud", "00135114-001", "East Futuna"),
-#        ("fue", "00135113-001", "Borgu Fulfulde"),
-#        ("fuf", "00135112-001", "Pular"),
-#        ("fuh", "00135111-001", "Western Niger Fulfulde"),
-#        ("fui", "00135012-001", "Bagirmi Fulfulde"),
-#        ("fuj", "00135140-001", "Ko"),
-#        ("ful", "00138508-001", "Fulah; Fula; Fulani; Fulfulde; Peul"),
-#        ("fum", "00135029-001", "Fum"),
-#        ("fun", "00134944-001", "Fulniô"),
-#        ("fuq", "00134943-001", "Central-Eastern Niger Fulfulde"),
-#        ("fur", "00134942-001", "Friulian"),
-#        ("fut", "00134941-001", "Futuna-Aniwa"),
-#        ("fuu", "00134940-001", "Furu"),
-#        ("fuv", "00134939-001", "Nigerian Fulfulde"),
-#        ("fuy", "00134930-001", "Fuyug"),
-#        ("fvr", "00134937-001", "Fur"),
-#        ("fwa", "00134945-001", "Fwâi"),
-#        ("fwe", "00134935-001", "Fwe"),
-#        ("gaa", "00134934-001", "Ga"),
-#        ("gab", "00134933-001", "Gabri"),
-#        ("gad", "00134932-001", "Gaddang"),
-#        ("gae", "00134931-001", "Guarequena"),
-#        ("gaf", "00134953-001", "Gende"),
-#        ("gag", "00134955-001", "Gagauz"),
-#        ("gah", "00134938-001", "Alekano"),
-#        ("gai", "00134960-001", "Borei"),
-#        ("gaj", "00134959-001", "Gadsup"),
-#        ("gak", "00134958-001", "Gamkonora"),
-#        ("gal", "00134957-001", "Galoli"),
-#        ("gam", "00134956-001", "Kandawo"),
-#        ("gan", "00134946-001", "Gan Chinese"),
-#        ("gao", "00134954-001", "Gants"),
-#        ("gap", "00134962-001", "Gal"),
-#        ("gaq", "00134952-001", "Gata'"),
-#        ("gar", "00134951-001", "Galeya"),
-#        ("gas", "00134950-001", "Adiwasi Garasia"),
-#        ("gat", "00134949-001", "Kenati"),
-#        ("gau", "00134948-001", "Mudhili Gadaba"),
-#        ("gav", "00134922-001", "Gabutamon"),
-#        ("gaw", "00134961-001", "Nobonob"),
-#        ("gax", "00134936-001", "Borana-Arsi-Guji Oromo"),
-#        ("gay", "00134912-001", "Gayo"),
-#        ("gaz", "00134911-001", "West Central Oromo"),
-#        ("gba", "00130985-001", "Gbaya"),
-#        ("gbb", "00134910-001", "Kaytetye"),
-#        ("gbc", "00134909-001", "Garawa"),
-#        ("gbd", "00134908-001", "Karadjeri"),
-#        ("gbe", "00134907-001", "Niksek"),
-#        ("gbf", "00134898-001", "Gaikundi"),
-#        ("gbg", "00134905-001", "Gbanziri"),
-#        ("gbh", "00134913-001", "Defi Gbe"),
-#        ("gbi", "00134903-001", "Galela"),
-#        ("gbj", "00134902-001", "Bodo Gadaba"),
-#        ("gbk", "00134901-001", "Gaddi"),
-#        ("gbl", "00134900-001", "Gamit"),
-#        ("gbm", "00134920-001", "Garhwali"),
-#        ("gbn", "00134904-001", "Mo'da"),
-#        ("gbo", "00134906-001", "Northern Grebo"),
-#        ("gbp", "00134928-001", "Gbaya-Bossangoa"),
-#        ("gbq", "00134927-001", "Gbaya-Bozoum"),
-#        ("gbr", "00134926-001", "Gbagyi"),
-#        ("gbs", "00134925-001", "Gbesi Gbe"),
-#        ("gbu", "00134924-001", "Gagadu"),
-#        ("gbv", "00134923-001", "Gbanu"),
-#        ("gbx", "00134914-001", "Eastern Xwla Gbe"),
-#        ("gby", "00134921-001", "Gbari"),
-#        ("gbz", "00134929-001", "Zoroastrian Dari"),
-#        ("gcc", "00134919-001", "Mali"),
-#        ("gcd", "00134918-001", "Ganggalida"),
-#        ("gce", "00138267-001", "Galice"),
-#        ("gcf", "00134917-001", "Guadeloupean Creole French"),
-#        ("gcl", "00134916-001", "Grenadian Creole English"),
-#        ("gcn", "00134964-001", "Gaina"),
-#        ("gcr", "00134899-001", "Guianese Creole French"),
-#        ("gct", "00134947-001", "Colonia Tovar German"),
-#        ("gda", "00135009-001", "Gade Lohar"),
-#        ("gdb", "00135008-001", "Pottangi Ollar Gadaba"),
-#        ("gdc", "00135007-001", "Gugu Badhun"),
-#        ("gdd", "00135006-001", "Gedaged"),
-#        ("gde", "00135005-001", "Gude"),
-#        ("gdf", "00135004-001", "Guduf-Gava"),
-#        ("gdg", "00134995-001", "Ga'dang"),
-#        ("gdh", "00135002-001", "Gadjerawang"),
-#        ("gdi", "00135010-001", "Gundi"),
-#        ("gdj", "00135000-001", "Gurdjar"),
-#        ("gdk", "00134999-001", "Gadang"),
-#        ("gdl", "00134548-001", "Dirasha"),
-#        ("gdm", "00134547-001", "Laal"),
-#        ("gdn", "00134538-001", "Umanakaina"),
-#        ("gdo", "00134545-001", "Ghodoberi"),
-#        ("gdq", "00134553-001", "Mehri"),
-#        ("gdr", "00134543-001", "Wipi"),
-#        ("gdu", "00134542-001", "Gudu"),
-#        ("gdx", "00134541-001", "Godwari"),
-#        ("gea", "00134540-001", "Geruma"),
-#        ("geb", "00134539-001", "Kire"),
-#        ("gec", "00134561-001", "Gboloo Grebo"),
-#        ("ged", "00134563-001", "Gade"),
-#        ("geg", "00134546-001", "Gengle"),
-#        ("geh", "00134568-001", "Hutterite German"),
-#        ("gei", "00134567-001", "Gebe"),
-#        ("gej", "00134566-001", "Gen"),
-#        ("gek", "00134565-001", "Yiwom"),
-#        ("gel", "00134564-001", "Kag-Fer-Jiir-Koor-Ror-Us-Zuksun"),
-#        ("geq", "00134554-001", "Geme"),
-#        ("ges", "00134562-001", "Geser-Gorom"),
-#        ("gew", "00134570-001", "Gera"),
-#        ("gex", "00134560-001", "Garre"),
-#        ("gey", "00134559-001", "Enya"),
-#        ("gez", "00138422-001", "Geez"),
-#        ("gfk", "00134558-001", "Patpatar"),
-#        ("gft", "00138010-001", "Gafat"),
-#        ("gga", "00134557-001", "Gao"),
-#        ("ggb", "00134556-001", "Gbii"),
-#        ("ggd", "00134530-001", "Gugadj"),
-#        ("gge", "00134569-001", "Guragone"),
-#        ("ggg", "00134544-001", "Gurgula"),
-#        ("ggk", "00137925-001", "Kungarakany"),
-#        ("ggl", "00134520-001", "Ganglau"),
-#        ("ggn", "00134519-001", "Eastern Gurung"),
-#        ("ggo", "00134518-001", "Southern Gondi"),
-#        ("ggr", "00137923-001", "Aghu Tharnggalu"),
-#        ("ggt", "00134517-001", "Gitua"),
-#        ("ggu", "00134516-001", "Gagu"),
-#        ("ggw", "00134515-001", "Gogodala"),
-#        ("gha", "00134506-001", "Ghadamès"),
-#        ("ghc", "00137954-001", "Hiberno-Scottish Gaelic"),
-#        ("ghe", "00134513-001", "Southern Ghale"),
-#        ("ghh", "00134521-001", "Northern Ghale"),
-#        ("ghk", "00134511-001", "Geko Karen"),
-#        ("ghl", "00134510-001", "Ghulfan"),
-#        ("ghn", "00134509-001", "Ghanongga"),
-#        ("gho", "00137945-001", "Ghomara"),
-#        ("ghr", "00134508-001", "Ghera"),
-#        ("ghs", "00134528-001", "Guhu-Samane"),
-#        ("ght", "00134512-001", "Kutang Ghale"),
-#        ("gia", "00134514-001", "Kitja"),
-#        ("gib", "00134536-001", "Gibanawa"),
-#        ("gic", "00134535-001", "Gail"),
-#        ("gid", "00134534-001", "Gidar"),
-#        ("gig", "00134533-001", "Goaria"),
-#        ("gil", "00134532-001", "Gilbertese"),
-#        ("gim", "00134531-001", "Gimi"),
-#        ("gin", "00134522-001", "Hinukh"),
-#        ("gio", "00134529-001", "Gelao"),
-#        ("gip", "00134537-001", "Gimi"),
-#        ("giq", "00134527-001", "Green Gelao"),
-#        ("gir", "00134526-001", "Red Gelao"),
-#        ("gis", "00134525-001", "North Giziga"),
-#        ("git", "00134524-001", "Gitxsan"),
-#        ("giw", "00134523-001", "White Gelao"),
-#        ("gix", "00134585-001", "Gilima"),
-#        ("giy", "00134635-001", "Giyug"),
-#        ("giz", "00134555-001", "South Giziga"),
-#        ("gji", "00134617-001", "Geji"),
-#        ("gjk", "00134616-001", "Kachi Koli"),
-#        ("gjn", "00134615-001", "Gonja"),
-#        ("gju", "00134614-001", "Gujari"),
-#        ("gka", "00134613-001", "Guya"),
-#        ("gke", "00134604-001", "Ndai"),
-#        ("gkn", "00134611-001", "Gokana"),
-#        ("gkp", "00134619-001", "Guinea Kpelle"),
-#        ("gla", "00138515-001", "Gaelic; Scottish Gaelic"),
-#        ("glc", "00134609-001", "Bon Gula"),
-#        ("gld", "00134608-001", "Nanai"),
-#        ("gle", "00138514-001", "Irish"),
-#        ("glg", "00138516-001", "Galician"),
-#        ("glh", "00134607-001", "Northwest Pashayi"),
-#        ("gli", "00138080-001", "Guliguli"),
-#        ("glj", "00134606-001", "Gula Iro"),
-#        ("glk", "00134605-001", "Gilaki"),
-#        ("glo", "00134627-001", "Galambu"),
-#        ("glr", "00134629-001", "Glaro-Twabo"),
-#        ("glu", "00134612-001", "Gula"),
-#        ("glv", "00138519-001", "Manx"),
-#        ("glw", "00134634-001", "Glavda"),
-#        ("gly", "00138073-001", "Gule"),
-#        ("gma", "00134633-001", "Gambera"),
-#        ("gmb", "00134632-001", "Gula'alaa"),
-#        ("gmd", "00134631-001", "Mághdě"),
-#        ("gmh", "00137898-001", "Middle High German"),
-#        ("gml", "00137895-001", "Middle Low German"),
-#        ("gmm", "00134630-001", "Gbaya-Mbodomo"),
-#        ("gmn", "00134620-001", "Gimnime"),
-#        ("gmu", "00134628-001", "Gumalu"),
-#        ("gmv", "00134636-001", "Gamo"),
-#        ("gmx", "00134626-001", "Magoma"),
-#        ("gmy", "00138441-001", "Mycenaean Greek"),
-#        ("gna", "00134625-001", "Kaansa"),
-#        ("gnb", "00134624-001", "Gangte"),
-#        ("gnc", "00138126-001", "Guanche"),
-#        ("gnd", "00134623-001", "Zulgo-Gemzek"),
-#        ("gne", "00134622-001", "Ganang"),
-#        ("gng", "00134621-001", "Ngangam"),
-#        ("gnh", "00134602-001", "Lere"),
-#        ("gni", "00134577-001", "Gooniyandi"),
-#        ("gnk", "00134610-001", "//Gana"),
-#        ("gnl", "00138070-001", "Gangulu"),
-#        ("gnm", "00134584-001", "Ginuman"),
-#        ("gnn", "00134583-001", "Gumatj"),
-#        ("gno", "00134582-001", "Northern Gondi"),
-#        ("gnq", "00134581-001", "Gana"),
-#        ("gnr", "00138034-001", "Gureng Gureng"),
-#        ("gnt", "00134580-001", "Guntai"),
-#        ("gnu", "00134571-001", "Gnau"),
-#        ("gnw", "00134578-001", "Western Bolivian Guaraní"),
-#        ("gnz", "00134586-001", "Ganzi"),
-#        ("goa", "00134576-001", "Guro"),
-#        ("gob", "00134575-001", "Playero"),
-#        ("goc", "00134574-001", "Gorakor"),
-#        ("god", "00134573-001", "Godié"),
-#        ("goe", "00134572-001", "Gongduk"),
-#        ("gof", "00134594-001", "Gofa"),
-#        ("gog", "00134596-001", "Gogo"),
-#        ("goh", "00137899-001", "Old High German"),
-#        ("goi", "00134579-001", "Gobasi"),
-#        ("goj", "00134601-001", "Gowlan"),
-#        ("gok", "00134600-001", "Gowli"),
-#        ("gol", "00134599-001", "Gola"),
-#        ("gom", "00134598-001", "Goan Konkani"),
-#        ("gon", "00130999-001", "Gondi"),
-#        ("goo", "00134597-001", "Gone Dau"),
-#        ("gop", "00134587-001", "Yeretuar"),
-#        ("goq", "00134595-001", "Gorap"),
-#        ("gor", "00134603-001", "Gorontalo"),
-#        ("gos", "00134593-001", "Gronings"),
-#        ("got", "00138438-001", "Gothic"),
-#        ("gou", "00134592-001", "Gavar"),
-#        ("gow", "00134591-001", "Gorowa"),
-#        ("gox", "00134590-001", "Gobu"),
-#        ("goy", "00134589-001", "Goundo"),
-#        ("goz", "00134490-001", "Gozarkhani"),
-#        ("gpa", "00134618-001", "Gupa-Abawa"),
-#        ("gpn", "00134507-001", "Taiap"),
-#        ("gqa", "00134422-001", "Ga'anda"),
-#        ("gqi", "00134421-001", "Guiqiong"),
-#        ("gqn", "00138061-001", "Guana"),
-#        ("gqr", "00134420-001", "Gor"),
-#        ("gra", "00134419-001", "Rajput Garasia"),
-#        ("grb", "00130977-001", "Grebo"),
-#        ("grc", "00137891-001", "Ancient Greek"),
-#        ("grd", "00134418-001", "Guruntum-Mbaaru"),
-#        ("grg", "00134417-001", "Madi"),
-#        ("grh", "00134408-001", "Gbiri-Niragu"),
-#        ("gri", "00134415-001", "Ghari"),
-#        ("grj", "00134423-001", "Southern Grebo"),
-#        ("grm", "00134413-001", "Kota Marudu Talantang"),
-#        ("grn", "00138517-001", "Guarani"),
-#        ("gro", "00134412-001", "Groma"),
-#        ("grq", "00134411-001", "Gorovu"),
-#        ("grr", "00134410-001", "Taznatit"),
-#        ("grs", "00134409-001", "Gresi"),
-#        ("grt", "00134431-001", "Garo"),
-#        ("gru", "00134433-001", "Kistane"),
-#        ("grv", "00134416-001", "Central Grebo"),
-#        ("grw", "00134438-001", "Gweda"),
-#        ("grx", "00134437-001", "Guriaso"),
-#        ("gry", "00134436-001", "Barclayville Grebo"),
-#        ("grz", "00134435-001", "Guramalum"),
-#        ("gse", "00134434-001", "Ghanaian Sign Language"),
-#        ("gsg", "00134424-001", "German Sign Language"),
-#        ("gsl", "00134432-001", "Gusilay"),
-#        ("gsm", "00134440-001", "Guatemalan Sign Language"),
-#        ("gsn", "00134430-001", "Gusan"),
-#        ("gso", "00134429-001", "Southwest Gbaya"),
-#        ("gsp", "00134428-001", "Wasembo"),
-#        ("gss", "00134427-001", "Greek Sign Language"),
-#        ("gsw", "00134426-001", "Swiss German; Alemannic; Alsatian"),
-#        ("gta", "00134400-001", "Guató"),
-#        ("gti", "00134439-001", "Gbati-ri"),
-#        ("gua", "00134414-001", "Shiki"),
-#        ("gub", "00134390-001", "Guajajára"),
-#        ("guc", "00134389-001", "Wayuu"),
-#        ("gud", "00134388-001", "Yocoboué Dida"),
-#        ("gue", "00134387-001", "Gurinji"),
-#        ("guf", "00134386-001", "Gupapuyngu"),
-#        ("gug", "00134385-001", "Paraguayan Guaraní"),
-#        ("guh", "00134376-001", "Guahibo"),
-#        ("gui", "00134383-001", "Eastern Bolivian Guaraní"),
-#        ("guj", "00138518-001", "Gujarati"),
-#        ("guk", "00134391-001", "Gumuz"),
-#        ("gul", "00134381-001", "Sea Island Creole English"),
-#        ("gum", "00134380-001", "Guambiano"),
-#        ("gun", "00134379-001", "Mbyá Guaraní"),
-#        ("guo", "00134378-001", "Guayabero"),
-#        ("gup", "00134398-001", "Gunwinggu"),
-#        ("guq", "00134382-001", "Aché"),
-#        ("gur", "00134384-001", "Farefare"),
-#        ("gus", "00134406-001", "Guinean Sign Language"),
-#        ("gut", "00134405-001", "Maléku Jaíka"),
-#        ("guu", "00134404-001", "Yanomamö"),
-#        ("guv", "00138018-001", "Gey"),
-#        ("guw", "00134403-001", "Gun"),
-#        ("gux", "00134402-001", "Gourmanchéma"),
-#        ("guz", "00134401-001", "Gusii"),
-#        ("gva", "00134392-001", "Guana"),
-#        ("gvc", "00134399-001", "Guanano"),
-#        ("gve", "00134407-001", "Duwet"),
-#        ("gvf", "00134397-001", "Golin"),
-#        ("gvj", "00134396-001", "Guajá"),
-#        ("gvl", "00134395-001", "Gulay"),
-#        ("gvm", "00134394-001", "Gurmana"),
-#        ("gvn", "00134442-001", "Kuku-Yalanji"),
-#        ("gvo", "00134377-001", "Gavião Do Jiparaná"),
-#        ("gvp", "00134425-001", "Pará Gavião"),
-#        ("gvr", "00134487-001", "Western Gurung"),
-#        ("gvs", "00134486-001", "Gumawana"),
-#        ("gvy", "00138106-001", "Guyani"),
-#        ("gwa", "00134485-001", "Mbato"),
-#        ("gwb", "00134484-001", "Gwa"),
-#        ("gwc", "00134483-001", "Kalami"),
-#        ("gwd", "00134482-001", "Gawwada"),
-#        ("gwe", "00134473-001", "Gweno"),
-#        ("gwf", "00134480-001", "Gowro"),
-#        ("gwg", "00134488-001", "Moo"),
-#        ("gwi", "00134478-001", "Gwich'in"),
-#        ("gwj", "00134477-001", "/Gwi"),
-#        ("gwn", "00134476-001", "Gwandara"),
-#        ("gwr", "00134475-001", "Gwere"),
-#        ("gwt", "00134474-001", "Gawar-Bati"),
-#        ("gwu", "00134496-001", "Guwamu"),
-#        ("gww", "00134498-001", "Kwini"),
-#        ("gwx", "00134481-001", "Gua"),
-#        ("gxx", "00134503-001", "Wè Southern"),
-#        ("gya", "00134502-001", "Northwest Gbaya"),
-#        ("gyb", "00134501-001", "Garus"),
-#        ("gyd", "00134500-001", "Kayardild"),
-#        ("gye", "00134499-001", "Gyem"),
-#        ("gyf", "00134489-001", "Gungabula"),
-#        ("gyg", "00134497-001", "Gbayi"),
-#        ("gyi", "00134505-001", "Gyele"),
-#        ("gyl", "00134495-001", "Gayil"),
-#        ("gym", "00134494-001", "Ngäbere"),
-#        ("gyn", "00134493-001", "Guyanese Creole English"),
-#        ("gyr", "00134492-001", "Guarayu"),
-#        ("gyy", "00134491-001", "Gunya"),
-#        ("gza", "00134465-001", "Ganza"),
-#        ("gzi", "00134504-001", "Gazi"),
-#        ("gzn", "00134479-001", "Gane"),
-#        ("haa", "00134455-001", "Han"),
-#        ("hab", "00134454-001", "Hanoi Sign Language"),
-#        ("hac", "00134453-001", "Gurani"),
-#        ("had", "00134452-001", "Hatam"),
-#        ("hae", "00134451-001", "Eastern Oromo"),
-#        ("haf", "00134450-001", "Haiphong Sign Language"),
-#        ("hag", "00134441-001", "Hanga"),
-#        ("hah", "00134448-001", "Hahon"),
-#        ("hai", "00130976-001", "Haida"),
-#        ("haj", "00134456-001", "Hajong"),
-#        ("hak", "00134446-001", "Hakka Chinese"),
-#        ("hal", "00134445-001", "Halang"),
-#        ("ham", "00134444-001", "Hewa"),
-#        ("han", "00134443-001", "Hangaza"),
-#        ("hao", "00134463-001", "Hakö"),
-#        ("hap", "00134447-001", "Hupla"),
-#        ("haq", "00134449-001", "Ha"),
-#        ("har", "00134471-001", "Harari"),
-#        ("has", "00134470-001", "Haisla"),
-#        ("hat", "00138525-001", "Haitian; Haitian Creole"),
-#        ("hau", "00138520-001", "Hausa"),
-#        ("hav", "00134469-001", "Havu"),
-#        ("haw", "00134468-001", "Hawaiian"),
-#        ("hax", "00134467-001", "Southern Haida"),
-#        ("hay", "00132720-001", "Haya"),
-#        ("haz", "00134457-001", "Hazaragi"),
-#        ("hba", "00133415-001", "Hamba"),
-#        ("hbb", "00134472-001", "Huba"),
-#        ("hbn", "00134462-001", "Heiban"),
-#        ("hbo", "00137889-001", "Ancient Hebrew"),
-#        ("hbs", "00138607-001", "Serbo-Croatian"),
-#        ("hbu", "00134461-001", "Habu"),
-#        ("hca", "00134460-001", "Andaman Creole Hindi"),
-#        ("hch", "00134459-001", "Huichol"),
-#        ("hdn", "00134458-001", "Northern Haida"),
-#        ("hds", "00134980-001", "Honduras Sign Language"),
-#        ("hdy", "00132722-001", "Hadiyya"),
-#        ("hea", "00131682-001", "Northern Qiandong Miao"),
-#        ("heb", "00138521-001", "Hebrew"),
-#        ("hed", "00131681-001", "Herdé"),
-#        ("heg", "00131680-001", "Helong"),
-#        ("heh", "00131679-001", "Hehe"),
-#        ("hei", "00131678-001", "Heiltsuk"),
-#        ("hem", "00131677-001", "Hemba"),
-#        ("her", "00138528-001", "Herero"),
-#        ("hgm", "00131668-001", "Hai//om"),
-#        ("hgw", "00131675-001", "Haigwai"),
-#        ("hhi", "00131683-001", "Hoia Hoia"),
-#        ("hhr", "00131673-001", "Kerak"),
-#        ("hhy", "00131672-001", "Hoyahoya"),
-#        ("hia", "00131671-001", "Lamang"),
-#        ("hib", "00138260-001", "Hibito"),
-#        ("hid", "00131670-001", "Hidatsa"),
-#        ("hif", "00131669-001", "Fiji Hindi"),
-#        ("hig", "00131691-001", "Kamwe"),
-#        ("hih", "00131693-001", "Pamosu"),
-#        ("hii", "00131676-001", "Hinduri"),
-#        ("hij", "00131698-001", "Hijuk"),
-#        ("hik", "00131697-001", "Seit-Kaitetu"),
-#        ("hil", "00131718-001", "Hiligaynon"),
-#        ("hin", "00138522-001", "Hindi"),
-#        ("hio", "00131943-001", "Tsoa"),
-#        ("hir", "00131942-001", "Himarimã"),
-#        ("hit", "00138433-001", "Hittite"),
-#        ("hiw", "00131941-001", "Hiw"),
-#        ("hix", "00131940-001", "Hixkaryána"),
-#        ("hji", "00131939-001", "Haji"),
-#        ("hka", "00131930-001", "Kahe"),
-#        ("hke", "00131937-001", "Hunde"),
-#        ("hkk", "00131945-001", "Hunjara-Kaina Ke"),
-#        ("hks", "00131935-001", "Hong Kong Sign Language"),
-#        ("hla", "00131934-001", "Halia"),
-#        ("hlb", "00131933-001", "Halbi"),
-#        ("hld", "00131932-001", "Halang Doan"),
-#        ("hle", "00131931-001", "Hlersu"),
-#        ("hlt", "00131953-001", "Nga La"),
-#        ("hlu", "00138426-001", "Hieroglyphic Luwian"),
-#        ("hma", "00131955-001", "Southern Mashan Hmong"),
-#        ("hmb", "00131938-001", "Humburi Senni Songhay"),
-#        ("hmc", "00131960-001", "Central Huishui Hmong"),
-#        ("hmd", "00131959-001", "Large Flowery Miao"),
-#        ("hme", "00131958-001", "Eastern Huishui Hmong"),
-#        ("hmf", "00131957-001", "Hmong Don"),
-#        ("hmg", "00131956-001", "Southwestern Guiyang Hmong"),
-#        ("hmh", "00131946-001", "Southwestern Huishui Hmong"),
-#        ("hmi", "00131954-001", "Northern Huishui Hmong"),
-#        ("hmj", "00131962-001", "Ge"),
-#        ("hmk", "00138253-001", "Maek"),
-#        ("hml", "00131952-001", "Luopohe Hmong"),
-#        ("hmm", "00131951-001", "Central Mashan Hmong"),
-#        ("hmn", "00131001-001", "Hmong"),
-#        ("hmo", "00138523-001", "Hiri Motu"),
-#        ("hmp", "00131950-001", "Northern Mashan Hmong"),
-#        ("hmq", "00131949-001", "Eastern Qiandong Miao"),
-#        ("hmr", "00131948-001", "Hmar"),
-#        ("hms", "00131922-001", "Southern Qiandong Miao"),
-#        ("hmt", "00131961-001", "Hamtai"),
-#        ("hmu", "00131936-001", "Hamap"),
-#        ("hmv", "00131912-001", "Hmong Dô"),
-#        ("hmw", "00131911-001", "Western Mashan Hmong"),
-#        ("hmy", "00131910-001", "Southern Guiyang Hmong"),
-#        ("hmz", "00131909-001", "Hmong Shua"),
-#        ("hna", "00131908-001", "Mina"),
-#        ("hnd", "00131907-001", "Southern Hindko"),
-#        ("hne", "00131898-001", "Chhattisgarhi"),
-#        ("hnh", "00131905-001", "//Ani"),
-#        ("hni", "00131913-001", "Hani"),
-#        ("hnj", "00131903-001", "Hmong Njua"),
-#        ("hnn", "00131902-001", "Hanunoo"),
-#        ("hno", "00131901-001", "Northern Hindko"),
-#        ("hns", "00131900-001", "Caribbean Hindustani"),
-#        ("hnu", "00131920-001", "Hung"),
-#        ("hoa", "00131904-001", "Hoava"),
-#        ("hob", "00131906-001", "Mari"),
-#        ("hoc", "00131928-001", "Ho"),
-#        ("hod", "00138331-001", "Holma"),
-#        ("hoe", "00131927-001", "Horom"),
-#        ("hoh", "00131926-001", "Hobyót"),
-#        ("hoi", "00131925-001", "Holikachuk"),
-#        ("hoj", "00131924-001", "Hadothi"),
-#        ("hol", "00131923-001", "Holu"),
-#        ("hom", "00138308-001", "Homa"),
-#        ("hoo", "00131914-001", "Holoholo"),
-#        ("hop", "00131921-001", "Hopi"),
-#        ("hor", "00138329-001", "Horo"),
-#        ("hos", "00131929-001", "Ho Chi Minh City Sign Language"),
-#        ("hot", "00131919-001", "Hote"),
-#        ("hov", "00131918-001", "Hovongan"),
-#        ("how", "00131917-001", "Honi"),
-#        ("hoy", "00131916-001", "Holiya"),
-#        ("hoz", "00131915-001", "Hozo"),
-#        ("hpo", "00131977-001", "Hpon"),
-#        ("hps", "00132027-001", "Hawai'i Pidgin Sign Language"),
-#        ("hra", "00131947-001", "Hrangkhol"),
-#        ("hre", "00132009-001", "Hre"),
-#        ("hrk", "00132008-001", "Haruku"),
-#        ("hrm", "00132007-001", "Horned Miao"),
-#        ("hro", "00132006-001", "Haroi"),
-#        ("hrr", "00132005-001", "Horuru"),
-#        ("hrt", "00131996-001", "Hértevin"),
-#        ("hru", "00132003-001", "Hruso"),
-#        ("hrv", "00138524-001", "Croatian"),
-#        ("hrx", "00132011-001", "Hunsrik"),
-#        ("hrz", "00132001-001", "Harzani"),
-#        ("hsb", "00132000-001", "Upper Sorbian"),
-#        ("hsh", "00131999-001", "Hungarian Sign Language"),
-#        ("hsl", "00131998-001", "Hausa Sign Language"),
-#        ("hsn", "00131997-001", "Xiang Chinese"),
-#        ("hss", "00132019-001", "Harsusi"),
-#        ("hti", "00132021-001", "Hoti"),
-#        ("hto", "00132004-001", "Minica Huitoto"),
-#        ("hts", "00132026-001", "Hadza"),
-#        ("htu", "00132025-001", "Hitu"),
-#        ("htx", "00138454-001", "Middle Hittite"),
-#        ("hub", "00132024-001", "Huambisa"),
-#        ("huc", "00132023-001", "=/Hua"),
-#        ("hud", "00132022-001", "Huaulu"),
-#        ("hue", "00132012-001", "San Francisco Del Mar Huave"),
-#        ("huf", "00132020-001", "Humene"),
-#        ("hug", "00132028-001", "Huachipaeri"),
-#        ("huh", "00132018-001", "Huilliche"),
-#        ("hui", "00132017-001", "Huli"),
-#        ("huj", "00132016-001", "Northern Guiyang Hmong"),
-#        ("huk", "00132015-001", "Hulung"),
-#        ("hul", "00132014-001", "Hula"),
-#        ("hum", "00132013-001", "Hungana"),
-#        ("hun", "00138526-001", "Hungarian"),
-#        ("huo", "00131994-001", "Hu"),
-#        ("hup", "00131969-001", "Hupa"),
-#        ("huq", "00132002-001", "Tsat"),
-#        ("hur", "00131976-001", "Halkomelem"),
-#        ("hus", "00131975-001", "Huastec"),
-#        ("hut", "00131974-001", "Humla"),
-#        ("huu", "00131973-001", "Murui Huitoto"),
-#        ("huv", "00131972-001", "San Mateo Del Mar Huave"),
-#        ("huw", "00131963-001", "Hukumina"),
-#        ("hux", "00131970-001", "Nüpode Huitoto"),
-#        ("huy", "00131978-001", "Hulaulá"),
-#        ("huz", "00131968-001", "Hunzib"),
-#        ("hvc", "00131967-001", "Haitian Vodoun Culture Language"),
-#        ("hve", "00131966-001", "San Dionisio Del Mar Huave"),
-#        ("hvk", "00131965-001", "Haveke"),
-#        ("hvn", "00131964-001", "Sabu"),
-#        ("hvv", "00131986-001", "Santa María Del Mar Huave"),
-#        ("hwa", "00131988-001", "Wané"),
-#        ("hwc", "00131971-001", "Hawai'i Creole English"),
-#        ("hwo", "00131993-001", "Hwana"),
-#        ("hya", "00131992-001", "Hya"),
-#        ("hye", "00138527-001", "Armenian"),
-#        ("iai", "00131991-001", "Iaai"),
-#        ("ian", "00131990-001", "Iatmul"),
-#        ("iap", "00131989-001", "Iapama"),
-#        ("iar", "00131979-001", "Purari"),
-#        ("iba", "00131987-001", "Iban"),
-#        ("ibb", "00131995-001", "Ibibio"),
-#        ("ibd", "00131985-001", "Iwaidja"),
-#        ("ibe", "00131984-001", "Akpes"),
-#        ("ibg", "00131983-001", "Ibanag"),
-#        ("ibi", "00131982-001", "Ibilo"),
-#        ("ibl", "00131981-001", "Ibaloi"),
-#        ("ibm", "00131980-001", "Agoi"),
-#        ("ibn", "00131879-001", "Ibino"),
-#        ("ibo", "00138532-001", "Igbo"),
-#        ("ibr", "00131768-001", "Ibuoro"),
-#        ("ibu", "00131899-001", "Ibu"),
-#        ("iby", "00131812-001", "Ibani"),
-#        ("ica", "00131811-001", "Ede Ica"),
-#        ("ich", "00131810-001", "Etkywan"),
-#        ("icl", "00131809-001", "Icelandic Sign Language"),
-#        ("icr", "00131808-001", "Islander Creole English"),
-#        ("ida", "00131799-001", "Idakho-Isukha-Tiriki"),
-#        ("idb", "00131806-001", "Indo-Portuguese"),
-#        ("idc", "00131814-001", "Idon"),
-#        ("idd", "00131804-001", "Ede Idaca"),
-#        ("ide", "00131803-001", "Idere"),
-#        ("idi", "00131802-001", "Idi"),
-#        ("ido", "00138535-001", "Ido"),
-#        ("idr", "00131801-001", "Indri"),
-#        ("ids", "00131800-001", "Idesa"),
-#        ("idt", "00131822-001", "Idaté"),
-#        ("idu", "00131824-001", "Idoma"),
-#        ("ifa", "00131807-001", "Amganad Ifugao"),
-#        ("ifb", "00131829-001", "Batad Ifugao"),
-#        ("ife", "00131828-001", "Ifè"),
-#        ("iff", "00138269-001", "Ifo"),
-#        ("ifk", "00131827-001", "Tuwali Ifugao"),
-#        ("ifm", "00131826-001", "Teke-Fuumu"),
-#        ("ifu", "00131825-001", "Mayoyao Ifugao"),
-#        ("ify", "00131815-001", "Keley-I Kallahan"),
-#        ("igb", "00131823-001", "Ebira"),
-#        ("ige", "00131831-001", "Igede"),
-#        ("igg", "00131821-001", "Igana"),
-#        ("igl", "00131820-001", "Igala"),
-#        ("igm", "00131819-001", "Kanggape"),
-#        ("ign", "00131818-001", "Ignaciano"),
-#        ("igo", "00131817-001", "Isebe"),
-#        ("igs", "00138353-001", "Interglossa"),
-#        ("igw", "00131791-001", "Igwe"),
-#        ("ihb", "00131830-001", "Iha Based Pidgin"),
-#        ("ihi", "00131805-001", "Ihievbe"),
-#        ("ihp", "00131781-001", "Iha"),
-#        ("iii", "00138533-001", "Sichuan Yi; Nuosu"),
-#        ("ijc", "00131780-001", "Izon"),
-#        ("ije", "00131779-001", "Biseni"),
-#        ("ijj", "00131778-001", "Ede Ije"),
-#        ("ijn", "00131777-001", "Kalabari"),
-#        ("ijs", "00131776-001", "Southeast Ijo"),
-#        ("ike", "00131767-001", "Eastern Canadian Inuktitut"),
-#        ("iki", "00131774-001", "Iko"),
-#        ("ikk", "00131782-001", "Ika"),
-#        ("ikl", "00131772-001", "Ikulu"),
-#        ("iko", "00131771-001", "Olulumo-Ikom"),
-#        ("ikp", "00131770-001", "Ikpeshi"),
-#        ("ikt", "00131769-001", "Western Canadian Inuktitut"),
-#        ("iku", "00138538-001", "Inuktitut"),
-#        ("ikv", "00131789-001", "Iku-Gora-Ankwa"),
-#        ("ikw", "00131773-001", "Ikwere"),
-#        ("ikx", "00131775-001", "Ik"),
-#        ("ikz", "00131797-001", "Ikizu"),
-#        ("ila", "00131796-001", "Ile Ape"),
-#        ("ilb", "00131795-001", "Ila"),
-#        ("ile", "00138531-001", "Interlingue"),
-#        ("ilg", "00131794-001", "Garig-Ilgar"),
-#        ("ili", "00131793-001", "Ili Turki"),
-#        ("ilk", "00131792-001", "Ilongot"),
-#        ("ill", "00131783-001", "Iranun"),
-#        ("ilo", "00131790-001", "Iloko"),
-#        ("ils", "00131798-001", "International Sign"),
-#        ("ilu", "00131788-001", "Ili'uun"),
-#        ("ilv", "00131787-001", "Ilue"),
-#        ("ilw", "00131786-001", "Talur"),
-#        ("ima", "00131785-001", "Mala Malasar"),
-#        ("ime", "00131784-001", "Imeraguen"),
-#        ("imi", "00131846-001", "Anamgura"),
-#        ("iml", "00137971-001", "Miluk"),
-#        ("imn", "00131896-001", "Imonda"),
-#        ("imo", "00131816-001", "Imbongu"),
-#        ("imr", "00131878-001", "Imroing"),
-#        ("ims", "00138384-001", "Marsian"),
-#        ("imy", "00138386-001", "Milyan"),
-#        ("ina", "00138529-001", "Interlingua"),
-#        ("inb", "00131877-001", "Inga"),
-#        ("ind", "00138530-001", "Indonesian"),
-#        ("ing", "00131876-001", "Degexit'an"),
-#        ("inh", "00131875-001", "Ingush"),
-#        ("inj", "00131874-001", "Jungle Inga"),
-#        ("inl", "00131865-001", "Indonesian Sign Language"),
-#        ("inm", "00138378-001", "Minaean"),
-#        ("inn", "00131872-001", "Isinai"),
-#        ("ino", "00131880-001", "Inoke-Yate"),
-#        ("inp", "00131870-001", "Ińapari"),
-#        ("ins", "00131869-001", "Indian Sign Language"),
-#        ("int", "00131868-001", "Intha"),
-#        ("inz", "00137995-001", "Ineseńo"),
-#        ("ior", "00131867-001", "Inor"),
-#        ("iou", "00131866-001", "Tuma-Irumu"),
-#        ("iow", "00137993-001", "Iowa-Oto"),
-#        ("ipi", "00131888-001", "Ipili"),
-#        ("ipk", "00138534-001", "Inupiaq"),
-#        ("ipo", "00131890-001", "Ipiko"),
-#        ("iqu", "00131873-001", "Iquito"),
-#        ("ire", "00131895-001", "Iresim"),
-#        ("irh", "00131894-001", "Irarutu"),
-#        ("iri", "00131893-001", "Irigwe"),
-#        ("irk", "00131892-001", "Iraqw"),
-#        ("irn", "00131891-001", "Irántxe"),
-#        ("irr", "00131881-001", "Ir"),
-#        ("iru", "00131889-001", "Irula"),
-#        ("irx", "00131897-001", "Kamberau"),
-#        ("iry", "00131887-001", "Iraya"),
-#        ("isa", "00131886-001", "Isabi"),
-#        ("isc", "00131885-001", "Isconahua"),
-#        ("isd", "00131884-001", "Isnag"),
-#        ("ise", "00131883-001", "Italian Sign Language"),
-#        ("isg", "00131882-001", "Irish Sign Language"),
-#        ("ish", "00131863-001", "Esan"),
-#        ("isi", "00131838-001", "Nkem-Nkum"),
-#        ("isl", "00138536-001", "Icelandic"),
-#        ("ism", "00131871-001", "Masimasi"),
-#        ("isn", "00131845-001", "Isanzu"),
-#        ("iso", "00131844-001", "Isoko"),
-#        ("isr", "00131843-001", "Israeli Sign Language"),
-#        ("ist", "00131842-001", "Istriot"),
-#        ("isu", "00131841-001", "Isu"),
-#        ("ita", "00138537-001", "Italian"),
-#        ("itb", "00131832-001", "Binongan Itneg"),
-#        ("ite", "00137932-001", "Itene"),
-#        ("iti", "00131839-001", "Inlaod Itneg"),
-#        ("itk", "00131847-001", "Judeo-Italian"),
-#        ("itl", "00131837-001", "Itelmen"),
-#        ("itm", "00131836-001", "Itu Mbon Uzo"),
-#        ("ito", "00131835-001", "Itonama"),
-#        ("itr", "00131834-001", "Iteri"),
-#        ("its", "00131833-001", "Isekiri"),
-#        ("itt", "00131855-001", "Maeng Itneg"),
-#        ("itv", "00131857-001", "Itawit"),
-#        ("itw", "00131840-001", "Ito"),
-#        ("itx", "00131862-001", "Itik"),
-#        ("ity", "00131861-001", "Moyadan Itneg"),
-#        ("itz", "00131860-001", "Itzá"),
-#        ("ium", "00131859-001", "Iu Mien"),
-#        ("ivb", "00131858-001", "Ibatan"),
-#        ("ivv", "00131848-001", "Ivatan"),
-#        ("iwk", "00131856-001", "I-Wak"),
-#        ("iwm", "00131414-001", "Iwam"),
-#        ("iwo", "00131854-001", "Iwur"),
-#        ("iws", "00131523-001", "Sepik Iwam"),
-#        ("ixc", "00131852-001", "Ixcatec"),
-#        ("ixl", "00131851-001", "Ixil"),
-#        ("iya", "00131850-001", "Iyayu"),
-#        ("iyo", "00131849-001", "Mesaka"),
-#        ("iyx", "00131944-001", "Yaka"),
-#        ("izh", "00131416-001", "Ingrian"),
-#        ("izi", "00131167-001", "Izi-Ezaa-Ikwo-Mgbo"),
-#        ("izr", "00131166-001", "Izere"),
-#        ("jaa", "00131165-001", "Jamamadí"),
-#        ("jab", "00131164-001", "Hyam"),
-#        ("jac", "00131163-001", "Popti'"),
-#        ("jad", "00131162-001", "Jahanka"),
-#        ("jae", "00131153-001", "Yabem"),
-#        ("jaf", "00131160-001", "Jara"),
-#        ("jah", "00131168-001", "Jah Hut"),
-#        ("jaj", "00131158-001", "Zazao"),
-#        ("jak", "00131157-001", "Jakun"),
-#        ("jal", "00131156-001", "Yalahatan"),
-#        ("jam", "00131155-001", "Jamaican Creole English"),
-#        ("jao", "00131175-001", "Yanyuwa"),
-#        ("jaq", "00131159-001", "Yaqay"),
-#        ("jar", "00131161-001", "Jarawa"),
-#        ("jas", "00131183-001", "New Caledonian Javanese"),
-#        ("jat", "00131182-001", "Jakati"),
-#        ("jau", "00131181-001", "Yaur"),
-#        ("jav", "00138540-001", "Javanese"),
-#        ("jax", "00131180-001", "Jambi Malay"),
-#        ("jay", "00131179-001", "Yan-nhangu"),
-#        ("jaz", "00131178-001", "Jawe"),
-#        ("jbe", "00131169-001", "Judeo-Berber"),
-#        ("jbj", "00131176-001", "Arandai"),
-#        ("jbn", "00131184-001", "Nafusi"),
-#        ("jbo", "00138357-001", "Lojban"),
-#        ("jbr", "00131174-001", "Jofotek-Bromnya"),
-#        ("jbt", "00131173-001", "Jabutí"),
-#        ("jbu", "00131172-001", "Jukun Takum"),
-#        ("jcs", "00131171-001", "Jamaican Country Sign Language"),
-#        ("jct", "00131170-001", "Krymchak"),
-#        ("jda", "00131145-001", "Jad"),
-#        ("jdg", "00131122-001", "Jadgali"),
-#        ("jdt", "00131154-001", "Judeo-Tat"),
-#        ("jeb", "00131134-001", "Jebero"),
-#        ("jee", "00131133-001", "Jerung"),
-#        ("jeg", "00131132-001", "Jeng"),
-#        ("jeh", "00131131-001", "Jeh"),
-#        ("jei", "00131130-001", "Yei"),
-#        ("jek", "00131121-001", "Jeri Kuo"),
-#        ("jel", "00131128-001", "Yelmek"),
-#        ("jen", "00131136-001", "Dza"),
-#        ("jer", "00131126-001", "Jere"),
-#        ("jet", "00131125-001", "Manem"),
-#        ("jeu", "00131124-001", "Jonkor Bourmataguil"),
-#        ("jgb", "00138017-001", "Ngbee"),
-#        ("jge", "00131123-001", "Judeo-Georgian"),
-#        ("jgo", "00131143-001", "Ngomba"),
-#        ("jhi", "00131127-001", "Jehai"),
-#        ("jhs", "00131129-001", "Jhankot Sign Language"),
-#        ("jia", "00131151-001", "Jina"),
-#        ("jib", "00131150-001", "Jibu"),
-#        ("jic", "00131149-001", "Tol"),
-#        ("jid", "00131148-001", "Bu"),
-#        ("jie", "00131147-001", "Jilbe"),
-#        ("jig", "00131146-001", "Djingili"),
-#        ("jih", "00131137-001", "Shangzhai"),
-#        ("jii", "00131144-001", "Jiiddu"),
-#        ("jil", "00131152-001", "Jilim"),
-#        ("jim", "00131142-001", "Jimi"),
-#        ("jio", "00131141-001", "Jiamao"),
-#        ("jiq", "00131140-001", "Guanyinqiao"),
-#        ("jit", "00131139-001", "Jita"),
-#        ("jiu", "00131199-001", "Youle Jinuo"),
-#        ("jiv", "00131135-001", "Shuar"),
-#        ("jiy", "00131177-001", "Buyuan Jinuo"),
-#        ("jko", "00131231-001", "Kubo"),
-#        ("jku", "00131230-001", "Labir"),
-#        ("jle", "00131229-001", "Ngile"),
-#        ("jma", "00131228-001", "Dima"),
-#        ("jmb", "00131227-001", "Zumbun"),
-#        ("jmc", "00131226-001", "Machame"),
-#        ("jmd", "00131217-001", "Yamdena"),
-#        ("jmi", "00131224-001", "Jimi"),
-#        ("jml", "00131232-001", "Jumli"),
-#        ("jmn", "00131222-001", "Makuri Naga"),
-#        ("jmr", "00131221-001", "Kamara"),
-#        ("jms", "00131220-001", "Mashi"),
-#        ("jmx", "00131219-001", "Western Juxtlahuaca Mixtec"),
-#        ("jna", "00131239-001", "Jangshung"),
-#        ("jnd", "00131223-001", "Jandavra"),
-#        ("jng", "00138044-001", "Yangman"),
-#        ("jni", "00131225-001", "Janji"),
-#        ("jnj", "00131247-001", "Yemsa"),
-#        ("jnl", "00131246-001", "Rawat"),
-#        ("jns", "00131245-001", "Jaunsari"),
-#        ("job", "00131244-001", "Joba"),
-#        ("jod", "00131243-001", "Wojenaka"),
-#        ("jor", "00138068-001", "Jorá"),
-#        ("jos", "00131242-001", "Jordanian Sign Language"),
-#        ("jow", "00131233-001", "Jowulu"),
-#        ("jpa", "00137863-001", "Jewish Palestinian Aramaic"),
-#        ("jpn", "00138539-001", "Japanese"),
-#        ("jpr", "00131240-001", "Judeo-Persian"),
-#        ("jqr", "00131248-001", "Jaqaru"),
-#        ("jra", "00131238-001", "Jarai"),
-#        ("jrb", "00130988-001", "Judeo-Arabic"),
-#        ("jrr", "00131237-001", "Jiru"),
-#        ("jrt", "00131236-001", "Jorto"),
-#        ("jru", "00131235-001", "Japrería"),
-#        ("jsl", "00131234-001", "Japanese Sign Language"),
-#        ("jua", "00131209-001", "Júma"),
-#        ("jub", "00131186-001", "Wannu"),
-#        ("juc", "00138036-001", "Jurchen"),
-#        ("jud", "00131218-001", "Worodougou"),
-#        ("juh", "00131198-001", "Hőne"),
-#        ("juk", "00131197-001", "Wapan"),
-#        ("jul", "00131196-001", "Jirel"),
-#        ("jum", "00131195-001", "Jumjum"),
-#        ("jun", "00131194-001", "Juang"),
-#        ("juo", "00131185-001", "Jiba"),
-#        ("jup", "00131192-001", "Hupdë"),
-#        ("jur", "00131200-001", "Jurúna"),
-#        ("jus", "00131190-001", "Jumla Sign Language"),
-#        ("jut", "00131189-001", "Jutish"),
-#        ("juu", "00131188-001", "Ju"),
-#        ("juw", "00131187-001", "Wãpha"),
-#        ("juy", "00131207-001", "Juray"),
-#        ("jvd", "00137947-001", "Javindo"),
-#        ("jvn", "00131191-001", "Caribbean Javanese"),
-#        ("jwi", "00131193-001", "Jwira-Pepesa"),
-#        ("jya", "00131215-001", "Jiarong"),
-#        ("jye", "00131214-001", "Judeo-Yemeni Arabic"),
-#        ("jyy", "00131213-001", "Jaya"),
-#        ("kaa", "00131212-001", "Kara-Kalpak"),
-#        ("kab", "00131096-001", "Kabyle"),
-#        ("kac", "00131210-001", "Kachin; Jingpho"),
-#        ("kad", "00131138-001", "Kadara"),
-#        ("kae", "00137986-001", "Ketangalan"),
-#        ("kaf", "00131208-001", "Katso"),
-#        ("kag", "00131216-001", "Kajaman"),
-#        ("kah", "00131206-001", "Kara"),
-#        ("kai", "00131205-001", "Karekare"),
-#        ("kaj", "00131204-001", "Jju"),
-#        ("kak", "00131203-001", "Kayapa Kallahan"),
-#        ("kal", "00138546-001", "Greenlandic; Kalaallisut"),
-#        ("kam", "00131202-001", "Kamba"),
-#        ("kan", "00138548-001", "Kannada"),
-#        ("kao", "00131241-001", "Xaasongaxango"),
-#        ("kap", "00131098-001", "Bezhta"),
-#        ("kaq", "00131024-001", "Capanahua"),
-#        ("kas", "00138551-001", "Kashmiri"),
-#        ("kat", "00138541-001", "Georgian"),
-#        ("kau", "00138550-001", "Kanuri"),
-#        ("kav", "00131025-001", "Katukína"),
-#        ("kaw", "00138367-001", "Kawi"),
-#        ("kax", "00131026-001", "Kao"),
-#        ("kay", "00131027-001", "Kamayurá"),
-#        ("kaz", "00138545-001", "Kazakh"),
-#        ("kba", "00137996-001", "Kalarko"),
-#        ("kbb", "00137959-001", "Kaxuiâna"),
-#        ("kbc", "00131028-001", "Kadiwéu"),
-#        ("kbd", "00131029-001", "Kabardian"),
-#        ("kbe", "00131030-001", "Kanju"),
-#        ("kbf", "00137965-001", "Kakauhua"),
-#        ("kbg", "00131031-001", "Khamba"),
-#        ("kbh", "00131032-001", "Camsá"),
-#        ("kbi", "00131033-001", "Kaptiau"),
-#        ("kbj", "00131034-001", "Kari"),
-#        ("kbk", "00131035-001", "Grass Koiari"),
-#        ("kbl", "00131051-001", "Kanembu"),
-#        ("kbm", "00131037-001", "Iwal"),
-#        ("kbn", "00131023-001", "Kare"),
-#        ("kbo", "00131039-001", "Keliko"),
-#        ("kbp", "00131040-001", "Kabiyé"),
-#        ("kbq", "00131041-001", "Kamano"),
-#        ("kbr", "00131042-001", "Kafa"),
-#        ("kbs", "00131043-001", "Kande"),
-#        ("kbt", "00131044-001", "Abadi"),
-#        ("kbu", "00131020-001", "Kabutra"),
-#        ("kbv", "00131046-001", "Dera"),
-#        ("kbw", "00131036-001", "Kaiep"),
-#        ("kbx", "00131047-001", "Ap Ma"),
-#        ("kby", "00131048-001", "Manga Kanuri"),
-#        ("kbz", "00131049-001", "Duhwa"),
-#        ("kca", "00131050-001", "Khanty"),
-#        ("kcb", "00131038-001", "Kawacha"),
-#        ("kcc", "00131008-001", "Lubila"),
-#        ("kcd", "00131003-001", "Ngkâlmpw Kanum"),
-#        ("kce", "00131006-001", "Kaivi"),
-#        ("kcf", "00131011-001", "Ukaan"),
-#        ("kcg", "00131012-001", "Tyap"),
-#        ("kch", "00131014-001", "Vono"),
-#        ("kci", "00131015-001", "Kamantan"),
-#        ("kcj", "00131016-001", "Kobiana"),
-#        ("kck", "00131021-001", "Kalanga"),
-#        ("kcl", "00131019-001", "Kela"),
-#        ("kcm", "00131018-001", "Gula"),
-#        ("kcn", "00131017-001", "Nubi"),
-#        ("kco", "00131013-001", "Kinalakna"),
-#        ("kcp", "00131022-001", "Kanga"),
-#        ("kcq", "00131004-001", "Kamo"),
-#        ("kcr", "00131005-001", "Katla"),
-#        ("kcs", "00131010-001", "Koenoem"),
-#        ("kct", "00131007-001", "Kaian"),
-#        ("kcu", "00131009-001", "Kami"),
-#        ("kcv", "00131104-001", "Kete"),
-#        ("kcw", "00131101-001", "Kabwari"),
-#        ("kcx", "00131100-001", "Kachama-Ganjule"),
-#        ("kcy", "00131099-001", "Korandje"),
-#        ("kcz", "00131053-001", "Konongo"),
-#        ("kda", "00138263-001", "Worimi"),
-#        ("kdc", "00131097-001", "Kutu"),
-#        ("kdd", "00131045-001", "Yankunytjatjara"),
-#        ("kde", "00131086-001", "Makonde"),
-#        ("kdf", "00131094-001", "Mamusi"),
-#        ("kdg", "00131102-001", "Seba"),
-#        ("kdh", "00131092-001", "Tem"),
-#        ("kdi", "00131091-001", "Kumam"),
-#        ("kdj", "00131090-001", "Karamojong"),
-#        ("kdk", "00131089-001", "Numee"),
-#        ("kdl", "00131088-001", "Tsikimba"),
-#        ("kdm", "00131087-001", "Kagoma"),
-#        ("kdn", "00131110-001", "Kunda"),
-#        ("kdp", "00131112-001", "Kaningdon-Nindem"),
-#        ("kdq", "00131095-001", "Koch"),
-#        ("kdr", "00131118-001", "Karaim"),
-#        ("kdt", "00131117-001", "Kuy"),
-#        ("kdu", "00131116-001", "Kadaru"),
-#        ("kdv", "00131115-001", "Kado"),
-#        ("kdw", "00131114-001", "Koneraw"),
-#        ("kdx", "00131113-001", "Kam"),
-#        ("kdy", "00131103-001", "Keder"),
-#        ("kdz", "00131111-001", "Kwaja"),
-#        ("kea", "00131120-001", "Kabuverdianu"),
-#        ("keb", "00131109-001", "Kélé"),
-#        ("kec", "00131108-001", "Keiga"),
-#        ("ked", "00131107-001", "Kerewe"),
-#        ("kee", "00131106-001", "Eastern Keres"),
-#        ("kef", "00131105-001", "Kpessi"),
-#        ("keg", "00131078-001", "Tese"),
-#        ("keh", "00131119-001", "Keak"),
-#        ("kei", "00131093-001", "Kei"),
-#        ("kej", "00131067-001", "Kadar"),
-#        ("kek", "00131066-001", "Kekchí"),
-#        ("kel", "00131065-001", "Kela"),
-#        ("kem", "00131064-001", "Kemak"),
-#        ("ken", "00131063-001", "Kenyang"),
-#        ("keo", "00131062-001", "Kakwa"),
-#        ("kep", "00131052-001", "Kaikadi"),
-#        ("keq", "00131060-001", "Kamar"),
-#        ("ker", "00131068-001", "Kera"),
-#        ("kes", "00131058-001", "Kugbo"),
-#        ("ket", "00131057-001", "Ket"),
-#        ("keu", "00131056-001", "Akebu"),
-#        ("kev", "00131055-001", "Kanikkaran"),
-#        ("kew", "00131054-001", "West Kewa"),
-#        ("kex", "00131076-001", "Kukna"),
-#        ("key", "00131059-001", "Kupia"),
-#        ("kez", "00131061-001", "Kukele"),
-#        ("kfa", "00131084-001", "Kodava"),
-#        ("kfb", "00131083-001", "Northwestern Kolami"),
-#        ("kfc", "00131082-001", "Konda-Dora"),
-#        ("kfd", "00131081-001", "Korra Koraga"),
-#        ("kfe", "00131080-001", "Kota"),
-#        ("kff", "00131079-001", "Koya"),
-#        ("kfg", "00131069-001", "Kudiya"),
-#        ("kfh", "00131077-001", "Kurichiya"),
-#        ("kfi", "00131085-001", "Kannada Kurumba"),
-#        ("kfj", "00131075-001", "Kemiehua"),
-#        ("kfk", "00131074-001", "Kinnauri"),
-#        ("kfl", "00131073-001", "Kung"),
-#        ("kfm", "00131072-001", "Khunsari"),
-#        ("kfn", "00131071-001", "Kuk"),
-#        ("kfo", "00131070-001", "Koro"),
-#        ("kfp", "00131201-001", "Korwa"),
-#        ("kfq", "00131458-001", "Korku"),
-#        ("kfr", "00131423-001", "Kachchi"),
-#        ("kfs", "00131422-001", "Bilaspuri"),
-#        ("kft", "00131421-001", "Kanjari"),
-#        ("kfu", "00131420-001", "Katkari"),
-#        ("kfv", "00131419-001", "Kurmukar"),
-#        ("kfw", "00131418-001", "Kharam Naga"),
-#        ("kfx", "00131409-001", "Kullu Pahari"),
-#        ("kfy", "00131266-001", "Kumaoni"),
-#        ("kfz", "00131424-001", "Koromfé"),
-#        ("kga", "00131211-001", "Koyaga"),
-#        ("kgb", "00131413-001", "Kawe"),
-#        ("kgc", "00131412-001", "Kasseng"),
-#        ("kgd", "00131411-001", "Kataang"),
-#        ("kge", "00131431-001", "Komering"),
-#        ("kgf", "00131415-001", "Kube"),
-#        ("kgg", "00138048-001", "Kusunda"),
-#        ("kgh", "00131417-001", "Upper Tanudan Kalinga"),
-#        ("kgi", "00131439-001", "Selangor Sign Language"),
-#        ("kgj", "00131438-001", "Gamale Kham"),
-#        ("kgk", "00131437-001", "Kaiwá"),
-#        ("kgl", "00131436-001", "Kunggari"),
-#        ("kgm", "00138046-001", "Karipúna"),
-#        ("kgn", "00131435-001", "Karingani"),
-#        ("kgo", "00131434-001", "Krongo"),
-#        ("kgp", "00131425-001", "Kaingang"),
-#        ("kgq", "00131432-001", "Kamoro"),
-#        ("kgr", "00131440-001", "Abun"),
-#        ("kgs", "00131430-001", "Kumbainggar"),
-#        ("kgt", "00131429-001", "Somyev"),
-#        ("kgu", "00131428-001", "Kobol"),
-#        ("kgv", "00131427-001", "Karas"),
-#        ("kgw", "00131426-001", "Karon Dori"),
-#        ("kgx", "00131401-001", "Kamaru"),
-#        ("kgy", "00131378-001", "Kyerung"),
-#        ("kha", "00131410-001", "Khasi"),
-#        ("khb", "00131390-001", "Lü"),
-#        ("khc", "00131389-001", "Tukang Besi North"),
-#        ("khd", "00131388-001", "Bädi Kanum"),
-#        ("khe", "00131387-001", "Korowai"),
-#        ("khf", "00131386-001", "Khuen"),
-#        ("khg", "00131377-001", "Khams Tibetan"),
-#        ("khh", "00131384-001", "Kehu"),
-#        ("khj", "00131392-001", "Kuturmi"),
-#        ("khk", "00131382-001", "Halh Mongolian"),
-#        ("khl", "00131381-001", "Lusi"),
-#        ("khm", "00138547-001", "Central Khmer"),
-#        ("khn", "00131380-001", "Khandesi"),
-#        ("kho", "00138453-001", "Khotanese; Sakan"),
-#        ("khp", "00131379-001", "Kapori"),
-#        ("khq", "00131399-001", "Koyra Chiini Songhay"),
-#        ("khr", "00131383-001", "Kharia"),
-#        ("khs", "00131385-001", "Kasua"),
-#        ("kht", "00131407-001", "Khamti"),
-#        ("khu", "00131406-001", "Nkhumbi"),
-#        ("khv", "00131405-001", "Khvarshi"),
-#        ("khw", "00131404-001", "Khowar"),
-#        ("khx", "00131403-001", "Kanu"),
-#        ("khy", "00131402-001", "Kele"),
-#        ("khz", "00131393-001", "Keapara"),
-#        ("kia", "00131400-001", "Kim"),
-#        ("kib", "00131408-001", "Koalib"),
-#        ("kic", "00131398-001", "Kickapoo"),
-#        ("kid", "00131397-001", "Koshin"),
-#        ("kie", "00131396-001", "Kibet"),
-#        ("kif", "00131395-001", "Eastern Parbate Kham"),
-#        ("kig", "00131394-001", "Kimaama"),
-#        ("kih", "00131442-001", "Kilmeri"),
-#        ("kii", "00138101-001", "Kitsai"),
-#        ("kij", "00131490-001", "Kilivila"),
-#        ("kik", "00138543-001", "Kikuyu; Gikuyu"),
-#        ("kil", "00131433-001", "Kariya"),
-#        ("kim", "00131486-001", "Karagas"),
-#        ("kin", "00138601-001", "Kinyarwanda; Rwanda"),
-#        ("kio", "00131485-001", "Kiowa"),
-#        ("kip", "00131484-001", "Sheshi Kham"),
-#        ("kiq", "00131483-001", "Kosadle"),
-#        ("kir", "00138555-001", "Kyrgyz; Kirghiz"),
-#        ("kis", "00131482-001", "Kis"),
-#        ("kit", "00131473-001", "Agob"),
-#        ("kiu", "00131480-001", "Kirmanjki"),
-#        ("kiv", "00131488-001", "Kimbu"),
-#        ("kiw", "00131478-001", "Northeast Kiwai"),
-#        ("kix", "00131477-001", "Khiamniungan Naga"),
-#        ("kiy", "00131476-001", "Kirikiri"),
-#        ("kiz", "00131475-001", "Kisi"),
-#        ("kja", "00131474-001", "Mlap"),
-#        ("kjb", "00131496-001", "Q'anjob'al"),
-#        ("kjc", "00131498-001", "Coastal Konjo"),
-#        ("kjd", "00131481-001", "Southern Kiwai"),
-#        ("kje", "00131503-001", "Kisar"),
-#        ("kjf", "00131502-001", "Khalaj"),
-#        ("kjg", "00131501-001", "Khmu"),
-#        ("kjh", "00131500-001", "Khakas"),
-#        ("kji", "00131499-001", "Zabana"),
-#        ("kjj", "00131489-001", "Khinalugh"),
-#        ("kjk", "00131497-001", "Highland Konjo"),
-#        ("kjl", "00131505-001", "Western Parbate Kham"),
-#        ("kjm", "00131495-001", "Kháng"),
-#        ("kjn", "00131494-001", "Kunjen"),
-#        ("kjo", "00131493-001", "Harijan Kinnauri"),
-#        ("kjp", "00131492-001", "Pwo Eastern Karen"),
-#        ("kjq", "00131491-001", "Western Keres"),
-#        ("kjr", "00131465-001", "Kurudu"),
-#        ("kjs", "00131504-001", "East Kewa"),
-#        ("kjt", "00131479-001", "Phrae Pwo Karen"),
-#        ("kju", "00131455-001", "Kashaya"),
-#        ("kjx", "00131454-001", "Ramopa"),
-#        ("kjy", "00131453-001", "Erave"),
-#        ("kjz", "00131452-001", "Bumthangkha"),
-#        ("kka", "00131451-001", "Kakanda"),
-#        ("kkb", "00131450-001", "Kwerisa"),
-#        ("kkc", "00131441-001", "Odoodee"),
-#        ("kkd", "00131448-001", "Kinuku"),
-#        ("kke", "00131456-001", "Kakabe"),
-#        ("kkf", "00131446-001", "Kalaktang Monpa"),
-#        ("kkg", "00131445-001", "Mabaka Valley Kalinga"),
-#        ("kkh", "00131444-001", "Khün"),
-#        ("kki", "00131443-001", "Kagulu"),
-#        ("kkj", "00131463-001", "Kako"),
-#        ("kkk", "00131447-001", "Kokota"),
-#        ("kkl", "00131449-001", "Kosarek Yale"),
-#        ("kkm", "00131471-001", "Kiong"),
-#        ("kkn", "00131470-001", "Kon Keu"),
-#        ("kko", "00131469-001", "Karko"),
-#        ("kkp", "00131468-001", "Gugubera"),
-#        ("kkq", "00131467-001", "Kaiku"),
-#        ("kkr", "00131466-001", "Kir-Balar"),
-#        ("kks", "00131457-001", "Giiwo"),
-#        ("kkt", "00131464-001", "Koi"),
-#        ("kku", "00131472-001", "Tumi"),
-#        ("kkv", "00131462-001", "Kangean"),
-#        ("kkw", "00131461-001", "Teke-Kukuya"),
-#        ("kkx", "00131460-001", "Kohin"),
-#        ("kky", "00131459-001", "Guguyimidjir"),
-#        ("kkz", "00131369-001", "Kaska"),
-#        ("kla", "00131487-001", "Klamath-Modoc"),
-#        ("klb", "00131391-001", "Kiliwa"),
-#        ("klc", "00131295-001", "Kolbila"),
-#        ("kld", "00131294-001", "Gamilaraay"),
-#        ("kle", "00131293-001", "Kulung"),
-#        ("klf", "00131292-001", "Kendeje"),
-#        ("klg", "00131291-001", "Tagakaulu Kalagan"),
-#        ("klh", "00131290-001", "Weliki"),
-#        ("kli", "00131281-001", "Kalumpang"),
-#        ("klj", "00131288-001", "Turkic Khalaj"),
-#        ("klk", "00131296-001", "Kono"),
-#        ("kll", "00131286-001", "Kagan Kalagan"),
-#        ("klm", "00131285-001", "Kolom"),
-#        ("kln", "00130984-001", "Kalenjin"),
-#        ("klo", "00131284-001", "Kapya"),
-#        ("klp", "00131283-001", "Kamasa"),
-#        ("klq", "00131303-001", "Rumu"),
-#        ("klr", "00131287-001", "Khaling"),
-#        ("kls", "00131289-001", "Kalasha"),
-#        ("klt", "00131311-001", "Nukna"),
-#        ("klu", "00131310-001", "Klao"),
-#        ("klv", "00131309-001", "Maskelynes"),
-#        ("klw", "00131308-001", "Lindu"),
-#        ("klx", "00131307-001", "Koluwawa"),
-#        ("kly", "00131306-001", "Kalao"),
-#        ("klz", "00131297-001", "Kabola"),
-#        ("kma", "00131304-001", "Konni"),
-#        ("kmb", "00131312-001", "Kimbundu"),
-#        ("kmc", "00131302-001", "Southern Dong"),
-#        ("kmd", "00131301-001", "Madukayang Kalinga"),
-#        ("kme", "00131300-001", "Bakole"),
-#        ("kmf", "00131299-001", "Kare"),
-#        ("kmg", "00131298-001", "Kâte"),
-#        ("kmh", "00131273-001", "Kalam"),
-#        ("kmi", "00131250-001", "Kami"),
-#        ("kmj", "00131282-001", "Kumarbhag Paharia"),
-#        ("kmk", "00131262-001", "Limos Kalinga"),
-#        ("kml", "00131261-001", "Lower Tanudan Kalinga"),
-#        ("kmm", "00131260-001", "Kom"),
-#        ("kmn", "00131259-001", "Awtuw"),
-#        ("kmo", "00131258-001", "Kwoma"),
-#        ("kmp", "00131249-001", "Gimme"),
-#        ("kmq", "00131256-001", "Kwama"),
-#        ("kmr", "00131264-001", "Northern Kurdish"),
-#        ("kms", "00131254-001", "Kamasau"),
-#        ("kmt", "00131253-001", "Kemtuik"),
-#        ("kmu", "00131252-001", "Kanite"),
-#        ("kmv", "00131251-001", "Karipúna Creole French"),
-#        ("kmw", "00131271-001", "Komo"),
-#        ("kmx", "00131255-001", "Waboda"),
-#        ("kmy", "00131257-001", "Koma"),
-#        ("kmz", "00131279-001", "Khorasani Turkish"),
-#        ("kna", "00131278-001", "Dera"),
-#        ("knb", "00131277-001", "Lubuagan Kalinga"),
-#        ("knc", "00131276-001", "Central Kanuri"),
-#        ("knd", "00131275-001", "Konda"),
-#        ("kne", "00131274-001", "Kankanaey"),
-#        ("knf", "00131265-001", "Mankanya"),
-#        ("kng", "00131272-001", "Koongo"),
-#        ("kni", "00131280-001", "Kanufi"),
-#        ("knj", "00131270-001", "Western Kanjobal"),
-#        ("knk", "00131269-001", "Kuranko"),
-#        ("knl", "00131268-001", "Keninjal"),
-#        ("knm", "00131267-001", "Kanamarí"),
-#        ("knn", "00131327-001", "Konkani"),
-#        ("kno", "00131263-001", "Kono"),
-#        ("knp", "00131305-001", "Kwanja"),
-#        ("knq", "00131359-001", "Kintaq"),
-#        ("knr", "00131358-001", "Kaningra"),
-#        ("kns", "00131357-001", "Kensiu"),
-#        ("knt", "00131356-001", "Panoan Katukína"),
-#        ("knu", "00131355-001", "Kono"),
-#        ("knv", "00131354-001", "Tabo"),
-#        ("knw", "00131345-001", "Kung-Ekoka"),
-#        ("knx", "00131352-001", "Kendayan"),
-#        ("kny", "00131360-001", "Kanyok"),
-#        ("knz", "00131350-001", "Kalamsé"),
-#        ("koa", "00131349-001", "Konomala"),
-#        ("koc", "00138168-001", "Kpati"),
-#        ("kod", "00131348-001", "Kodi"),
-#        ("koe", "00131347-001", "Kacipo-Balesi"),
-#        ("kof", "00138173-001", "Kubi"),
-#        ("kog", "00131367-001", "Cogui"),
-#        ("koh", "00131351-001", "Koyo"),
-#        ("koi", "00131353-001", "Komi-Permyak"),
-#        ("koj", "00131375-001", "Sara Dunjo"),
-#        ("kok", "00130991-001", "Konkani"),
-#        ("kol", "00131374-001", "Kol"),
-#        ("kom", "00138553-001", "Komi"),
-#        ("kon", "00138542-001", "Kongo"),
-#        ("koo", "00131373-001", "Konzo"),
-#        ("kop", "00131372-001", "Kwato"),
-#        ("koq", "00131371-001", "Kota"),
-#        ("kor", "00138549-001", "Korean"),
-#        ("kos", "00131370-001", "Kosraean"),
-#        ("kot", "00131361-001", "Lagwan"),
-#        ("kou", "00131368-001", "Koke"),
-#        ("kov", "00131376-001", "Kudu-Camo"),
-#        ("kow", "00131366-001", "Kugama"),
-#        ("kox", "00138220-001", "Coxima"),
-#        ("koy", "00131365-001", "Koyukon"),
-#        ("koz", "00131364-001", "Korak"),
-#        ("kpa", "00131363-001", "Kutto"),
-#        ("kpb", "00131362-001", "Mullu Kurumba"),
-#        ("kpc", "00131337-001", "Curripaco"),
-#        ("kpd", "00131314-001", "Koba"),
-#        ("kpe", "00130983-001", "Kpelle"),
-#        ("kpf", "00131346-001", "Komba"),
-#        ("kpg", "00131326-001", "Kapingamarangi"),
-#        ("kph", "00131325-001", "Kplang"),
-#        ("kpi", "00131324-001", "Kofei"),
-#        ("kpj", "00131323-001", "Karajá"),
-#        ("kpk", "00131322-001", "Kpan"),
-#        ("kpl", "00131313-001", "Kpala"),
-#        ("kpm", "00131320-001", "Koho"),
-#        ("kpn", "00138180-001", "Kepkiriwát"),
-#        ("kpo", "00131328-001", "Ikposo"),
-#        ("kpp", "00131318-001", "Paku Karen"),
-#        ("kpq", "00131317-001", "Korupun-Sela"),
-#        ("kpr", "00131316-001", "Korafe-Yegha"),
-#        ("kps", "00131315-001", "Tehit"),
-#        ("kpt", "00131335-001", "Karata"),
-#        ("kpu", "00131319-001", "Kafoa"),
-#        ("kpv", "00131321-001", "Komi-Zyrian"),
-#        ("kpw", "00131343-001", "Kobon"),
-#        ("kpx", "00131342-001", "Mountain Koiali"),
-#        ("kpy", "00131341-001", "Koryak"),
-#        ("kpz", "00131340-001", "Kupsabiny"),
-#        ("kqa", "00131339-001", "Mum"),
-#        ("kqb", "00131338-001", "Kovai"),
-#        ("kqc", "00131329-001", "Doromu-Koki"),
-#        ("kqd", "00131336-001", "Koy Sanjaq Surat"),
-#        ("kqe", "00131344-001", "Kalagan"),
-#        ("kqf", "00131334-001", "Kakabai"),
-#        ("kqg", "00131333-001", "Khe"),
-#        ("kqh", "00131332-001", "Kisankasa"),
-#        ("kqi", "00131331-001", "Koitabu"),
-#        ("kqj", "00131330-001", "Koromira"),
-#        ("kqk", "00131853-001", "Kotafon Gbe"),
-#        ("kql", "00133024-001", "Kyenele"),
-#        ("kqm", "00132727-001", "Khisa"),
-#        ("kqn", "00132726-001", "Kaonde"),
-#        ("kqo", "00132725-001", "Eastern Krahn"),
-#        ("kqp", "00132724-001", "Kimré"),
-#        ("kqq", "00132723-001", "Krenak"),
-#        ("kqr", "00132205-001", "Kimaragang"),
-#        ("kqs", "00132713-001", "Northern Kissi"),
-#        ("kqt", "00131864-001", "Klias River Kadazan"),
-#        ("kqu", "00138334-001", "Seroa"),
-#        ("kqv", "00132728-001", "Okolod"),
-#        ("kqw", "00132718-001", "Kandas"),
-#        ("kqx", "00132717-001", "Mser"),
-#        ("kqy", "00132716-001", "Koorete"),
-#        ("kqz", "00138304-001", "Korana"),
-#        ("kra", "00132715-001", "Kumhali"),
-#        ("krb", "00138265-001", "Karkin"),
-#        ("krc", "00132714-001", "Karachay-Balkar"),
-#        ("krd", "00132736-001", "Kairui-Midiki"),
-#        ("kre", "00132738-001", "Panará"),
-#        ("krf", "00132721-001", "Koro"),
-#        ("krh", "00132743-001", "Kurama"),
-#        ("kri", "00132742-001", "Krio"),
-#        ("krj", "00132741-001", "Kinaray-A"),
-#        ("krk", "00132740-001", "Kerek"),
-#        ("krl", "00132739-001", "Karelian"),
-#        ("krm", "00132729-001", "Krim"),
-#        ("krn", "00132737-001", "Sapo"),
-#        ("krp", "00132745-001", "Korop"),
-#        ("krr", "00132735-001", "Kru'ng 2"),
-#        ("krs", "00132734-001", "Gbaya"),
-#        ("krt", "00132733-001", "Tumari Kanuri"),
-#        ("kru", "00132732-001", "Kurukh"),
-#        ("krv", "00132731-001", "Kavet"),
-#        ("krw", "00132705-001", "Western Krahn"),
-#        ("krx", "00132744-001", "Karon"),
-#        ("kry", "00132719-001", "Kryts"),
-#        ("krz", "00132695-001", "Sota Kanum"),
-#        ("ksa", "00132694-001", "Shuwa-Zamani"),
-#        ("ksb", "00132693-001", "Shambala"),
-#        ("ksc", "00132692-001", "Southern Kalinga"),
-#        ("ksd", "00132691-001", "Kuanua"),
-#        ("kse", "00132690-001", "Kuni"),
-#        ("ksf", "00132681-001", "Bafia"),
-#        ("ksg", "00132688-001", "Kusaghe"),
-#        ("ksh", "00132696-001", "Kölsch"),
-#        ("ksi", "00132686-001", "Krisa"),
-#        ("ksj", "00132685-001", "Uare"),
-#        ("ksk", "00132684-001", "Kansa"),
-#        ("ksl", "00132683-001", "Kumalu"),
-#        ("ksm", "00132703-001", "Kumba"),
-#        ("ksn", "00132687-001", "Kasiguranin"),
-#        ("kso", "00132689-001", "Kofa"),
-#        ("ksp", "00132711-001", "Kaba"),
-#        ("ksq", "00132710-001", "Kwaami"),
-#        ("ksr", "00132709-001", "Borong"),
-#        ("kss", "00132708-001", "Southern Kisi"),
-#        ("kst", "00132707-001", "Winyé"),
-#        ("ksu", "00132706-001", "Khamyang"),
-#        ("ksv", "00132697-001", "Kusu"),
-#        ("ksw", "00132704-001", "S'gaw Karen"),
-#        ("ksx", "00132712-001", "Kedang"),
-#        ("ksy", "00132702-001", "Kharia Thar"),
-#        ("ksz", "00132701-001", "Kodaku"),
-#        ("kta", "00132700-001", "Katua"),
-#        ("ktb", "00132699-001", "Kambaata"),
-#        ("ktc", "00132698-001", "Kholok"),
-#        ("ktd", "00132760-001", "Kokata"),
-#        ("kte", "00132810-001", "Nubri"),
-#        ("ktf", "00132730-001", "Kwami"),
-#        ("ktg", "00137941-001", "Kalkutung"),
-#        ("kth", "00132792-001", "Karanga"),
-#        ("kti", "00132791-001", "North Muyu"),
-#        ("ktj", "00132790-001", "Plapo Krumen"),
-#        ("ktk", "00137931-001", "Kaniet"),
-#        ("ktl", "00132789-001", "Koroshi"),
-#        ("ktm", "00132788-001", "Kurti"),
-#        ("ktn", "00132779-001", "Karitiâna"),
-#        ("kto", "00132786-001", "Kuot"),
-#        ("ktp", "00132794-001", "Kaduo"),
-#        ("ktq", "00137990-001", "Katabaga"),
-#        ("ktr", "00132784-001", "Kota Marudu Tinagas"),
-#        ("kts", "00132783-001", "South Muyu"),
-#        ("ktt", "00132782-001", "Ketum"),
-#        ("ktu", "00132781-001", "Kituba"),
-#        ("ktv", "00132780-001", "Eastern Katu"),
-#        ("ktw", "00137992-001", "Kato"),
-#        ("ktx", "00132802-001", "Kaxararí"),
-#        ("kty", "00132804-001", "Kango"),
-#        ("ktz", "00132787-001", "Ju/'hoan"),
-#        ("kua", "00138544-001", "Kuanyama; Kwanyama"),
-#        ("kub", "00132809-001", "Kutep"),
-#        ("kuc", "00132808-001", "Kwinsu"),
-#        ("kud", "00132807-001", "'Auhelawa"),
-#        ("kue", "00132806-001", "Kuman"),
-#        ("kuf", "00132805-001", "Western Katu"),
-#        ("kug", "00132795-001", "Kupa"),
-#        ("kuh", "00132803-001", "Kushi"),
-#        ("kui", "00132811-001", "Kuikúro-Kalapálo"),
-#        ("kuj", "00132801-001", "Kuria"),
-#        ("kuk", "00132800-001", "Kepo'"),
-#        ("kul", "00132799-001", "Kulere"),
-#        ("kum", "00132798-001", "Kumyk"),
-#        ("kun", "00132797-001", "Kunama"),
-#        ("kuo", "00132796-001", "Kumukio"),
-#        ("kup", "00132777-001", "Kunimaipa"),
-#        ("kuq", "00132752-001", "Karipuna"),
-#        ("kur", "00138552-001", "Kurdish"),
-#        ("kus", "00132785-001", "Kusaal"),
-#        ("kut", "00132759-001", "Kutenai"),
-#        ("kuu", "00132758-001", "Upper Kuskokwim"),
-#        ("kuv", "00132757-001", "Kur"),
-#        ("kuw", "00132756-001", "Kpagua"),
-#        ("kux", "00132755-001", "Kukatja"),
-#        ("kuy", "00132746-001", "Kuuku-Ya'u"),
-#        ("kuz", "00138066-001", "Kunza"),
-#        ("kva", "00132753-001", "Bagvalal"),
-#        ("kvb", "00132761-001", "Kubu"),
-#        ("kvc", "00132751-001", "Kove"),
-#        ("kvd", "00132750-001", "Kui"),
-#        ("kve", "00132749-001", "Kalabakan"),
-#        ("kvf", "00132748-001", "Kabalai"),
-#        ("kvg", "00132747-001", "Kuni-Boazi"),
-#        ("kvh", "00132769-001", "Komodo"),
-#        ("kvi", "00132771-001", "Kwang"),
-#        ("kvj", "00132754-001", "Psikye"),
-#        ("kvk", "00132776-001", "Korean Sign Language"),
-#        ("kvl", "00132775-001", "Brek Karen"),
-#        ("kvm", "00132774-001", "Kendem"),
-#        ("kvn", "00132773-001", "Border Kuna"),
-#        ("kvo", "00132772-001", "Dobel"),
-#        ("kvp", "00132762-001", "Kompane"),
-#        ("kvq", "00132770-001", "Geba Karen"),
-#        ("kvr", "00132778-001", "Kerinci"),
-#        ("kvs", "00132768-001", "Kunggara"),
-#        ("kvt", "00132767-001", "Lahta Karen"),
-#        ("kvu", "00132766-001", "Yinbaw Karen"),
-#        ("kvv", "00132765-001", "Kola"),
-#        ("kvw", "00132764-001", "Wersing"),
-#        ("kvx", "00132665-001", "Parkari Koli"),
-#        ("kvy", "00132793-001", "Yintale Karen"),
-#        ("kvz", "00132682-001", "Tsakwambo"),
-#        ("kwa", "00132597-001", "Dâw"),
-#        ("kwb", "00132596-001", "Kwa"),
-#        ("kwc", "00132595-001", "Likwala"),
-#        ("kwd", "00132594-001", "Kwaio"),
-#        ("kwe", "00132593-001", "Kwerba"),
-#        ("kwf", "00132592-001", "Kwara'ae"),
-#        ("kwg", "00132583-001", "Sara Kaba Deme"),
-#        ("kwh", "00132590-001", "Kowiai"),
-#        ("kwi", "00132598-001", "Awa-Cuaiquer"),
-#        ("kwj", "00132588-001", "Kwanga"),
-#        ("kwk", "00132587-001", "Kwakiutl"),
-#        ("kwl", "00132586-001", "Kofyar"),
-#        ("kwm", "00132585-001", "Kwambi"),
-#        ("kwn", "00132584-001", "Kwangali"),
-#        ("kwo", "00132606-001", "Kwomtari"),
-#        ("kwp", "00132608-001", "Kodia"),
-#        ("kwq", "00132591-001", "Kwak"),
-#        ("kwr", "00132613-001", "Kwer"),
-#        ("kws", "00132612-001", "Kwese"),
-#        ("kwt", "00132611-001", "Kwesten"),
-#        ("kwu", "00132610-001", "Kwakum"),
-#        ("kwv", "00132609-001", "Sara Kaba Náà"),
-#        ("kww", "00132599-001", "Kwinti"),
-#        ("kwx", "00132607-001", "Khirwar"),
-#        ("kwy", "00132615-001", "San Salvador Kongo"),
-#        ("kwz", "00138086-001", "Kwadi"),
-#        ("kxa", "00132605-001", "Kairiru"),
-#        ("kxb", "00132604-001", "Krobu"),
-#        ("kxc", "00132603-001", "Konso"),
-#        ("kxd", "00132602-001", "Brunei"),
-#        ("kxe", "00132601-001", "Kakihum"),
-#        ("kxf", "00132575-001", "Manumanaw Karen"),
-#        ("kxh", "00132614-001", "Karo"),
-#        ("kxi", "00132589-001", "Keningau Murut"),
-#        ("kxj", "00132565-001", "Kulfa"),
-#        ("kxk", "00132564-001", "Zayein Karen"),
-#        ("kxl", "00132563-001", "Nepali Kurux"),
-#        ("kxm", "00132562-001", "Northern Khmer"),
-#        ("kxn", "00132561-001", "Kanowit-Tanjong Melanau"),
-#        ("kxo", "00137989-001", "Kanoé"),
-#        ("kxp", "00132560-001", "Wadiyara Koli"),
-#        ("kxq", "00132551-001", "Smärky Kanum"),
-#        ("kxr", "00132558-001", "Koro"),
-#        ("kxs", "00132566-001", "Kangjia"),
-#        ("kxt", "00132556-001", "Koiwat"),
-#        ("kxu", "00132555-001", "Kui"),
-#        ("kxv", "00132554-001", "Kuvi"),
-#        ("kxw", "00132553-001", "Konai"),
-#        ("kxx", "00132573-001", "Likuba"),
-#        ("kxy", "00132557-001", "Kayong"),
-#        ("kxz", "00132559-001", "Kerewo"),
-#        ("kya", "00132581-001", "Kwaya"),
-#        ("kyb", "00132580-001", "Butbut Kalinga"),
-#        ("kyc", "00132579-001", "Kyaka"),
-#        ("kyd", "00132578-001", "Karey"),
-#        ("kye", "00132577-001", "Krache"),
-#        ("kyf", "00132576-001", "Kouya"),
-#        ("kyg", "00132567-001", "Keyagana"),
-#        ("kyh", "00132574-001", "Karok"),
-#        ("kyi", "00132582-001", "Kiput"),
-#        ("kyj", "00132572-001", "Karao"),
-#        ("kyk", "00132571-001", "Kamayo"),
-#        ("kyl", "00132570-001", "Kalapuya"),
-#        ("kym", "00132569-001", "Kpatili"),
-#        ("kyn", "00132617-001", "Karolanos"),
-#        ("kyo", "00132552-001", "Kelon"),
-#        ("kyp", "00132600-001", "Kang"),
-#        ("kyq", "00132662-001", "Kenga"),
-#        ("kyr", "00132661-001", "Kuruáya"),
-#        ("kys", "00132660-001", "Baram Kayan"),
-#        ("kyt", "00132659-001", "Kayagar"),
-#        ("kyu", "00132658-001", "Western Kayah"),
-#        ("kyv", "00132657-001", "Kayort"),
-#        ("kyw", "00132648-001", "Kudmali"),
-#        ("kyx", "00132655-001", "Rapoisi"),
-#        ("kyy", "00132663-001", "Kambaira"),
-#        ("kyz", "00132653-001", "Kayabí"),
-#        ("kza", "00132652-001", "Western Karaboro"),
-#        ("kzb", "00132651-001", "Kaibobo"),
-#        ("kzc", "00132650-001", "Bondoukou Kulango"),
-#        ("kzd", "00132649-001", "Kadai"),
-#        ("kze", "00132671-001", "Kosena"),
-#        ("kzf", "00132673-001", "Da'a Kaili"),
-#        ("kzg", "00132656-001", "Kikai"),
-#        ("kzh", "00132678-001", "Kenuzi-Dongola"),
-#        ("kzi", "00132677-001", "Kelabit"),
-#        ("kzj", "00132676-001", "Coastal Kadazan"),
-#        ("kzk", "00138305-001", "Kazukuru"),
-#        ("kzl", "00132675-001", "Kayeli"),
-#        ("kzm", "00132674-001", "Kais"),
-#        ("kzn", "00132664-001", "Kokola"),
-#        ("kzo", "00132672-001", "Kaningi"),
-#        ("kzp", "00132680-001", "Kaidipang"),
-#        ("kzq", "00132670-001", "Kaike"),
-#        ("kzr", "00132669-001", "Karang"),
-#        ("kzs", "00132668-001", "Sugut Dusun"),
-#        ("kzt", "00132667-001", "Tambunan Dusun"),
-#        ("kzu", "00132666-001", "Kayupulau"),
-#        ("kzv", "00132640-001", "Komyandaret"),
-#        ("kzw", "00138199-001", "Karirí-Xocó"),
-#        ("kzx", "00132679-001", "Kamarian"),
-#        ("kzy", "00132654-001", "Kango"),
-#        ("kzz", "00132630-001", "Kalabra"),
-#        ("laa", "00132629-001", "Lapuyan Subanun"),
-#        ("lab", "00138365-001", "Linear A"),
-#        ("lac", "00132628-001", "Lacandon"),
-#        ("lad", "00132627-001", "Ladino"),
-#        ("lae", "00132626-001", "Pattani"),
-#        ("laf", "00132625-001", "Lafofa"),
-#        ("lag", "00132616-001", "Langi"),
-#        ("lah", "00130982-001", "Lahnda"),
-#        ("lai", "00132623-001", "Lambya"),
-#        ("laj", "00132631-001", "Lango"),
-#        ("lak", "00132621-001", "Laka"),
-#        ("lal", "00132620-001", "Lalia"),
-#        ("lam", "00132619-001", "Lamba"),
-#        ("lan", "00132618-001", "Laru"),
-#        ("lao", "00138561-001", "Laotian; Lao"),
-#        ("lap", "00132638-001", "Laka"),
-#        ("laq", "00132622-001", "Qabiao"),
-#        ("lar", "00132624-001", "Larteh"),
-#        ("las", "00132646-001", "Lama"),
-#        ("lat", "00138556-001", "Latin"),
-#        ("lau", "00132645-001", "Laba"),
-#        ("lav", "00138564-001", "Latvian"),
-#        ("law", "00132644-001", "Lauje"),
-#        ("lax", "00132643-001", "Tiwa"),
-#        ("lay", "00132642-001", "Lama"),
-#        ("laz", "00138292-001", "Aribwatsa"),
-#        ("lba", "00132641-001", "Lui"),
-#        ("lbb", "00132632-001", "Label"),
-#        ("lbc", "00132639-001", "Lakkia"),
-#        ("lbe", "00132647-001", "Lak"),
-#        ("lbf", "00132637-001", "Tinani"),
-#        ("lbg", "00132636-001", "Laopang"),
-#        ("lbi", "00132635-001", "La'bi"),
-#        ("lbj", "00132634-001", "Ladakhi"),
-#        ("lbm", "00132829-001", "Lodhi"),
-#        ("lbn", "00132568-001", "Lamet"),
-#        ("lbo", "00132763-001", "Laven"),
-#        ("lbq", "00132988-001", "Wampar"),
-#        ("lbr", "00132987-001", "Northern Lorung"),
-#        ("lbs", "00132986-001", "Libyan Sign Language"),
-#        ("lbt", "00132985-001", "Lachi"),
-#        ("lbu", "00132984-001", "Labu"),
-#        ("lbv", "00132983-001", "Lavatbura-Lamusong"),
-#        ("lbw", "00132974-001", "Tolaki"),
-#        ("lbx", "00132981-001", "Lawangan"),
-#        ("lby", "00132989-001", "Lamu-Lamu"),
-#        ("lbz", "00132979-001", "Lardil"),
-#        ("lcc", "00132978-001", "Legenyem"),
-#        ("lcd", "00132977-001", "Lola"),
-#        ("lce", "00132976-001", "Loncong"),
-#        ("lcf", "00131696-001", "Lubu"),
-#        ("lch", "00131695-001", "Luchazi"),
-#        ("lcl", "00131694-001", "Lisela"),
-#        ("lcm", "00131684-001", "Tungag"),
-#        ("lcp", "00131692-001", "Western Lawa"),
-#        ("lcq", "00131700-001", "Luhu"),
-#        ("lcs", "00131690-001", "Lisabata-Nuniali"),
-#        ("ldb", "00131689-001", "Idun"),
-#        ("ldd", "00131688-001", "Luri"),
-#        ("ldg", "00131687-001", "Lenyima"),
-#        ("ldh", "00131686-001", "Lamja-Dengsa-Tola"),
-#        ("ldi", "00131660-001", "Laari"),
-#        ("ldj", "00131699-001", "Lemoro"),
-#        ("ldk", "00131674-001", "Leelau"),
-#        ("ldl", "00131650-001", "Kaan"),
-#        ("ldm", "00131649-001", "Landoma"),
-#        ("ldn", "00138346-001", "Láadan"),
-#        ("ldo", "00131648-001", "Loo"),
-#        ("ldp", "00131647-001", "Tso"),
-#        ("ldq", "00131646-001", "Lufu"),
-#        ("lea", "00131645-001", "Lega-Shabunda"),
-#        ("leb", "00131636-001", "Lala-Bisa"),
-#        ("lec", "00131643-001", "Leco"),
-#        ("led", "00131651-001", "Lendu"),
-#        ("lee", "00131641-001", "Lyélé"),
-#        ("lef", "00131640-001", "Lelemi"),
-#        ("leg", "00131639-001", "Lengua"),
-#        ("leh", "00131638-001", "Lenje"),
-#        ("lei", "00131658-001", "Lemio"),
-#        ("lej", "00131642-001", "Lengola"),
-#        ("lek", "00131644-001", "Leipon"),
-#        ("lel", "00131666-001", "Lele"),
-#        ("lem", "00131665-001", "Nomaande"),
-#        ("len", "00131664-001", "Lenca"),
-#        ("leo", "00131663-001", "Leti"),
-#        ("lep", "00131662-001", "Lepcha"),
-#        ("leq", "00131661-001", "Lembena"),
-#        ("ler", "00131652-001", "Lenkau"),
-#        ("les", "00131659-001", "Lese"),
-#        ("let", "00131667-001", "Lesing-Gelimi"),
-#        ("leu", "00131657-001", "Kara"),
-#        ("lev", "00131656-001", "Lamma"),
-#        ("lew", "00131655-001", "Ledo Kaili"),
-#        ("lex", "00131654-001", "Luang"),
-#        ("ley", "00131653-001", "Lemolang"),
-#        ("lez", "00131715-001", "Lezghian"),
-#        ("lfa", "00131765-001", "Lefa"),
-#        ("lfn", "00138356-001", "Lingua Franca Nova"),
-#        ("lga", "00131685-001", "Lungga"),
-#        ("lgb", "00131747-001", "Laghu"),
-#        ("lgg", "00131746-001", "Lugbara"),
-#        ("lgh", "00131745-001", "Laghuu"),
-#        ("lgi", "00131744-001", "Lengilu"),
-#        ("lgk", "00131743-001", "Lingarak"),
-#        ("lgl", "00131734-001", "Wala"),
-#        ("lgm", "00131741-001", "Lega-Mwenga"),
-#        ("lgn", "00131749-001", "Opuuo"),
-#        ("lgq", "00131739-001", "Logba"),
-#        ("lgr", "00131738-001", "Lengo"),
-#        ("lgt", "00131737-001", "Pahi"),
-#        ("lgu", "00131736-001", "Longgu"),
-#        ("lgz", "00131735-001", "Ligenza"),
-#        ("lha", "00131757-001", "Laha"),
-#        ("lhh", "00131759-001", "Laha"),
-#        ("lhi", "00131742-001", "Lahu Shi"),
-#        ("lhl", "00131764-001", "Lahul Lohar"),
-#        ("lhm", "00131763-001", "Lhomi"),
-#        ("lhn", "00131762-001", "Lahanan"),
-#        ("lhp", "00131761-001", "Lhokpu"),
-#        ("lhs", "00138287-001", "Mlahsö"),
-#        ("lht", "00131760-001", "Lo-Toga"),
-#        ("lhu", "00131750-001", "Lahu"),
-#        ("lia", "00131758-001", "West-Central Limba"),
-#        ("lib", "00131766-001", "Likum"),
-#        ("lic", "00131756-001", "Hlai"),
-#        ("lid", "00131755-001", "Nyindrou"),
-#        ("lie", "00131754-001", "Likila"),
-#        ("lif", "00131753-001", "Limbu"),
-#        ("lig", "00131752-001", "Ligbi"),
-#        ("lih", "00131751-001", "Lihir"),
-#        ("lii", "00131732-001", "Lingkhim"),
-#        ("lij", "00131707-001", "Ligurian"),
-#        ("lik", "00131740-001", "Lika"),
-#        ("lil", "00131714-001", "Lillooet"),
-#        ("lim", "00138559-001", "Limburgish; Limburger; Limburgian"),
-#        ("lin", "00138560-001", "Lingala"),
-#        ("lio", "00131713-001", "Liki"),
-#        ("lip", "00131712-001", "Sekpele"),
-#        ("liq", "00131711-001", "Libido"),
-#        ("lir", "00131710-001", "Liberian English"),
-#        ("lis", "00131701-001", "Lisu"),
-#        ("lit", "00138562-001", "Lithuanian"),
-#        ("liu", "00131708-001", "Logorik"),
-#        ("liv", "00131716-001", "Liv"),
-#        ("liw", "00131706-001", "Col"),
-#        ("lix", "00131705-001", "Liabuku"),
-#        ("liy", "00131704-001", "Banda-Bambari"),
-#        ("liz", "00131703-001", "Libinza"),
-#        ("lje", "00131702-001", "Rampi"),
-#        ("lji", "00131724-001", "Laiyolo"),
-#        ("ljl", "00131726-001", "Li'o"),
-#        ("ljp", "00131709-001", "Lampung Api"),
-#        ("lka", "00131731-001", "Lakalei"),
-#        ("lkb", "00131730-001", "Kabras"),
-#        ("lkc", "00131729-001", "Kucong"),
-#        ("lkd", "00131728-001", "Lakondę"),
-#        ("lke", "00131727-001", "Kenyi"),
-#        ("lkh", "00131717-001", "Lakha"),
-#        ("lki", "00131725-001", "Laki"),
-#        ("lkj", "00131733-001", "Remun"),
-#        ("lkl", "00131723-001", "Laeko-Libuat"),
-#        ("lkn", "00131722-001", "Lakon"),
-#        ("lko", "00131721-001", "Khayo"),
-#        ("lkr", "00131720-001", "Päri"),
-#        ("lks", "00131719-001", "Kisa"),
-#        ("lkt", "00131620-001", "Lakota"),
-#        ("lky", "00131748-001", "Lokoya"),
-#        ("lla", "00131637-001", "Lala-Roba"),
-#        ("llb", "00131552-001", "Lolo"),
-#        ("llc", "00131551-001", "Lele"),
-#        ("lld", "00131550-001", "Ladin"),
-#        ("lle", "00131549-001", "Lele"),
-#        ("llf", "00138083-001", "Hermit"),
-#        ("llg", "00131548-001", "Lole"),
-#        ("llh", "00131547-001", "Lamu"),
-#        ("lli", "00131538-001", "Teke-Laali"),
-#        ("llk", "00131545-001", "Lelak"),
-#        ("lll", "00131553-001", "Lilau"),
-#        ("llm", "00131543-001", "Lasalimu"),
-#        ("lln", "00131542-001", "Lele"),
-#        ("llo", "00131541-001", "Khlor"),
-#        ("llp", "00131540-001", "North Efate"),
-#        ("llq", "00131539-001", "Lolak"),
-#        ("lls", "00131561-001", "Lithuanian Sign Language"),
-#        ("llu", "00131563-001", "Lau"),
-#        ("llx", "00131546-001", "Lauan"),
-#        ("lma", "00131568-001", "East Limba"),
-#        ("lmb", "00131567-001", "Merei"),
-#        ("lmc", "00131566-001", "Limilngan"),
-#        ("lmd", "00131565-001", "Lumun"),
-#        ("lme", "00131564-001", "Pévé"),
-#        ("lmf", "00131554-001", "South Lembata"),
-#        ("lmg", "00131562-001", "Lamogai"),
-#        ("lmh", "00131570-001", "Lambichhong"),
-#        ("lmi", "00131560-001", "Lombi"),
-#        ("lmj", "00131559-001", "West Lembata"),
-#        ("lmk", "00131558-001", "Lamkang"),
-#        ("lml", "00131557-001", "Hano"),
-#        ("lmm", "00131556-001", "Lamam"),
-#        ("lmn", "00131530-001", "Lambadi"),
-#        ("lmo", "00131569-001", "Lombard"),
-#        ("lmp", "00131544-001", "Limbum"),
-#        ("lmq", "00131520-001", "Lamatuka"),
-#        ("lmr", "00131519-001", "Lamalera"),
-#        ("lmu", "00131518-001", "Lamenu"),
-#        ("lmv", "00131517-001", "Lomaiviti"),
-#        ("lmw", "00131516-001", "Lake Miwok"),
-#        ("lmx", "00131515-001", "Laimbue"),
-#        ("lmy", "00131506-001", "Lamboya"),
-#        ("lmz", "00138049-001", "Lumbee"),
-#        ("lna", "00132975-001", "Langbashe"),
-#        ("lnb", "00132997-001", "Mbalanhu"),
-#        ("lnd", "00132999-001", "Lundayeh"),
-#        ("lng", "00138370-001", "Langobardic"),
-#        ("lnh", "00132982-001", "Lanoh"),
-#        ("lni", "00133004-001", "Daantanai'"),
-#        ("lnj", "00137984-001", "Leningitij"),
-#        ("lnl", "00133003-001", "South Central Banda"),
-#        ("lnm", "00133002-001", "Langam"),
-#        ("lnn", "00133001-001", "Lorediakarkar"),
-#        ("lno", "00133000-001", "Lango"),
-#        ("lns", "00132990-001", "Lamnso'"),
-#        ("lnu", "00132998-001", "Longuda"),
-#        ("lnz", "00133006-001", "Lonzo"),
-#        ("loa", "00132996-001", "Loloda"),
-#        ("lob", "00132995-001", "Lobi"),
-#        ("loc", "00132994-001", "Inonhan"),
-#        ("loe", "00132993-001", "Saluan"),
-#        ("lof", "00132992-001", "Logol"),
-#        ("log", "00132966-001", "Logo"),
-#        ("loh", "00133005-001", "Narim"),
-#        ("loi", "00132980-001", "Loma"),
-#        ("loj", "00132956-001", "Lou"),
-#        ("lok", "00132955-001", "Loko"),
-#        ("lol", "00132954-001", "Mongo"),
-#        ("lom", "00132953-001", "Loma"),
-#        ("lon", "00132952-001", "Malawi Lomwe"),
-#        ("loo", "00132951-001", "Lombo"),
-#        ("lop", "00132942-001", "Lopa"),
-#        ("loq", "00132949-001", "Lobala"),
-#        ("lor", "00132957-001", "Téén"),
-#        ("los", "00132947-001", "Loniu"),
-#        ("lot", "00132946-001", "Otuho"),
-#        ("lou", "00132945-001", "Louisiana Creole French"),
-#        ("lov", "00132944-001", "Lopi"),
-#        ("low", "00132964-001", "Tampias Lobu"),
-#        ("lox", "00132948-001", "Loun"),
-#        ("loy", "00132950-001", "Lowa"),
-#        ("loz", "00132972-001", "Lozi"),
-#        ("lpa", "00132971-001", "Lelepa"),
-#        ("lpe", "00132970-001", "Lepki"),
-#        ("lpn", "00132969-001", "Long Phuri Naga"),
-#        ("lpo", "00132968-001", "Lipo"),
-#        ("lpx", "00132967-001", "Lopit"),
-#        ("lra", "00132958-001", "Rara Bakati'"),
-#        ("lrc", "00132965-001", "Northern Luri"),
-#        ("lre", "00138104-001", "Laurentian"),
-#        ("lrg", "00132973-001", "Laragia"),
-#        ("lri", "00132963-001", "Marachi"),
-#        ("lrk", "00132962-001", "Loarki"),
-#        ("lrl", "00132961-001", "Lari"),
-#        ("lrm", "00132960-001", "Marama"),
-#        ("lrn", "00132959-001", "Lorang"),
-#        ("lro", "00133021-001", "Laro"),
-#        ("lrr", "00133071-001", "Southern Lorung"),
-#        ("lrt", "00132991-001", "Larantuka Malay"),
-#        ("lrv", "00133053-001", "Larevat"),
-#        ("lrz", "00133052-001", "Lemerig"),
-#        ("lsa", "00133051-001", "Lasgerdi"),
-#        ("lsd", "00133050-001", "Lishana Deni"),
-#        ("lse", "00133049-001", "Lusengo"),
-#        ("lsg", "00133040-001", "Lyons Sign Language"),
-#        ("lsh", "00133047-001", "Lish"),
-#        ("lsi", "00133055-001", "Lashi"),
-#        ("lsl", "00133045-001", "Latvian Sign Language"),
-#        ("lsm", "00133044-001", "Saamia"),
-#        ("lso", "00133043-001", "Laos Sign Language"),
-#        ("lsp", "00133042-001", "Panamanian Sign Language"),
-#        ("lsr", "00133041-001", "Aruop"),
-#        ("lss", "00133063-001", "Lasi"),
-#        ("lst", "00133065-001", "Trinidad and Tobago Sign Language"),
-#        ("ltc", "00137914-001", "Late Middle Chinese"),
-#        ("lti", "00133048-001", "Leti"),
-#        ("ltn", "00133070-001", "Latundę"),
-#        ("lto", "00133069-001", "Tsotso"),
-#        ("lts", "00133068-001", "Tachoni"),
-#        ("ltu", "00133067-001", "Latu"),
-#        ("ltz", "00138557-001", "Letzeburgesch; Luxembourgish"),
-#        ("lua", "00133066-001", "Luba-Lulua"),
-#        ("lub", "00138563-001", "Luba-Katanga"),
-#        ("luc", "00133056-001", "Aringa"),
-#        ("lud", "00133064-001", "Ludian"),
-#        ("lue", "00133072-001", "Luvale"),
-#        ("luf", "00133062-001", "Laua"),
-#        ("lug", "00138558-001", "Luganda; Ganda"),
-#        ("lui", "00133061-001", "Luiseno"),
-#        ("luj", "00133060-001", "Luna"),
-#        ("luk", "00133059-001", "Lunanakha"),
-#        ("lul", "00133058-001", "Olu'bo"),
-#        ("lum", "00133057-001", "Luimbi"),
-#        ("lun", "00133038-001", "Lunda"),
-#        ("luo", "00133013-001", "Luo"),
-#        ("lup", "00133046-001", "Lumbu"),
-#        ("luq", "00133020-001", "Lucumi"),
-#        ("lur", "00133019-001", "Laura"),
-#        ("lus", "00133018-001", "Lushai"),
-#        ("lut", "00133017-001", "Lushootseed"),
-#        ("luu", "00133016-001", "Lumba-Yakkha"),
-#        ("luv", "00133007-001", "Luwati"),
-#        ("luw", "00133014-001", "Luo"),
-#        ("luy", "00130979-001", "Luyia"),
-#        ("luz", "00133022-001", "Southern Luri"),
-#        ("lva", "00133012-001", "Maku'a"),
-#        ("lvk", "00133011-001", "Lavukaleve"),
-#        ("lvu", "00133010-001", "Levuka"),
-#        ("lwa", "00133009-001", "Lwalu"),
-#        ("lwe", "00133008-001", "Lewo Eleng"),
-#        ("lwg", "00133030-001", "Wanga"),
-#        ("lwh", "00133032-001", "White Lachi"),
-#        ("lwl", "00133015-001", "Eastern Lawa"),
-#        ("lwm", "00133037-001", "Laomian"),
-#        ("lwo", "00133036-001", "Luwo"),
-#        ("lwt", "00133035-001", "Lewotobi"),
-#        ("lww", "00133034-001", "Lewo"),
-#        ("lya", "00133033-001", "Layakha"),
-#        ("lyg", "00133023-001", "Lyngngam"),
-#        ("lyn", "00133031-001", "Luyana"),
-#        ("lzh", "00137900-001", "Literary Chinese"),
-#        ("lzl", "00133039-001", "Litzlitz"),
-#        ("lzn", "00133029-001", "Leinong Naga"),
-#        ("lzz", "00133028-001", "Laz"),
-#        ("maa", "00133027-001", "San Jerónimo Tecóatl Mazatec"),
-#        ("mab", "00133026-001", "Yutanduchi Mixtec"),
-#        ("mad", "00133025-001", "Madurese"),
-#        ("mae", "00132926-001", "Bo-Rukul"),
-#        ("maf", "00133054-001", "Mafa"),
-#        ("mag", "00132943-001", "Magahi"),
-#        ("mah", "00138566-001", "Marshallese"),
-#        ("mai", "00132858-001", "Maithili"),
-#        ("maj", "00132857-001", "Jalapa De Díaz Mazatec"),
-#        ("mak", "00132856-001", "Makasar"),
-#        ("mal", "00138569-001", "Malayalam"),
-#        ("mam", "00132855-001", "Mam"),
-#        ("man", "00130998-001", "Mandingo"),
-#        ("maq", "00132854-001", "Chiquihuitlán Mazatec"),
-#        ("mar", "00138571-001", "Marathi"),
-#        ("mas", "00132853-001", "Masai"),
-#        ("mat", "00132844-001", "San Francisco Matlatzinca"),
-#        ("mau", "00132851-001", "Huautla Mazatec"),
-#        ("mav", "00132859-001", "Sateré-Mawé"),
-#        ("maw", "00132849-001", "Mampruli"),
-#        ("max", "00132848-001", "North Moluccan Malay"),
-#        ("maz", "00132847-001", "Central Mazahua"),
-#        ("mba", "00132846-001", "Higaonon"),
-#        ("mbb", "00132845-001", "Western Bukidnon Manobo"),
-#        ("mbc", "00132867-001", "Macushi"),
-#        ("mbd", "00132869-001", "Dibabawon Manobo"),
-#        ("mbe", "00138074-001", "Molale"),
-#        ("mbf", "00132852-001", "Baba Malay"),
-#        ("mbh", "00132874-001", "Mangseng"),
-#        ("mbi", "00132873-001", "Ilianen Manobo"),
-#        ("mbj", "00132872-001", "Nadëb"),
-#        ("mbk", "00132871-001", "Malol"),
-#        ("mbl", "00132870-001", "Maxakalí"),
-#        ("mbm", "00132860-001", "Ombamba"),
-#        ("mbn", "00132868-001", "Macaguán"),
-#        ("mbo", "00132876-001", "Mbo"),
-#        ("mbp", "00132866-001", "Malayo"),
-#        ("mbq", "00132865-001", "Maisin"),
-#        ("mbr", "00132864-001", "Nukak Makú"),
-#        ("mbs", "00132863-001", "Sarangani Manobo"),
-#        ("mbt", "00132862-001", "Matigsalug Manobo"),
-#        ("mbu", "00132836-001", "Mbula-Bwazza"),
-#        ("mbv", "00132875-001", "Mbulungish"),
-#        ("mbw", "00132850-001", "Maring"),
-#        ("mbx", "00132826-001", "Mari"),
-#        ("mby", "00132825-001", "Memoni"),
-#        ("mbz", "00132824-001", "Amoltepec Mixtec"),
-#        ("mca", "00132823-001", "Maca"),
-#        ("mcb", "00132822-001", "Machiguenga"),
-#        ("mcc", "00132821-001", "Bitur"),
-#        ("mcd", "00132812-001", "Sharanahua"),
-#        ("mce", "00132819-001", "Itundujia Mixtec"),
-#        ("mcf", "00132827-001", "Matsés"),
-#        ("mcg", "00132817-001", "Mapoyo"),
-#        ("mch", "00132816-001", "Maquiritari"),
-#        ("mci", "00132815-001", "Mese"),
-#        ("mcj", "00132814-001", "Mvanip"),
-#        ("mck", "00132834-001", "Mbunda"),
-#        ("mcl", "00137940-001", "Macaguaje"),
-#        ("mcm", "00132818-001", "Malaccan Creole Portuguese"),
-#        ("mcn", "00132820-001", "Masana"),
-#        ("mco", "00132842-001", "Coatlán Mixe"),
-#        ("mcp", "00132841-001", "Makaa"),
-#        ("mcq", "00132840-001", "Ese"),
-#        ("mcr", "00132839-001", "Menya"),
-#        ("mcs", "00132838-001", "Mambai"),
-#        ("mct", "00132837-001", "Mengisa"),
-#        ("mcu", "00132828-001", "Cameroon Mambila"),
-#        ("mcv", "00132835-001", "Minanibai"),
-#        ("mcw", "00132843-001", "Mawa"),
-#        ("mcx", "00132833-001", "Mpiemo"),
-#        ("mcy", "00132832-001", "South Watut"),
-#        ("mcz", "00132831-001", "Mawan"),
-#        ("mda", "00132830-001", "Mada"),
-#        ("mdb", "00132878-001", "Morigi"),
-#        ("mdc", "00132813-001", "Male"),
-#        ("mdd", "00132861-001", "Mbum"),
-#        ("mde", "00132923-001", "Maba"),
-#        ("mdf", "00132922-001", "Moksha"),
-#        ("mdg", "00132921-001", "Massalat"),
-#        ("mdh", "00132920-001", "Maguindanao"),
-#        ("mdi", "00132919-001", "Mamvu"),
-#        ("mdj", "00132918-001", "Mangbetu"),
-#        ("mdk", "00132909-001", "Mangbutu"),
-#        ("mdl", "00132916-001", "Maltese Sign Language"),
-#        ("mdm", "00132924-001", "Mayogo"),
-#        ("mdn", "00132914-001", "Mbati"),
-#        ("mdp", "00132913-001", "Mbala"),
-#        ("mdq", "00132912-001", "Mbole"),
-#        ("mdr", "00132911-001", "Mandar"),
-#        ("mds", "00132910-001", "Maria"),
-#        ("mdt", "00132932-001", "Mbere"),
-#        ("mdu", "00132934-001", "Mboko"),
-#        ("mdv", "00132917-001", "Santa Lucía Monteverde Mixtec"),
-#        ("mdw", "00132939-001", "Mbosi"),
-#        ("mdx", "00132938-001", "Dizin"),
-#        ("mdy", "00132937-001", "Male"),
-#        ("mdz", "00132936-001", "Suruí Do Pará"),
-#        ("mea", "00132935-001", "Menka"),
-#        ("meb", "00132925-001", "Ikobi-Mena"),
-#        ("mec", "00132933-001", "Mara"),
-#        ("med", "00132941-001", "Melpa"),
-#        ("mee", "00132931-001", "Mengen"),
-#        ("mef", "00132930-001", "Megam"),
-#        ("meg", "00132929-001", "Mea"),
-#        ("meh", "00132928-001", "Southwestern Tlaxiaco Mixtec"),
-#        ("mei", "00132927-001", "Midob"),
-#        ("mej", "00132901-001", "Meyah"),
-#        ("mek", "00132940-001", "Mekeo"),
-#        ("mel", "00132915-001", "Central Melanau"),
-#        ("mem", "00137968-001", "Mangala"),
-#        ("men", "00132891-001", "Mende"),
-#        ("meo", "00132890-001", "Kedah Malay"),
-#        ("mep", "00132889-001", "Miriwung"),
-#        ("meq", "00132888-001", "Merey"),
-#        ("mer", "00132887-001", "Meru"),
-#        ("mes", "00132886-001", "Masmaje"),
-#        ("met", "00132877-001", "Mato"),
-#        ("meu", "00132884-001", "Motu"),
-#        ("mev", "00132892-001", "Mann"),
-#        ("mew", "00132882-001", "Maaka"),
-#        ("mey", "00132881-001", "Hassaniyya"),
-#        ("mez", "00132880-001", "Menominee"),
-#        ("mfa", "00132879-001", "Pattani Malay"),
-#        ("mfb", "00132899-001", "Bangka"),
-#        ("mfc", "00132883-001", "Mba"),
-#        ("mfd", "00132885-001", "Mendankwe-Nkwen"),
-#        ("mfe", "00132907-001", "Morisyen"),
-#        ("mff", "00132906-001", "Naki"),
-#        ("mfg", "00132905-001", "Mixifore"),
-#        ("mfh", "00132904-001", "Matal"),
-#        ("mfi", "00132903-001", "Wandala"),
-#        ("mfj", "00132902-001", "Mefele"),
-#        ("mfk", "00132893-001", "North Mofu"),
-#        ("mfl", "00132900-001", "Putai"),
-#        ("mfm", "00132908-001", "Marghi South"),
-#        ("mfn", "00132898-001", "Cross River Mbembe"),
-#        ("mfo", "00132897-001", "Mbe"),
-#        ("mfp", "00132896-001", "Makassar Malay"),
-#        ("mfq", "00132895-001", "Moba"),
-#        ("mfr", "00132894-001", "Marithiel"),
-#        ("mfs", "00132502-001", "Mexican Sign Language"),
-#        ("mft", "00132111-001", "Mokerang"),
-#        ("mfu", "00132633-001", "Mbwela"),
-#        ("mfv", "00132204-001", "Mandjak"),
-#        ("mfw", "00138255-001", "Mulaha"),
-#        ("mfx", "00132203-001", "Melo"),
-#        ("mfy", "00132202-001", "Mayo"),
-#        ("mfz", "00132201-001", "Mabaan"),
-#        ("mga", "00137894-001", "Middle Irish"),
-#        ("mgb", "00132200-001", "Mararit"),
-#        ("mgc", "00132191-001", "Morokodo"),
-#        ("mgd", "00132198-001", "Moru"),
-#        ("mge", "00132206-001", "Mango"),
-#        ("mgf", "00132196-001", "Maklew"),
-#        ("mgg", "00132195-001", "Mpongmpong"),
-#        ("mgh", "00132194-001", "Makhuwa-Meetto"),
-#        ("mgi", "00132193-001", "Lijili"),
-#        ("mgj", "00132192-001", "Abureni"),
-#        ("mgk", "00132214-001", "Mawes"),
-#        ("mgl", "00132216-001", "Maleu-Kilenge"),
-#        ("mgm", "00132199-001", "Mambae"),
-#        ("mgn", "00132221-001", "Mbangi"),
-#        ("mgo", "00132220-001", "Meta'"),
-#        ("mgp", "00132219-001", "Eastern Magar"),
-#        ("mgq", "00132218-001", "Malila"),
-#        ("mgr", "00132217-001", "Mambwe-Lungu"),
-#        ("mgs", "00132207-001", "Manda"),
-#        ("mgt", "00132215-001", "Mongol"),
-#        ("mgu", "00132223-001", "Mailu"),
-#        ("mgv", "00132213-001", "Matengo"),
-#        ("mgw", "00132212-001", "Matumbi"),
-#        ("mgx", "00132211-001", "Omati"),
-#        ("mgy", "00132210-001", "Mbunga"),
-#        ("mgz", "00132209-001", "Mbugwe"),
-#        ("mha", "00132183-001", "Manda"),
-#        ("mhb", "00132222-001", "Mahongwe"),
-#        ("mhc", "00132197-001", "Mocho"),
-#        ("mhd", "00132173-001", "Mbugu"),
-#        ("mhe", "00132172-001", "Besisi"),
-#        ("mhf", "00132171-001", "Mamaa"),
-#        ("mhg", "00132170-001", "Margu"),
-#        ("mhh", "00132169-001", "Maskoy Pidgin"),
-#        ("mhi", "00132168-001", "Ma'di"),
-#        ("mhj", "00132159-001", "Mogholi"),
-#        ("mhk", "00132166-001", "Mungaka"),
-#        ("mhl", "00132174-001", "Mauwake"),
-#        ("mhm", "00132164-001", "Makhuwa-Moniga"),
-#        ("mhn", "00132163-001", "Mócheno"),
-#        ("mho", "00132162-001", "Mashi"),
-#        ("mhp", "00132161-001", "Balinese Malay"),
-#        ("mhq", "00132181-001", "Mandan"),
-#        ("mhr", "00132165-001", "Eastern Mari"),
-#        ("mhs", "00132167-001", "Buru"),
-#        ("mht", "00132189-001", "Mandahuaca"),
-#        ("mhu", "00132188-001", "Digaro-Mishmi"),
-#        ("mhw", "00132187-001", "Mbukushu"),
-#        ("mhx", "00132186-001", "Maru"),
-#        ("mhy", "00132185-001", "Ma'anyan"),
-#        ("mhz", "00132184-001", "Mor"),
-#        ("mia", "00138162-001", "Miami"),
-#        ("mib", "00132175-001", "Atatláhuca Mixtec"),
-#        ("mic", "00132182-001", "Mi'kmaq; Micmac"),
-#        ("mid", "00132190-001", "Mandaic"),
-#        ("mie", "00132180-001", "Ocotepec Mixtec"),
-#        ("mif", "00132179-001", "Mofu-Gudur"),
-#        ("mig", "00132178-001", "San Miguel El Grande Mixtec"),
-#        ("mih", "00132177-001", "Chayuco Mixtec"),
-#        ("mii", "00132176-001", "Chigmecatitlán Mixtec"),
-#        ("mij", "00132238-001", "Abar"),
-#        ("mik", "00132288-001", "Mikasuki"),
-#        ("mil", "00132208-001", "Peńoles Mixtec"),
-#        ("mim", "00132270-001", "Alacatlatzala Mixtec"),
-#        ("min", "00132269-001", "Minangkabau"),
-#        ("mio", "00132268-001", "Pinotepa Nacional Mixtec"),
-#        ("mip", "00132267-001", "Apasco-Apoala Mixtec"),
-#        ("miq", "00132266-001", "Mískito"),
-#        ("mir", "00132257-001", "Isthmus Mixe"),
-#        ("mis", "00130972-001", "uncoded languages"),
-#        ("mit", "00132264-001", "Southern Puebla Mixtec"),
-#        ("miu", "00132272-001", "Cacaloxtepec Mixtec"),
-#        ("miw", "00132262-001", "Akoye"),
-#        ("mix", "00132261-001", "Mixtepec Mixtec"),
-#        ("miy", "00132260-001", "Ayutla Mixtec"),
-#        ("miz", "00132259-001", "Coatzospan Mixtec"),
-#        ("mja", "00132258-001", "Mahei"),
-#        ("mjc", "00132280-001", "San Juan Colorado Mixtec"),
-#        ("mjd", "00132282-001", "Northwest Maidu"),
-#        ("mje", "00138189-001", "Muskum"),
-#        ("mjg", "00132265-001", "Tu"),
-#        ("mjh", "00132287-001", "Mwera"),
-#        ("mji", "00132286-001", "Kim Mun"),
-#        ("mjj", "00132285-001", "Mawak"),
-#        ("mjk", "00132284-001", "Matukar"),
-#        ("mjl", "00132283-001", "Mandeali"),
-#        ("mjm", "00132273-001", "Medebur"),
-#        ("mjn", "00132281-001", "Ma"),
-#        ("mjo", "00132289-001", "Malankuravan"),
-#        ("mjp", "00132279-001", "Malapandaram"),
-#        ("mjq", "00132278-001", "Malaryan"),
-#        ("mjr", "00132277-001", "Malavedan"),
-#        ("mjs", "00132276-001", "Miship"),
-#        ("mjt", "00132275-001", "Sauria Paharia"),
-#        ("mju", "00132274-001", "Manna-Dora"),
-#        ("mjv", "00132255-001", "Mannan"),
-#        ("mjw", "00132230-001", "Karbi"),
-#        ("mjx", "00132263-001", "Mahali"),
-#        ("mjy", "00138184-001", "Mahican"),
-#        ("mjz", "00132237-001", "Majhi"),
-#        ("mka", "00132236-001", "Mbre"),
-#        ("mkb", "00132235-001", "Mal Paharia"),
-#        ("mkc", "00132234-001", "Siliput"),
-#        ("mkd", "00138568-001", "Macedonian"),
-#        ("mke", "00132233-001", "Mawchi"),
-#        ("mkf", "00132224-001", "Miya"),
-#        ("mkg", "00132231-001", "Mak"),
-#        ("mki", "00132239-001", "Dhatki"),
-#        ("mkj", "00132229-001", "Mokilese"),
-#        ("mkk", "00132228-001", "Byep"),
-#        ("mkl", "00132227-001", "Mokole"),
-#        ("mkm", "00132226-001", "Moklen"),
-#        ("mkn", "00132225-001", "Kupang Malay"),
-#        ("mko", "00132247-001", "Mingang Doso"),
-#        ("mkp", "00132249-001", "Moikodi"),
-#        ("mkq", "00138169-001", "Bay Miwok"),
-#        ("mkr", "00132232-001", "Malas"),
-#        ("mks", "00132254-001", "Silacayoapan Mixtec"),
-#        ("mkt", "00132253-001", "Vamale"),
-#        ("mku", "00132252-001", "Konyanka Maninka"),
-#        ("mkv", "00132251-001", "Mafea"),
-#        ("mkw", "00132250-001", "Kituba"),
-#        ("mkx", "00132240-001", "Cinamiguin Manobo"),
-#        ("mky", "00132248-001", "East Makian"),
-#        ("mkz", "00132256-001", "Makasae"),
-#        ("mla", "00132246-001", "Malo"),
-#        ("mlb", "00132245-001", "Mbule"),
-#        ("mlc", "00132244-001", "Cao Lan"),
-#        ("mld", "00132243-001", "Malakhel"),
-#        ("mle", "00132242-001", "Manambu"),
-#        ("mlf", "00132143-001", "Mal"),
-#        ("mlg", "00138565-001", "Malagasy"),
-#        ("mlh", "00132271-001", "Mape"),
-#        ("mli", "00132160-001", "Malimpung"),
-#        ("mlj", "00132075-001", "Miltu"),
-#        ("mlk", "00132074-001", "Ilwana"),
-#        ("mll", "00132073-001", "Malua Bay"),
-#        ("mlm", "00132072-001", "Mulam"),
-#        ("mln", "00132071-001", "Malango"),
-#        ("mlo", "00132070-001", "Mlomp"),
-#        ("mlp", "00132061-001", "Bargam"),
-#        ("mlq", "00132068-001", "Western Maninkakan"),
-#        ("mlr", "00132076-001", "Vame"),
-#        ("mls", "00132066-001", "Masalit"),
-#        ("mlt", "00138573-001", "Maltese"),
-#        ("mlu", "00132065-001", "To'abaita"),
-#        ("mlv", "00132064-001", "Motlav"),
-#        ("mlw", "00132063-001", "Moloko"),
-#        ("mlx", "00132062-001", "Malfaxal"),
-#        ("mlz", "00132084-001", "Malaynon"),
-#        ("mma", "00132086-001", "Mama"),
-#        ("mmb", "00132069-001", "Momina"),
-#        ("mmc", "00132091-001", "Michoacán Mazahua"),
-#        ("mmd", "00132090-001", "Maonan"),
-#        ("mme", "00132089-001", "Mae"),
-#        ("mmf", "00132088-001", "Mundat"),
-#        ("mmg", "00132087-001", "North Ambrym"),
-#        ("mmh", "00132077-001", "Mehináku"),
-#        ("mmi", "00132085-001", "Musar"),
-#        ("mmj", "00132093-001", "Majhwar"),
-#        ("mmk", "00132083-001", "Mukha-Dora"),
-#        ("mml", "00132082-001", "Man Met"),
-#        ("mmm", "00132081-001", "Maii"),
-#        ("mmn", "00132080-001", "Mamanwa"),
-#        ("mmo", "00132079-001", "Mangga Buang"),
-#        ("mmp", "00132053-001", "Siawi"),
-#        ("mmq", "00132092-001", "Musak"),
-#        ("mmr", "00132067-001", "Western Xiangxi Miao"),
-#        ("mmt", "00132043-001", "Malalamai"),
-#        ("mmu", "00132042-001", "Mmaala"),
-#        ("mmv", "00138271-001", "Miriti"),
-#        ("mmw", "00132041-001", "Emae"),
-#        ("mmx", "00132040-001", "Madak"),
-#        ("mmy", "00132039-001", "Migaama"),
-#        ("mmz", "00132038-001", "Mabaale"),
-#        ("mna", "00132029-001", "Mbula"),
-#        ("mnb", "00132036-001", "Muna"),
-#        ("mnc", "00132044-001", "Manchu"),
-#        ("mnd", "00132034-001", "Mondé"),
-#        ("mne", "00132033-001", "Naba"),
-#        ("mnf", "00132032-001", "Mundani"),
-#        ("mng", "00132031-001", "Eastern Mnong"),
-#        ("mnh", "00132051-001", "Mono"),
-#        ("mni", "00132035-001", "Manipuri"),
-#        ("mnj", "00132037-001", "Munji"),
-#        ("mnk", "00132059-001", "Mandinka"),
-#        ("mnl", "00132058-001", "Tiale"),
-#        ("mnm", "00132057-001", "Mapena"),
-#        ("mnn", "00132056-001", "Southern Mnong"),
-#        ("mnp", "00132055-001", "Min Bei Chinese"),
-#        ("mnq", "00132054-001", "Minriq"),
-#        ("mnr", "00132045-001", "Mono"),
-#        ("mns", "00132052-001", "Mansi"),
-#        ("mnt", "00138296-001", "Maykulan"),
-#        ("mnu", "00132060-001", "Mer"),
-#        ("mnv", "00132050-001", "Rennell-Bellona"),
-#        ("mnw", "00132049-001", "Mon"),
-#        ("mnx", "00132048-001", "Manikion"),
-#        ("mny", "00132047-001", "Manyawa"),
-#        ("mnz", "00132095-001", "Moni"),
-#        ("moa", "00132030-001", "Mwan"),
-#        ("moc", "00132078-001", "Mocoví"),
-#        ("mod", "00138280-001", "Mobilian"),
-#        ("moe", "00132140-001", "Montagnais"),
-#        ("mof", "00138278-001", "Mohegan-Montauk-Narragansett"),
-#        ("mog", "00132139-001", "Mongondow"),
-#        ("moh", "00132138-001", "Mohawk"),
-#        ("moi", "00132137-001", "Mboi"),
-#        ("moj", "00132136-001", "Monzombo"),
-#        ("mok", "00132135-001", "Morori"),
-#        ("mom", "00138091-001", "Monimbo"),
-#        ("mon", "00138570-001", "Mongolian"),
-#        ("moo", "00132126-001", "Monom"),
-#        ("mop", "00132133-001", "Mopán Maya"),
-#        ("moq", "00132141-001", "Mor"),
-#        ("mor", "00132131-001", "Moro"),
-#        ("mos", "00132130-001", "Mossi"),
-#        ("mot", "00132129-001", "Barí"),
-#        ("mou", "00132128-001", "Mogum"),
-#        ("mov", "00132127-001", "Mohave"),
-#        ("mow", "00132149-001", "Moi"),
-#        ("mox", "00132151-001", "Molima"),
-#        ("moy", "00132134-001", "Shekkacho"),
-#        ("moz", "00132156-001", "Mukulu"),
-#        ("mpa", "00132155-001", "Mpoto"),
-#        ("mpb", "00132154-001", "Mullukmulluk"),
-#        ("mpc", "00132153-001", "Mangarayi"),
-#        ("mpd", "00132152-001", "Machinere"),
-#        ("mpe", "00132142-001", "Majang"),
-#        ("mpg", "00132150-001", "Marba"),
-#        ("mph", "00132158-001", "Maung"),
-#        ("mpi", "00132148-001", "Mpade"),
-#        ("mpj", "00132147-001", "Martu Wangka"),
-#        ("mpk", "00132146-001", "Mbara"),
-#        ("mpl", "00132145-001", "Middle Watut"),
-#        ("mpm", "00132144-001", "Yosondúa Mixtec"),
-#        ("mpn", "00132118-001", "Mindiri"),
-#        ("mpo", "00132157-001", "Miu"),
-#        ("mpp", "00132132-001", "Migabac"),
-#        ("mpq", "00132108-001", "Matís"),
-#        ("mpr", "00132107-001", "Vangunu"),
-#        ("mps", "00132106-001", "Dadibi"),
-#        ("mpt", "00132105-001", "Mian"),
-#        ("mpu", "00132104-001", "Makuráp"),
-#        ("mpv", "00132103-001", "Mungkip"),
-#        ("mpw", "00132094-001", "Mapidian"),
-#        ("mpx", "00132101-001", "Misima-Paneati"),
-#        ("mpy", "00132109-001", "Mapia"),
-#        ("mpz", "00132099-001", "Mpi"),
-#        ("mqa", "00132098-001", "Maba"),
-#        ("mqb", "00132097-001", "Mbuko"),
-#        ("mqc", "00132096-001", "Mangole"),
-#        ("mqe", "00132116-001", "Matepi"),
-#        ("mqf", "00132100-001", "Momuna"),
-#        ("mqg", "00132102-001", "Kota Bangun Kutai Malay"),
-#        ("mqh", "00132124-001", "Tlazoyaltepec Mixtec"),
-#        ("mqi", "00132123-001", "Mariri"),
-#        ("mqj", "00132122-001", "Mamasa"),
-#        ("mqk", "00132121-001", "Rajah Kabunsuwan Manobo"),
-#        ("mql", "00132120-001", "Mbelime"),
-#        ("mqm", "00132119-001", "South Marquesan"),
-#        ("mqn", "00132110-001", "Moronene"),
-#        ("mqo", "00132117-001", "Modole"),
-#        ("mqp", "00132125-001", "Manipa"),
-#        ("mqq", "00132115-001", "Minokok"),
-#        ("mqr", "00132114-001", "Mander"),
-#        ("mqs", "00132113-001", "West Makian"),
-#        ("mqt", "00132112-001", "Mok"),
-#        ("mqu", "00132307-001", "Mandari"),
-#        ("mqv", "00132046-001", "Mosimo"),
-#        ("mqw", "00132241-001", "Murupi"),
-#        ("mqx", "00132466-001", "Mamuju"),
-#        ("mqy", "00132465-001", "Manggarai"),
-#        ("mqz", "00132464-001", "Malasanga"),
-#        ("mra", "00132463-001", "Mlabri"),
-#        ("mrb", "00132462-001", "Marino"),
-#        ("mrc", "00132461-001", "Maricopa"),
-#        ("mrd", "00132452-001", "Western Magar"),
-#        ("mre", "00137924-001", "Martha's Vineyard Sign Language"),
-#        ("mrf", "00132459-001", "Elseng"),
-#        ("mrg", "00132467-001", "Miri"),
-#        ("mrh", "00132457-001", "Mara Chin"),
-#        ("mri", "00138567-001", "Maori"),
-#        ("mrj", "00132456-001", "Western Mari"),
-#        ("mrk", "00132455-001", "Hmwaveke"),
-#        ("mrl", "00132454-001", "Mortlockese"),
-#        ("mrm", "00132453-001", "Merlav"),
-#        ("mrn", "00132475-001", "Cheke Holo"),
-#        ("mro", "00132477-001", "Mru"),
-#        ("mrp", "00132460-001", "Morouas"),
-#        ("mrq", "00132482-001", "North Marquesan"),
-#        ("mrr", "00132481-001", "Maria"),
-#        ("mrs", "00132480-001", "Maragus"),
-#        ("mrt", "00132479-001", "Marghi Central"),
-#        ("mru", "00132478-001", "Mono"),
-#        ("mrv", "00132468-001", "Mangareva"),
-#        ("mrw", "00132476-001", "Maranao"),
-#        ("mrx", "00132484-001", "Maremgi"),
-#        ("mry", "00132474-001", "Karaga Mandaya"),
-#        ("mrz", "00132473-001", "Marind"),
-#        ("msa", "00138572-001", "Malay"),
-#        ("msb", "00132472-001", "Masbatenyo"),
-#        ("msc", "00132471-001", "Sankaran Maninka"),
-#        ("msd", "00132470-001", "Yucatec Maya Sign Language"),
-#        ("mse", "00132444-001", "Musey"),
-#        ("msf", "00132483-001", "Mekwei"),
-#        ("msg", "00132458-001", "Moraid"),
-#        ("msh", "00132434-001", "Masikoro Malagasy"),
-#        ("msi", "00132433-001", "Sabah Malay"),
-#        ("msj", "00132432-001", "Ma"),
-#        ("msk", "00132431-001", "Mansaka"),
-#        ("msl", "00132430-001", "Molof"),
-#        ("msm", "00132429-001", "Agusan Manobo"),
-#        ("msn", "00132420-001", "Vurës"),
-#        ("mso", "00132427-001", "Mombum"),
-#        ("msp", "00138087-001", "Maritsauá"),
-#        ("msq", "00132435-001", "Caac"),
-#        ("msr", "00132425-001", "Mongolian Sign Language"),
-#        ("mss", "00132424-001", "West Masela"),
-#        ("mst", "00132423-001", "Cataelano Mandaya"),
-#        ("msu", "00132422-001", "Musom"),
-#        ("msv", "00132442-001", "Maslam"),
-#        ("msw", "00132426-001", "Mansoanka"),
-#        ("msx", "00132428-001", "Moresada"),
-#        ("msy", "00132450-001", "Aruamu"),
-#        ("msz", "00132449-001", "Momare"),
-#        ("mta", "00132448-001", "Cotabato Manobo"),
-#        ("mtb", "00132447-001", "Anyin Morofo"),
-#        ("mtc", "00132446-001", "Munit"),
-#        ("mtd", "00132445-001", "Mualang"),
-#        ("mte", "00132436-001", "Mono"),
-#        ("mtf", "00135356-001", "Murik"),
-#        ("mtg", "00132451-001", "Una"),
-#        ("mth", "00134466-001", "Munggui"),
-#        ("mti", "00132441-001", "Maiwa"),
-#        ("mtj", "00132440-001", "Moskona"),
-#        ("mtk", "00132439-001", "Mbe'"),
-#        ("mtl", "00132438-001", "Montol"),
-#        ("mtm", "00138118-001", "Mator"),
-#        ("mtn", "00138116-001", "Matagalpa"),
-#        ("mto", "00132437-001", "Totontepec Mixe"),
-#        ("mtp", "00132499-001", "Wichí Lhamtés Nocten"),
-#        ("mtq", "00132549-001", "Muong"),
-#        ("mtr", "00132469-001", "Mewari"),
-#        ("mts", "00132531-001", "Yora"),
-#        ("mtt", "00132530-001", "Mota"),
-#        ("mtu", "00132529-001", "Tututepec Mixtec"),
-#        ("mtv", "00132528-001", "Asaro'o"),
-#        ("mtw", "00132527-001", "Magahat"),
-#        ("mtx", "00132518-001", "Tidaá Mixtec"),
-#        ("mty", "00132525-001", "Nabi"),
-#        ("mua", "00132533-001", "Mundang"),
-#        ("mub", "00132523-001", "Mubi"),
-#        ("muc", "00132522-001", "Mbu'"),
-#        ("mud", "00132521-001", "Mednyj Aleut"),
-#        ("mue", "00132520-001", "Media Lengua"),
-#        ("mug", "00132519-001", "Musgu"),
-#        ("muh", "00132541-001", "Mündü"),
-#        ("mui", "00132543-001", "Musi"),
-#        ("muj", "00132526-001", "Mabire"),
-#        ("muk", "00132548-001", "Mugom"),
-#        ("mul", "00130974-001", "multiple languages"),
-#        ("mum", "00132547-001", "Maiwala"),
-#        ("muo", "00132546-001", "Nyong"),
-#        ("mup", "00132545-001", "Malvi"),
-#        ("muq", "00132544-001", "Eastern Xiangxi Miao"),
-#        ("mur", "00132534-001", "Murle"),
-#        ("mus", "00132542-001", "Creek"),
-#        ("mut", "00132550-001", "Western Muria"),
-#        ("muu", "00132540-001", "Yaaku"),
-#        ("muv", "00132539-001", "Muthuvan"),
-#        ("mux", "00132538-001", "Bo-Ung"),
-#        ("muy", "00132537-001", "Muyang"),
-#        ("muz", "00132536-001", "Mursi"),
-#        ("mva", "00132535-001", "Manam"),
-#        ("mvb", "00138023-001", "Mattole"),
-#        ("mvd", "00132516-001", "Mamboru"),
-#        ("mve", "00132491-001", "Marwari"),
-#        ("mvf", "00132524-001", "Peripheral Mongolian"),
-#        ("mvg", "00132498-001", "Yucuańe Mixtec"),
-#        ("mvh", "00132497-001", "Mire"),
-#        ("mvi", "00132496-001", "Miyako"),
-#        ("mvk", "00132495-001", "Mekmek"),
-#        ("mvl", "00138015-001", "Mbara"),
-#        ("mvm", "00132494-001", "Muya"),
-#        ("mvn", "00132485-001", "Minaveha"),
-#        ("mvo", "00132492-001", "Marovo"),
-#        ("mvp", "00132500-001", "Duri"),
-#        ("mvq", "00132490-001", "Moere"),
-#        ("mvr", "00132489-001", "Marau"),
-#        ("mvs", "00132488-001", "Massep"),
-#        ("mvt", "00132487-001", "Mpotovoro"),
-#        ("mvu", "00132486-001", "Marfa"),
-#        ("mvv", "00132508-001", "Tagal Murut"),
-#        ("mvw", "00132510-001", "Machinga"),
-#        ("mvx", "00132493-001", "Meoswar"),
-#        ("mvy", "00132515-001", "Indus Kohistani"),
-#        ("mvz", "00132514-001", "Mesqan"),
-#        ("mwa", "00132513-001", "Mwatebu"),
-#        ("mwb", "00132512-001", "Juwal"),
-#        ("mwc", "00132511-001", "Are"),
-#        ("mwd", "00132501-001", "Mudbura"),
-#        ("mwe", "00132509-001", "Mwera"),
-#        ("mwf", "00132517-001", "Murrinh-Patha"),
-#        ("mwg", "00132507-001", "Aiklep"),
-#        ("mwh", "00132506-001", "Mouk-Aria"),
-#        ("mwi", "00132505-001", "Labo"),
-#        ("mwj", "00132504-001", "Maligo"),
-#        ("mwk", "00132503-001", "Kita Maninkakan"),
-#        ("mwl", "00132404-001", "Mirandese"),
-#        ("mwm", "00132532-001", "Sar"),
-#        ("mwn", "00132421-001", "Nyamwanga"),
-#        ("mwo", "00132336-001", "Central Maewo"),
-#        ("mwp", "00132335-001", "Kala Lagaw Ya"),
-#        ("mwq", "00132334-001", "Mün Chin"),
-#        ("mwr", "00130995-001", "Marwari"),
-#        ("mws", "00132333-001", "Mwimbi-Muthambi"),
-#        ("mwt", "00132332-001", "Moken"),
-#        ("mwu", "00138041-001", "Mittu"),
-#        ("mwv", "00132331-001", "Mentawai"),
-#        ("mww", "00132322-001", "Hmong Daw"),
-#        ("mwx", "00132329-001", "Mediak"),
-#        ("mwy", "00132337-001", "Mosiro"),
-#        ("mwz", "00132327-001", "Moingi"),
-#        ("mxa", "00132326-001", "Northwest Oaxaca Mixtec"),
-#        ("mxb", "00132325-001", "Tezoatlán Mixtec"),
-#        ("mxc", "00132324-001", "Manyika"),
-#        ("mxd", "00132323-001", "Modang"),
-#        ("mxe", "00132345-001", "Mele-Fila"),
-#        ("mxf", "00132347-001", "Malgbe"),
-#        ("mxg", "00132330-001", "Mbangala"),
-#        ("mxh", "00132352-001", "Mvuba"),
-#        ("mxi", "00138063-001", "Mozarabic"),
-#        ("mxj", "00132351-001", "Miju-Mishmi"),
-#        ("mxk", "00132350-001", "Monumbo"),
-#        ("mxl", "00132349-001", "Maxi Gbe"),
-#        ("mxm", "00132348-001", "Meramera"),
-#        ("mxn", "00132338-001", "Moi"),
-#        ("mxo", "00132346-001", "Mbowe"),
-#        ("mxp", "00132354-001", "Tlahuitoltepec Mixe"),
-#        ("mxq", "00132344-001", "Juquila Mixe"),
-#        ("mxr", "00132343-001", "Murik"),
-#        ("mxs", "00132342-001", "Huitepec Mixtec"),
-#        ("mxt", "00132341-001", "Jamiltepec Mixtec"),
-#        ("mxu", "00132340-001", "Mada"),
-#        ("mxv", "00132314-001", "Metlatónoc Mixtec"),
-#        ("mxw", "00132353-001", "Namo"),
-#        ("mxx", "00132328-001", "Mahou"),
-#        ("mxy", "00132304-001", "Southeastern Nochixtlán Mixtec"),
-#        ("mxz", "00132303-001", "Central Masela"),
-#        ("mya", "00138574-001", "Myanmar; Burmese"),
-#        ("myb", "00132302-001", "Mbay"),
-#        ("myc", "00132301-001", "Mayeka"),
-#        ("myd", "00132300-001", "Maramba"),
-#        ("mye", "00132299-001", "Myene"),
-#        ("myf", "00132290-001", "Bambassi"),
-#        ("myg", "00132297-001", "Manta"),
-#        ("myh", "00137933-001", "Makah"),
-#        ("myi", "00132305-001", "Mina"),
-#        ("myj", "00132295-001", "Mangayat"),
-#        ("myk", "00132294-001", "Mamara Senoufo"),
-#        ("myl", "00132293-001", "Moma"),
-#        ("mym", "00132292-001", "Me'en"),
-#        ("myo", "00132312-001", "Anfillo"),
-#        ("myp", "00132296-001", "Pirahã"),
-#        ("myq", "00132298-001", "Forest Maninka"),
-#        ("myr", "00132320-001", "Muniche"),
-#        ("mys", "00137920-001", "Mesmes"),
-#        ("myt", "00132319-001", "Sangab Mandaya"),
-#        ("myu", "00132318-001", "Mundurukú"),
-#        ("myv", "00132317-001", "Erzya"),
-#        ("myw", "00132316-001", "Muyuw"),
-#        ("myx", "00132315-001", "Masaaba"),
-#        ("myy", "00132306-001", "Macuna"),
-#        ("myz", "00137864-001", "Classical Mandaic"),
-#        ("mza", "00132313-001", "Santa María Zacatepec Mixtec"),
-#        ("mzb", "00132321-001", "Tumzabt"),
-#        ("mzc", "00132311-001", "Madagascar Sign Language"),
-#        ("mzd", "00132310-001", "Malimba"),
-#        ("mze", "00132309-001", "Morawa"),
-#        ("mzg", "00132308-001", "Monastic Sign Language"),
-#        ("mzh", "00132356-001", "Wichí Lhamtés Güisnay"),
-#        ("mzi", "00132291-001", "Ixcatlán Mazatec"),
-#        ("mzj", "00132339-001", "Manya"),
-#        ("mzk", "00132401-001", "Nigeria Mambila"),
-#        ("mzl", "00132400-001", "Mazatlán Mixe"),
-#        ("mzm", "00132399-001", "Mumuye"),
-#        ("mzn", "00132398-001", "Mazanderani"),
-#        ("mzo", "00138005-001", "Matipuhy"),
-#        ("mzp", "00132397-001", "Movima"),
-#        ("mzq", "00132396-001", "Mori Atas"),
-#        ("mzr", "00132387-001", "Marúbo"),
-#        ("mzs", "00132394-001", "Macanese"),
-#        ("mzt", "00132402-001", "Mintil"),
-#        ("mzu", "00132392-001", "Inapang"),
-#        ("mzv", "00132391-001", "Manza"),
-#        ("mzw", "00132390-001", "Deg"),
-#        ("mzx", "00132389-001", "Mawayana"),
-#        ("mzy", "00132388-001", "Mozambican Sign Language"),
-#        ("mzz", "00132410-001", "Maiadomu"),
-#        ("naa", "00132412-001", "Namla"),
-#        ("nab", "00132395-001", "Southern Nambikuára"),
-#        ("nac", "00132417-001", "Narak"),
-#        ("nad", "00132416-001", "Nijadali"),
-#        ("nae", "00132415-001", "Naka'ela"),
-#        ("naf", "00132414-001", "Nabak"),
-#        ("nag", "00132413-001", "Naga Pidgin"),
-#        ("naj", "00132403-001", "Nalu"),
-#        ("nak", "00132411-001", "Nakanai"),
-#        ("nal", "00132419-001", "Nalik"),
-#        ("nam", "00132409-001", "Nangikurrunggurr"),
-#        ("nan", "00132408-001", "Min Nan Chinese"),
-#        ("nao", "00132407-001", "Naaba"),
-#        ("nap", "00132406-001", "Neapolitan"),
-#        ("naq", "00132405-001", "Nama"),
-#        ("nar", "00132379-001", "Iguta"),
-#        ("nas", "00132418-001", "Naasioi"),
-#        ("nat", "00132393-001", "Hungworo"),
-#        ("nau", "00138575-001", "Nauruan"),
-#        ("nav", "00138584-001", "Navajo; Navaho"),
-#        ("naw", "00132369-001", "Nawuri"),
-#        ("nax", "00132368-001", "Nakwi"),
-#        ("nay", "00138285-001", "Narrinyeri"),
-#        ("naz", "00132367-001", "Coatepec Nahuatl"),
-#        ("nba", "00132366-001", "Nyemba"),
-#        ("nbb", "00132365-001", "Ndoe"),
-#        ("nbc", "00132364-001", "Chang Naga"),
-#        ("nbd", "00132355-001", "Ngbinda"),
-#        ("nbe", "00132362-001", "Konyak Naga"),
-#        ("nbf", "00132370-001", "Naxi"),
-#        ("nbg", "00132360-001", "Nagarchal"),
-#        ("nbh", "00132359-001", "Ngamo"),
-#        ("nbi", "00132358-001", "Mao Naga"),
-#        ("nbj", "00132357-001", "Ngarinman"),
-#        ("nbk", "00132377-001", "Nake"),
-#        ("nbl", "00138583-001", "South Ndebele"),
-#        ("nbm", "00132361-001", "Ngbaka Ma'bo"),
-#        ("nbn", "00132363-001", "Kuri"),
-#        ("nbo", "00132385-001", "Nkukoli"),
-#        ("nbp", "00132384-001", "Nnam"),
-#        ("nbq", "00132383-001", "Nggem"),
-#        ("nbr", "00132382-001", "Numana-Nunku-Gbantu-Numbu"),
-#        ("nbs", "00132381-001", "Namibian Sign Language"),
-#        ("nbt", "00132380-001", "Na"),
-#        ("nbu", "00132371-001", "Rongmei Naga"),
-#        ("nbv", "00132378-001", "Ngamambo"),
-#        ("nbw", "00132386-001", "Southern Ngbandi"),
-#        ("nbx", "00132376-001", "Ngura"),
-#        ("nby", "00132375-001", "Ningera"),
-#        ("nca", "00132374-001", "Iyo"),
-#        ("ncb", "00132373-001", "Central Nicobarese"),
-#        ("ncc", "00132372-001", "Ponam"),
-#        ("ncd", "00134464-001", "Nachering"),
-#        ("nce", "00135354-001", "Yale"),
-#        ("ncf", "00137102-001", "Notsi"),
-#        ("ncg", "00137103-001", "Nisga'a"),
-#        ("nch", "00137104-001", "Central Huasteca Nahuatl"),
-#        ("nci", "00137870-001", "Classical Nahuatl"),
-#        ("ncj", "00137105-001", "Northern Puebla Nahuatl"),
-#        ("nck", "00137106-001", "Nakara"),
-#        ("ncl", "00137107-001", "Michoacán Nahuatl"),
-#        ("ncm", "00137108-001", "Nambo"),
-#        ("ncn", "00137109-001", "Nauna"),
-#        ("nco", "00137110-001", "Sibe"),
-#        ("ncp", "00137123-001", "Ndaktup"),
-#        ("ncr", "00137112-001", "Ncane"),
-#        ("ncs", "00137101-001", "Nicaraguan Sign Language"),
-#        ("nct", "00137114-001", "Chothe Naga"),
-#        ("ncu", "00137115-001", "Chumburung"),
-#        ("ncx", "00137116-001", "Central Puebla Nahuatl"),
-#        ("ncz", "00138249-001", "Natchez"),
-#        ("nda", "00137117-001", "Ndasa"),
-#        ("ndb", "00137118-001", "Kenswei Nsei"),
-#        ("ndc", "00137119-001", "Ndau"),
-#        ("ndd", "00137120-001", "Nde-Nsele-Nta"),
-#        ("nde", "00138577-001", "North Ndebele"),
-#        ("ndf", "00138286-001", "Nadruvian"),
-#        ("ndg", "00137121-001", "Ndengereko"),
-#        ("ndh", "00137090-001", "Ndali"),
-#        ("ndi", "00137113-001", "Samba Leko"),
-#        ("ndj", "00137111-001", "Ndamba"),
-#        ("ndk", "00137080-001", "Ndaka"),
-#        ("ndl", "00137081-001", "Ndolo"),
-#        ("ndm", "00137082-001", "Ndam"),
-#        ("ndn", "00137083-001", "Ngundi"),
-#        ("ndo", "00138579-001", "Ndonga"),
-#        ("ndp", "00137084-001", "Ndo"),
-#        ("ndq", "00137085-001", "Ndombe"),
-#        ("ndr", "00137086-001", "Ndoola"),
-#        ("nds", "00137087-001", "Low German; Low Saxon"),
-#        ("ndt", "00137100-001", "Ndunga"),
-#        ("ndu", "00137089-001", "Dugun"),
-#        ("ndv", "00137079-001", "Ndut"),
-#        ("ndw", "00137091-001", "Ndobo"),
-#        ("ndx", "00137092-001", "Nduga"),
-#        ("ndy", "00137093-001", "Lutos"),
-#        ("ndz", "00137094-001", "Ndogo"),
-#        ("nea", "00137095-001", "Eastern Ngad'a"),
-#        ("neb", "00137096-001", "Toura"),
-#        ("nec", "00137097-001", "Nedebang"),
-#        ("ned", "00137098-001", "Nde-Gbite"),
-#        ("nee", "00137099-001", "Kumak"),
-#        ("nef", "00137125-001", "Nefamese"),
-#        ("neg", "00137159-001", "Negidal"),
-#        ("neh", "00137122-001", "Nyenkha"),
-#        ("nei", "00138376-001", "Neo-Hittite"),
-#        ("nej", "00137149-001", "Neko"),
-#        ("nek", "00137150-001", "Neku"),
-#        ("nem", "00137151-001", "Nemi"),
-#        ("nen", "00137152-001", "Nengone"),
-#        ("neo", "00137153-001", "Ná-Meo"),
-#        ("nep", "00138578-001", "Nepali"),
-#        ("neq", "00137154-001", "North Central Mixe"),
-#        ("ner", "00137155-001", "Yahadian"),
-#        ("nes", "00137156-001", "Bhoti Kinnauri"),
-#        ("net", "00137169-001", "Nete"),
-#        ("nev", "00137158-001", "Nyaheun"),
-#        ("new", "00137147-001", "Nepal Bhasa; Newari"),
-#        ("nex", "00137160-001", "Neme"),
-#        ("ney", "00137161-001", "Neyo"),
-#        ("nez", "00137162-001", "Nez Perce"),
-#        ("nfa", "00137163-001", "Dhao"),
-#        ("nfd", "00137164-001", "Ahwai"),
-#        ("nfl", "00137165-001", "Ayiwo"),
-#        ("nfr", "00137166-001", "Nafaanra"),
-#        ("nfu", "00137167-001", "Mfumte"),
-#        ("nga", "00137168-001", "Ngbaka"),
-#        ("ngb", "00137136-001", "Northern Ngbandi"),
-#        ("ngc", "00137134-001", "Ngombe"),
-#        ("ngd", "00137157-001", "Ngando"),
-#        ("nge", "00137126-001", "Ngemba"),
-#        ("ngg", "00137127-001", "Ngbaka Manza"),
-#        ("ngh", "00137128-001", "N/u"),
-#        ("ngi", "00137129-001", "Ngizim"),
-#        ("ngj", "00137130-001", "Ngie"),
-#        ("ngk", "00137131-001", "Ngalkbun"),
-#        ("ngl", "00137132-001", "Lomwe"),
-#        ("ngm", "00137133-001", "Ngatik Men's Creole"),
-#        ("ngn", "00137146-001", "Ngwo"),
-#        ("ngo", "00137135-001", "Ngoni"),
-#        ("ngp", "00137124-001", "Ngulu"),
-#        ("ngq", "00137137-001", "Ngurimi"),
-#        ("ngr", "00137138-001", "Nanggu"),
-#        ("ngs", "00137139-001", "Gvoko"),
-#        ("ngt", "00137140-001", "Ngeq"),
-#        ("ngu", "00137141-001", "Guerrero Nahuatl"),
-#        ("ngv", "00138097-001", "Nagumi"),
-#        ("ngw", "00137142-001", "Ngwaba"),
-#        ("ngx", "00137143-001", "Nggwahyi"),
-#        ("ngy", "00137144-001", "Tibea"),
-#        ("ngz", "00137145-001", "Ngungwel"),
-#        ("nha", "00137057-001", "Nhanda"),
-#        ("nhb", "00136997-001", "Beng"),
-#        ("nhc", "00138031-001", "Tabasco Nahuatl"),
-#        ("nhd", "00137088-001", "Chiripá"),
-#        ("nhe", "00137012-001", "Eastern Huasteca Nahuatl"),
-#        ("nhf", "00137013-001", "Nhuwala"),
-#        ("nhg", "00137014-001", "Tetelcingo Nahuatl"),
-#        ("nhh", "00137015-001", "Nahari"),
-#        ("nhi", "00137016-001", "Zacatlán-Ahuacatlán-Tepetzintla Nahuatl"),
-#        ("nhk", "00137017-001", "Isthmus-Cosoleacaque Nahuatl"),
-#        ("nhm", "00137018-001", "Morelos Nahuatl"),
-#        ("nhn", "00137019-001", "Central Nahuatl"),
-#        ("nho", "00137032-001", "Takuu"),
-#        ("nhp", "00137021-001", "Isthmus-Pajapan Nahuatl"),
-#        ("nhq", "00137010-001", "Huaxcaleca Nahuatl"),
-#        ("nhr", "00137023-001", "Naro"),
-#        ("nht", "00137024-001", "Ometepec Nahuatl"),
-#        ("nhu", "00137025-001", "Noone"),
-#        ("nhv", "00137026-001", "Temascaltepec Nahuatl"),
-#        ("nhw", "00137027-001", "Western Huasteca Nahuatl"),
-#        ("nhx", "00137028-001", "Isthmus-Mecayapan Nahuatl"),
-#        ("nhy", "00137029-001", "Northern Oaxaca Nahuatl"),
-#        ("nhz", "00137030-001", "Santa María La Alta Nahuatl"),
-#        ("nia", "00136999-001", "Nias"),
-#        ("nib", "00137022-001", "Nakama"),
-#        ("nid", "00137980-001", "Ngandi"),
-#        ("nie", "00137020-001", "Niellim"),
-#        ("nif", "00136989-001", "Nek"),
-#        ("nig", "00136990-001", "Ngalakan"),
-#        ("nih", "00136991-001", "Nyiha"),
-#        ("nii", "00136992-001", "Nii"),
-#        ("nij", "00136993-001", "Ngaju"),
-#        ("nik", "00136994-001", "Southern Nicobarese"),
-#        ("nil", "00136995-001", "Nila"),
-#        ("nim", "00136996-001", "Nilamba"),
-#        ("nin", "00137009-001", "Ninzo"),
-#        ("nio", "00136998-001", "Nganasan"),
-#        ("niq", "00136988-001", "Nandi"),
-#        ("nir", "00137000-001", "Nimboran"),
-#        ("nis", "00137001-001", "Nimi"),
-#        ("nit", "00137002-001", "Southeastern Kolami"),
-#        ("niu", "00137003-001", "Niuean"),
-#        ("niv", "00137004-001", "Gilyak"),
-#        ("niw", "00137005-001", "Nimo"),
-#        ("nix", "00137006-001", "Hema"),
-#        ("niy", "00137007-001", "Ngiti"),
-#        ("niz", "00137008-001", "Ningil"),
-#        ("nja", "00137034-001", "Nzanyi"),
-#        ("njb", "00137068-001", "Nocte Naga"),
-#        ("njd", "00137031-001", "Ndonde Hamba"),
-#        ("njh", "00137058-001", "Lotha Naga"),
-#        ("nji", "00137059-001", "Gudanji"),
-#        ("njj", "00137060-001", "Njen"),
-#        ("njl", "00137061-001", "Njalgulgule"),
-#        ("njm", "00137062-001", "Angami Naga"),
-#        ("njn", "00137063-001", "Liangmai Naga"),
-#        ("njo", "00137064-001", "Ao Naga"),
-#        ("njr", "00137065-001", "Njerep"),
-#        ("njs", "00137078-001", "Nisa"),
-#        ("njt", "00137067-001", "Ndyuka-Trio Pidgin"),
-#        ("nju", "00137056-001", "Ngadjunmaya"),
-#        ("njx", "00137069-001", "Kunyi"),
-#        ("njy", "00137070-001", "Njyem"),
-#        ("nka", "00137071-001", "Nkoya"),
-#        ("nkb", "00137072-001", "Khoibu Naga"),
-#        ("nkc", "00137073-001", "Nkongho"),
-#        ("nkd", "00137074-001", "Koireng"),
-#        ("nke", "00137075-001", "Duke"),
-#        ("nkf", "00137076-001", "Inpui Naga"),
-#        ("nkg", "00137077-001", "Nekgini"),
-#        ("nkh", "00137045-001", "Khezha Naga"),
-#        ("nki", "00137043-001", "Thangal Naga"),
-#        ("nkj", "00137066-001", "Nakai"),
-#        ("nkk", "00137035-001", "Nokuku"),
-#        ("nkm", "00137036-001", "Namat"),
-#        ("nkn", "00137037-001", "Nkangala"),
-#        ("nko", "00137038-001", "Nkonya"),
-#        ("nkp", "00138033-001", "Niuatoputapu"),
-#        ("nkr", "00137039-001", "Nukuoro"),
-#        ("nks", "00137040-001", "North Asmat"),
-#        ("nkt", "00137041-001", "Nyika"),
-#        ("nku", "00137042-001", "Bouna Kulango"),
-#        ("nkv", "00137055-001", "Nyika"),
-#        ("nkw", "00137044-001", "Nkutu"),
-#        ("nkx", "00137033-001", "Nkoroo"),
-#        ("nkz", "00137046-001", "Nkari"),
-#        ("nla", "00137047-001", "Ngombale"),
-#        ("nlc", "00137048-001", "Nalca"),
-#        ("nld", "00138580-001", "Dutch"),
-#        ("nld", "00138580-001", "Dutch (Flemish)"),
-#        ("nld", "00138580-001", "Dutch; Flemish"),
-#        ("nld", "00138580-001", "Dutch (Northern)"),
-#        ("nle", "00137049-001", "East Nyala"),
-#        ("nlg", "00137050-001", "Gela"),
-#        ("nli", "00137051-001", "Grangali"),
-#        ("nlj", "00137052-001", "Nyali"),
-#        ("nlk", "00137053-001", "Ninia Yali"),
-#        ("nll", "00137054-001", "Nihali"),
-#        ("nln", "00137179-001", "Durango Nahuatl"),
-#        ("nlo", "00137328-001", "Ngul"),
-#        ("nlr", "00137148-001", "Ngarla"),
-#        ("nlu", "00137286-001", "Nchumbulu"),
-#        ("nlv", "00137287-001", "Orizaba Nahuatl"),
-#        ("nlx", "00137288-001", "Nahali"),
-#        ("nly", "00137289-001", "Nyamal"),
-#        ("nlz", "00137290-001", "Nalögo"),
-#        ("nma", "00137291-001", "Maram Naga"),
-#        ("nmb", "00137292-001", "Big Nambas"),
-#        ("nmc", "00137293-001", "Ngam"),
-#        ("nmd", "00137306-001", "Ndumu"),
-#        ("nme", "00137295-001", "Mzieme Naga"),
-#        ("nmf", "00137284-001", "Tangkhul Naga"),
-#        ("nmg", "00137297-001", "Kwasio"),
-#        ("nmh", "00137298-001", "Monsang Naga"),
-#        ("nmi", "00137299-001", "Nyam"),
-#        ("nmj", "00137300-001", "Ngombe"),
-#        ("nmk", "00137301-001", "Namakura"),
-#        ("nml", "00137302-001", "Ndemli"),
-#        ("nmm", "00137303-001", "Manangba"),
-#        ("nmn", "00137304-001", "!Xóő"),
-#        ("nmo", "00137305-001", "Moyon Naga"),
-#        ("nmp", "00137273-001", "Nimanbur"),
-#        ("nmq", "00137271-001", "Nambya"),
-#        ("nmr", "00137294-001", "Nimbari"),
-#        ("nms", "00137263-001", "Letemboi"),
-#        ("nmt", "00137264-001", "Namonuito"),
-#        ("nmu", "00137265-001", "Northeast Maidu"),
-#        ("nmv", "00137266-001", "Ngamini"),
-#        ("nmw", "00137267-001", "Nimoa"),
-#        ("nmx", "00137268-001", "Nama"),
-#        ("nmy", "00137269-001", "Namuyi"),
-#        ("nmz", "00137270-001", "Nawdm"),
-#        ("nna", "00137283-001", "Nyangumarta"),
-#        ("nnb", "00137272-001", "Nande"),
-#        ("nnc", "00137261-001", "Nancere"),
-#        ("nnd", "00137274-001", "West Ambae"),
-#        ("nne", "00137275-001", "Ngandyera"),
-#        ("nnf", "00137276-001", "Ngaing"),
-#        ("nng", "00137277-001", "Maring Naga"),
-#        ("nnh", "00137278-001", "Ngiemboon"),
-#        ("nni", "00137279-001", "North Nuaulu"),
-#        ("nnj", "00137280-001", "Nyangatom"),
-#        ("nnk", "00137281-001", "Nankina"),
-#        ("nnl", "00137308-001", "Northern Rengma Naga"),
-#        ("nnm", "00137262-001", "Namia"),
-#        ("nnn", "00137296-001", "Ngete"),
-#        ("nno", "00138581-001", "Norwegian Nynorsk"),
-#        ("nnp", "00137331-001", "Wancho Naga"),
-#        ("nnq", "00137332-001", "Ngindo"),
-#        ("nnr", "00137946-001", "Narungga"),
-#        ("nns", "00137333-001", "Ningye"),
-#        ("nnt", "00137949-001", "Nanticoke"),
-#        ("nnu", "00137334-001", "Dwang"),
-#        ("nnv", "00137916-001", "Nugunu"),
-#        ("nnw", "00137335-001", "Southern Nuni"),
-#        ("nnx", "00137336-001", "Ngong"),
-#        ("nny", "00137337-001", "Nyangga"),
-#        ("nnz", "00137338-001", "Nda'nda'"),
-#        ("noa", "00137339-001", "Woun Meu"),
-#        ("nob", "00138576-001", "Norwegian Bokmål"),
-#        ("noc", "00137352-001", "Nuk"),
-#        ("nod", "00137341-001", "Northern Thai"),
-#        ("noe", "00137330-001", "Nimadi"),
-#        ("nof", "00137695-001", "Nomane"),
-#        ("nog", "00137344-001", "Nogai"),
-#        ("noh", "00137285-001", "Nomu"),
-#        ("noi", "00137346-001", "Noiri"),
-#        ("nok", "00137921-001", "Nooksack"),
-#        ("nom", "00137915-001", "Nocamán"),
-#        ("non", "00137869-001", "Old Norse"),
-#        ("noo", "00137347-001", "Nootka"),
-#        ("nop", "00137348-001", "Numanggang"),
-#        ("noq", "00137349-001", "Ngongo"),
-#        ("nor", "00138582-001", "Norwegian"),
-#        ("nos", "00137350-001", "Eastern Nisu"),
-#        ("not", "00137351-001", "Nomatsiguenga"),
-#        ("nou", "00137319-001", "Ewage-Notu"),
-#        ("nov", "00138347-001", "Novial"),
-#        ("now", "00137317-001", "Nyambo"),
-#        ("noy", "00137340-001", "Noy"),
-#        ("noz", "00137309-001", "Nayi"),
-#        ("npa", "00137310-001", "Nar Phu"),
-#        ("npb", "00137311-001", "Nupbikha"),
-#        ("nph", "00137312-001", "Phom Naga"),
-#        ("npl", "00137313-001", "Southeastern Puebla Nahuatl"),
-#        ("npn", "00137314-001", "Mondropolon"),
-#        ("npo", "00137315-001", "Pochuri Naga"),
-#        ("nps", "00137316-001", "Nipsan"),
-#        ("npu", "00137329-001", "Puimei Naga"),
-#        ("npy", "00137318-001", "Napu"),
-#        ("nqg", "00137307-001", "Ede Nago"),
-#        ("nqk", "00137320-001", "Kura Ede Nago"),
-#        ("nqm", "00137321-001", "Ndom"),
-#        ("nqn", "00137322-001", "Nen"),
-#        ("nqo", "00137323-001", "N'Ko"),
-#        ("nra", "00137324-001", "Ngom"),
-#        ("nrb", "00137325-001", "Nara"),
-#        ("nrc", "00138385-001", "Noric"),
-#        ("nre", "00137326-001", "Southern Rengma Naga"),
-#        ("nrg", "00137327-001", "Narango"),
-#        ("nri", "00137239-001", "Chokri Naga"),
-#        ("nrl", "00137342-001", "Ngarluma"),
-#        ("nrm", "00137282-001", "Narom"),
-#        ("nrn", "00137998-001", "Norn"),
-#        ("nrp", "00138381-001", "North Picene"),
-#        ("nrr", "00137193-001", "Norra"),
-#        ("nrt", "00137960-001", "Northern Kalapuya"),
-#        ("nrx", "00137194-001", "Ngurmbur"),
-#        ("nrz", "00137195-001", "Lala"),
-#        ("nsa", "00137196-001", "Sangtam Naga"),
-#        ("nsc", "00137197-001", "Nshi"),
-#        ("nsd", "00137198-001", "Southern Nisu"),
-#        ("nse", "00137199-001", "Nsenga"),
-#        ("nsg", "00137200-001", "Ngasa"),
-#        ("nsh", "00137201-001", "Ngoshie"),
-#        ("nsi", "00137214-001", "Nigerian Sign Language"),
-#        ("nsk", "00137203-001", "Naskapi"),
-#        ("nsl", "00137192-001", "Norwegian Sign Language"),
-#        ("nsm", "00137205-001", "Sumi Naga"),
-#        ("nsn", "00137206-001", "Nehan"),
-#        ("nso", "00137207-001", "Pedi; Sepedi; Northern Sotho"),
-#        ("nsp", "00137208-001", "Nepalese Sign Language"),
-#        ("nsq", "00137209-001", "Northern Sierra Miwok"),
-#        ("nsr", "00137210-001", "Maritime Sign Language"),
-#        ("nss", "00137211-001", "Nali"),
-#        ("nst", "00137212-001", "Tase Naga"),
-#        ("nsu", "00137181-001", "Sierra Negra Nahuatl"),
-#        ("nsv", "00137204-001", "Southwestern Nisu"),
-#        ("nsw", "00137202-001", "Navut"),
-#        ("nsx", "00137171-001", "Nsongo"),
-#        ("nsy", "00137172-001", "Nasal"),
-#        ("nsz", "00137173-001", "Nisenan"),
-#        ("nte", "00137174-001", "Nathembo"),
-#        ("nti", "00137175-001", "Natioro"),
-#        ("ntj", "00137176-001", "Ngaanyatjarra"),
-#        ("ntk", "00137177-001", "Ikoma-Nata-Isenye"),
-#        ("ntm", "00137178-001", "Nateni"),
-#        ("nto", "00137191-001", "Ntomba"),
-#        ("ntp", "00137180-001", "Northern Tepehuan"),
-#        ("ntr", "00137170-001", "Delo"),
-#        ("nts", "00138297-001", "Natagaimas"),
-#        ("ntu", "00137182-001", "Natügu"),
-#        ("ntw", "00138300-001", "Nottoway"),
-#        ("nty", "00137183-001", "Mantsi"),
-#        ("ntz", "00137184-001", "Natanzi"),
-#        ("nua", "00137185-001", "Yuaga"),
-#        ("nuc", "00137982-001", "Nukuini"),
-#        ("nud", "00131513-001", "Ngala"),
-#        ("nue", "00131521-001", "Ngundu"),
-#        ("nuf", "00131511-001", "Nusu"),
-#        ("nug", "00131510-001", "Nungali"),
-#        ("nuh", "00131509-001", "Ndunda"),
-#        ("nui", "00131508-001", "Ngumbi"),
-#        ("nuj", "00131528-001", "Nyole"),
-#        ("nul", "00131512-001", "Nusa Laut"),
-#        ("num", "00131514-001", "Niuafo'ou"),
-#        ("nun", "00131536-001", "Nung"),
-#        ("nuo", "00131535-001", "Nguôn"),
-#        ("nup", "00131534-001", "Nupe-Nupe-Tako"),
-#        ("nuq", "00131533-001", "Nukumanu"),
-#        ("nur", "00131532-001", "Nukuria"),
-#        ("nus", "00131531-001", "Nuer"),
-#        ("nut", "00131522-001", "Nung"),
-#        ("nuu", "00131529-001", "Ngbundu"),
-#        ("nuv", "00131537-001", "Northern Nuni"),
-#        ("nuw", "00131527-001", "Nguluwan"),
-#        ("nux", "00131526-001", "Mehek"),
-#        ("nuy", "00131525-001", "Nunggubuyu"),
-#        ("nuz", "00131524-001", "Tlamacazapa Nahuatl"),
-#        ("nvh", "00131572-001", "Nasarian"),
-#        ("nvm", "00131507-001", "Namiae"),
-#        ("nwa", "00138019-001", "Nawathinehena"),
-#        ("nwb", "00131555-001", "Nyabwa"),
-#        ("nwc", "00137883-001", "Classical Newari; Old Newari; Classical Nepal Bhasa"),
-#        ("nwe", "00131617-001", "Ngwe"),
-#        ("nwi", "00131616-001", "Southwest Tanna"),
-#        ("nwm", "00131615-001", "Nyamusa-Molo"),
-#        ("nwr", "00131614-001", "Nawaru"),
-#        ("nwx", "00137881-001", "Middle Newar"),
-#        ("nwy", "00138035-001", "Nottoway-Meherrin"),
-#        ("nxa", "00131613-001", "Nauete"),
-#        ("nxd", "00131612-001", "Ngando"),
-#        ("nxe", "00131603-001", "Nage"),
-#        ("nxg", "00131610-001", "Ngad'a"),
-#        ("nxi", "00131618-001", "Nindi"),
-#        ("nxl", "00131608-001", "South Nuaulu"),
-#        ("nxm", "00138442-001", "Numidian"),
-#        ("nxn", "00131607-001", "Ngawun"),
-#        ("nxr", "00131606-001", "Ninggerum"),
-#        ("nxu", "00131605-001", "Narau"),
-#        ("nxx", "00131604-001", "Nafri"),
-#        ("nya", "00138585-001", "Chichewa; Chewa; Nyanja"),
-#        ("nyb", "00131626-001", "Nyangbo"),
-#        ("nyc", "00131628-001", "Nyanga-li"),
-#        ("nyd", "00131611-001", "Nyore"),
-#        ("nye", "00131633-001", "Nyengo"),
-#        ("nyf", "00131632-001", "Giryama"),
-#        ("nyg", "00131631-001", "Nyindu"),
-#        ("nyh", "00131630-001", "Nyigina"),
-#        ("nyi", "00131629-001", "Ama"),
-#        ("nyj", "00131619-001", "Nyanga"),
-#        ("nyk", "00131627-001", "Nyaneka"),
-#        ("nyl", "00131635-001", "Nyeu"),
-#        ("nym", "00131625-001", "Nyamwezi"),
-#        ("nyn", "00131624-001", "Nyankole"),
-#        ("nyo", "00131623-001", "Nyoro"),
-#        ("nyp", "00138094-001", "Nyang'i"),
-#        ("nyq", "00131622-001", "Nayini"),
-#        ("nyr", "00131621-001", "Nyiha"),
-#        ("nys", "00138096-001", "Nyunga"),
-#        ("nyt", "00131595-001", "Nyawaygi"),
-#        ("nyu", "00131634-001", "Nyungwe"),
-#        ("nyv", "00131609-001", "Nyulnyul"),
-#        ("nyw", "00131585-001", "Nyaw"),
-#        ("nyx", "00137929-001", "Nganyaywana"),
-#        ("nyy", "00131584-001", "Nyakyusa-Ngonde"),
-#        ("nza", "00131583-001", "Tigon Mbembe"),
-#        ("nzb", "00131582-001", "Njebi"),
-#        ("nzi", "00131581-001", "Nzima"),
-#        ("nzk", "00131580-001", "Nzakara"),
-#        ("nzm", "00131571-001", "Zeme Naga"),
-#        ("nzs", "00131578-001", "New Zealand Sign Language"),
-#        ("nzu", "00131586-001", "Teke-Nzikou"),
-#        ("nzy", "00131576-001", "Nzakambay"),
-#        ("oaa", "00131575-001", "Orok"),
-#        ("oac", "00131574-001", "Oroch"),
-#        ("oar", "00138402-001", "Old Aramaic"),
-#        ("oav", "00137897-001", "Old Avar"),
-#        ("obi", "00137927-001", "Obispeńo"),
-#        ("obl", "00131573-001", "Oblo"),
-#        ("obm", "00138401-001", "Moabite"),
-#        ("obo", "00131593-001", "Obo Manobo"),
-#        ("obr", "00137910-001", "Old Burmese"),
-#        ("obt", "00137913-001", "Old Breton"),
-#        ("obu", "00131577-001", "Obulom"),
-#        ("oca", "00131579-001", "Ocaina"),
-#        ("och", "00138399-001", "Old Chinese"),
-#        ("oci", "00138586-001", "Occitan; Provençal"),
-#        ("oco", "00137893-001", "Old Cornish"),
-#        ("ocu", "00131601-001", "Atzingo Matlatzinca"),
-#        ("oda", "00131600-001", "Odut"),
-#        ("odk", "00131599-001", "Od"),
-#        ("odt", "00137882-001", "Old Dutch"),
-#        ("odu", "00131598-001", "Odual"),
-#        ("ofo", "00138011-001", "Ofo"),
-#        ("ofs", "00137888-001", "Old Frisian"),
-#        ("ofu", "00131597-001", "Efutop"),
-#        ("ogb", "00131596-001", "Ogbia"),
-#        ("ogc", "00131587-001", "Ogbah"),
-#        ("oge", "00137892-001", "Old Georgian"),
-#        ("ogg", "00131594-001", "Ogbogolo"),
-#        ("ogo", "00131602-001", "Khana"),
-#        ("ogu", "00131592-001", "Ogbronuagum"),
-#        ("oht", "00138390-001", "Old Hittite"),
-#        ("ohu", "00137896-001", "Old Hungarian"),
-#        ("oia", "00131591-001", "Oirata"),
-#        ("oin", "00131590-001", "Inebu One"),
-#        ("ojb", "00131589-001", "Northwestern Ojibwa"),
-#        ("ojc", "00131588-001", "Central Ojibwa"),
-#        ("ojg", "00131813-001", "Eastern Ojibwa"),
-#        ("oji", "00138587-001", "Ojibwa"),
-#        ("ojp", "00137885-001", "Old Japanese"),
-#        ("ojs", "00132010-001", "Severn Ojibwa"),
-#        ("ojv", "00137186-001", "Ontong Java"),
-#        ("ojw", "00137187-001", "Western Ojibwa"),
-#        ("oka", "00137188-001", "Okanagan"),
-#        ("okb", "00137189-001", "Okobo"),
-#        ("okd", "00137190-001", "Okodia"),
-#        ("oke", "00137216-001", "Okpe"),
-#        ("okh", "00137250-001", "Koresh-e Rostam"),
-#        ("oki", "00137213-001", "Okiek"),
-#        ("okj", "00138259-001", "Oko-Juwoi"),
-#        ("okk", "00137240-001", "Kwamtim One"),
-#        ("okl", "00138262-001", "Old Kentish Sign Language"),
-#        ("okm", "00137866-001", "Middle Korean"),
-#        ("okn", "00137241-001", "Oki-No-Erabu"),
-#        ("oko", "00137880-001", "Old Korean"),
-#        ("okr", "00137242-001", "Kirike"),
-#        ("oks", "00137243-001", "Oko-Eni-Osayen"),
-#        ("oku", "00137244-001", "Oku"),
-#        ("okv", "00137245-001", "Orokaiva"),
-#        ("okx", "00137246-001", "Okpe"),
-#        ("ola", "00137247-001", "Walungge"),
-#        ("old", "00137260-001", "Mochi"),
-#        ("ole", "00137249-001", "Olekha"),
-#        ("olm", "00137238-001", "Oloma"),
-#        ("olo", "00137251-001", "Livvi"),
-#        ("olr", "00137252-001", "Olrat"),
-#        ("oma", "00137253-001", "Omaha-Ponca"),
-#        ("omb", "00137254-001", "East Ambae"),
-#        ("omc", "00138338-001", "Mochica"),
-#        ("ome", "00138339-001", "Omejes"),
-#        ("omg", "00137255-001", "Omagua"),
-#        ("omi", "00137256-001", "Omi"),
-#        ("omk", "00138342-001", "Omok"),
-#        ("oml", "00137257-001", "Ombo"),
-#        ("omn", "00138434-001", "Minoan"),
-#        ("omo", "00137258-001", "Utarmbung"),
-#        ("omp", "00137859-001", "Old Manipuri"),
-#        ("omr", "00137868-001", "Old Marathi"),
-#        ("omt", "00137259-001", "Omotik"),
-#        ("omu", "00138311-001", "Omurano"),
-#        ("omw", "00137227-001", "South Tairora"),
-#        ("omx", "00137873-001", "Old Mon"),
-#        ("ona", "00137225-001", "Ona"),
-#        ("onb", "00137248-001", "Lingao"),
-#        ("one", "00137217-001", "Oneida"),
-#        ("ong", "00137218-001", "Olo"),
-#        ("oni", "00137219-001", "Onin"),
-#        ("onj", "00137220-001", "Onjob"),
-#        ("onk", "00137221-001", "Kabore One"),
-#        ("onn", "00137222-001", "Onobasulu"),
-#        ("ono", "00137223-001", "Onondaga"),
-#        ("onp", "00137224-001", "Sartang"),
-#        ("onr", "00137237-001", "Northern One"),
-#        ("ons", "00137226-001", "Ono"),
-#        ("ont", "00137215-001", "Ontenu"),
-#        ("onu", "00137228-001", "Unua"),
-#        ("onw", "00137878-001", "Old Nubian"),
-#        ("onx", "00137229-001", "Onin Based Pidgin"),
-#        ("ood", "00137230-001", "Tohono O'odham"),
-#        ("oog", "00137231-001", "Ong"),
-#        ("oon", "00137232-001", "Önge"),
-#        ("oor", "00137233-001", "Oorlams"),
-#        ("oos", "00138456-001", "Old Ossetic"),
-#        ("opa", "00137234-001", "Okpamheri"),
-#        ("opk", "00137235-001", "Kopkaka"),
-#        ("opm", "00137236-001", "Oksapmin"),
-#        ("opo", "00136920-001", "Opao"),
-#        ("opt", "00136646-001", "Opata"),
-#        ("opy", "00137011-001", "Ofayé"),
-#        ("ora", "00136738-001", "Oroha"),
-#        ("orc", "00136739-001", "Orma"),
-#        ("ore", "00136740-001", "Orejón"),
-#        ("org", "00136741-001", "Oring"),
-#        ("orh", "00136742-001", "Oroqen"),
-#        ("ori", "00138589-001", "Oriya"),
-#        ("orm", "00138588-001", "Oromo; Afan Oromo; Galla"),
-#        ("orn", "00136743-001", "Orang Kanaq"),
-#        ("oro", "00136744-001", "Orokolo"),
-#        ("orr", "00136745-001", "Oruma"),
-#        ("ors", "00136758-001", "Orang Seletar"),
-#        ("ort", "00136747-001", "Adivasi Oriya"),
-#        ("oru", "00136736-001", "Ormuri"),
-#        ("orv", "00137854-001", "Old Russian"),
-#        ("orw", "00136749-001", "Oro Win"),
-#        ("orx", "00136750-001", "Oro"),
-#        ("orz", "00136751-001", "Ormu"),
-#        ("osa", "00136752-001", "Osage"),
-#        ("osc", "00138388-001", "Oscan"),
-#        ("osi", "00136753-001", "Osing"),
-#        ("oso", "00136754-001", "Ososo"),
-#        ("osp", "00137858-001", "Old Spanish"),
-#        ("oss", "00138590-001", "Ossetian; Ossetic"),
-#        ("ost", "00136755-001", "Osatu"),
-#        ("osu", "00136756-001", "Southern One"),
-#        ("osx", "00137852-001", "Old Saxon"),
-#        ("ota", "00137853-001", "Ottoman Turkish"),
-#        ("otb", "00137856-001", "Old Tibetan"),
-#        ("otd", "00136725-001", "Ot Danum"),
-#        ("ote", "00136748-001", "Mezquital Otomi"),
-#        ("oti", "00138241-001", "Oti"),
-#        ("otk", "00137857-001", "Old Turkish"),
-#        ("otl", "00136746-001", "Tilapa Otomi"),
-#        ("otm", "00136715-001", "Eastern Highland Otomi"),
-#        ("otn", "00136716-001", "Tenango Otomi"),
-#        ("otq", "00136717-001", "Querétaro Otomi"),
-#        ("otr", "00136718-001", "Otoro"),
-#        ("ots", "00136719-001", "Estado de México Otomi"),
-#        ("ott", "00136720-001", "Temoaya Otomi"),
-#        ("otu", "00138206-001", "Otuke"),
-#        ("otw", "00136721-001", "Ottawa"),
-#        ("otx", "00136722-001", "Texcatepec Otomi"),
-#        ("oty", "00138406-001", "Old Tamil"),
-#        ("otz", "00136735-001", "Ixtenco Otomi"),
-#        ("oua", "00136724-001", "Tagargrent"),
-#        ("oub", "00136714-001", "Glio-Oubi"),
-#        ("oue", "00136726-001", "Ounge"),
-#        ("oui", "00137909-001", "Old Uighur"),
-#        ("oum", "00138150-001", "Ouma"),
-#        ("oun", "00136727-001", "!O!ung"),
-#        ("owi", "00136728-001", "Owiniga"),
-#        ("owl", "00137886-001", "Old Welsh"),
-#        ("oyb", "00136729-001", "Oy"),
-#        ("oyd", "00136730-001", "Oyda"),
-#        ("oym", "00136731-001", "Wayampi"),
-#        ("oyy", "00136732-001", "Oya'oya"),
-#        ("ozm", "00136733-001", "Koonzime"),
-#        ("pab", "00136734-001", "Parecís"),
-#        ("pac", "00136760-001", "Pacoh"),
-#        ("pad", "00136794-001", "Paumarí"),
-#        ("pae", "00136757-001", "Pagibete"),
-#        ("paf", "00138160-001", "Paranawát"),
-#        ("pag", "00136784-001", "Pangasinan"),
-#        ("pah", "00136785-001", "Tenharim"),
-#        ("pai", "00136786-001", "Pe"),
-#        ("pak", "00136787-001", "Parakanã"),
-#        ("pal", "00138400-001", "Pahlavi"),
-#        ("pam", "00136788-001", "Pampanga; Kapampangan"),
-#        ("pan", "00138591-001", "Punjabi; Panjabi"),
-#        ("pao", "00136789-001", "Northern Paiute"),
-#        ("pap", "00136790-001", "Papiamento"),
-#        ("paq", "00136791-001", "Parya"),
-#        ("par", "00136804-001", "Panamint"),
-#        ("pas", "00136793-001", "Papasena"),
-#        ("pat", "00136782-001", "Papitalai"),
-#        ("pau", "00136795-001", "Palauan"),
-#        ("pav", "00136796-001", "Pakaásnovos"),
-#        ("paw", "00136797-001", "Pawnee"),
-#        ("pax", "00138326-001", "Pankararé"),
-#        ("pay", "00136798-001", "Pech"),
-#        ("paz", "00138313-001", "Pankararú"),
-#        ("pbb", "00136799-001", "Páez"),
-#        ("pbc", "00136800-001", "Patamona"),
-#        ("pbe", "00136801-001", "Mezontla Popoloca"),
-#        ("pbf", "00136802-001", "Coyotepec Popoloca"),
-#        ("pbg", "00138345-001", "Paraujano"),
-#        ("pbh", "00136803-001", "E'ńapa Woromaipu"),
-#        ("pbi", "00136771-001", "Parkwa"),
-#        ("pbl", "00136769-001", "Mak"),
-#        ("pbn", "00136792-001", "Kpasam"),
-#        ("pbo", "00136761-001", "Papel"),
-#        ("pbp", "00136762-001", "Badyara"),
-#        ("pbr", "00136763-001", "Pangwa"),
-#        ("pbs", "00136764-001", "Central Pame"),
-#        ("pbt", "00136765-001", "Southern Pashto"),
-#        ("pbu", "00136766-001", "Northern Pashto"),
-#        ("pbv", "00136767-001", "Pnar"),
-#        ("pby", "00136768-001", "Pyu"),
-#        ("pbz", "00136781-001", "Palu"),
-#        ("pca", "00136770-001", "Santa Inés Ahuatempan Popoloca"),
-#        ("pcb", "00136759-001", "Pear"),
-#        ("pcc", "00136772-001", "Bouyei"),
-#        ("pcd", "00136773-001", "Picard"),
-#        ("pce", "00136774-001", "Ruching Palaung"),
-#        ("pcf", "00136775-001", "Paliyan"),
-#        ("pcg", "00136776-001", "Paniya"),
-#        ("pch", "00136777-001", "Pardhan"),
-#        ("pci", "00136778-001", "Duruwa"),
-#        ("pcj", "00136779-001", "Parenga"),
-#        ("pck", "00136780-001", "Paite Chin"),
-#        ("pcl", "00136692-001", "Pardhi"),
-#        ("pcm", "00136632-001", "Nigerian Pidgin"),
-#        ("pcn", "00136723-001", "Piti"),
-#        ("pcp", "00136647-001", "Pacahuara"),
-#        ("pcr", "00136648-001", "Panang"),
-#        ("pcw", "00136649-001", "Pyapun"),
-#        ("pda", "00136650-001", "Anam"),
-#        ("pdc", "00136651-001", "Pennsylvania German"),
-#        ("pdi", "00136652-001", "Pa Di"),
-#        ("pdn", "00136653-001", "Podena"),
-#        ("pdo", "00136654-001", "Padoe"),
-#        ("pdt", "00136667-001", "Plautdietsch"),
-#        ("pdu", "00136656-001", "Kayan"),
-#        ("pea", "00136645-001", "Peranakan Indonesian"),
-#        ("peb", "00138301-001", "Eastern Pomo"),
-#        ("ped", "00136658-001", "Mala"),
-#        ("pee", "00136659-001", "Taje"),
-#        ("pef", "00138284-001", "Northeastern Pomo"),
-#        ("peg", "00136660-001", "Pengo"),
-#        ("peh", "00136661-001", "Bonan"),
-#        ("pei", "00136662-001", "Chichimeca-Jonaz"),
-#        ("pej", "00138277-001", "Northern Pomo"),
-#        ("pek", "00136663-001", "Penchal"),
-#        ("pel", "00136664-001", "Pekal"),
-#        ("pem", "00136665-001", "Phende"),
-#        ("peo", "00137902-001", "Old Persian"),
-#        ("pep", "00136634-001", "Kunja"),
-#        ("peq", "00136657-001", "Southern Pomo"),
-#        ("pes", "00136655-001", "Western Farsi"),
-#        ("pev", "00136624-001", "Pémono"),
-#        ("pex", "00136625-001", "Petats"),
-#        ("pey", "00136626-001", "Petjo"),
-#        ("pez", "00136627-001", "Eastern Penan"),
-#        ("pfa", "00136628-001", "Pááfang"),
-#        ("pfe", "00136629-001", "Peere"),
-#        ("pfl", "00136630-001", "Pfaelzisch"),
-#        ("pga", "00136631-001", "Sudanese Creole Arabic"),
-#        ("pgg", "00136644-001", "Pangwali"),
-#        ("pgi", "00136633-001", "Pagi"),
-#        ("pgk", "00136623-001", "Rerep"),
-#        ("pgn", "00138393-001", "Paelignian"),
-#        ("pgs", "00136635-001", "Pangseng"),
-#        ("pgu", "00136636-001", "Pagu"),
-#        ("pgy", "00136637-001", "Pongyong"),
-#        ("pha", "00136638-001", "Pa-Hng"),
-#        ("phd", "00136639-001", "Phudagi"),
-#        ("phg", "00136640-001", "Phuong"),
-#        ("phh", "00136641-001", "Phukha"),
-#        ("phk", "00136642-001", "Phake"),
-#        ("phl", "00136643-001", "Phalura"),
-#        ("phm", "00136669-001", "Phimbi"),
-#        ("phn", "00138394-001", "Phoenician"),
-#        ("pho", "00136703-001", "Phunoi"),
-#        ("phq", "00136666-001", "Phana'"),
-#        ("phr", "00136693-001", "Pahari-Potwari"),
-#        ("pht", "00136694-001", "Phu Thai"),
-#        ("phu", "00136695-001", "Phuan"),
-#        ("phv", "00136696-001", "Pahlavani"),
-#        ("phw", "00136697-001", "Phangduwali"),
-#        ("pia", "00136698-001", "Pima Bajo"),
-#        ("pib", "00136699-001", "Yine"),
-#        ("pic", "00136700-001", "Pinji"),
-#        ("pid", "00136713-001", "Piaroa"),
-#        ("pie", "00137994-001", "Piro"),
-#        ("pif", "00136702-001", "Pingelapese"),
-#        ("pig", "00136691-001", "Pisabo"),
-#        ("pih", "00136704-001", "Pitcairn-Norfolk"),
-#        ("pii", "00136705-001", "Pini"),
-#        ("pij", "00137917-001", "Pijao"),
-#        ("pil", "00136706-001", "Yom"),
-#        ("pim", "00137926-001", "Powhatan"),
-#        ("pin", "00136707-001", "Piame"),
-#        ("pio", "00136708-001", "Piapoco"),
-#        ("pip", "00136709-001", "Pero"),
-#        ("pir", "00136710-001", "Piratapuyo"),
-#        ("pis", "00136711-001", "Pijin"),
-#        ("pit", "00136712-001", "Pitta Pitta"),
-#        ("piu", "00136680-001", "Pintupi-Luritja"),
-#        ("piv", "00136678-001", "Pileni"),
-#        ("piw", "00136701-001", "Pimbwe"),
-#        ("pix", "00136670-001", "Piu"),
-#        ("piy", "00136671-001", "Piya-Kwonci"),
-#        ("piz", "00136672-001", "Pije"),
-#        ("pjt", "00136673-001", "Pitjantjatjara"),
-#        ("pka", "00137884-001", "Ardhamāgadhī Prākrit"),
-#        ("pkb", "00136674-001", "Pokomo"),
-#        ("pkc", "00137942-001", "Paekche"),
-#        ("pkg", "00136675-001", "Pak-Tong"),
-#        ("pkh", "00136676-001", "Pankhu"),
-#        ("pkn", "00136677-001", "Pakanha"),
-#        ("pko", "00136690-001", "Pökoot"),
-#        ("pkp", "00136679-001", "Pukapuka"),
-#        ("pkr", "00136668-001", "Attapady Kurumba"),
-#        ("pks", "00136681-001", "Pakistan Sign Language"),
-#        ("pkt", "00136682-001", "Maleng"),
-#        ("pku", "00136683-001", "Paku"),
-#        ("pla", "00136684-001", "Miani"),
-#        ("plb", "00136685-001", "Polonombauk"),
-#        ("plc", "00136686-001", "Central Palawano"),
-#        ("pld", "00136687-001", "Polari"),
-#        ("ple", "00136688-001", "Palu'e"),
-#        ("plg", "00136689-001", "Pilagá"),
-#        ("plh", "00136814-001", "Paulohi"),
-#        ("pli", "00138592-001", "Pali"),
-#        ("plj", "00136963-001", "Polci"),
-#        ("plk", "00136783-001", "Kohistani Shina"),
-#        ("pll", "00136921-001", "Shwe Palaung"),
-#        ("pln", "00136922-001", "Palenquero"),
-#        ("plo", "00136923-001", "Oluta Popoluca"),
-#        ("plp", "00136924-001", "Palpa"),
-#        ("plq", "00138460-001", "Palaic"),
-#        ("plr", "00136925-001", "Palaka Senoufo"),
-#        ("pls", "00136926-001", "San Marcos Tlalcoyalco Popoloca"),
-#        ("plt", "00136927-001", "Plateau Malagasy"),
-#        ("plu", "00136928-001", "Palikúr"),
-#        ("plv", "00136941-001", "Southwest Palawano"),
-#        ("plw", "00136930-001", "Brooke's Point Palawano"),
-#        ("ply", "00136919-001", "Bolyu"),
-#        ("plz", "00136932-001", "Paluan"),
-#        ("pma", "00136933-001", "Paama"),
-#        ("pmb", "00136934-001", "Pambia"),
-#        ("pmc", "00138124-001", "Palumata"),
-#        ("pme", "00136935-001", "Pwaamei"),
-#        ("pmf", "00136936-001", "Pamona"),
-#        ("pmh", "00137887-001", "Māhārāṣṭri Prākrit"),
-#        ("pmi", "00136937-001", "Northern Pumi"),
-#        ("pmj", "00136938-001", "Southern Pumi"),
-#        ("pmk", "00138112-001", "Pamlico"),
-#        ("pml", "00138107-001", "Lingua Franca"),
-#        ("pmm", "00136939-001", "Pomo"),
-#        ("pmn", "00136940-001", "Pam"),
-#        ("pmo", "00136908-001", "Pom"),
-#        ("pmq", "00136906-001", "Northern Pame"),
-#        ("pmr", "00136929-001", "Paynamar"),
-#        ("pms", "00136898-001", "Piemontese"),
-#        ("pmt", "00136899-001", "Tuamotuan"),
-#        ("pmu", "00136900-001", "Mirpur Panjabi"),
-#        ("pmw", "00136901-001", "Plains Miwok"),
-#        ("pmx", "00136902-001", "Poumei Naga"),
-#        ("pmy", "00136903-001", "Papuan Malay"),
-#        ("pmz", "00138025-001", "Southern Pame"),
-#        ("pna", "00136904-001", "Punan Bah-Biau"),
-#        ("pnb", "00136905-001", "Western Panjabi"),
-#        ("pnc", "00136918-001", "Pannei"),
-#        ("pne", "00136907-001", "Western Penan"),
-#        ("png", "00136896-001", "Pongu"),
-#        ("pnh", "00136909-001", "Penrhyn"),
-#        ("pni", "00136910-001", "Aoheng"),
-#        ("pnm", "00136911-001", "Punan Batu 1"),
-#        ("pnn", "00136912-001", "Pinai-Hagahai"),
-#        ("pno", "00138055-001", "Panobo"),
-#        ("pnp", "00136913-001", "Pancana"),
-#        ("pnq", "00136914-001", "Pana"),
-#        ("pnr", "00136915-001", "Panim"),
-#        ("pns", "00136916-001", "Ponosakan"),
-#        ("pnt", "00136943-001", "Pontic"),
-#        ("pnu", "00136897-001", "Jiongnai Bunu"),
-#        ("pnv", "00136931-001", "Pinigura"),
-#        ("pnw", "00136966-001", "Panytyima"),
-#        ("pnx", "00136967-001", "Phong-Kniang"),
-#        ("pny", "00136968-001", "Pinyin"),
-#        ("pnz", "00136969-001", "Pana"),
-#        ("poc", "00136970-001", "Poqomam"),
-#        ("pod", "00138060-001", "Ponares"),
-#        ("poe", "00136971-001", "San Juan Atzingo Popoloca"),
-#        ("pof", "00136972-001", "Poke"),
-#        ("pog", "00138058-001", "Potiguára"),
-#        ("poh", "00136973-001", "Poqomchi'"),
-#        ("poi", "00136974-001", "Highland Popoluca"),
-#        ("pok", "00136987-001", "Pokangá"),
-#        ("pol", "00138593-001", "Polish"),
-#        ("pom", "00136976-001", "Southeastern Pomo"),
-#        ("pon", "00136965-001", "Pohnpeian"),
-#        ("poo", "00136978-001", "Central Pomo"),
-#        ("pop", "00136979-001", "Pwapwa"),
-#        ("poq", "00136980-001", "Texistepec Popoluca"),
-#        ("por", "00138595-001", "Portuguese"),
-#        ("pos", "00136981-001", "Sayula Popoluca"),
-#        ("pot", "00136982-001", "Potawatomi"),
-#        ("pov", "00136983-001", "Upper Guinea Crioulo"),
-#        ("pow", "00136984-001", "San Felipe Otlaltepec Popoloca"),
-#        ("pox", "00138052-001", "Polabian"),
-#        ("poy", "00136985-001", "Pogolo"),
-#        ("ppa", "00136986-001", "Pao"),
-#        ("ppe", "00136954-001", "Papi"),
-#        ("ppi", "00136952-001", "Paipai"),
-#        ("ppk", "00136975-001", "Uma"),
-#        ("ppl", "00136944-001", "Pipil"),
-#        ("ppm", "00136945-001", "Papuma"),
-#        ("ppn", "00136946-001", "Papapana"),
-#        ("ppo", "00136947-001", "Folopa"),
-#        ("ppp", "00136948-001", "Pelende"),
-#        ("ppq", "00136949-001", "Pei"),
-#        ("ppr", "00136950-001", "Piru"),
-#        ("pps", "00136951-001", "San Luís Temalacayuca Popoloca"),
-#        ("ppt", "00136964-001", "Pare"),
-#        ("ppu", "00138065-001", "Papora"),
-#        ("pqa", "00136953-001", "Pa'a"),
-#        ("pqm", "00136942-001", "Malecite-Passamaquoddy"),
-#        ("prb", "00136955-001", "Lua'"),
-#        ("prc", "00136956-001", "Parachi"),
-#        ("prd", "00136957-001", "Parsi-Dari"),
-#        ("pre", "00136958-001", "Principense"),
-#        ("prg", "00138039-001", "Prussian"),
-#        ("prh", "00136959-001", "Porohanon"),
-#        ("pri", "00136960-001", "Paicî"),
-#        ("prk", "00136961-001", "Parauk"),
-#        ("prl", "00136962-001", "Peruvian Sign Language"),
-#        ("prm", "00136874-001", "Kibiri"),
-#        ("prn", "00136977-001", "Prasuni"),
-#        ("pro", "00137905-001", "Old Provençal"),
-#        ("prp", "00136917-001", "Parsi"),
-#        ("prq", "00136828-001", "Ashéninka Perené"),
-#        ("prr", "00138105-001", "Puri"),
-#        ("prs", "00136829-001", "Dari"),
-#        ("prt", "00136830-001", "Phai"),
-#        ("pru", "00136831-001", "Puragi"),
-#        ("prw", "00136832-001", "Parawen"),
-#        ("prx", "00136833-001", "Purik"),
-#        ("pry", "00136834-001", "Pray 3"),
-#        ("prz", "00136835-001", "Providencia Sign Language"),
-#        ("psa", "00136836-001", "Asue Awyu"),
-#        ("psc", "00136849-001", "Persian Sign Language"),
-#        ("psd", "00136838-001", "Plains Indian Sign Language"),
-#        ("pse", "00136827-001", "Central Malay"),
-#        ("psg", "00136840-001", "Penang Sign Language"),
-#        ("psh", "00136841-001", "Southwest Pashayi"),
-#        ("psi", "00136842-001", "Southeast Pashayi"),
-#        ("psl", "00136843-001", "Puerto Rican Sign Language"),
-#        ("psm", "00137948-001", "Pauserna"),
-#        ("psn", "00136844-001", "Panasuan"),
-#        ("pso", "00136845-001", "Polish Sign Language"),
-#        ("psp", "00136846-001", "Philippine Sign Language"),
-#        ("psq", "00136847-001", "Pasi"),
-#        ("psr", "00136816-001", "Portuguese Sign Language"),
-#        ("pss", "00136839-001", "Kaulong"),
-#        ("pst", "00136837-001", "Central Pashto"),
-#        ("psu", "00137904-001", "Sauraseni Prākrit"),
-#        ("psw", "00136806-001", "Port Sandwich"),
-#        ("psy", "00137952-001", "Piscataway"),
-#        ("pta", "00136807-001", "Pai Tavytera"),
-#        ("pth", "00137985-001", "Pataxó Hã-Ha-Hãe"),
-#        ("pti", "00136808-001", "Pintiini"),
-#        ("ptn", "00136809-001", "Patani"),
-#        ("pto", "00136810-001", "Zo'é"),
-#        ("ptp", "00136811-001", "Patep"),
-#        ("ptr", "00136812-001", "Piamatsina"),
-#        ("ptt", "00136813-001", "Enrekang"),
-#        ("ptu", "00136826-001", "Bambam"),
-#        ("ptv", "00136815-001", "Port Vato"),
-#        ("ptw", "00137999-001", "Pentlatch"),
-#        ("pty", "00136805-001", "Pathiya"),
-#        ("pua", "00136817-001", "Western Highland Purepecha"),
-#        ("pub", "00136818-001", "Purum"),
-#        ("puc", "00136819-001", "Punan Merap"),
-#        ("pud", "00136820-001", "Punan Aput"),
-#        ("pue", "00136821-001", "Puelche"),
-#        ("puf", "00136822-001", "Punan Merah"),
-#        ("pug", "00136823-001", "Phuie"),
-#        ("pui", "00136824-001", "Puinave"),
-#        ("puj", "00136825-001", "Punan Tubu"),
-#        ("puk", "00136851-001", "Pu Ko"),
-#        ("pum", "00136885-001", "Puma"),
-#        ("puo", "00136848-001", "Puoc"),
-#        ("pup", "00136875-001", "Pulabu"),
-#        ("puq", "00137973-001", "Puquina"),
-#        ("pur", "00136876-001", "Puruborá"),
-#        ("pus", "00138594-001", "Pashto; Pushto"),
-#        ("put", "00136877-001", "Putoh"),
-#        ("puu", "00136878-001", "Punu"),
-#        ("puw", "00136879-001", "Puluwatese"),
-#        ("pux", "00136880-001", "Puare"),
-#        ("puy", "00137976-001", "Purisimeńo"),
-#        ("puz", "00136881-001", "Purum Naga"),
-#        ("pwa", "00136882-001", "Pawaia"),
-#        ("pwb", "00136895-001", "Panawa"),
-#        ("pwg", "00136884-001", "Gapapaiwa"),
-#        ("pwm", "00136873-001", "Molbog"),
-#        ("pwn", "00136886-001", "Paiwan"),
-#        ("pwo", "00136887-001", "Pwo Western Karen"),
-#        ("pwr", "00136888-001", "Powari"),
-#        ("pww", "00136889-001", "Pwo Northern Karen"),
-#        ("pxm", "00136890-001", "Quetzaltepec Mixe"),
-#        ("pye", "00136891-001", "Pye Krumen"),
-#        ("pym", "00136892-001", "Fyam"),
-#        ("pyn", "00136893-001", "Poyanáwa"),
-#        ("pyu", "00136894-001", "Puyuma"),
-#        ("pyx", "00138371-001", "Pyu"),
-#        ("pyy", "00136862-001", "Pyen"),
-#        ("pzn", "00136860-001", "Para Naga"),
-#        ("qua", "00136883-001", "Quapaw"),
-#        ("qub", "00136852-001", "Huallaga Huánuco Quechua"),
-#        ("quc", "00136853-001", "K'iche'"),
-#        ("qud", "00136854-001", "Calderón Highland Quichua"),
-#        ("que", "00138596-001", "Quechua"),
-#        ("quf", "00136855-001", "Lambayeque Quechua"),
-#        ("qug", "00136856-001", "Chimborazo Highland Quichua"),
-#        ("quh", "00136857-001", "South Bolivian Quechua"),
-#        ("qui", "00136858-001", "Quileute"),
-#        ("quk", "00136859-001", "Chachapoyas Quechua"),
-#        ("qul", "00136872-001", "North Bolivian Quechua"),
-#        ("qum", "00136861-001", "Sipacapense"),
-#        ("qun", "00138208-001", "Quinault"),
-#        ("qup", "00136850-001", "Southern Pastaza Quechua"),
-#        ("quq", "00136863-001", "Quinqui"),
-#        ("qur", "00136864-001", "Yanahuanca Pasco Quechua"),
-#        ("qus", "00136865-001", "Santiago del Estero Quichua"),
-#        ("quv", "00136866-001", "Sacapulteco"),
-#        ("quw", "00136867-001", "Tena Lowland Quichua"),
-#        ("qux", "00136868-001", "Yauyos Quechua"),
-#        ("quy", "00136869-001", "Ayacucho Quechua"),
-#        ("quz", "00136870-001", "Cusco Quechua"),
-#        ("qva", "00136871-001", "Ambo-Pasco Quechua"),
-#        ("qvc", "00136737-001", "Cajamarca Quechua"),
-#        ("qve", "00137684-001", "Eastern Apurímac Quechua"),
-#        ("qvh", "00137685-001", "Huamalíes-Dos de Mayo Huánuco Quechua"),
-#        ("qvi", "00137686-001", "Imbabura Highland Quichua"),
-#        ("qvj", "00137687-001", "Loja Highland Quichua"),
-#        ("qvl", "00137688-001", "Cajatambo North Lima Quechua"),
-#        ("qvm", "00137698-001", "Margos-Yarowilca-Lauricocha Quechua"),
-#        ("qvn", "00137690-001", "North Junín Quechua"),
-#        ("qvo", "00137683-001", "Napo Lowland Quechua"),
-#        ("qvp", "00137692-001", "Pacaraos Quechua"),
-#        ("qvs", "00137693-001", "San Martín Quechua"),
-#        ("qvw", "00137694-001", "Huaylla Wanca Quechua"),
-#        ("qvy", "00137691-001", "Queyu"),
-#        ("qvz", "00137689-001", "Northern Pastaza Quichua"),
-#        ("qwa", "00137681-001", "Corongo Ancash Quechua"),
-#        ("qwc", "00137906-001", "Classical Quechua"),
-#        ("qwh", "00137677-001", "Huaylas Ancash Quechua"),
-#        ("qwm", "00138261-001", "Kuman"),
-#        ("qws", "00137669-001", "Sihuas Ancash Quechua"),
-#        ("qwt", "00138248-001", "Kwalhioqua-Tlatskanai"),
-#        ("qxa", "00137697-001", "Chiquián Ancash Quechua"),
-#        ("qxc", "00137717-001", "Chincha Quechua"),
-#        ("qxh", "00137719-001", "Panao Huánuco Quechua"),
-#        ("qxl", "00137715-001", "Salasaca Highland Quichua"),
-#        ("qxn", "00137724-001", "Northern Conchucos Ancash Quechua"),
-#        ("qxo", "00137727-001", "Southern Conchucos Ancash Quechua"),
-#        ("qxp", "00137728-001", "Puno Quechua"),
-#        ("qxq", "00137729-001", "Qashqa'i"),
-#        ("qxr", "00137705-001", "Cańar Highland Quichua"),
-#        ("qxs", "00137721-001", "Southern Qiang"),
-#        ("qxt", "00137714-001", "Santa Ana de Tusi Pasco Quechua"),
-#        ("qxu", "00137706-001", "Arequipa-La Unión Quechua"),
-#        ("qxw", "00137699-001", "Jauja Wanca Quechua"),
-#        ("qya", "00138352-001", "Quenya"),
-#        ("qyp", "00137970-001", "Quiripi"),
-#        ("raa", "00137682-001", "Dungmali"),
-#        ("rab", "00137636-001", "Camling"),
-#        ("rac", "00137630-001", "Rasawa"),
-#        ("rad", "00137631-001", "Rade"),
-#        ("raf", "00137632-001", "Western Meohang"),
-#        ("rag", "00137606-001", "Logooli"),
-#        ("rah", "00137627-001", "Rabha"),
-#        ("rai", "00137617-001", "Ramoaaina"),
-#        ("raj", "00130990-001", "Rajasthani"),
-#        ("rak", "00137616-001", "Tulu-Bohuai"),
-#        ("ral", "00137615-001", "Ralte"),
-#        ("ram", "00137613-001", "Canela"),
-#        ("ran", "00137612-001", "Riantana"),
-#        ("rao", "00137611-001", "Rao"),
-#        ("rap", "00137608-001", "Rapanui"),
-#        ("raq", "00137620-001", "Saam"),
-#        ("rar", "00137654-001", "Rarotongan; Cook Islands Maori"),
-#        ("ras", "00137656-001", "Tegali"),
-#        ("rat", "00137657-001", "Razajerdi"),
-#        ("rau", "00137659-001", "Raute"),
-#        ("rav", "00137652-001", "Sampang"),
-#        ("raw", "00137663-001", "Rawang"),
-#        ("rax", "00137664-001", "Rang"),
-#        ("ray", "00137665-001", "Rapa"),
-#        ("raz", "00137637-001", "Rahambuu"),
-#        ("rbb", "00137649-001", "Rumai Palaung"),
-#        ("rcf", "00137713-001", "Réunion Creole French"),
-#        ("rdb", "00137646-001", "Rudbari"),
-#        ("rea", "00137645-001", "Rerau"),
-#        ("reb", "00137643-001", "Rembong"),
-#        ("ree", "00137642-001", "Rejang Kayan"),
-#        ("reg", "00137641-001", "Kara"),
-#        ("rei", "00137638-001", "Reli"),
-#        ("rej", "00137607-001", "Rejang"),
-#        ("rel", "00137810-001", "Rendille"),
-#        ("rem", "00138030-001", "Remo"),
-#        ("ren", "00137813-001", "Rengao"),
-#        ("rer", "00138028-001", "Rer Bare"),
-#        ("res", "00137815-001", "Reshe"),
-#        ("ret", "00137808-001", "Retta"),
-#        ("rey", "00137818-001", "Reyesano"),
-#        ("rga", "00137821-001", "Roria"),
-#        ("rge", "00137822-001", "Romano-Greek"),
-#        ("rgk", "00138026-001", "Rangkas"),
-#        ("rgn", "00137798-001", "Romagnol"),
-#        ("rgr", "00137814-001", "Resígaro"),
-#        ("rgs", "00137797-001", "Southern Roglai"),
-#        ("rgu", "00137807-001", "Ringgou"),
-#        ("rhg", "00137792-001", "Rohingya"),
-#        ("rhp", "00137801-001", "Yahang"),
-#        ("ria", "00137802-001", "Riang"),
-#        ("rie", "00137803-001", "Rien"),
-#        ("rif", "00137804-001", "Tarifit"),
-#        ("ril", "00137816-001", "Riang"),
-#        ("rim", "00137848-001", "Nyaturu"),
-#        ("rin", "00137847-001", "Nungu"),
-#        ("rir", "00137846-001", "Ribun"),
-#        ("rit", "00137843-001", "Ritarungo"),
-#        ("riu", "00137842-001", "Riung"),
-#        ("rjg", "00137828-001", "Rajong"),
-#        ("rji", "00137827-001", "Raji"),
-#        ("rjs", "00137826-001", "Rajbanshi"),
-#        ("rka", "00137825-001", "Kraol"),
-#        ("rkb", "00137840-001", "Rikbaktsa"),
-#        ("rkh", "00137793-001", "Rakahanga-Manihiki"),
-#        ("rki", "00137758-001", "Rakhine"),
-#        ("rkm", "00137756-001", "Marka"),
-#        ("rkt", "00137754-001", "Rangpuri"),
-#        ("rma", "00137752-001", "Rama"),
-#        ("rmb", "00137749-001", "Rembarunga"),
-#        ("rmc", "00137759-001", "Carpathian Romani"),
-#        ("rmd", "00137731-001", "Traveller Danish"),
-#        ("rme", "00137743-001", "Angloromani"),
-#        ("rmf", "00137742-001", "Kalo Finnish Romani"),
-#        ("rmg", "00137741-001", "Traveller Norwegian"),
-#        ("rmh", "00137740-001", "Murkim"),
-#        ("rmi", "00137739-001", "Lomavren"),
-#        ("rmk", "00137737-001", "Romkun"),
-#        ("rml", "00137735-001", "Baltic Romani"),
-#        ("rmm", "00137732-001", "Roma"),
-#        ("rmn", "00137775-001", "Balkan Romani"),
-#        ("rmo", "00137746-001", "Sinte Romani"),
-#        ("rmp", "00137778-001", "Rempi"),
-#        ("rmr", "00137779-001", "Caló"),
-#        ("rms", "00137785-001", "Romanian Sign Language"),
-#        ("rmt", "00137761-001", "Domari"),
-#        ("rmu", "00137784-001", "Tavringer Romani"),
-#        ("rmv", "00138359-001", "Romanova"),
-#        ("rmw", "00137768-001", "Welsh Romani"),
-#        ("rmx", "00137766-001", "Romam"),
-#        ("rmy", "00137762-001", "Vlax Romani"),
-#        ("rmz", "00137757-001", "Marma"),
-#        ("rna", "00138067-001", "Runa"),
-#        ("rnd", "00137773-001", "Ruund"),
-#        ("rng", "00137845-001", "Ronga"),
-#        ("rnl", "00137796-001", "Ranglong"),
-#        ("rnn", "00137795-001", "Roon"),
-#        ("rnp", "00137434-001", "Rongpo"),
-#        ("rnw", "00137559-001", "Rungwa"),
-#        ("rob", "00137650-001", "Tae'"),
-#        ("roc", "00137429-001", "Cacgia Roglai"),
-#        ("rod", "00137426-001", "Rogo"),
-#        ("roe", "00137425-001", "Ronji"),
-#        ("rof", "00137423-001", "Rombo"),
-#        ("rog", "00137421-001", "Northern Roglai"),
-#        ("roh", "00138597-001", "Romansh"),
-#        ("rol", "00137419-001", "Romblomanon"),
-#        ("rom", "00130986-001", "Romany; Romani"),
-#        ("ron", "00138599-001", "Romanian; Moldavian; Moldovan"),
-#        ("roo", "00137445-001", "Rotokas"),
-#        ("rop", "00137467-001", "Kriol"),
-#        ("ror", "00137468-001", "Rongga"),
-#        ("rou", "00137478-001", "Runga"),
-#        ("row", "00137463-001", "Dela-Oenale"),
-#        ("rpn", "00137472-001", "Repanbitip"),
-#        ("rpt", "00137475-001", "Rapting"),
-#        ("rri", "00137455-001", "Ririo"),
-#        ("rro", "00137469-001", "Waima"),
-#        ("rsb", "00137452-001", "Romano-Serbian"),
-#        ("rsi", "00137462-001", "Rennellese Sign Language"),
-#        ("rsl", "00137458-001", "Russian Sign Language"),
-#        ("rth", "00137461-001", "Ratahan"),
-#        ("rtm", "00137370-001", "Rotuman"),
-#        ("rtw", "00137371-001", "Rathawi"),
-#        ("rub", "00137378-001", "Gungu"),
-#        ("ruc", "00137379-001", "Ruuli"),
-#        ("rue", "00137381-001", "Rusyn"),
-#        ("ruf", "00137376-001", "Luguru"),
-#        ("rug", "00137365-001", "Roviana"),
-#        ("ruh", "00137364-001", "Ruga"),
-#        ("rui", "00137363-001", "Rufiji"),
-#        ("ruk", "00137361-001", "Che"),
-#        ("run", "00138598-001", "Kirundi; Rundi"),
-#        ("ruo", "00137354-001", "Istro Romanian"),
-#        ("rup", "00137385-001", "Aromanian; Arumanian; Macedo-Romanian"),
-#        ("ruq", "00137408-001", "Megleno Romanian"),
-#        ("rus", "00138600-001", "Russian"),
-#        ("rut", "00137403-001", "Rutul"),
-#        ("ruu", "00137407-001", "Lanas Lobu"),
-#        ("ruy", "00137400-001", "Mala"),
-#        ("ruz", "00137412-001", "Ruma"),
-#        ("rwa", "00137392-001", "Rawo"),
-#        ("rwk", "00137386-001", "Rwa"),
-#        ("rwm", "00137388-001", "Amba"),
-#        ("rwo", "00137399-001", "Rawa"),
-#        ("rwr", "00137384-001", "Marwari"),
-#        ("ryn", "00137393-001", "Northern Amami-Oshima"),
-#        ("rys", "00137394-001", "Yaeyama"),
-#        ("ryu", "00137398-001", "Central Okinawan"),
-#        ("saa", "00137464-001", "Saba"),
-#        ("sab", "00137561-001", "Buglere"),
-#        ("sac", "00137562-001", "Meskwaki"),
-#        ("sad", "00137568-001", "Sandawe"),
-#        ("sae", "00137570-001", "Sabanę"),
-#        ("saf", "00137571-001", "Safaliba"),
-#        ("sag", "00138606-001", "Sango; Sangho"),
-#        ("sah", "00137564-001", "Yakut"),
-#        ("saj", "00137544-001", "Sahu"),
-#        ("sak", "00137545-001", "Sake"),
-#        ("sam", "00138251-001", "Samaritan Aramaic"),
-#        ("san", "00138602-001", "Sanskrit"),
-#        ("sao", "00137557-001", "Sause"),
-#        ("sap", "00137542-001", "Sanapaná"),
-#        ("saq", "00137551-001", "Samburu"),
-#        ("sar", "00138254-001", "Saraveca"),
-#        ("sas", "00137555-001", "Sasak"),
-#        ("sat", "00137575-001", "Santali"),
-#        ("sau", "00137591-001", "Saleman"),
-#        ("sav", "00137592-001", "Saafi-Saafi"),
-#        ("saw", "00137593-001", "Sawi"),
-#        ("sax", "00137594-001", "Sa"),
-#        ("say", "00137595-001", "Saya"),
-#        ("saz", "00137600-001", "Saurashtra"),
-#        ("sba", "00137601-001", "Ngambay"),
-#        ("sbb", "00137602-001", "Simbo"),
-#        ("sbc", "00137604-001", "Kele"),
-#        ("sbd", "00137596-001", "Southern Samo"),
-#        ("sbe", "00137576-001", "Saliba"),
-#        ("sbf", "00137577-001", "Shabo"),
-#        ("sbg", "00137579-001", "Seget"),
-#        ("sbh", "00137589-001", "Sori-Harengan"),
-#        ("sbi", "00137581-001", "Seti"),
-#        ("sbj", "00137585-001", "Surbakhal"),
-#        ("sbk", "00137586-001", "Safwa"),
-#        ("sbl", "00137598-001", "Botolan Sambal"),
-#        ("sbm", "00137556-001", "Sagala"),
-#        ("sbn", "00137495-001", "Sindhi Bhil"),
-#        ("sbo", "00137498-001", "Sabüm"),
-#        ("sbp", "00137499-001", "Sangu"),
-#        ("sbq", "00137501-001", "Sileibi"),
-#        ("sbr", "00137494-001", "Sembakung Murut"),
-#        ("sbs", "00137503-001", "Subiya"),
-#        ("sbt", "00137504-001", "Kimki"),
-#        ("sbu", "00137506-001", "Stod Bhoti"),
-#        ("sbv", "00138389-001", "Sabine"),
-#        ("sbw", "00137479-001", "Simba"),
-#        ("sbx", "00137500-001", "Seberuang"),
-#        ("sby", "00137490-001", "Soli"),
-#        ("sbz", "00137489-001", "Sara Kaba"),
-#        ("sca", "00137488-001", "Sansu"),
-#        ("scb", "00137487-001", "Chut"),
-#        ("sce", "00137485-001", "Dongxiang"),
-#        ("scf", "00137482-001", "San Miguel Creole French"),
-#        ("scg", "00137481-001", "Sanggau"),
-#        ("sch", "00137511-001", "Sakachep"),
-#        ("sci", "00137534-001", "Sri Lankan Creole Malay"),
-#        ("sck", "00137528-001", "Sadri"),
-#        ("scl", "00137529-001", "Shina"),
-#        ("scn", "00137535-001", "Sicilian"),
-#        ("sco", "00137532-001", "Lowlands Scots; Scots; Lallans"),
-#        ("scp", "00137512-001", "Helambu Sherpa"),
-#        ("scq", "00137513-001", "Sa'och"),
-#        ("scs", "00137525-001", "North Slavey"),
-#        ("scu", "00137519-001", "Shumcho"),
-#        ("scv", "00137443-001", "Sheni"),
-#        ("scw", "00137524-001", "Sha"),
-#        ("scx", "00138444-001", "Sicel"),
-#        ("sda", "00137523-001", "Toraja-Sa'dan"),
-#        ("sdb", "00137522-001", "Shabak"),
-#        ("sdc", "00137521-001", "Sassarese Sardinian"),
-#        ("sde", "00137520-001", "Surubu"),
-#        ("sdf", "00137510-001", "Sarli"),
-#        ("sdg", "00137517-001", "Savi"),
-#        ("sdh", "00137515-001", "Southern Kurdish"),
-#        ("sdj", "00137514-001", "Suundi"),
-#        ("sdk", "00137516-001", "Sos Kundi"),
-#        ("sdl", "00137518-001", "Saudi Arabian Sign Language"),
-#        ("sdm", "00137540-001", "Semandang"),
-#        ("sdn", "00137539-001", "Gallurese Sardinian"),
-#        ("sdo", "00137538-001", "Bukar-Sadung Bidayuh"),
-#        ("sdp", "00137537-001", "Sherdukpen"),
-#        ("sdr", "00137536-001", "Oraon Sadri"),
-#        ("sds", "00138183-001", "Sened"),
-#        ("sdt", "00138182-001", "Shuadit"),
-#        ("sdu", "00137526-001", "Sarudu"),
-#        ("sdx", "00137533-001", "Sibu Melanau"),
-#        ("sdz", "00137541-001", "Sallands"),
-#        ("sea", "00137531-001", "Semai"),
-#        ("seb", "00137530-001", "Shempire Senoufo"),
-#        ("sec", "00137508-001", "Sechelt"),
-#        ("sed", "00137480-001", "Sedang"),
-#        ("see", "00137483-001", "Seneca"),
-#        ("sef", "00137484-001", "Cebaara Senoufo"),
-#        ("seg", "00137486-001", "Segeju"),
-#        ("seh", "00137491-001", "Sena"),
-#        ("sei", "00137492-001", "Seri"),
-#        ("sej", "00137502-001", "Sene"),
-#        ("sek", "00137507-001", "Sekani"),
-#        ("sel", "00137505-001", "Selkup"),
-#        ("sen", "00137509-001", "Nanerigé Sénoufo"),
-#        ("seo", "00137497-001", "Suarmin"),
-#        ("sep", "00137496-001", "Sěcěté Sénoufo"),
-#        ("seq", "00137527-001", "Senara Sénoufo"),
-#        ("ser", "00137587-001", "Serrano"),
-#        ("ses", "00137584-001", "Koyraboro Senni Songhai"),
-#        ("set", "00137583-001", "Sentani"),
-#        ("seu", "00137574-001", "Serui-Laut"),
-#        ("sev", "00137578-001", "Nyarafolo Senoufo"),
-#        ("sew", "00137580-001", "Sewa Bay"),
-#        ("sey", "00137582-001", "Secoya"),
-#        ("sez", "00137603-001", "Senthang Chin"),
-#        ("sfb", "00137599-001", "Langue des signes de Belgique Francophone"),
-#        ("sfm", "00137590-001", "Small Flowery Miao"),
-#        ("sfs", "00137597-001", "South African Sign Language"),
-#        ("sfw", "00137605-001", "Sehwi"),
-#        ("sga", "00137867-001", "Old Irish"),
-#        ("sgb", "00137566-001", "Mag-Anchi Ayta"),
-#        ("sgc", "00137543-001", "Kipsigis"),
-#        ("sge", "00137554-001", "Segai"),
-#        ("sgg", "00137553-001", "Swiss-German Sign Language"),
-#        ("sgh", "00137552-001", "Shughni"),
-#        ("sgi", "00137549-001", "Suga"),
-#        ("sgk", "00137547-001", "Sangkong"),
-#        ("sgl", "00137546-001", "Sanglechi-Ishkashimi"),
-#        ("sgm", "00138298-001", "Singa"),
-#        ("sgn", "ISO 639-2 code", "Sign Languages"),
-#        ("sgo", "00137548-001", "Songa"),
-#        ("sgp", "00137550-001", "Singpho"),
-#        ("sgr", "00137572-001", "Sangisari"),
-#        ("sgt", "00137569-001", "Brokpake"),
-#        ("sgu", "00137567-001", "Salas"),
-#        ("sgw", "00137558-001", "Sebat Bet Gurage"),
-#        ("sgx", "00137565-001", "Sierra Leone Sign Language"),
-#        ("sgz", "00137573-001", "Sursurunga"),
-#        ("sha", "00137563-001", "Shall-Zwall"),
-#        ("shb", "00137560-001", "Ninam"),
-#        ("shc", "00137588-001", "Sonde"),
-#        ("she", "00137493-001", "Sheko"),
-#        ("shg", "00137397-001", "Shua"),
-#        ("shh", "00137396-001", "Shoshoni"),
-#        ("shi", "00137395-001", "Tachelhit"),
-#        ("shj", "00137391-001", "Shatt"),
-#        ("shk", "00137389-001", "Shilluk"),
-#        ("shl", "00137387-001", "Shendu"),
-#        ("shm", "00137406-001", "Shahrudi"),
-#        ("shn", "00137390-001", "Shan"),
-#        ("sho", "00137414-001", "Shanga"),
-#        ("shp", "00137413-001", "Shipibo-Conibo"),
-#        ("shq", "00137411-001", "Sala"),
-#        ("shr", "00137410-001", "Shi"),
-#        ("shs", "00137409-001", "Shuswap"),
-#        ("sht", "00137966-001", "Shasta"),
-#        ("shu", "00137415-001", "Chadian Arabic"),
-#        ("shv", "00137405-001", "Shehri"),
-#        ("shw", "00137404-001", "Shwai"),
-#        ("shx", "00137402-001", "She"),
-#        ("shy", "00137382-001", "Tachawit"),
-#        ("shz", "00137355-001", "Syenara Senoufo"),
-#        ("sia", "00137356-001", "Akkala Sami"),
-#        ("sib", "00137357-001", "Sebop"),
-#        ("sid", "00137358-001", "Sidamo"),
-#        ("sie", "00137359-001", "Simaa"),
-#        ("sif", "00137360-001", "Siamou"),
-#        ("sig", "00137362-001", "Paasaal"),
-#        ("sih", "00137366-001", "Zire"),
-#        ("sii", "00137374-001", "Shom Peng"),
-#        ("sij", "00137353-001", "Numbami"),
-#        ("sik", "00137380-001", "Sikiana"),
-#        ("sil", "00137377-001", "Tumulung Sisaala"),
-#        ("sim", "00137368-001", "Mende"),
-#        ("sin", "00138608-001", "Sinhala; Sinhalese; Singhalese"),
-#        ("sip", "00137375-001", "Sikkimese"),
-#        ("siq", "00137383-001", "Sonia"),
-#        ("sir", "00137373-001", "Siri"),
-#        ("sis", "00137922-001", "Siuslaw"),
-#        ("siu", "00137372-001", "Sinagen"),
-#        ("siv", "00137430-001", "Sumariup"),
-#        ("siw", "00137367-001", "Siwai"),
-#        ("six", "00137401-001", "Sumau"),
-#        ("siy", "00137460-001", "Sivandi"),
-#        ("siz", "00137459-001", "Siwi"),
-#        ("sja", "00137457-001", "Epena"),
-#        ("sjb", "00137456-001", "Sajau Basap"),
-#        ("sjd", "00137447-001", "Kildin Sami"),
-#        ("sje", "00137454-001", "Pite Sami"),
-#        ("sjg", "00137451-001", "Assangori"),
-#        ("sjk", "00137950-001", "Kemi Sami"),
-#        ("sjl", "00137450-001", "Sajalong"),
-#        ("sjm", "00137449-001", "Mapun"),
-#        ("sjn", "00138355-001", "Sindarin"),
-#        ("sjo", "00137453-001", "Xibe"),
-#        ("sjp", "00137477-001", "Surjapuri"),
-#        ("sjr", "00137476-001", "Siar-Lak"),
-#        ("sjs", "00137935-001", "Senhaja De Srair"),
-#        ("sjt", "00137474-001", "Ter Sami"),
-#        ("sju", "00137473-001", "Ume Sami"),
-#        ("sjw", "00137470-001", "Shawnee"),
-#        ("ska", "00137466-001", "Skagit"),
-#        ("skb", "00137465-001", "Saek"),
-#        ("skc", "00137471-001", "Sauk"),
-#        ("skd", "00137448-001", "Southern Sierra Miwok"),
-#        ("ske", "00137417-001", "Seke"),
-#        ("skf", "00137418-001", "Sakirabiá"),
-#        ("skg", "00137420-001", "Sakalava Malagasy"),
-#        ("skh", "00137422-001", "Sikule"),
-#        ("ski", "00137424-001", "Sika"),
-#        ("skj", "00137427-001", "Seke"),
-#        ("skk", "00137428-001", "Sok"),
-#        ("skm", "00137437-001", "Sakam"),
-#        ("skn", "00137439-001", "Kolibugan Subanon"),
-#        ("sko", "00137416-001", "Seko Tengah"),
-#        ("skp", "00137444-001", "Sekapan"),
-#        ("skq", "00137442-001", "Sininkere"),
-#        ("skr", "00137440-001", "Seraiki"),
-#        ("sks", "00137431-001", "Maia"),
-#        ("skt", "00137438-001", "Sakata"),
-#        ("sku", "00137446-001", "Sakao"),
-#        ("skv", "00137436-001", "Skou"),
-#        ("skw", "00138111-001", "Skepi Creole Dutch"),
-#        ("skx", "00137435-001", "Seko Padang"),
-#        ("sky", "00137433-001", "Sikaiana"),
-#        ("skz", "00137432-001", "Sekar"),
-#        ("slc", "00137369-001", "Sáliba"),
-#        ("sld", "00137648-001", "Sissala"),
-#        ("sle", "00137799-001", "Sholaga"),
-#        ("slf", "00137841-001", "Swiss-Italian Sign Language"),
-#        ("slg", "00137744-001", "Selungai Murut"),
-#        ("slh", "00137747-001", "Southern Puget Sound Salish"),
-#        ("sli", "00137745-001", "Lower Silesian"),
-#        ("slj", "00137738-001", "Salumá"),
-#        ("slk", "00138609-001", "Slovak"),
-#        ("sll", "00137767-001", "Salt-Yui"),
-#        ("slm", "00137765-001", "Pangutaran Sama"),
-#        ("sln", "00138113-001", "Salinan"),
-#        ("slp", "00137763-001", "Lamaholot"),
-#        ("slq", "00137764-001", "Salchuq"),
-#        ("slr", "00137769-001", "Salar"),
-#        ("sls", "00137770-001", "Singapore Sign Language"),
-#        ("slt", "00137771-001", "Sila"),
-#        ("slu", "00137772-001", "Selaru"),
-#        ("slv", "00138610-001", "Slovenian"),
-#        ("slw", "00137774-001", "Sialum"),
-#        ("slx", "00137782-001", "Salampasu"),
-#        ("sly", "00137789-001", "Selayar"),
-#        ("slz", "00137788-001", "Ma'ya"),
-#        ("sma", "00137787-001", "Southern Sami"),
-#        ("smb", "00137786-001", "Simbari"),
-#        ("smc", "00137776-001", "Som"),
-#        ("smd", "00137783-001", "Sama"),
-#        ("sme", "00138605-001", "Northern Sami"),
-#        ("smf", "00137791-001", "Auwe"),
-#        ("smg", "00137781-001", "Simbali"),
-#        ("smh", "00137780-001", "Samei"),
-#        ("smj", "00137790-001", "Lule Sami"),
-#        ("smk", "00137733-001", "Bolinao"),
-#        ("sml", "00137734-001", "Central Sama"),
-#        ("smm", "00137736-001", "Musasa"),
-#        ("smn", "00137441-001", "Inari Sami"),
-#        ("smo", "00138611-001", "Samoan"),
-#        ("smp", "00138062-001", "Samaritan"),
-#        ("smq", "00137760-001", "Samo"),
-#        ("smr", "00137750-001", "Simeulue"),
-#        ("sms", "00137751-001", "Skolt Sami"),
-#        ("smt", "00137753-001", "Simte"),
-#        ("smu", "00137755-001", "Somray"),
-#        ("smv", "00137805-001", "Samvedi"),
-#        ("smw", "00137777-001", "Sumbawa"),
-#        ("smx", "00137844-001", "Samba"),
-#        ("smy", "00137824-001", "Semnani"),
-#        ("smz", "00137836-001", "Simeku"),
-#        ("sna", "00138612-001", "Shona"),
-#        ("snb", "00137834-001", "Sebuyau"),
-#        ("snc", "00137832-001", "Sinaugoro"),
-#        ("snd", "00138604-001", "Sindhi"),
-#        ("sne", "00137831-001", "Bau Bidayuh"),
-#        ("snf", "00137829-001", "Noon"),
-#        ("sng", "00137835-001", "Sanga"),
-#        ("snh", "00138043-001", "Shinabo"),
-#        ("sni", "00138042-001", "Sensi"),
-#        ("snj", "00137830-001", "Riverain Sango"),
-#        ("snk", "00137837-001", "Soninke"),
-#        ("snl", "00137849-001", "Sangil"),
-#        ("snm", "00137838-001", "Southern Ma'di"),
-#        ("snn", "00137839-001", "Siona"),
-#        ("sno", "00137833-001", "Snohomish"),
-#        ("snp", "00137806-001", "Siane"),
-#        ("snq", "00137794-001", "Sangu"),
-#        ("snr", "00137800-001", "Sihan"),
-#        ("sns", "00137820-001", "South West Bay"),
-#        ("snu", "00137819-001", "Senggi"),
-#        ("snv", "00137817-001", "Sa'ban"),
-#        ("snw", "00137823-001", "Selee"),
-#        ("snx", "00137812-001", "Sam"),
-#        ("sny", "00137811-001", "Saniyo-Hiyewe"),
-#        ("snz", "00137809-001", "Sinsauru"),
-#        ("soa", "00137748-001", "Thai Song"),
-#        ("sob", "00137639-001", "Sobei"),
-#        ("soc", "00137640-001", "So"),
-#        ("sod", "00137644-001", "Songoora"),
-#        ("soe", "00137647-001", "Songomeno"),
-#        ("sog", "00138366-001", "Sogdian"),
-#        ("soh", "00137658-001", "Aka"),
-#        ("soi", "00137660-001", "Sonha"),
-#        ("soj", "00137662-001", "Soi"),
-#        ("sok", "00137661-001", "Sokoro"),
-#        ("sol", "00137667-001", "Solos"),
-#        ("som", "00138613-001", "Somali"),
-#        ("soo", "00137655-001", "Songo"),
-#        ("sop", "00137653-001", "Songe"),
-#        ("soq", "00137635-001", "Kanasi"),
-#        ("sor", "00137651-001", "Somrai"),
-#        ("sos", "00137609-001", "Seeku"),
-#        ("sot", "00138617-001", "Sesotho; Southern Sotho"),
-#        ("sou", "00137610-001", "Southern Thai"),
-#        ("sov", "00137614-001", "Sonsorol"),
-#        ("sow", "00137618-001", "Sowanda"),
-#        ("sox", "00137619-001", "So"),
-#        ("soy", "00137629-001", "Miyobe"),
-#        ("soz", "00137634-001", "Temi"),
-#        ("spa", "00138504-001", "Spanish; Castilian"),
-#        ("spb", "00137633-001", "Sepa"),
-#        ("spc", "00137621-001", "Sapé"),
-#        ("spd", "00137628-001", "Saep"),
-#        ("spe", "00137626-001", "Sepa"),
-#        ("spg", "00137625-001", "Sian"),
-#        ("spi", "00137624-001", "Saponi"),
-#        ("spk", "00137623-001", "Sengo"),
-#        ("spl", "00137622-001", "Selepet"),
-#        ("spm", "00137716-001", "Sepen"),
-#        ("spo", "00137666-001", "Spokane"),
-#        ("spp", "00137712-001", "Supyire Senoufo"),
-#        ("spq", "00137711-001", "Loreto-Ucayali Spanish"),
-#        ("spr", "00137710-001", "Saparua"),
-#        ("sps", "00137709-001", "Saposa"),
-#        ("spt", "00137708-001", "Spiti Bhoti"),
-#        ("spu", "00137704-001", "Sapuan"),
-#        ("spx", "00138364-001", "South Picene"),
-#        ("spy", "00137703-001", "Sabaot"),
-#        ("sqa", "00137702-001", "Shama-Sambuga"),
-#        ("sqh", "00137701-001", "Shau"),
-#        ("sqi", "00138614-001", "Albanian"),
-#        ("sqm", "00137707-001", "Suma"),
-#        ("sqn", "00138089-001", "Susquehannock"),
-#        ("sqo", "00137726-001", "Sorkhei"),
-#        ("sqq", "00137725-001", "Sou"),
-#        ("sqr", "00137875-001", "Siculo Arabic"),
-#        ("sqs", "00137722-001", "Sri Lankan Sign Language"),
-#        ("sqt", "00137730-001", "Soqotri"),
-#        ("squ", "00137720-001", "Squamish"),
-#        ("sra", "00137718-001", "Saruga"),
-#        ("srb", "00137723-001", "Sora"),
-#        ("src", "00137700-001", "Logudorese Sardinian"),
-#        ("srd", "00138603-001", "Sardinian"),
-#        ("sre", "00137670-001", "Sara"),
-#        ("srf", "00137671-001", "Nafi"),
-#        ("srg", "00137672-001", "Sulod"),
-#        ("srh", "00137673-001", "Sarikoli"),
-#        ("sri", "00137674-001", "Siriano"),
-#        ("srk", "00137675-001", "Serudung Murut"),
-#        ("srl", "00137676-001", "Isirawa"),
-#        ("srm", "00137678-001", "Saramaccan"),
-#        ("srn", "00137679-001", "Sranan Tongo"),
-#        ("sro", "00137680-001", "Campidanese Sardinian"),
-#        ("srp", "00138615-001", "Serbian"),
-#        ("srq", "00137668-001", "Sirionó"),
-#        ("srr", "00137696-001", "Serer"),
-#        ("srs", "00137345-001", "Sarsi"),
-#        ("srt", "00135408-001", "Sauri"),
-#        ("sru", "00135640-001", "Suruí"),
-#        ("srv", "00135641-001", "Waray Sorsogon"),
-#        ("srw", "00135642-001", "Serua"),
-#        ("srx", "00135643-001", "Sirmauri"),
-#        ("sry", "00135644-001", "Sera"),
-#        ("srz", "00135645-001", "Shahmirzadi"),
-#        ("ssb", "00135646-001", "Southern Sama"),
-#        ("ssc", "00135647-001", "Suba-Simbiti"),
-#        ("ssd", "00135648-001", "Siroi"),
-#        ("sse", "00135661-001", "Balangingi"),
-#        ("ssf", "00135650-001", "Thao"),
-#        ("ssg", "00135639-001", "Seimat"),
-#        ("ssh", "00135652-001", "Shihhi Arabic"),
-#        ("ssi", "00135653-001", "Sansi"),
-#        ("ssj", "00135654-001", "Sausi"),
-#        ("ssk", "00135655-001", "Sunam"),
-#        ("ssl", "00135656-001", "Western Sisaala"),
-#        ("ssm", "00135657-001", "Semnam"),
-#        ("ssn", "00135658-001", "Waata"),
-#        ("sso", "00135659-001", "Sissano"),
-#        ("ssp", "00135660-001", "Spanish Sign Language"),
-#        ("ssq", "00135628-001", "So'a"),
-#        ("ssr", "00135626-001", "Swiss-French Sign Language"),
-#        ("sss", "00135649-001", "Sô"),
-#        ("sst", "00135618-001", "Sinasina"),
-#        ("ssu", "00135619-001", "Susuami"),
-#        ("ssv", "00135620-001", "Shark Bay"),
-#        ("ssw", "00138616-001", "Swazi; Swati; Siswati"),
-#        ("ssx", "00135621-001", "Samberigi"),
-#        ("ssy", "00135622-001", "Saho"),
-#        ("ssz", "00135623-001", "Sengseng"),
-#        ("sta", "00135624-001", "Settla"),
-#        ("stb", "00135625-001", "Northern Subanen"),
-#        ("std", "00135638-001", "Sentinel"),
-#        ("ste", "00135627-001", "Liana-Seti"),
-#        ("stf", "00135616-001", "Seta"),
-#        ("stg", "00135629-001", "Trieng"),
-#        ("sth", "00135630-001", "Shelta"),
-#        ("sti", "00135631-001", "Bulo Stieng"),
-#        ("stj", "00135632-001", "Matya Samo"),
-#        ("stk", "00135633-001", "Arammba"),
-#        ("stl", "00135634-001", "Stellingwerfs"),
-#        ("stm", "00135635-001", "Setaman"),
-#        ("stn", "00135636-001", "Owa"),
-#        ("sto", "00135663-001", "Stoney"),
-#        ("stp", "00135617-001", "Southeastern Tepehuan"),
-#        ("stq", "00135651-001", "Saterfriesisch"),
-#        ("str", "00135686-001", "Straits Salish"),
-#        ("sts", "00135687-001", "Shumashti"),
-#        ("stt", "00135688-001", "Budeh Stieng"),
-#        ("stu", "00135689-001", "Samtao"),
-#        ("stv", "00135690-001", "Silt'e"),
-#        ("stw", "00135691-001", "Satawalese"),
-#        ("sua", "00135692-001", "Sulka"),
-#        ("sub", "00135693-001", "Suku"),
-#        ("suc", "00135694-001", "Western Subanon"),
-#        ("sue", "00135707-001", "Suena"),
-#        ("sug", "00135696-001", "Suganga"),
-#        ("sui", "00135685-001", "Suki"),
-#        ("suj", "00135698-001", "Shubi"),
-#        ("suk", "00135699-001", "Sukuma"),
-#        ("sul", "00135700-001", "Surigaonon"),
-#        ("sum", "00135701-001", "Sumo-Mayangna"),
-#        ("sun", "00138618-001", "Sundanese"),
-#        ("suq", "00135702-001", "Suri"),
-#        ("sur", "00135703-001", "Mwaghavul"),
-#        ("sus", "00135704-001", "Susu"),
-#        ("sut", "00138092-001", "Subtiaba"),
-#        ("suv", "00135705-001", "Sulung"),
-#        ("suw", "00135706-001", "Sumbwa"),
-#        ("sux", "00138377-001", "Sumerian"),
-#        ("suy", "00135674-001", "Suyá"),
-#        ("suz", "00135672-001", "Sunwar"),
-#        ("sva", "00135695-001", "Svan"),
-#        ("svb", "00135664-001", "Ulau-Suain"),
-#        ("svc", "00135665-001", "Vincentian Creole English"),
-#        ("sve", "00135666-001", "Serili"),
-#        ("svk", "00135667-001", "Slovakian Sign Language"),
-#        ("svr", "00135668-001", "Savara"),
-#        ("svs", "00135669-001", "Savosavo"),
-#        ("svx", "00138020-001", "Skalvian"),
-#        ("swa", "00138620-001", "Swahili; Kiswahili"),
-#        ("swb", "00135670-001", "Maore Comorian"),
-#        ("swc", "00135671-001", "Congo Swahili"),
-#        ("swe", "00138619-001", "Swedish"),
-#        ("swf", "00135684-001", "Sere"),
-#        ("swg", "00135673-001", "Swabian"),
-#        ("swh", "00135662-001", "Swahili"),
-#        ("swi", "00135675-001", "Sui"),
-#        ("swj", "00135676-001", "Sira"),
-#        ("swk", "00135677-001", "Malawi Sena"),
-#        ("swl", "00135678-001", "Swedish Sign Language"),
-#        ("swm", "00135679-001", "Samosa"),
-#        ("swn", "00135680-001", "Sawknah"),
-#        ("swo", "00135681-001", "Shanenawa"),
-#        ("swp", "00135682-001", "Suau"),
-#        ("swq", "00135594-001", "Sharwa"),
-#        ("swr", "00135697-001", "Saweru"),
-#        ("sws", "00135637-001", "Seluwasan"),
-#        ("swt", "00135548-001", "Sawila"),
-#        ("swu", "00135549-001", "Suwawa"),
-#        ("swv", "00135550-001", "Shekhawati"),
-#        ("sww", "00135551-001", "Sowa"),
-#        ("swx", "00135552-001", "Suruahá"),
-#        ("swy", "00135553-001", "Sarua"),
-#        ("sxb", "00135554-001", "Suba"),
-#        ("sxc", "00138462-001", "Sicanian"),
-#        ("sxe", "00135555-001", "Sighu"),
-#        ("sxg", "00135556-001", "Shixing"),
-#        ("sxk", "00138054-001", "Southern Kalapuya"),
-#        ("sxl", "00138040-001", "Selian"),
-#        ("sxm", "00135569-001", "Samre"),
-#        ("sxn", "00135558-001", "Sangir"),
-#        ("sxo", "00138443-001", "Sorothaptic"),
-#        ("sxr", "00135547-001", "Saaroa"),
-#        ("sxs", "00135560-001", "Sasaru"),
-#        ("sxu", "00135561-001", "Upper Saxon"),
-#        ("sxw", "00135562-001", "Saxwe Gbe"),
-#        ("sya", "00135563-001", "Siang"),
-#        ("syb", "00135564-001", "Central Subanen"),
-#        ("syc", "00137874-001", "Classical Syriac"),
-#        ("syi", "00135565-001", "Seki"),
-#        ("syk", "00135566-001", "Sukur"),
-#        ("syl", "00135567-001", "Sylheti"),
-#        ("sym", "00135536-001", "Maya Samo"),
-#        ("syn", "00135559-001", "Senaya"),
-#        ("syo", "00135557-001", "Suoy"),
-#        ("syr", "00130987-001", "Syriac"),
-#        ("sys", "00135526-001", "Sinyar"),
-#        ("syw", "00135527-001", "Kagate"),
-#        ("syy", "00135528-001", "Al-Sayyid Bedouin Sign Language"),
-#        ("sza", "00135529-001", "Semelai"),
-#        ("szb", "00135530-001", "Ngalum"),
-#        ("szc", "00135531-001", "Semaq Beri"),
-#        ("szd", "00138021-001", "Seru"),
-#        ("sze", "00135532-001", "Seze"),
-#        ("szg", "00135533-001", "Sengele"),
-#        ("szl", "00135546-001", "Silesian"),
-#        ("szn", "00135535-001", "Sula"),
-#        ("szp", "00135525-001", "Suabo"),
-#        ("szv", "00135537-001", "Isu"),
-#        ("szw", "00135538-001", "Sawai"),
-#        ("taa", "00135539-001", "Lower Tanana"),
-#        ("tab", "00135540-001", "Tabassaran"),
-#        ("tac", "00135541-001", "Lowland Tarahumara"),
-#        ("tad", "00135542-001", "Tause"),
-#        ("tae", "00135543-001", "Tariana"),
-#        ("taf", "00135544-001", "Tapirapé"),
-#        ("tag", "00135545-001", "Tagoi"),
-#        ("tah", "00138634-001", "Tahitian"),
-#        ("taj", "00135571-001", "Eastern Tamang"),
-#        ("tak", "00135605-001", "Tala"),
-#        ("tal", "00135568-001", "Tal"),
-#        ("tam", "00138621-001", "Tamil"),
-#        ("tan", "00135595-001", "Tangale"),
-#        ("tao", "00135596-001", "Yami"),
-#        ("tap", "00135597-001", "Taabwa"),
-#        ("taq", "00135598-001", "Tamasheq"),
-#        ("tar", "00135599-001", "Central Tarahumara"),
-#        ("tas", "00138108-001", "Tay Boi"),
-#        ("tat", "00138632-001", "Tatar"),
-#        ("tau", "00135600-001", "Upper Tanana"),
-#        ("tav", "00135601-001", "Tatuyo"),
-#        ("taw", "00135602-001", "Tai"),
-#        ("tax", "00135615-001", "Tamki"),
-#        ("tay", "00135604-001", "Atayal"),
-#        ("taz", "00135593-001", "Tocho"),
-#        ("tba", "00135606-001", "Aikanã"),
-#        ("tbb", "00138120-001", "Tapeba"),
-#        ("tbc", "00135607-001", "Takia"),
-#        ("tbd", "00135608-001", "Kaki Ae"),
-#        ("tbe", "00135609-001", "Tanimbili"),
-#        ("tbf", "00135610-001", "Mandara"),
-#        ("tbg", "00135611-001", "North Tairora"),
-#        ("tbh", "00138082-001", "Thurawal"),
-#        ("tbi", "00135612-001", "Gaam"),
-#        ("tbj", "00135613-001", "Tiang"),
-#        ("tbk", "00135614-001", "Calamian Tagbanwa"),
-#        ("tbl", "00135582-001", "Tboli"),
-#        ("tbm", "00135580-001", "Tagbu"),
-#        ("tbn", "00135603-001", "Barro Negro Tunebo"),
-#        ("tbo", "00135572-001", "Tawala"),
-#        ("tbp", "00135573-001", "Taworta"),
-#        ("tbr", "00135574-001", "Tumtum"),
-#        ("tbs", "00135575-001", "Tanguat"),
-#        ("tbt", "00135576-001", "Tembo; Kitembo"),
-#        ("tbu", "00138069-001", "Tubar"),
-#        ("tbv", "00135577-001", "Tobo"),
-#        ("tbw", "00135578-001", "Tagbanwa"),
-#        ("tbx", "00135579-001", "Kapin"),
-#        ("tby", "00135592-001", "Tabaru"),
-#        ("tbz", "00135581-001", "Ditammari"),
-#        ("tca", "00135570-001", "Ticuna"),
-#        ("tcb", "00135583-001", "Tanacross"),
-#        ("tcc", "00135584-001", "Datooga"),
-#        ("tcd", "00135585-001", "Tafi"),
-#        ("tce", "00135586-001", "Southern Tutchone"),
-#        ("tcf", "00135587-001", "Malinaltepec Me'phaa"),
-#        ("tcg", "00135588-001", "Tamagario"),
-#        ("tch", "00135589-001", "Turks And Caicos Creole English"),
-#        ("tci", "00135590-001", "Wára"),
-#        ("tck", "00135717-001", "Tchitchege"),
-#        ("tcl", "00135534-001", "Taman"),
-#        ("tcm", "00135683-001", "Tanahmerah"),
-#        ("tcn", "00135823-001", "Tichurong"),
-#        ("tco", "00135824-001", "Taungyo"),
-#        ("tcp", "00135825-001", "Tawr Chin"),
-#        ("tcq", "00135826-001", "Kaiy"),
-#        ("tcs", "00135827-001", "Torres Strait Creole"),
-#        ("tct", "00135828-001", "T'en"),
-#        ("tcu", "00135829-001", "Southeastern Tarahumara"),
-#        ("tcw", "00135830-001", "Tecpatlán Totonac"),
-#        ("tcx", "00135831-001", "Toda"),
-#        ("tcy", "00135844-001", "Tulu"),
-#        ("tcz", "00135833-001", "Thado Chin"),
-#        ("tda", "00135822-001", "Tagdal"),
-#        ("tdb", "00135835-001", "Panchpargania"),
-#        ("tdc", "00135836-001", "Emberá-Tadó"),
-#        ("tdd", "00135837-001", "Tai Nüa"),
-#        ("tdf", "00135838-001", "Talieng"),
-#        ("tdg", "00135839-001", "Western Tamang"),
-#        ("tdh", "00135840-001", "Thulung"),
-#        ("tdi", "00135841-001", "Tomadino"),
-#        ("tdj", "00135842-001", "Tajio"),
-#        ("tdk", "00135843-001", "Tambas"),
-#        ("tdl", "00135811-001", "Sur"),
-#        ("tdn", "00135809-001", "Tondano"),
-#        ("tdo", "00135832-001", "Teme"),
-#        ("tdq", "00135801-001", "Tita"),
-#        ("tdr", "00135802-001", "Todrah"),
-#        ("tds", "00135803-001", "Doutai"),
-#        ("tdt", "00135804-001", "Tetun Dili"),
-#        ("tdu", "00135805-001", "Tempasuk Dusun"),
-#        ("tdv", "00135806-001", "Toro"),
-#        ("tdx", "00135807-001", "Tandroy-Mahafaly Malagasy"),
-#        ("tdy", "00135808-001", "Tadyawan"),
-#        ("tea", "00135821-001", "Temiar"),
-#        ("teb", "00138003-001", "Tetete"),
-#        ("tec", "00135810-001", "Terik"),
-#        ("ted", "00135799-001", "Tepo Krumen"),
-#        ("tee", "00135812-001", "Huehuetla Tepehua"),
-#        ("tef", "00135813-001", "Teressa"),
-#        ("teg", "00135814-001", "Teke-Tege"),
-#        ("teh", "00135815-001", "Tehuelche"),
-#        ("tei", "00135816-001", "Torricelli"),
-#        ("tek", "00135817-001", "Ibali Teke"),
-#        ("tel", "00138622-001", "Telugu"),
-#        ("tem", "00135818-001", "Timne"),
-#        ("ten", "00137983-001", "Tama"),
-#        ("teo", "00135819-001", "Teso"),
-#        ("tep", "00137972-001", "Tepecano"),
-#        ("teq", "00135846-001", "Temein"),
-#        ("ter", "00135800-001", "Tereno"),
-#        ("tes", "00135834-001", "Tengger"),
-#        ("tet", "00135869-001", "Tetum"),
-#        ("teu", "00135870-001", "Soo"),
-#        ("tev", "00135871-001", "Teor"),
-#        ("tew", "00135872-001", "Tewa"),
-#        ("tex", "00135873-001", "Tennet"),
-#        ("tey", "00135874-001", "Tulishi"),
-#        ("tfi", "00135875-001", "Tofin Gbe"),
-#        ("tfn", "00135876-001", "Tanaina"),
-#        ("tfo", "00135877-001", "Tefaro"),
-#        ("tfr", "00135890-001", "Teribe"),
-#        ("tft", "00135879-001", "Ternate"),
-#        ("tga", "00135868-001", "Sagalla"),
-#        ("tgb", "00135881-001", "Tobilung"),
-#        ("tgc", "00135882-001", "Tigak"),
-#        ("tgd", "00135883-001", "Ciwogai"),
-#        ("tge", "00135884-001", "Eastern Gorkha Tamang"),
-#        ("tgf", "00135885-001", "Chalikha"),
-#        ("tgg", "00135886-001", "Tangga"),
-#        ("tgh", "00135887-001", "Tobagonian Creole English"),
-#        ("tgi", "00135888-001", "Lawunuia"),
-#        ("tgk", "00138623-001", "Tajik"),
-#        ("tgl", "00138627-001", "Tagalog"),
-#        ("tgo", "00135889-001", "Sudest"),
-#        ("tgp", "00135857-001", "Tangoa"),
-#        ("tgq", "00135855-001", "Tring"),
-#        ("tgr", "00135878-001", "Tareng"),
-#        ("tgs", "00135847-001", "Nume"),
-#        ("tgt", "00135848-001", "Central Tagbanwa"),
-#        ("tgu", "00135849-001", "Tanggu"),
-#        ("tgv", "00138273-001", "Tingui-Boto"),
-#        ("tgw", "00135850-001", "Tagwana Senoufo"),
-#        ("tgx", "00135851-001", "Tagish"),
-#        ("tgy", "00138268-001", "Togoyo"),
-#        ("tha", "00138624-001", "Thai"),
-#        ("thc", "00135852-001", "Tai Hang Tong"),
-#        ("thd", "00135853-001", "Thayore"),
-#        ("the", "00135854-001", "Chitwania Tharu"),
-#        ("thf", "00135867-001", "Thangmi"),
-#        ("thh", "00135856-001", "Northern Tarahumara"),
-#        ("thi", "00135845-001", "Tai Long"),
-#        ("thk", "00135858-001", "Tharaka"),
-#        ("thl", "00135859-001", "Dangaura Tharu"),
-#        ("thm", "00135860-001", "Aheu"),
-#        ("thn", "00135861-001", "Thachanadan"),
-#        ("thp", "00135862-001", "Thompson"),
-#        ("thq", "00135863-001", "Kochila Tharu"),
-#        ("thr", "00135864-001", "Rana Tharu"),
-#        ("ths", "00135865-001", "Thakali"),
-#        ("tht", "00135777-001", "Tahltan"),
-#        ("thu", "00135880-001", "Thuri"),
-#        ("thv", "00135820-001", "Tahaggart Tamahaq"),
-#        ("thw", "00135731-001", "Thudam"),
-#        ("thx", "00135732-001", "The"),
-#        ("thy", "00135733-001", "Tha"),
-#        ("thz", "00135734-001", "Tayart Tamajeq"),
-#        ("tia", "00135735-001", "Tidikelt Tamazight"),
-#        ("tic", "00135736-001", "Tira"),
-#        ("tid", "00135737-001", "Tidong"),
-#        ("tie", "00135738-001", "Tingal"),
-#        ("tif", "00135739-001", "Tifal"),
-#        ("tig", "00135752-001", "Tigre"),
-#        ("tih", "00135741-001", "Timugon Murut"),
-#        ("tii", "00135730-001", "Tiene"),
-#        ("tij", "00135743-001", "Tilung"),
-#        ("tik", "00135744-001", "Tikar"),
-#        ("til", "00138175-001", "Tillamook"),
-#        ("tim", "00135745-001", "Timbe"),
-#        ("tin", "00135746-001", "Tindi"),
-#        ("tio", "00135747-001", "Teop"),
-#        ("tip", "00135748-001", "Trimuris"),
-#        ("tiq", "00135749-001", "Tiéfo"),
-#        ("tir", "00138625-001", "Tigrinya"),
-#        ("tis", "00135750-001", "Masadiit Itneg"),
-#        ("tit", "00135719-001", "Tinigua"),
-#        ("tiu", "00135742-001", "Adasen"),
-#        ("tiv", "00135740-001", "Tiv"),
-#        ("tiw", "00135709-001", "Tiwi"),
-#        ("tix", "00135710-001", "Southern Tiwa"),
-#        ("tiy", "00135711-001", "Tiruray"),
-#        ("tiz", "00135712-001", "Tai Hongjin"),
-#        ("tja", "00135713-001", "Tajuasohn"),
-#        ("tjg", "00135714-001", "Tunjung"),
-#        ("tji", "00135715-001", "Northern Tujia"),
-#        ("tjm", "00138231-001", "Timucua"),
-#        ("tjn", "00138218-001", "Tonjon"),
-#        ("tjo", "00135716-001", "Temacine Tamazight"),
-#        ("tjs", "00135729-001", "Southern Tujia"),
-#        ("tju", "00138225-001", "Tjurruru"),
-#        ("tka", "00138245-001", "Truká"),
-#        ("tkb", "00135718-001", "Buksa"),
-#        ("tkd", "00135708-001", "Tukudede"),
-#        ("tke", "00135720-001", "Takwane"),
-#        ("tkf", "00138244-001", "Tukumanféd"),
-#        ("tkk", "00135721-001", "Takpa"),
-#        ("tkl", "00135722-001", "Tokelau"),
-#        ("tkm", "00138200-001", "Takelma"),
-#        ("tkn", "00135723-001", "Toku-No-Shima"),
-#        ("tkp", "00135724-001", "Tikopia"),
-#        ("tkq", "00135725-001", "Tee"),
-#        ("tkr", "00135726-001", "Tsakhur"),
-#        ("tks", "00135727-001", "Takestani"),
-#        ("tkt", "00135728-001", "Kathoriya Tharu"),
-#        ("tku", "00135754-001", "Upper Necaxa Totonac"),
-#        ("tkw", "00135788-001", "Teanu"),
-#        ("tkx", "00135751-001", "Tangko"),
-#        ("tkz", "00135778-001", "Takua"),
-#        ("tla", "00135779-001", "Southwestern Tepehuan"),
-#        ("tlb", "00135780-001", "Tobelo"),
-#        ("tlc", "00135781-001", "Yecuatla Totonac"),
-#        ("tld", "00135782-001", "Talaud"),
-#        ("tlf", "00135783-001", "Telefol"),
-#        ("tlg", "00135784-001", "Tofanma"),
-#        ("tlh", "00138348-001", "Klingon; tlhIngan Hol"),
-#        ("tli", "00135785-001", "Tlingit"),
-#        ("tlj", "00135798-001", "Talinga-Bwisi"),
-#        ("tlk", "00135787-001", "Taloki"),
-#        ("tll", "00135776-001", "Tetela"),
-#        ("tlm", "00135789-001", "Tolomako"),
-#        ("tln", "00135790-001", "Talondo'"),
-#        ("tlo", "00135791-001", "Talodi"),
-#        ("tlp", "00135792-001", "Filomena Mata-Coahuitlán Totonac"),
-#        ("tlq", "00135793-001", "Tai Loi"),
-#        ("tlr", "00135794-001", "Talise"),
-#        ("tls", "00135795-001", "Tambotalo"),
-#        ("tlt", "00135796-001", "Teluti"),
-#        ("tlu", "00135797-001", "Tulehu"),
-#        ("tlv", "00135765-001", "Taliabu"),
-#        ("tlw", "00135763-001", "South Wemale"),
-#        ("tlx", "00135786-001", "Khehek"),
-#        ("tly", "00135755-001", "Talysh"),
-#        ("tma", "00135756-001", "Tama"),
-#        ("tmb", "00135757-001", "Katbol"),
-#        ("tmc", "00135758-001", "Tumak"),
-#        ("tmd", "00135759-001", "Haruai"),
-#        ("tme", "00135760-001", "Tremembé"),
-#        ("tmf", "00135761-001", "Toba-Maskoy"),
-#        ("tmg", "00138337-001", "Ternateńo"),
-#        ("tmh", "00130989-001", "Tamashek"),
-#        ("tmi", "00135762-001", "Tutuba"),
-#        ("tmj", "00135775-001", "Samarokena"),
-#        ("tmk", "00135764-001", "Northwestern Tamang"),
-#        ("tml", "00135753-001", "Tamnim Citak"),
-#        ("tmm", "00135766-001", "Tai Thanh"),
-#        ("tmn", "00135767-001", "Taman"),
-#        ("tmo", "00135768-001", "Temoq"),
-#        ("tmp", "00135769-001", "Tai Mène"),
-#        ("tmq", "00135770-001", "Tumleo"),
-#        ("tmr", "00138288-001", "Jewish Babylonian Aramaic"),
-#        ("tms", "00135771-001", "Tima"),
-#        ("tmt", "00135772-001", "Tasmate"),
-#        ("tmu", "00135773-001", "Iau"),
-#        ("tmv", "00135774-001", "Tembo; Motembo"),
-#        ("tmw", "00135500-001", "Temuan"),
-#        ("tmy", "00135225-001", "Tami"),
-#        ("tmz", "00138246-001", "Tamanaku"),
-#        ("tna", "00135591-001", "Tacana"),
-#        ("tnb", "00135275-001", "Western Tunebo"),
-#        ("tnc", "00135276-001", "Tanimuca-Retuarã"),
-#        ("tnd", "00135277-001", "Angosturas Tunebo"),
-#        ("tne", "00135278-001", "Tinoc Kallahan"),
-#        ("tnf", "00135279-001", "Tangshewi"),
-#        ("tng", "00135280-001", "Tobanga"),
-#        ("tnh", "00135281-001", "Maiani"),
-#        ("tni", "00135282-001", "Tandia"),
-#        ("tnk", "00135295-001", "Kwamera"),
-#        ("tnl", "00135284-001", "Lenakel"),
-#        ("tnm", "00135273-001", "Tabla"),
-#        ("tnn", "00135286-001", "North Tanna"),
-#        ("tno", "00135287-001", "Toromono"),
-#        ("tnp", "00135288-001", "Whitesands"),
-#        ("tnq", "00138279-001", "Taino"),
-#        ("tnr", "00135289-001", "Bedik"),
-#        ("tns", "00135290-001", "Tenis"),
-#        ("tnt", "00135291-001", "Tontemboan"),
-#        ("tnu", "00135292-001", "Tay Khang"),
-#        ("tnv", "00135293-001", "Tangchangya"),
-#        ("tnw", "00135294-001", "Tonsawang"),
-#        ("tnx", "00135262-001", "Tanema"),
-#        ("tny", "00135260-001", "Tongwe"),
-#        ("tnz", "00135283-001", "Tonga"),
-#        ("tob", "00135252-001", "Toba"),
-#        ("toc", "00135253-001", "Coyutla Totonac"),
-#        ("tod", "00135254-001", "Toma"),
-#        ("toe", "00137957-001", "Tomedes"),
-#        ("tof", "00135255-001", "Gizrra"),
-#        ("tog", "00135256-001", "Tonga"),
-#        ("toh", "00135257-001", "Gitonga"),
-#        ("toi", "00135258-001", "Tonga"),
-#        ("toj", "00135259-001", "Tojolabal"),
-#        ("tol", "00135272-001", "Tolowa"),
-#        ("tom", "00135261-001", "Tombulu"),
-#        ("ton", "00138629-001", "Tonga"),
-#        ("too", "00135250-001", "Xicotepec De Juárez Totonac"),
-#        ("top", "00135263-001", "Papantla Totonac"),
-#        ("toq", "00135264-001", "Toposa"),
-#        ("tor", "00135265-001", "Togbo-Vara Banda"),
-#        ("tos", "00135266-001", "Highland Totonac"),
-#        ("tou", "00135267-001", "Tho"),
-#        ("tov", "00135268-001", "Upper Taromi"),
-#        ("tow", "00135269-001", "Jemez"),
-#        ("tox", "00135270-001", "Tobian"),
-#        ("toy", "00135297-001", "Topoiyo"),
-#        ("toz", "00135251-001", "To"),
-#        ("tpa", "00135285-001", "Taupota"),
-#        ("tpc", "00135320-001", "Azoyú Me'phaa"),
-#        ("tpe", "00135321-001", "Tippera"),
-#        ("tpf", "00135322-001", "Tarpia"),
-#        ("tpg", "00135323-001", "Kula"),
-#        ("tpi", "00135324-001", "Tok Pisin"),
-#        ("tpj", "00135325-001", "Tapieté"),
-#        ("tpk", "00137938-001", "Tupinikin"),
-#        ("tpl", "00135326-001", "Tlacoapa Me'phaa"),
-#        ("tpm", "00135327-001", "Tampulma"),
-#        ("tpn", "00137930-001", "Tupinambá"),
-#        ("tpo", "00135328-001", "Tai Pao"),
-#        ("tpp", "00135341-001", "Pisaflores Tepehua"),
-#        ("tpq", "00135330-001", "Tukpa"),
-#        ("tpr", "00135319-001", "Tuparí"),
-#        ("tpt", "00135332-001", "Tlachichilco Tepehua"),
-#        ("tpu", "00135333-001", "Tampuan"),
-#        ("tpv", "00135334-001", "Tanapag"),
-#        ("tpw", "00138095-001", "Tupí"),
-#        ("tpx", "00135335-001", "Acatepec Me'phaa"),
-#        ("tpy", "00135336-001", "Trumai"),
-#        ("tpz", "00135337-001", "Tinputz"),
-#        ("tqb", "00135338-001", "Tembé"),
-#        ("tql", "00135339-001", "Lehali"),
-#        ("tqm", "00135340-001", "Turumsa"),
-#        ("tqn", "00135308-001", "Tenino"),
-#        ("tqo", "00135306-001", "Toaripi"),
-#        ("tqp", "00135329-001", "Tomoip"),
-#        ("tqq", "00135298-001", "Tunni"),
-#        ("tqr", "00138081-001", "Torona"),
-#        ("tqt", "00135299-001", "Western Totonac"),
-#        ("tqu", "00135300-001", "Touo"),
-#        ("tqw", "00138077-001", "Tonkawa"),
-#        ("tra", "00135301-001", "Tirahi"),
-#        ("trb", "00135302-001", "Terebu"),
-#        ("trc", "00135303-001", "Copala Triqui"),
-#        ("trd", "00135304-001", "Turi"),
-#        ("tre", "00135305-001", "East Tarangan"),
-#        ("trf", "00135318-001", "Trinidadian Creole English"),
-#        ("trg", "00135307-001", "Lishán Didán"),
-#        ("trh", "00135296-001", "Turaka"),
-#        ("tri", "00135309-001", "Trió"),
-#        ("trj", "00135310-001", "Toram"),
-#        ("trl", "00135311-001", "Traveller Scottish"),
-#        ("trm", "00135312-001", "Tregami"),
-#        ("trn", "00135313-001", "Trinitario"),
-#        ("tro", "00135314-001", "Tarao Naga"),
-#        ("trp", "00135315-001", "Kok Borok"),
-#        ("trq", "00135316-001", "San Martín Itunyoso Triqui"),
-#        ("trr", "00135228-001", "Taushiro"),
-#        ("trs", "00135331-001", "Chicahuaxtla Triqui"),
-#        ("trt", "00135271-001", "Tunggare"),
-#        ("tru", "00135182-001", "Turoyo"),
-#        ("trv", "00135183-001", "Taroko"),
-#        ("trw", "00135184-001", "Torwali"),
-#        ("trx", "00135185-001", "Tringgus-Sembaan Bidayuh"),
-#        ("try", "00138064-001", "Turung"),
-#        ("trz", "00135186-001", "Torá"),
-#        ("tsa", "00135187-001", "Tsaangi"),
-#        ("tsb", "00135188-001", "Tsamai"),
-#        ("tsc", "00135189-001", "Tswa"),
-#        ("tsd", "00135190-001", "Tsakonian"),
-#        ("tse", "00135203-001", "Tunisian Sign Language"),
-#        ("tsf", "00135192-001", "Southwestern Tamang"),
-#        ("tsg", "00135181-001", "Tausug"),
-#        ("tsh", "00135194-001", "Tsuvan"),
-#        ("tsi", "00135195-001", "Tsimshian"),
-#        ("tsj", "00135196-001", "Tshangla"),
-#        ("tsk", "00135197-001", "Tseku"),
-#        ("tsl", "00135198-001", "Ts'ün-Lao"),
-#        ("tsm", "00135199-001", "Turkish Sign Language"),
-#        ("tsn", "00138628-001", "Setswana; Tswana"),
-#        ("tso", "00138631-001", "Tsonga"),
-#        ("tsp", "00135200-001", "Northern Toussian"),
-#        ("tsq", "00135201-001", "Thai Sign Language"),
-#        ("tsr", "00135170-001", "Akei"),
-#        ("tss", "00135193-001", "Taiwan Sign Language"),
-#        ("tsu", "00135191-001", "Tsou"),
-#        ("tsv", "00135160-001", "Tsogo"),
-#        ("tsw", "00135161-001", "Tsishingini"),
-#        ("tsx", "00135162-001", "Mubami"),
-#        ("tsy", "00135163-001", "Tebul Sign Language"),
-#        ("tsz", "00135164-001", "Purepecha"),
-#        ("tta", "00138057-001", "Tutelo"),
-#        ("ttb", "00135165-001", "Gaa"),
-#        ("ttc", "00135166-001", "Tektiteko"),
-#        ("ttd", "00135167-001", "Tauade"),
-#        ("tte", "00135180-001", "Bwanabwana"),
-#        ("ttf", "00135169-001", "Tuotomb"),
-#        ("ttg", "00135159-001", "Tutong"),
-#        ("tth", "00135171-001", "Upper Ta'oih"),
-#        ("tti", "00135172-001", "Tobati"),
-#        ("ttj", "00135173-001", "Tooro"),
-#        ("ttk", "00135174-001", "Totoro"),
-#        ("ttl", "00135175-001", "Totela"),
-#        ("ttm", "00135176-001", "Northern Tutchone"),
-#        ("ttn", "00135177-001", "Towei"),
-#        ("tto", "00135178-001", "Lower Ta'oih"),
-#        ("ttp", "00135179-001", "Tombelala"),
-#        ("ttq", "00135205-001", "Tawallammat Tamajaq"),
-#        ("ttr", "00135239-001", "Tera"),
-#        ("tts", "00135202-001", "Northeastern Thai"),
-#        ("ttt", "00135229-001", "Muslim Tat"),
-#        ("ttu", "00135230-001", "Torau"),
-#        ("ttv", "00135231-001", "Titan"),
-#        ("ttw", "00135232-001", "Long Wat"),
-#        ("tty", "00135233-001", "Sikaritai"),
-#        ("ttz", "00135234-001", "Tsum"),
-#        ("tua", "00135235-001", "Wiarumus"),
-#        ("tub", "00135236-001", "Tübatulabal"),
-#        ("tuc", "00135249-001", "Mutu"),
-#        ("tud", "00138088-001", "Tuxá"),
-#        ("tue", "00135238-001", "Tuyuca"),
-#        ("tuf", "00135227-001", "Central Tunebo"),
-#        ("tug", "00135240-001", "Tunia"),
-#        ("tuh", "00135241-001", "Taulil"),
-#        ("tui", "00135242-001", "Tupuri"),
-#        ("tuj", "00135243-001", "Tugutil"),
-#        ("tuk", "00138626-001", "Turkmen"),
-#        ("tul", "00135244-001", "Tula"),
-#        ("tum", "00135245-001", "Tumbuka"),
-#        ("tun", "00137951-001", "Tunica"),
-#        ("tuo", "00135246-001", "Tucano"),
-#        ("tuq", "00135247-001", "Tedaga"),
-#        ("tur", "00138630-001", "Turkish"),
-#        ("tus", "00135248-001", "Tuscarora"),
-#        ("tuu", "00135216-001", "Tututni"),
-#        ("tuv", "00135214-001", "Turkana"),
-#        ("tux", "00137988-001", "Tuxináwa"),
-#        ("tuy", "00135237-001", "Tugen"),
-#        ("tuz", "00135206-001", "Turka"),
-#        ("tva", "00135207-001", "Vaghua"),
-#        ("tvd", "00135208-001", "Tsuvadi"),
-#        ("tve", "00135209-001", "Te'un"),
-#        ("tvk", "00135210-001", "Southeast Ambrym"),
-#        ("tvl", "00135211-001", "Tuvalu"),
-#        ("tvm", "00135212-001", "Tela-Masbuar"),
-#        ("tvn", "00135213-001", "Tavoyan"),
-#        ("tvo", "00135226-001", "Tidore"),
-#        ("tvs", "00135215-001", "Taveta"),
-#        ("tvt", "00135204-001", "Tutsa Naga"),
-#        ("tvw", "00135217-001", "Sedoa"),
-#        ("tvy", "00138007-001", "Timor Pidgin"),
-#        ("twa", "00137961-001", "Twana"),
-#        ("twb", "00135218-001", "Western Tawbuid"),
-#        ("twc", "00137964-001", "Teshenawa"),
-#        ("twd", "00135219-001", "Twents"),
-#        ("twe", "00135220-001", "Tewa"),
-#        ("twf", "00135221-001", "Northern Tiwa"),
-#        ("twg", "00135222-001", "Tereweng"),
-#        ("twh", "00135223-001", "Tai Dón"),
-#        ("twi", "00138633-001", "Twi"),
-#        ("twl", "00135224-001", "Tawara"),
-#        ("twm", "00135351-001", "Tawang Monpa"),
-#        ("twn", "00135168-001", "Twendi"),
-#        ("two", "00135317-001", "Tswapong"),
-#        ("twp", "00135457-001", "Ere"),
-#        ("twq", "00135458-001", "Tasawaq"),
-#        ("twr", "00135459-001", "Southwestern Tarahumara"),
-#        ("twt", "00138258-001", "Turiwára"),
-#        ("twu", "00135460-001", "Termanu"),
-#        ("tww", "00135461-001", "Tuwari"),
-#        ("twx", "00135462-001", "Tewe"),
-#        ("twy", "00135463-001", "Tawoyan"),
-#        ("txa", "00135464-001", "Tombonuo"),
-#        ("txb", "00138374-001", "Tokharian B"),
-#        ("txc", "00138257-001", "Tsetsaut"),
-#        ("txe", "00135465-001", "Totoli"),
-#        ("txg", "00138375-001", "Tangut"),
-#        ("txh", "00138368-001", "Thracian"),
-#        ("txi", "00135478-001", "Ikpeng"),
-#        ("txm", "00135467-001", "Tomini"),
-#        ("txn", "00135456-001", "West Tarangan"),
-#        ("txo", "00135469-001", "Toto"),
-#        ("txq", "00135470-001", "Tii"),
-#        ("txr", "00138363-001", "Tartessian"),
-#        ("txs", "00135471-001", "Tonsea"),
-#        ("txt", "00135472-001", "Citak"),
-#        ("txu", "00135473-001", "Kayapó"),
-#        ("txx", "00135474-001", "Tatana"),
-#        ("txy", "00135475-001", "Tanosy Malagasy"),
-#        ("tya", "00135476-001", "Tauya"),
-#        ("tye", "00135477-001", "Kyenga"),
-#        ("tyh", "00135445-001", "O'du"),
-#        ("tyi", "00135443-001", "Teke-Tsaayi"),
-#        ("tyj", "00135466-001", "Tai Do"),
-#        ("tyl", "00135435-001", "Thu Lao"),
-#        ("tyn", "00135436-001", "Kombai"),
-#        ("typ", "00135437-001", "Thaypan"),
-#        ("tyr", "00135438-001", "Tai Daeng"),
-#        ("tys", "00135439-001", "Tày Sa Pa"),
-#        ("tyt", "00135440-001", "Tày Tac"),
-#        ("tyu", "00135441-001", "Kua"),
-#        ("tyv", "00135442-001", "Tuvinian"),
-#        ("tyx", "00135455-001", "Teke-Tyee"),
-#        ("tyz", "00135444-001", "Tày"),
-#        ("tza", "00135433-001", "Tanzanian Sign Language"),
-#        ("tzh", "00135446-001", "Tzeltal"),
-#        ("tzj", "00135447-001", "Tz'utujil"),
-#        ("tzm", "00135448-001", "Central Atlas Tamazight"),
-#        ("tzn", "00135449-001", "Tugun"),
-#        ("tzo", "00135450-001", "Tzotzil"),
-#        ("tzx", "00135451-001", "Tabriak"),
-#        ("uam", "00138330-001", "Uamué"),
-#        ("uan", "00135452-001", "Kuan"),
-#        ("uar", "00135453-001", "Tairuma"),
-#        ("uba", "00135480-001", "Ubang"),
-#        ("ubi", "00135434-001", "Ubi"),
-#        ("ubr", "00135468-001", "Ubir"),
-#        ("ubu", "00135503-001", "Umbu-Ungu"),
-#        ("uby", "00138270-001", "Ubykh"),
-#        ("uda", "00135504-001", "Uda"),
-#        ("ude", "00135505-001", "Udihe"),
-#        ("udg", "00135506-001", "Muduga"),
-#        ("udi", "00135507-001", "Udi"),
-#        ("udj", "00135508-001", "Ujir"),
-#        ("udl", "00135509-001", "Wuzlam"),
-#        ("udm", "00135510-001", "Udmurt"),
-#        ("udu", "00135511-001", "Uduk"),
-#        ("ues", "00135524-001", "Kioko"),
-#        ("ufi", "00135513-001", "Ufim"),
-#        ("uga", "00138373-001", "Ugaritic"),
-#        ("ugb", "00135502-001", "Kuku-Ugbanh"),
-#        ("uge", "00135515-001", "Ughele"),
-#        ("ugn", "00135516-001", "Ugandan Sign Language"),
-#        ("ugo", "00135517-001", "Ugong"),
-#        ("ugy", "00135518-001", "Uruguayan Sign Language"),
-#        ("uha", "00135519-001", "Uhami"),
-#        ("uhn", "00135520-001", "Damal"),
-#        ("uig", "00138635-001", "Uighur; Uyghur"),
-#        ("uis", "00135521-001", "Uisai"),
-#        ("uiv", "00135522-001", "Iyive"),
-#        ("uji", "00135523-001", "Tanjijili"),
-#        ("uka", "00135491-001", "Kaburi"),
-#        ("ukg", "00135489-001", "Ukuriguma"),
-#        ("ukh", "00135512-001", "Ukhwejo"),
-#        ("ukl", "00135481-001", "Ukrainian Sign Language"),
-#        ("ukp", "00135482-001", "Ukpe-Bayobiri"),
-#        ("ukq", "00135483-001", "Ukwa"),
-#        ("ukr", "00138636-001", "Ukrainian"),
-#        ("uks", "00135484-001", "Urubú-Kaapor Sign Language"),
-#        ("uku", "00135485-001", "Ukue"),
-#        ("ukw", "00135486-001", "Ukwuani-Aboh-Ndoni"),
-#        ("ula", "00135487-001", "Fungwa"),
-#        ("ulb", "00135488-001", "Ulukwumi"),
-#        ("ulc", "00135501-001", "Ulch"),
-#        ("ulf", "00135490-001", "Usku"),
-#        ("uli", "00135479-001", "Ulithian"),
-#        ("ulk", "00135492-001", "Meriam"),
-#        ("ull", "00135493-001", "Ullatan"),
-#        ("ulm", "00135494-001", "Ulumanda'"),
-#        ("uln", "00135495-001", "Unserdeutsch"),
-#        ("ulu", "00135496-001", "Uma' Lung"),
-#        ("uma", "00135497-001", "Umatilla"),
-#        ("umb", "00135498-001", "Umbundu"),
-#        ("umc", "00138361-001", "Marrucinian"),
-#        ("umd", "00135499-001", "Umbindhamu"),
-#        ("umg", "00135411-001", "Umbuygamu"),
-#        ("umi", "00135514-001", "Ukit"),
-#        ("umm", "00135454-001", "Umon"),
-#        ("umn", "00135365-001", "Makyan Naga"),
-#        ("umo", "00138000-001", "Umotína"),
-#        ("ump", "00135366-001", "Umpila"),
-#        ("umr", "00135367-001", "Umbugarla"),
-#        ("ums", "00135368-001", "Pendau"),
-#        ("umu", "00135369-001", "Munsee"),
-#        ("una", "00135370-001", "North Watut"),
-#        ("und", "00130975-001", "undetermined"),
-#        ("une", "00135371-001", "Uneme"),
-#        ("ung", "00135372-001", "Ngarinyin"),
-#        ("unk", "00135373-001", "Enawené-Nawé"),
-#        ("unm", "00137997-001", "Unami"),
-#        ("unp", "00135386-001", "Worora"),
-#        ("unr", "00135375-001", "Mundari"),
-#        ("unx", "00135364-001", "Munda"),
-#        ("unz", "00135377-001", "Unde Kaili"),
-#        ("uok", "00135378-001", "Uokha"),
-#        ("upi", "00135379-001", "Umeda"),
-#        ("upv", "00135380-001", "Uripiv-Wala-Rano-Atchin"),
-#        ("ura", "00135381-001", "Urarina"),
-#        ("urb", "00135382-001", "Urubú-Kaapor"),
-#        ("urc", "00135383-001", "Urningangg"),
-#        ("urd", "00138637-001", "Urdu"),
-#        ("ure", "00135384-001", "Uru"),
-#        ("urf", "00135353-001", "Uradhi"),
-#        ("urg", "00135376-001", "Urigina"),
-#        ("urh", "00135374-001", "Urhobo"),
-#        ("uri", "00135343-001", "Urim"),
-#        ("urk", "00135344-001", "Urak Lawoi'"),
-#        ("url", "00135345-001", "Urali"),
-#        ("urm", "00135346-001", "Urapmin"),
-#        ("urn", "00135347-001", "Uruangnirin"),
-#        ("uro", "00135348-001", "Ura"),
-#        ("urp", "00135349-001", "Uru-Pa-In"),
-#        ("urr", "00135350-001", "Lehalurup"),
-#        ("urt", "00135363-001", "Urat"),
-#        ("uru", "00137944-001", "Urumi"),
-#        ("urv", "00137956-001", "Uruava"),
-#        ("urw", "00135352-001", "Sop"),
-#        ("urx", "00135342-001", "Urimo"),
-#        ("ury", "00136598-001", "Orya"),
-#        ("urz", "00135355-001", "Uru-Eu-Wau-Wau"),
-#        ("usa", "00137343-001", "Usarufa"),
-#        ("ush", "00135357-001", "Ushojo"),
-#        ("usi", "00135358-001", "Usui"),
-#        ("usk", "00135359-001", "Usaghade"),
-#        ("usp", "00135360-001", "Uspanteco"),
-#        ("usu", "00135361-001", "Uya"),
-#        ("uta", "00135362-001", "Otank"),
-#        ("ute", "00135388-001", "Ute-Southern Paiute"),
-#        ("utp", "00135422-001", "Amba"),
-#        ("utr", "00135385-001", "Etulo"),
-#        ("utu", "00135412-001", "Utu"),
-#        ("uum", "00135413-001", "Urum"),
-#        ("uun", "00138100-001", "Kulon-Pazeh"),
-#        ("uur", "00135414-001", "Ura"),
-#        ("uuu", "00135415-001", "U"),
-#        ("uve", "00135416-001", "West Uvean"),
-#        ("uvh", "00135417-001", "Uri"),
-#        ("uvl", "00135418-001", "Lote"),
-#        ("uwa", "00135419-001", "Kuku-Uwanh"),
-#        ("uya", "00135432-001", "Doko-Uyanga"),
-#        ("uzb", "00138638-001", "Uzbek"),
-#        ("uzn", "00135421-001", "Northern Uzbek"),
-#        ("uzs", "00135410-001", "Southern Uzbek"),
-#        ("vaa", "00135423-001", "Vaagri Booli"),
-#        ("vae", "00135424-001", "Vale"),
-#        ("vaf", "00135425-001", "Vafsi"),
-#        ("vag", "00135426-001", "Vagla"),
-#        ("vah", "00135427-001", "Varhadi-Nagpuri"),
-#        ("vai", "00135428-001", "Vai"),
-#        ("vaj", "00135429-001", "Vasekela Bushman"),
-#        ("val", "00135430-001", "Vehes"),
-#        ("vam", "00135431-001", "Vanimo"),
-#        ("van", "00135399-001", "Valman"),
-#        ("vao", "00135397-001", "Vao"),
-#        ("vap", "00135420-001", "Vaiphei"),
-#        ("var", "00135389-001", "Huarijio"),
-#        ("vas", "00135390-001", "Vasavi"),
-#        ("vau", "00135391-001", "Vanuma"),
-#        ("vav", "00135392-001", "Varli"),
-#        ("vay", "00135393-001", "Wayu"),
-#        ("vbb", "00135394-001", "Southeast Babar"),
-#        ("vec", "00135395-001", "Venetian"),
-#        ("ved", "00135396-001", "Veddah"),
-#        ("vel", "00135409-001", "Veluws"),
-#        ("vem", "00135398-001", "Vemgo-Mabas"),
-#        ("ven", "00138639-001", "Venda"),
-#        ("veo", "00138045-001", "Ventureńo"),
-#        ("vep", "00135387-001", "Veps"),
-#        ("ver", "00135400-001", "Mom Jango"),
-#        ("vgr", "00135401-001", "Vaghri"),
-#        ("vgt", "00135402-001", "Vlaamse Gebarentaal"),
-#        ("vic", "00135403-001", "Virgin Islands Creole English"),
-#        ("vid", "00135404-001", "Vidunda"),
-#        ("vie", "00138640-001", "Vietnamese"),
-#        ("vif", "00135405-001", "Vili"),
-#        ("vig", "00135406-001", "Viemo"),
-#        ("vil", "00135407-001", "Vilela"),
-#        ("vin", "00136006-001", "Vinza"),
-#        ("vis", "00135274-001", "Vishavan"),
-#        ("vit", "00135866-001", "Viti"),
-#        ("viv", "00136372-001", "Iduna"),
-#        ("vka", "00138056-001", "Kariyarra"),
-#        ("vki", "00136373-001", "Ija-Zuba"),
-#        ("vkj", "00136374-001", "Kujarge"),
-#        ("vkk", "00136375-001", "Kaur"),
-#        ("vkl", "00136376-001", "Kulisusu"),
-#        ("vkm", "00138059-001", "Kamakan"),
-#        ("vko", "00136377-001", "Kodeoha"),
-#        ("vkp", "00136378-001", "Korlai Creole Portuguese"),
-#        ("vkt", "00136379-001", "Tenggarong Kutai Malay"),
-#        ("vku", "00136380-001", "Kurrama"),
-#        ("vlp", "00136393-001", "Valpei"),
-#        ("vls", "00136382-001", "Vlaams"),
-#        ("vma", "00136371-001", "Martuyhunira"),
-#        ("vmb", "00136384-001", "Mbabaram"),
-#        ("vmc", "00136385-001", "Juxtlahuaca Mixtec"),
-#        ("vmd", "00136386-001", "Mudu Koraga"),
-#        ("vme", "00136387-001", "East Masela"),
-#        ("vmf", "00136388-001", "Mainfränkisch"),
-#        ("vmg", "00136389-001", "Minigir"),
-#        ("vmh", "00136390-001", "Maraghei"),
-#        ("vmi", "00136391-001", "Miwa"),
-#        ("vmj", "00136392-001", "Ixtayutla Mixtec"),
-#        ("vmk", "00136360-001", "Makhuwa-Shirima"),
-#        ("vml", "00138053-001", "Malgana"),
-#        ("vmm", "00136358-001", "Mitlatongo Mixtec"),
-#        ("vmp", "00136381-001", "Soyaltepec Mazatec"),
-#        ("vmq", "00136350-001", "Soyaltepec Mixtec"),
-#        ("vmr", "00136351-001", "Marenje"),
-#        ("vms", "00138016-001", "Moksela"),
-#        ("vmu", "00136352-001", "Muluridyi"),
-#        ("vmv", "00138022-001", "Valley Maidu"),
-#        ("vmw", "00136353-001", "Makhuwa"),
-#        ("vmx", "00136354-001", "Tamazola Mixtec"),
-#        ("vmy", "00136355-001", "Ayautla Mazatec"),
-#        ("vmz", "00136356-001", "Mazatlán Mazatec"),
-#        ("vnk", "00138027-001", "Vano"),
-#        ("vnm", "00136357-001", "Vinmavis"),
-#        ("vnp", "00136370-001", "Vunapu"),
-#        ("vol", "00138641-001", "Volapük"),
-#        ("vor", "00136359-001", "Voro"),
-#        ("vot", "00136348-001", "Votic"),
-#        ("vra", "00136361-001", "Vera'a"),
-#        ("vro", "00136362-001", "Vőro"),
-#        ("vrs", "00136363-001", "Varisi"),
-#        ("vrt", "00136364-001", "Burmbar"),
-#        ("vsi", "00136365-001", "Moldova Sign Language"),
-#        ("vsl", "00136366-001", "Venezuelan Sign Language"),
-#        ("vsv", "00136367-001", "Valencian Sign Language"),
-#        ("vto", "00136368-001", "Vitou"),
-#        ("vum", "00136395-001", "Vumbu"),
-#        ("vun", "00136349-001", "Vunjo"),
-#        ("vut", "00136383-001", "Vute"),
-#        ("vwa", "00136418-001", "Awa"),
-#        ("waa", "00136419-001", "Walla Walla"),
-#        ("wab", "00136420-001", "Wab"),
-#        ("wac", "00136421-001", "Wasco-Wishram"),
-#        ("wad", "00136422-001", "Wandamen"),
-#        ("wae", "00136423-001", "Walser"),
-#        ("waf", "00138121-001", "Wakoná"),
-#        ("wag", "00136424-001", "Wa'ema"),
-#        ("wah", "00136425-001", "Watubela"),
-#        ("wai", "00136426-001", "Wares"),
-#        ("waj", "00136439-001", "Waffa"),
-#        ("wal", "00136428-001", "Wolaytta; Walamo"),
-#        ("wam", "00138078-001", "Wampanoag"),
-#        ("wan", "00136417-001", "Wan"),
-#        ("wao", "00138079-001", "Wappo"),
-#        ("wap", "00136430-001", "Wapishana"),
-#        ("waq", "00136431-001", "Wageman"),
-#        ("war", "00136432-001", "Waray"),
-#        ("was", "00136433-001", "Washo"),
-#        ("wat", "00136434-001", "Kaninuwa"),
-#        ("wau", "00136435-001", "Waurá"),
-#        ("wav", "00136436-001", "Waka"),
-#        ("waw", "00136437-001", "Waiwai"),
-#        ("wax", "00136438-001", "Watam"),
-#        ("way", "00136406-001", "Wayana"),
-#        ("waz", "00136404-001", "Wampur"),
-#        ("wba", "00136427-001", "Warao"),
-#        ("wbb", "00136396-001", "Wabo"),
-#        ("wbe", "00136397-001", "Waritai"),
-#        ("wbf", "00136398-001", "Wara"),
-#        ("wbh", "00136399-001", "Wanda"),
-#        ("wbi", "00136400-001", "Vwanji"),
-#        ("wbj", "00136401-001", "Alagwa"),
-#        ("wbk", "00136402-001", "Waigali"),
-#        ("wbl", "00136403-001", "Wakhi"),
-#        ("wbm", "00136416-001", "Wa"),
-#        ("wbp", "00136405-001", "Warlpiri"),
-#        ("wbq", "00136394-001", "Waddar"),
-#        ("wbr", "00136407-001", "Wagdi"),
-#        ("wbt", "00136408-001", "Wanman"),
-#        ("wbv", "00136409-001", "Wajarri"),
-#        ("wbw", "00136410-001", "Woi"),
-#        ("wca", "00136411-001", "Yanomámi"),
-#        ("wci", "00136412-001", "Waci Gbe"),
-#        ("wdd", "00136413-001", "Wandji"),
-#        ("wdg", "00136414-001", "Wadaginam"),
-#        ("wdj", "00136326-001", "Wadjiginy"),
-#        ("wdu", "00136429-001", "Wadjigu"),
-#        ("wea", "00136369-001", "Wewaw"),
-#        ("wec", "00136280-001", "Wè Western"),
-#        ("wed", "00136281-001", "Wedau"),
-#        ("weh", "00136282-001", "Weh"),
-#        ("wei", "00136283-001", "Were"),
-#        ("wem", "00136284-001", "Weme Gbe"),
-#        ("weo", "00136285-001", "North Wemale"),
-#        ("wep", "00136286-001", "Westphalien"),
-#        ("wer", "00136287-001", "Weri"),
-#        ("wes", "00136288-001", "Cameroon Pidgin"),
-#        ("wet", "00136301-001", "Perai"),
-#        ("weu", "00136290-001", "Welaung"),
-#        ("wew", "00136279-001", "Wejewa"),
-#        ("wfg", "00136292-001", "Yafi"),
-#        ("wga", "00136293-001", "Wagaya"),
-#        ("wgg", "00136294-001", "Wangganguru"),
-#        ("wgi", "00136295-001", "Wahgi"),
-#        ("wgo", "00136296-001", "Waigeo"),
-#        ("wgw", "00136297-001", "Wagawaga"),
-#        ("wgy", "00136298-001", "Warrgamay"),
-#        ("wha", "00136299-001", "Manusela"),
-#        ("whg", "00136268-001", "North Wahgi"),
-#        ("whk", "00136291-001", "Wahau Kenyah"),
-#        ("whu", "00136289-001", "Wahau Kayan"),
-#        ("wib", "00136258-001", "Southern Toussian"),
-#        ("wic", "00136259-001", "Wichita"),
-#        ("wie", "00136260-001", "Wik-Epa"),
-#        ("wif", "00136261-001", "Wik-Keyangan"),
-#        ("wig", "00136262-001", "Wik-Ngathana"),
-#        ("wih", "00136263-001", "Wik-Me'anha"),
-#        ("wii", "00136264-001", "Minidien"),
-#        ("wij", "00136265-001", "Wik-Iiyanh"),
-#        ("wik", "00136278-001", "Wikalkan"),
-#        ("wil", "00136267-001", "Wilawila"),
-#        ("wim", "00136257-001", "Wik-Mungkan"),
-#        ("win", "00136269-001", "Ho-Chunk"),
-#        ("wir", "00138002-001", "Wiraféd"),
-#        ("wit", "00136270-001", "Wintu"),
-#        ("wiu", "00136271-001", "Wiru"),
-#        ("wiv", "00136272-001", "Muduapa"),
-#        ("wiw", "00136273-001", "Wirangu"),
-#        ("wiy", "00138008-001", "Wiyot"),
-#        ("wja", "00136274-001", "Waja"),
-#        ("wji", "00136275-001", "Warji"),
-#        ("wka", "00138009-001", "Kw'adza"),
-#        ("wkb", "00136276-001", "Kumbaran"),
-#        ("wkd", "00136277-001", "Wakde"),
-#        ("wkl", "00136303-001", "Kalanadi"),
-#        ("wku", "00136337-001", "Kunduvadi"),
-#        ("wkw", "00136300-001", "Wakawaka"),
-#        ("wla", "00136327-001", "Walio"),
-#        ("wlc", "00136328-001", "Mwali Comorian"),
-#        ("wle", "00136329-001", "Wolane"),
-#        ("wlg", "00136330-001", "Kunbarlang"),
-#        ("wli", "00136331-001", "Waioli"),
-#        ("wlk", "00137974-001", "Wailaki"),
-#        ("wll", "00136332-001", "Wali"),
-#        ("wlm", "00137901-001", "Middle Welsh"),
-#        ("wln", "00138642-001", "Walloon"),
-#        ("wlo", "00136333-001", "Wolio"),
-#        ("wlr", "00136334-001", "Wailapa"),
-#        ("wls", "00136347-001", "Wallisian"),
-#        ("wlu", "00137977-001", "Wuliwuli"),
-#        ("wlv", "00136336-001", "Wichí Lhamtés Vejoz"),
-#        ("wlw", "00136325-001", "Walak"),
-#        ("wlx", "00136338-001", "Wali"),
-#        ("wly", "00138161-001", "Waling"),
-#        ("wma", "00138159-001", "Mawa"),
-#        ("wmb", "00136339-001", "Wambaya"),
-#        ("wmc", "00136340-001", "Wamas"),
-#        ("wmd", "00136341-001", "Mamaindé"),
-#        ("wme", "00136342-001", "Wambule"),
-#        ("wmh", "00136343-001", "Waima'a"),
-#        ("wmi", "00136344-001", "Wamin"),
-#        ("wmm", "00136345-001", "Maiwa"),
-#        ("wmn", "00138281-001", "Waamwang"),
-#        ("wmo", "00136346-001", "Wom"),
-#        ("wms", "00136314-001", "Wambon"),
-#        ("wmt", "00136312-001", "Walmajarri"),
-#        ("wmw", "00136335-001", "Mwani"),
-#        ("wmx", "00136304-001", "Womo"),
-#        ("wnb", "00136305-001", "Wanambre"),
-#        ("wnc", "00136306-001", "Wantoat"),
-#        ("wnd", "00138294-001", "Wandarang"),
-#        ("wne", "00136307-001", "Waneci"),
-#        ("wng", "00136308-001", "Wanggom"),
-#        ("wni", "00136309-001", "Ndzwani Comorian"),
-#        ("wnk", "00136310-001", "Wanukaka"),
-#        ("wnm", "00136311-001", "Wanggamala"),
-#        ("wno", "00136324-001", "Wano"),
-#        ("wnp", "00136313-001", "Wanap"),
-#        ("wnu", "00136302-001", "Usan"),
-#        ("woa", "00136315-001", "Tyaraity"),
-#        ("wob", "00136316-001", "Wè Northern"),
-#        ("woc", "00136317-001", "Wogeo"),
-#        ("wod", "00136318-001", "Wolani"),
-#        ("woe", "00136319-001", "Woleaian"),
-#        ("wof", "00136320-001", "Gambian Wolof"),
-#        ("wog", "00136321-001", "Wogamusin"),
-#        ("woi", "00136322-001", "Kamang"),
-#        ("wok", "00136449-001", "Longto"),
-#        ("wol", "00138643-001", "Wolof"),
-#        ("wom", "00136266-001", "Wom"),
-#        ("won", "00136415-001", "Wongo"),
-#        ("woo", "00136555-001", "Manombai"),
-#        ("wor", "00136556-001", "Woria"),
-#        ("wos", "00136557-001", "Hanga Hundi"),
-#        ("wow", "00136558-001", "Wawonii"),
-#        ("woy", "00138272-001", "Weyto"),
-#        ("wpc", "00136559-001", "Maco"),
-#        ("wra", "00136560-001", "Warapu"),
-#        ("wrb", "00136561-001", "Warluwara"),
-#        ("wrd", "00136562-001", "Warduji"),
-#        ("wrg", "00136563-001", "Warungu"),
-#        ("wrh", "00136576-001", "Wiradhuri"),
-#        ("wri", "00138335-001", "Wariyangga"),
-#        ("wrl", "00136565-001", "Warlmanpa"),
-#        ("wrm", "00136554-001", "Warumungu"),
-#        ("wrn", "00136567-001", "Warnang"),
-#        ("wrp", "00136568-001", "Waropen"),
-#        ("wrr", "00136569-001", "Wardaman"),
-#        ("wrs", "00136570-001", "Waris"),
-#        ("wru", "00136571-001", "Waru"),
-#        ("wrv", "00136572-001", "Waruna"),
-#        ("wrw", "00138341-001", "Gugu Warra"),
-#        ("wrx", "00136573-001", "Wae Rana"),
-#        ("wry", "00136574-001", "Merwari"),
-#        ("wrz", "00136575-001", "Waray"),
-#        ("wsa", "00136543-001", "Warembori"),
-#        ("wsi", "00136541-001", "Wusi"),
-#        ("wsk", "00136564-001", "Waskia"),
-#        ("wsr", "00136533-001", "Owenia"),
-#        ("wss", "00136534-001", "Wasa"),
-#        ("wsu", "00138323-001", "Wasu"),
-#        ("wsv", "00136535-001", "Wotapuri-Katarqalai"),
-#        ("wtf", "00136536-001", "Dumpu"),
-#        ("wti", "00136537-001", "Berta"),
-#        ("wtk", "00136538-001", "Watakataui"),
-#        ("wtm", "00136539-001", "Mewati"),
-#        ("wtw", "00136540-001", "Wotu"),
-#        ("wua", "00136553-001", "Wikngenchera"),
-#        ("wub", "00136542-001", "Wunambal"),
-#        ("wud", "00136531-001", "Wudu"),
-#        ("wuh", "00136544-001", "Wutunhua"),
-#        ("wul", "00136545-001", "Silimo"),
-#        ("wum", "00136546-001", "Wumbvu"),
-#        ("wun", "00136547-001", "Bungu"),
-#        ("wur", "00138158-001", "Wurrugu"),
-#        ("wut", "00136548-001", "Wutung"),
-#        ("wuu", "00136549-001", "Wu Chinese"),
-#        ("wuv", "00136550-001", "Wuvulu-Aua"),
-#        ("wux", "00136551-001", "Wulna"),
-#        ("wuy", "00136578-001", "Wauyai"),
-#        ("wwa", "00136532-001", "Waama"),
-#        ("wwo", "00136566-001", "Wetamut"),
-#        ("wwr", "00136601-001", "Warrwa"),
-#        ("www", "00136602-001", "Wawa"),
-#        ("wxa", "00136603-001", "Waxianghua"),
-#        ("wya", "00138163-001", "Wyandot"),
-#        ("wyb", "00136604-001", "Wangaaybuwan-Ngiyambaa"),
-#        ("wym", "00136605-001", "Wymysorys"),
-#        ("wyr", "00136606-001", "Wayoró"),
-#        ("wyy", "00136607-001", "Western Fijian"),
-#        ("xaa", "00137911-001", "Andalusian Arabic"),
-#        ("xab", "00136608-001", "Sambe"),
-#        ("xac", "00136609-001", "Kachari"),
-#        ("xad", "00138166-001", "Adai"),
-#        ("xae", "00138448-001", "Aequian"),
-#        ("xag", "00138170-001", "Aghwan"),
-#        ("xai", "00138156-001", "Kaimbé"),
-#        ("xal", "00136622-001", "Kalmyk; Oirat"),
-#        ("xam", "00138179-001", "/Xam"),
-#        ("xan", "00136611-001", "Xamtanga"),
-#        ("xao", "00136600-001", "Khao"),
-#        ("xap", "00138181-001", "Apalachee"),
-#        ("xaq", "00138464-001", "Aquitanian"),
-#        ("xar", "00138131-001", "Karami"),
-#        ("xas", "00138149-001", "Kamas"),
-#        ("xat", "00136613-001", "Katawixi"),
-#        ("xau", "00136614-001", "Kauwera"),
-#        ("xav", "00136615-001", "Xavánte"),
-#        ("xaw", "00136616-001", "Kawaiisu"),
-#        ("xay", "00136617-001", "Kayan Mahakam"),
-#        ("xba", "00138153-001", "Kamba"),
-#        ("xbc", "00138432-001", "Bactrian"),
-#        ("xbi", "00136618-001", "Kombio"),
-#        ("xbm", "00137908-001", "Middle Breton"),
-#        ("xbo", "00138221-001", "Bolgarian"),
-#        ("xbr", "00136619-001", "Kambera"),
-#        ("xbw", "00138216-001", "Kambiwá"),
-#        ("xbx", "00136620-001", "Kabixí"),
-#        ("xcb", "00138232-001", "Cumbric"),
-#        ("xcc", "00138392-001", "Camunic"),
-#        ("xce", "00138396-001", "Celtiberian"),
-#        ("xcg", "00138397-001", "Cisalpine Gaulish"),
-#        ("xch", "00138237-001", "Chemakum"),
-#        ("xcl", "00137890-001", "Classical Armenian"),
-#        ("xcm", "00138198-001", "Comecrudo"),
-#        ("xcn", "00138215-001", "Cotoname"),
-#        ("xco", "00138437-001", "Chorasmian"),
-#        ("xcr", "00138466-001", "Carian"),
-#        ("xct", "00137912-001", "Classical Tibetan"),
-#        ("xcu", "00138214-001", "Curonian"),
-#        ("xcv", "00138213-001", "Chuvantsy"),
-#        ("xcw", "00138212-001", "Coahuilteco"),
-#        ("xcy", "00138211-001", "Cayuse"),
-#        ("xdc", "00138457-001", "Dacian"),
-#        ("xdm", "00138458-001", "Edomite"),
-#        ("xdy", "00136621-001", "Malayic Dayak"),
-#        ("xeb", "00138465-001", "Eblan"),
-#        ("xed", "00136589-001", "Hdi"),
-#        ("xeg", "00138205-001", "//Xegwi"),
-#        ("xel", "00136587-001", "Kelo"),
-#        ("xem", "00136610-001", "Kembayan"),
-#        ("xep", "00138440-001", "Epi-Olmec"),
-#        ("xer", "00136579-001", "Xerénte"),
-#        ("xes", "00136580-001", "Kesawai"),
-#        ("xet", "00136581-001", "Xetá"),
-#        ("xeu", "00136582-001", "Keoru-Ahia"),
-#        ("xfa", "00138452-001", "Faliscan"),
-#        ("xga", "00138451-001", "Galatian"),
-#        ("xgf", "00138196-001", "Gabrielino-Fernandeńo"),
-#        ("xgl", "00138195-001", "Galindan"),
-#        ("xgr", "00138193-001", "Garza"),
-#        ("xha", "00138450-001", "Harami"),
-#        ("xhc", "00138191-001", "Hunnic"),
-#        ("xhd", "00138449-001", "Hadrami"),
-#        ("xhe", "00136583-001", "Khetrani"),
-#        ("xho", "00138644-001", "Xhosa"),
-#        ("xhr", "00138447-001", "Hernican"),
-#        ("xht", "00138436-001", "Hattic"),
-#        ("xhu", "00138439-001", "Hurrian"),
-#        ("xhv", "00136584-001", "Khua"),
-#        ("xia", "00136585-001", "Xiandao"),
-#        ("xib", "00138459-001", "Iberian"),
-#        ("xii", "00136586-001", "Xiri"),
-#        ("xil", "00138379-001", "Illyrian"),
-#        ("xin", "00138239-001", "Xinca"),
-#        ("xip", "00138238-001", "Xipináwa"),
-#        ("xir", "00136599-001", "Xiriâna"),
-#        ("xiv", "00138398-001", "Indus Valley Language"),
-#        ("xiy", "00136588-001", "Xipaya"),
-#        ("xka", "00136577-001", "Kalkoti"),
-#        ("xkb", "00136590-001", "Manigri-Kambolé Ede Nago"),
-#        ("xkc", "00136591-001", "Kho'ini"),
-#        ("xkd", "00136592-001", "Mendalam Kayan"),
-#        ("xke", "00136593-001", "Kereho"),
-#        ("xkf", "00136594-001", "Khengkha"),
-#        ("xkg", "00136595-001", "Kagoro"),
-#        ("xkh", "00136596-001", "Karahawyana"),
-#        ("xki", "00136597-001", "Kenyan Sign Language"),
-#        ("xkj", "00136509-001", "Kajali"),
-#        ("xkk", "00136612-001", "Kaco'"),
-#        ("xkl", "00136552-001", "Mainstream Kenyah"),
-#        ("xkn", "00136463-001", "Kayan River Kayan"),
-#        ("xko", "00136464-001", "Kiorr"),
-#        ("xkp", "00136465-001", "Kabatei"),
-#        ("xkq", "00136466-001", "Koroni"),
-#        ("xkr", "00138187-001", "Xakriabá"),
-#        ("xks", "00136467-001", "Kumbewaha"),
-#        ("xkt", "00136468-001", "Kantosi"),
-#        ("xku", "00136469-001", "Kaamba"),
-#        ("xkv", "00136470-001", "Kgalagadi"),
-#        ("xkw", "00136471-001", "Kembra"),
-#        ("xkx", "00136484-001", "Karore"),
-#        ("xky", "00136473-001", "Uma' Lasan"),
-#        ("xkz", "00136462-001", "Kurtokha"),
-#        ("xla", "00136475-001", "Kamula"),
-#        ("xlb", "00138145-001", "Loup B"),
-#        ("xlc", "00138424-001", "Lycian"),
-#        ("xld", "00138407-001", "Lydian"),
-#        ("xle", "00138416-001", "Lemnian"),
-#        ("xlg", "00138414-001", "Ligurian (Ancient)"),
-#        ("xli", "00138409-001", "Liburnian"),
-#        ("xln", "00138429-001", "Alanic"),
-#        ("xlo", "00138139-001", "Loup A"),
-#        ("xlp", "00138430-001", "Lepontic"),
-#        ("xls", "00138382-001", "Lusitanian"),
-#        ("xlu", "00138403-001", "Cuneiform Luwian"),
-#        ("xly", "00138405-001", "Elymian"),
-#        ("xma", "00136476-001", "Mushungulu"),
-#        ("xmb", "00136477-001", "Mbonga"),
-#        ("xmc", "00136478-001", "Makhuwa-Marrevone"),
-#        ("xmd", "00136479-001", "Mbedam"),
-#        ("xme", "00138445-001", "Median"),
-#        ("xmf", "00136480-001", "Mingrelian"),
-#        ("xmg", "00136481-001", "Mengaka"),
-#        ("xmh", "00136482-001", "Kuku-Muminh"),
-#        ("xmj", "00136451-001", "Majera"),
-#        ("xmk", "00138461-001", "Ancient Macedonian"),
-#        ("xml", "00136474-001", "Malaysian Sign Language"),
-#        ("xmm", "00136472-001", "Manado Malay"),
-#        ("xmn", "00137879-001", "Manichaean Middle Persian"),
-#        ("xmo", "00136441-001", "Morerebi"),
-#        ("xmp", "00136442-001", "Kuku-Mu'inh"),
-#        ("xmq", "00136443-001", "Kuku-Mangk"),
-#        ("xmr", "00138455-001", "Meroitic"),
-#        ("xms", "00136444-001", "Moroccan Sign Language"),
-#        ("xmt", "00136445-001", "Matbat"),
-#        ("xmu", "00136446-001", "Kamu"),
-#        ("xmv", "00136447-001", "Antankarana Malagasy"),
-#        ("xmw", "00136448-001", "Tsimihety Malagasy"),
-#        ("xmx", "00136461-001", "Maden"),
-#        ("xmy", "00136450-001", "Mayaguduna"),
-#        ("xmz", "00136440-001", "Mori Bawah"),
-#        ("xna", "00138446-001", "Ancient North Arabian"),
-#        ("xnb", "00136452-001", "Kanakanabu"),
-#        ("xng", "00137877-001", "Middle Mongolian"),
-#        ("xnh", "00136453-001", "Kuanhua"),
-#        ("xnn", "00136454-001", "Northern Kankanay"),
-#        ("xno", "00137876-001", "Anglo-Norman"),
-#        ("xnr", "00136455-001", "Kangri"),
-#        ("xns", "00136456-001", "Kanashi"),
-#        ("xoc", "00138264-001", "O'chi'chi'"),
-#        ("xod", "00136457-001", "Kokoda"),
-#        ("xog", "00136458-001", "Soga"),
-#        ("xoi", "00136459-001", "Kominimung"),
-#        ("xok", "00136460-001", "Xokleng"),
-#        ("xom", "00136486-001", "Komo"),
-#        ("xon", "00136520-001", "Konkomba"),
-#        ("xoo", "00138266-001", "Xukurú"),
-#        ("xop", "00136483-001", "Kopar"),
-#        ("xor", "00136510-001", "Korubo"),
-#        ("xow", "00136511-001", "Kowaki"),
-#        ("xpc", "00138327-001", "Pecheneg"),
-#        ("xpe", "00136512-001", "Liberia Kpelle"),
-#        ("xpg", "00138387-001", "Phrygian"),
-#        ("xpi", "00138324-001", "Pictish"),
-#        ("xpk", "00136513-001", "Kulina Pano"),
-#        ("xpm", "00138322-001", "Pumpokol"),
-#        ("xpn", "00138321-001", "Kapinawá"),
-#        ("xpo", "00138319-001", "Pochutec"),
-#        ("xpp", "00138318-001", "Puyo-Paekche"),
-#        ("xpr", "00138383-001", "Parthian"),
-#        ("xps", "00138316-001", "Pisidian"),
-#        ("xpu", "00138380-001", "Punic"),
-#        ("xpy", "00138314-001", "Puyo"),
-#        ("xqa", "00137872-001", "Karakhanid"),
-#        ("xqt", "00138420-001", "Qatabanian"),
-#        ("xra", "00136514-001", "Krahô"),
-#        ("xrb", "00136515-001", "Eastern Karaboro"),
-#        ("xre", "00136516-001", "Kreye"),
-#        ("xri", "00136517-001", "Krikati-Timbira"),
-#        ("xrm", "00138307-001", "Armazic"),
-#        ("xrn", "00138306-001", "Arin"),
-#        ("xrr", "00138391-001", "Raetic"),
-#        ("xrt", "00138317-001", "Aranama-Tamique"),
-#        ("xru", "00136530-001", "Marriammu"),
-#        ("xrw", "00136519-001", "Karawa"),
-#        ("xsa", "00138431-001", "Sabaean"),
-#        ("xsb", "00136508-001", "Tinà Sambal"),
-#        ("xsc", "00138428-001", "Scythian"),
-#        ("xsd", "00138427-001", "Sidetic"),
-#        ("xse", "00136521-001", "Sempan"),
-#        ("xsh", "00136522-001", "Shamang"),
-#        ("xsi", "00136523-001", "Sio"),
-#        ("xsj", "00136524-001", "Subi"),
-#        ("xsl", "00136525-001", "South Slavey"),
-#        ("xsm", "00136526-001", "Kasem"),
-#        ("xsn", "00136527-001", "Sanga"),
-#        ("xso", "00138336-001", "Solano"),
-#        ("xsp", "00136528-001", "Silopi"),
-#        ("xsq", "00136529-001", "Makhuwa-Saka"),
-#        ("xsr", "00136497-001", "Sherpa"),
-#        ("xss", "00138333-001", "Assan"),
-#        ("xsu", "00136495-001", "Sanumá"),
-#        ("xsv", "00138332-001", "Sudovian"),
-#        ("xsy", "00136518-001", "Saisiyat"),
-#        ("xta", "00136487-001", "Alcozauca Mixtec"),
-#        ("xtb", "00136488-001", "Chazumba Mixtec"),
-#        ("xtc", "00136489-001", "Katcha-Kadugli-Miri"),
-#        ("xtd", "00136490-001", "Diuxi-Tilantongo Mixtec"),
-#        ("xte", "00136491-001", "Ketengban"),
-#        ("xtg", "00138411-001", "Transalpine Gaulish"),
-#        ("xti", "00136492-001", "Sinicahua Mixtec"),
-#        ("xtj", "00136493-001", "San Juan Teita Mixtec"),
-#        ("xtl", "00136494-001", "Tijaltepec Mixtec"),
-#        ("xtm", "00136507-001", "Magdalena Peńasco Mixtec"),
-#        ("xtn", "00136496-001", "Northern Tlaxiaco Mixtec"),
-#        ("xto", "00138395-001", "Tokharian A"),
-#        ("xtp", "00136485-001", "San Miguel Piedras Mixtec"),
-#        ("xtq", "00137865-001", "Tumshuqese"),
-#        ("xtr", "00138410-001", "Early Tripuri"),
-#        ("xts", "00136498-001", "Sindihui Mixtec"),
-#        ("xtt", "00136499-001", "Tacahua Mixtec"),
-#        ("xtu", "00136500-001", "Cuyamecalco Mixtec"),
-#        ("xtw", "00136501-001", "Tawandę"),
-#        ("xty", "00136502-001", "Yoloxochitl Mixtec"),
-#        ("xtz", "00138256-001", "Tasmanian"),
-#        ("xua", "00136503-001", "Alu Kurumba"),
-#        ("xub", "00136504-001", "Betta Kurumba"),
-#        ("xug", "00136505-001", "Kunigami"),
-#        ("xuj", "00136506-001", "Jennu Kurumba"),
-#        ("xum", "00138412-001", "Umbrian"),
-#        ("xuo", "00136232-001", "Kuo"),
-#        ("xup", "00138250-001", "Upper Umpqua"),
-#        ("xur", "00138413-001", "Urartian"),
-#        ("xut", "00135957-001", "Kuthant"),
-#        ("xuu", "00136323-001", "Kxoe"),
-#        ("xve", "00138417-001", "Venetic"),
-#        ("xvi", "00136007-001", "Kamviri"),
-#        ("xvn", "00138419-001", "Vandalic"),
-#        ("xvo", "00138435-001", "Volscian"),
-#        ("xvs", "00138421-001", "Vestinian"),
-#        ("xwa", "00136008-001", "Kwaza"),
-#        ("xwc", "00138299-001", "Woccon"),
-#        ("xwe", "00136009-001", "Xwela Gbe"),
-#        ("xwg", "00136010-001", "Kwegu"),
-#        ("xwl", "00136011-001", "Western Xwla Gbe"),
-#        ("xwo", "00138295-001", "Written Oirat"),
-#        ("xwr", "00136012-001", "Kwerba Mamberamo"),
-#        ("xxb", "00138293-001", "Boro"),
-#        ("xxk", "00136013-001", "Ke'o"),
-#        ("xxr", "00138291-001", "Koropó"),
-#        ("xxt", "00138290-001", "Tambora"),
-#        ("xyl", "00138289-001", "Yalakalore"),
-#        ("xzh", "00138423-001", "Zhang-Zhung"),
-#        ("xzm", "00138274-001", "Zemgalian"),
-#        ("xzp", "00137861-001", "Ancient Zapotec"),
-#        ("yaa", "00136014-001", "Yaminahua"),
-#        ("yab", "00136027-001", "Yuhup"),
-#        ("yac", "00136016-001", "Pass Valley Yali"),
-#        ("yad", "00136005-001", "Yagua"),
-#        ("yae", "00136018-001", "Pumé"),
-#        ("yaf", "00136019-001", "Yaka"),
-#        ("yag", "00136020-001", "Yámana"),
-#        ("yah", "00136021-001", "Yazgulyam"),
-#        ("yai", "00136022-001", "Yagnobi"),
-#        ("yaj", "00136023-001", "Banda-Yangere"),
-#        ("yak", "00136024-001", "Yakima"),
-#        ("yal", "00136025-001", "Yalunka"),
-#        ("yam", "00136026-001", "Yamba"),
-#        ("yao", "00135994-001", "Yao"),
-#        ("yap", "00135992-001", "Yapese"),
-#        ("yaq", "00136015-001", "Yaqui"),
-#        ("yar", "00135984-001", "Yabarana"),
-#        ("yas", "00135985-001", "Nugunu"),
-#        ("yat", "00135986-001", "Yambeta"),
-#        ("yau", "00135987-001", "Yuwana"),
-#        ("yav", "00135988-001", "Yangben"),
-#        ("yaw", "00137975-001", "Yawalapití"),
-#        ("yax", "00135989-001", "Yauma"),
-#        ("yay", "00135990-001", "Agwagwune"),
-#        ("yaz", "00135991-001", "Lokaa"),
-#        ("yba", "00136004-001", "Yala"),
-#        ("ybb", "00135993-001", "Yemba"),
-#        ("ybd", "00135982-001", "Yangbye"),
-#        ("ybe", "00135995-001", "West Yugur"),
-#        ("ybh", "00135996-001", "Yakha"),
-#        ("ybi", "00135997-001", "Yamphu"),
-#        ("ybj", "00135998-001", "Hasha"),
-#        ("ybk", "00135999-001", "Bokha"),
-#        ("ybl", "00136000-001", "Yukuben"),
-#        ("ybm", "00136001-001", "Yaben"),
-#        ("ybn", "00137962-001", "Yabaâna"),
-#        ("ybo", "00136002-001", "Yabong"),
-#        ("ybx", "00136029-001", "Yawiyo"),
-#        ("yby", "00135983-001", "Yaweyuha"),
-#        ("ych", "00136017-001", "Chesu"),
-#        ("ycl", "00136052-001", "Lolopo"),
-#        ("ycn", "00136053-001", "Yucuna"),
-#        ("ycp", "00136054-001", "Chepya"),
-#        ("ydd", "00136055-001", "Eastern Yiddish"),
-#        ("yde", "00136056-001", "Yangum Dey"),
-#        ("ydg", "00136057-001", "Yidgha"),
-#        ("ydk", "00136058-001", "Yoidik"),
-#        ("yds", "00136059-001", "Yiddish Sign Language"),
-#        ("yea", "00136060-001", "Ravula"),
-#        ("yec", "00136073-001", "Yeniche"),
-#        ("yee", "00136062-001", "Yimas"),
-#        ("yei", "00138004-001", "Yeni"),
-#        ("yej", "00136051-001", "Yevanic"),
-#        ("yel", "00136064-001", "Yela"),
-#        ("yen", "00136065-001", "Yendang"),
-#        ("yer", "00136066-001", "Tarok"),
-#        ("yes", "00136067-001", "Yeskwa"),
-#        ("yet", "00136068-001", "Yetfa"),
-#        ("yeu", "00136069-001", "Yerukula"),
-#        ("yev", "00136070-001", "Yapunda"),
-#        ("yey", "00136071-001", "Yeyi"),
-#        ("ygl", "00136072-001", "Yangum Gel"),
-#        ("ygm", "00136040-001", "Yagomi"),
-#        ("ygp", "00136038-001", "Gepo"),
-#        ("ygr", "00136061-001", "Yagaria"),
-#        ("ygw", "00136030-001", "Yagwoia"),
-#        ("yha", "00136031-001", "Baha Buyang"),
-#        ("yhd", "00136032-001", "Judeo-Iraqi Arabic"),
-#        ("yhl", "00136033-001", "Hlepho Phowa"),
-#        ("yia", "00136034-001", "Yinggarda"),
-#        ("yid", "00138645-001", "Yiddish"),
-#        ("yif", "00136035-001", "Ache"),
-#        ("yig", "00136036-001", "Wusa Nasu"),
-#        ("yih", "00136037-001", "Western Yiddish"),
-#        ("yii", "00136050-001", "Yidiny"),
-#        ("yij", "00136039-001", "Yindjibarndi"),
-#        ("yik", "00136028-001", "Dongshanba Lalo"),
-#        ("yil", "00136041-001", "Yindjilandji"),
-#        ("yim", "00136042-001", "Yimchungru Naga"),
-#        ("yin", "00136043-001", "Yinchia"),
-#        ("yip", "00136044-001", "Pholo"),
-#        ("yiq", "00136045-001", "Miqie"),
-#        ("yir", "00136046-001", "North Awyu"),
-#        ("yis", "00136047-001", "Yis"),
-#        ("yit", "00136048-001", "Eastern Lalu"),
-#        ("yiu", "00135960-001", "Awu"),
-#        ("yiv", "00136063-001", "Northern Nisu"),
-#        ("yix", "00136003-001", "Axi Yi"),
-#        ("yiy", "00135914-001", "Yir Yoront"),
-#        ("yiz", "00135915-001", "Azhe"),
-#        ("yka", "00135916-001", "Yakan"),
-#        ("ykg", "00135917-001", "Northern Yukaghir"),
-#        ("yki", "00135918-001", "Yoke"),
-#        ("ykk", "00135919-001", "Yakaikeke"),
-#        ("ykl", "00135920-001", "Khlula"),
-#        ("ykm", "00135921-001", "Kap"),
-#        ("yko", "00135922-001", "Yasa"),
-#        ("ykr", "00135935-001", "Yekora"),
-#        ("ykt", "00135924-001", "Kathu"),
-#        ("yky", "00135913-001", "Yakoma"),
-#        ("yla", "00135926-001", "Yaul"),
-#        ("yle", "00135927-001", "Yele"),
-#        ("ylg", "00135928-001", "Yelogu"),
-#        ("yli", "00135929-001", "Angguruk Yali"),
-#        ("yll", "00135930-001", "Yil"),
-#        ("ylm", "00135931-001", "Limi"),
-#        ("yln", "00135932-001", "Langnian Buyang"),
-#        ("ylo", "00135933-001", "Naluo Yi"),
-#        ("ylr", "00137934-001", "Yalarnnga"),
-#        ("ylu", "00135902-001", "Aribwaung"),
-#        ("yly", "00135925-001", "Nyâlayu"),
-#        ("yma", "00135923-001", "Yamphe"),
-#        ("ymb", "00135892-001", "Yambes"),
-#        ("ymc", "00135893-001", "Southern Muji"),
-#        ("ymd", "00135894-001", "Muda"),
-#        ("yme", "00138099-001", "Yameo"),
-#        ("ymg", "00135895-001", "Yamongeri"),
-#        ("ymh", "00135896-001", "Mili"),
-#        ("ymi", "00135897-001", "Moji"),
-#        ("ymk", "00135898-001", "Makwe"),
-#        ("yml", "00135899-001", "Iamalele"),
-#        ("ymm", "00135912-001", "Maay"),
-#        ("ymn", "00135901-001", "Yamna"),
-#        ("ymo", "00135891-001", "Yangum Mon"),
-#        ("ymp", "00135903-001", "Yamap"),
-#        ("ymq", "00135904-001", "Qila Muji"),
-#        ("ymr", "00135905-001", "Malasar"),
-#        ("yms", "00138463-001", "Mysian"),
-#        ("ymt", "00138085-001", "Mator-Taygi-Karagas"),
-#        ("ymx", "00135906-001", "Northern Muji"),
-#        ("ymz", "00135907-001", "Muzi"),
-#        ("yna", "00135908-001", "Aluo"),
-#        ("ynd", "00135909-001", "Yandruwandha"),
-#        ("yne", "00135910-001", "Lang'e"),
-#        ("yng", "00135911-001", "Yango"),
-#        ("ynh", "00135937-001", "Yangho"),
-#        ("ynk", "00135971-001", "Naukan Yupik"),
-#        ("ynl", "00135934-001", "Yangulam"),
-#        ("ynn", "00138075-001", "Yana"),
-#        ("yno", "00135961-001", "Yong"),
-#        ("yns", "00135962-001", "Yansi"),
-#        ("ynu", "00138072-001", "Yahuna"),
-#        ("yob", "00138071-001", "Yoba"),
-#        ("yog", "00135963-001", "Yogad"),
-#        ("yoi", "00135964-001", "Yonaguni"),
-#        ("yok", "00135965-001", "Yokuts"),
-#        ("yol", "00138125-001", "Yola"),
-#        ("yom", "00135966-001", "Yombe"),
-#        ("yon", "00135967-001", "Yonggom"),
-#        ("yor", "00138646-001", "Yoruba"),
-#        ("yos", "00135968-001", "Yos"),
-#        ("yox", "00135981-001", "Yoron"),
-#        ("yoy", "00135970-001", "Yoy"),
-#        ("ypa", "00135959-001", "Phala"),
-#        ("ypb", "00135972-001", "Labo Phowa"),
-#        ("ypg", "00135973-001", "Phola"),
-#        ("yph", "00135974-001", "Phupha"),
-#        ("ypm", "00135975-001", "Phuma"),
-#        ("ypn", "00135976-001", "Ani Phowa"),
-#        ("ypo", "00135977-001", "Alo Phola"),
-#        ("ypp", "00135978-001", "Phupa"),
-#        ("ypz", "00135979-001", "Phuza"),
-#        ("yra", "00135980-001", "Yerakai"),
-#        ("yrb", "00135948-001", "Yareba"),
-#        ("yre", "00135946-001", "Yaouré"),
-#        ("yri", "00135969-001", "Yarí"),
-#        ("yrk", "00135938-001", "Nenets"),
-#        ("yrl", "00135939-001", "Nhengatu"),
-#        ("yrn", "00135940-001", "Yerong"),
-#        ("yrs", "00135941-001", "Yarsun"),
-#        ("yrw", "00135942-001", "Yarawata"),
-#        ("ysc", "00138102-001", "Yassic"),
-#        ("ysd", "00135943-001", "Samatao"),
-#        ("ysl", "00135944-001", "Yugoslavian Sign Language"),
-#        ("ysn", "00135945-001", "Sani"),
-#        ("yso", "00135958-001", "Nisi"),
-#        ("ysp", "00135947-001", "Southern Lolopo"),
-#        ("ysr", "00138038-001", "Sirenik Yupik"),
-#        ("yss", "00135936-001", "Yessan-Mayo"),
-#        ("ysy", "00135949-001", "Sanie"),
-#        ("yta", "00135950-001", "Talu"),
-#        ("ytl", "00135951-001", "Tanglang"),
-#        ("ytp", "00135952-001", "Thopho"),
-#        ("yua", "00135953-001", "Yucateco"),
-#        ("yub", "00138032-001", "Yugambal"),
-#        ("yuc", "00135954-001", "Yuchi"),
-#        ("yud", "00135955-001", "Judeo-Tripolitanian Arabic"),
-#        ("yue", "00135956-001", "Yue Chinese"),
-#        ("yuf", "00136083-001", "Havasupai-Walapai-Yavapai"),
-#        ("yug", "00138029-001", "Yug"),
-#        ("yui", "00135900-001", "Yurutí"),
-#        ("yuj", "00136049-001", "Karkar-Yuri"),
-#        ("yuk", "00138012-001", "Yuki"),
-#        ("yul", "00136189-001", "Yulu"),
-#        ("yum", "00136190-001", "Quechan"),
-#        ("yun", "00136191-001", "Bena"),
-#        ("yup", "00136192-001", "Yukpa"),
-#        ("yuq", "00136193-001", "Yuqui"),
-#        ("yur", "00136194-001", "Yurok"),
-#        ("yut", "00136195-001", "Yopno"),
-#        ("yuu", "00136196-001", "Yugh"),
-#        ("yuw", "00136197-001", "Yau"),
-#        ("yux", "00136210-001", "Southern Yukaghir"),
-#        ("yuy", "00136199-001", "East Yugur"),
-#        ("yuz", "00136188-001", "Yuracare"),
-#        ("yva", "00136201-001", "Yawa"),
-#        ("yvt", "00138014-001", "Yavitero"),
-#        ("ywa", "00136202-001", "Kalou"),
-#        ("ywl", "00136203-001", "Western Lalu"),
-#        ("ywn", "00136204-001", "Yawanawa"),
-#        ("ywq", "00136205-001", "Wuding-Luquan Yi"),
-#        ("ywr", "00136206-001", "Yawuru"),
-#        ("ywt", "00136207-001", "Xishanba Lalo"),
-#        ("ywu", "00136208-001", "Wumeng Nasu"),
-#        ("yww", "00136209-001", "Yawarawarga"),
-#        ("yyu", "00136177-001", "Yau"),
-#        ("yyz", "00136175-001", "Ayizi"),
-#        ("yzg", "00136198-001", "E'ma Buyang"),
-#        ("yzk", "00136167-001", "Zokhuo"),
-#        ("zaa", "00136168-001", "Sierra de Juárez Zapotec"),
-#        ("zab", "00136169-001", "San Juan Guelavía Zapotec"),
-#        ("zac", "00136170-001", "Ocotlán Zapotec"),
-#        ("zad", "00136171-001", "Cajonos Zapotec"),
-#        ("zae", "00136172-001", "Yareni Zapotec"),
-#        ("zaf", "00136173-001", "Ayoquesco Zapotec"),
-#        ("zag", "00136174-001", "Zaghawa"),
-#        ("zah", "00136187-001", "Zangwal"),
-#        ("zai", "00136176-001", "Isthmus Zapotec"),
-#        ("zaj", "00136165-001", "Zaramo"),
-#        ("zak", "00136178-001", "Zanaki"),
-#        ("zal", "00136179-001", "Zauzou"),
-#        ("zam", "00136180-001", "Miahuatlán Zapotec"),
-#        ("zao", "00136181-001", "Ozolotepec Zapotec"),
-#        ("zap", "00130978-001", "Zapotec"),
-#        ("zaq", "00136182-001", "Aloápam Zapotec"),
-#        ("zar", "00136183-001", "Rincón Zapotec"),
-#        ("zas", "00136184-001", "Santo Domingo Albarradas Zapotec"),
-#        ("zat", "00136185-001", "Tabaa Zapotec"),
-#        ("zau", "00136212-001", "Zangskari"),
-#        ("zav", "00136166-001", "Yatzachi Zapotec"),
-#        ("zaw", "00136200-001", "Mitla Zapotec"),
-#        ("zax", "00136235-001", "Xadani Zapotec"),
-#        ("zay", "00136236-001", "Zayse-Zergulla"),
-#        ("zaz", "00136237-001", "Zari"),
-#        ("zbc", "00136238-001", "Central Berawan"),
-#        ("zbe", "00136239-001", "East Berawan"),
-#        ("zbl", "00138349-001", "Blissymbols; Blissymbolics; Bliss"),
-#        ("zbt", "00136240-001", "Batui"),
-#        ("zbw", "00136241-001", "West Berawan"),
-#        ("zca", "00136242-001", "Coatecas Altas Zapotec"),
-#        ("zch", "00136243-001", "Central Hongshuihe Zhuang"),
-#        ("zdj", "00136256-001", "Ngazidja Comorian"),
-#        ("zea", "00136245-001", "Zeeuws"),
-#        ("zeg", "00136234-001", "Zenag"),
-#        ("zeh", "00136247-001", "Eastern Hongshuihe Zhuang"),
-#        ("zen", "00136248-001", "Zenaga"),
-#        ("zga", "00136249-001", "Kinga"),
-#        ("zgb", "00136250-001", "Guibei Zhuang"),
-#        ("zgm", "00136251-001", "Minz Zhuang"),
-#        ("zgn", "00136252-001", "Guibian Zhuang"),
-#        ("zgr", "00136253-001", "Magori"),
-#        ("zha", "00138647-001", "Zhuang; Chuang"),
-#        ("zhb", "00136254-001", "Zhaba"),
-#        ("zhd", "00136255-001", "Dai Zhuang"),
-#        ("zhi", "00136223-001", "Zhire"),
-#        ("zhn", "00136221-001", "Nong Zhuang"),
-#        ("zho", "00138648-001", "Chinese"),
-#        ("zhw", "00136244-001", "Zhoa"),
-#        ("zia", "00136213-001", "Zia"),
-#        ("zib", "00136214-001", "Zimbabwe Sign Language"),
-#        ("zik", "00136215-001", "Zimakani"),
-#        ("zim", "00136216-001", "Mesme"),
-#        ("zin", "00136217-001", "Zinza"),
-#        ("zir", "00136218-001", "Ziriya"),
-#        ("ziw", "00136219-001", "Zigula"),
-#        ("ziz", "00136220-001", "Zizilivakan"),
-#        ("zka", "00136233-001", "Kaimbulawa"),
-#        ("zkb", "00138109-001", "Koibal"),
-#        ("zkg", "00138110-001", "Koguryo"),
-#        ("zkh", "00138098-001", "Khorezmian"),
-#        ("zkk", "00138114-001", "Karankawa"),
-#        ("zko", "00138117-001", "Kott"),
-#        ("zkp", "00138119-001", "São Paulo Kaingáng"),
-#        ("zkr", "00136222-001", "Zakhring"),
-#        ("zkt", "00138122-001", "Kitan"),
-#        ("zku", "00138123-001", "Kaurna"),
-#        ("zkv", "00138084-001", "Krevinian"),
-#        ("zkz", "00138076-001", "Khazar"),
-#        ("zlj", "00136211-001", "Liujiang Zhuang"),
-#        ("zlm", "00136224-001", "Malay"),
-#        ("zln", "00136225-001", "Lianshan Zhuang"),
-#        ("zlq", "00136226-001", "Liuqian Zhuang"),
-#        ("zma", "00136227-001", "Manda"),
-#        ("zmb", "00136228-001", "Zimba"),
-#        ("zmc", "00136229-001", "Margany"),
-#        ("zmd", "00136230-001", "Maridan"),
-#        ("zme", "00136231-001", "Mangerr"),
-#        ("zmf", "00136143-001", "Mfinu"),
-#        ("zmg", "00136246-001", "Marti Ke"),
-#        ("zmh", "00136186-001", "Makolkol"),
-#        ("zmi", "00136097-001", "Negeri Sembilan Malay"),
-#        ("zmj", "00136098-001", "Maridjabin"),
-#        ("zmk", "00136099-001", "Mandandanyi"),
-#        ("zml", "00136100-001", "Madngele"),
-#        ("zmm", "00136101-001", "Marimanindji"),
-#        ("zmn", "00136102-001", "Mbangwe"),
-#        ("zmo", "00136103-001", "Molo"),
-#        ("zmp", "00136104-001", "Mpuono"),
-#        ("zmq", "00136105-001", "Mituku"),
-#        ("zmr", "00136118-001", "Maranunggu"),
-#        ("zms", "00136107-001", "Mbesa"),
-#        ("zmt", "00136096-001", "Maringarr"),
-#        ("zmu", "00136109-001", "Muruwari"),
-#        ("zmv", "00136110-001", "Mbariman-Gudhinma"),
-#        ("zmw", "00136111-001", "Mbo"),
-#        ("zmx", "00136112-001", "Bomitaba"),
-#        ("zmy", "00136113-001", "Mariyedi"),
-#        ("zmz", "00136114-001", "Mbandja"),
-#        ("zna", "00136115-001", "Zan Gula"),
-#        ("zne", "00136116-001", "Zande"),
-#        ("zng", "00136085-001", "Mang"),
-#        ("znk", "00138001-001", "Manangkari"),
-#        ("zns", "00136108-001", "Mangas"),
-#        ("zoc", "00136106-001", "Copainalá Zoque"),
-#        ("zoh", "00136075-001", "Chimalapa Zoque"),
-#        ("zom", "00136076-001", "Zou"),
-#        ("zoo", "00136077-001", "Asunción Mixtepec Zapotec"),
-#        ("zoq", "00136078-001", "Tabasco Zoque"),
-#        ("zor", "00136079-001", "Rayón Zoque"),
-#        ("zos", "00136080-001", "Francisco León Zoque"),
-#        ("zpa", "00136081-001", "Lachiguiri Zapotec"),
-#        ("zpb", "00136082-001", "Yautepec Zapotec"),
-#        ("zpc", "00136095-001", "Choapan Zapotec"),
-#        ("zpd", "00136084-001", "Southeastern Ixtlán Zapotec"),
-#        ("zpe", "00136074-001", "Petapa Zapotec"),
-#        ("zpf", "00136086-001", "San Pedro Quiatoni Zapotec"),
-#        ("zpg", "00136087-001", "Guevea De Humboldt Zapotec"),
-#        ("zph", "00136088-001", "Totomachapan Zapotec"),
-#        ("zpi", "00136089-001", "Santa María Quiegolani Zapotec"),
-#        ("zpj", "00136090-001", "Quiavicuzas Zapotec"),
-#        ("zpk", "00136091-001", "Tlacolulita Zapotec"),
-#        ("zpl", "00136092-001", "Lachixío Zapotec"),
-#        ("zpm", "00136093-001", "Mixtepec Zapotec"),
-#        ("zpn", "00136094-001", "Santa Inés Yatzechi Zapotec"),
-#        ("zpo", "00136120-001", "Amatlán Zapotec"),
-#        ("zpp", "00136154-001", "El Alto Zapotec"),
-#        ("zpq", "00136117-001", "Zoogocho Zapotec"),
-#        ("zpr", "00136144-001", "Santiago Xanica Zapotec"),
-#        ("zps", "00136145-001", "Coatlán Zapotec"),
-#        ("zpt", "00136146-001", "San Vicente Coatlán Zapotec"),
-#        ("zpu", "00136147-001", "Yalálag Zapotec"),
-#        ("zpv", "00136148-001", "Chichicapan Zapotec"),
-#        ("zpw", "00136149-001", "Zaniza Zapotec"),
-#        ("zpx", "00136150-001", "San Baltazar Loxicha Zapotec"),
-#        ("zpy", "00136151-001", "Mazaltepec Zapotec"),
-#        ("zpz", "00136164-001", "Texmelucan Zapotec"),
-#        ("zqe", "00136153-001", "Qiubei Zhuang"),
-#        ("zra", "00137978-001", "Kara"),
-#        ("zrg", "00136142-001", "Mirgan"),
-#        ("zrn", "00136155-001", "Zirenkel"),
-#        ("zro", "00136156-001", "Záparo"),
-#        ("zrp", "00138283-001", "Zarphatic"),
-#        ("zrs", "00136157-001", "Mairasi"),
-#        ("zsa", "00136158-001", "Sarasira"),
-#        ("zsk", "00138369-001", "Kaskean"),
-#        ("zsl", "00136159-001", "Zambian Sign Language"),
-#        ("zsm", "00136160-001", "Standard Malay"),
-#        ("zsr", "00136161-001", "Southern Rincon Zapotec"),
-#        ("zsu", "00136162-001", "Sukurum"),
-#        ("zte", "00136163-001", "Elotepec Zapotec"),
-#        ("ztg", "00136131-001", "Xanaguía Zapotec"),
-#        ("ztl", "00136129-001", "Lapaguía-Guivini Zapotec"),
-#        ("ztm", "00136152-001", "San Agustín Mixtepec Zapotec"),
-#        ("ztn", "00136121-001", "Santa Catarina Albarradas Zapotec"),
-#        ("ztp", "00136122-001", "Loxicha Zapotec"),
-#        ("ztq", "00136123-001", "Quioquitani-Quierí Zapotec"),
-#        ("zts", "00136124-001", "Tilquiapan Zapotec"),
-#        ("ztt", "00136125-001", "Tejalapan Zapotec"),
-#        ("ztu", "00136126-001", "Güilá Zapotec"),
-#        ("ztx", "00136127-001", "Zaachila Zapotec"),
-#        ("zty", "00136128-001", "Yatee Zapotec"),
-#        ("zua", "00136141-001", "Zeem"),
-#        ("zuh", "00136130-001", "Tokano"),
-#        ("zul", "00138649-001", "Zulu"),
-#        ("zum", "00136119-001", "Kumzari"),
-#        ("zun", "00136132-001", "Zuni"),
-#        ("zuy", "00136133-001", "Zumaya"),
-#        ("zwa", "00136134-001", "Zay"),
-#        ("zxx", "00130973-001", "no linguistic content"),
-#        ("zyb", "00136135-001", "Yongbei Zhuang"),
-#        ("zyg", "00136136-001", "Yang Zhuang"),
-#        ("zyj", "00136137-001", "Youjiang Zhuang"),
-#        ("zyn", "00136138-001", "Yongnan Zhuang"),
-#        ("zyp", "00136139-001", "Zyphe"),
-#        ("zza", "00131000-001", "Zaza; Dimili; Dimli; Kirdki; Kirmanjki; Zazaki"),
-#        ("zzj", "00136140-001", "Zuojiang Zhuang"),
-#        ("---", "unknown", "Unknown"),
-#        ("---", "other", "Other")
-#]
+# The ISO-3166 country codes are in collection/data,
+#   see collbank.collection.refdata
 
 
 # Static files (CSS, JavaScript, Images)
@@ -71,6 +71,8 @@ urlpatterns = [
     re_path(r'^source/details(?:/(?P<pk>\d+))?/$', SourceInfoDetails.as_view(), name='sourceinfo_details'),
     re_path(r'^source/edit(?:/(?P<pk>\d+))?/$', SourceInfoEdit.as_view(), name='sourceinfo_edit'),
     re_path(r'^source/load(?:/(?P<pk>\d+))?/$', SourceInfoLoadXml.as_view(), name='sourceinfo_load'),
+    re_path(r'^source/import/$', CollectionImport.as_view(), name='import_collections'),
+    re_path(r'^source/preflight/$', CollectionPreflight.as_view(), name='preflight_collections'),
 
     # ------------- Uploading VLO XML definitions and viewing those uploads -------------------------------
     re_path(r'^vloitem/list', VloItemList.as_view(), name='vloitem_list'),
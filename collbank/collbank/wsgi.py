@@ -30,6 +30,10 @@ from django.core.wsgi import get_wsgi_application
 
 _application = get_wsgi_application()
 
+# Compile the XSD schema once, before the first publish request comes in
+from collbank.collection.views import warm_schema
+warm_schema()
+
 
 def application(environ, start_response):
     path_info = environ['PATH_INFO']